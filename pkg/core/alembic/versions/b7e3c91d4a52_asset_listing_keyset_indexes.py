@@ -0,0 +1,41 @@
+"""asset listing keyset and editorial containment indexes
+
+Revision ID: b7e3c91d4a52
+Revises: 90533b501986
+Create Date: 2026-10-18 00:00:00.000000
+
+Keyset pagination for /api/scheduling/assets orders schedulable assets by
+(discovered_at DESC, uuid DESC); editorial filters use JSONB containment.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b7e3c91d4a52"
+down_revision = "90533b501986"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_assets_schedulable_keyset",
+        "assets",
+        [sa.text("discovered_at DESC"), sa.text("uuid DESC")],
+        postgresql_where=sa.text(
+            "state = 'ready' AND approved_for_broadcast = true AND is_deleted = false"
+        ),
+    )
+    op.create_index(
+        "ix_asset_editorial_payload",
+        "asset_editorial",
+        ["payload"],
+        postgresql_using="gin",
+        postgresql_ops={"payload": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asset_editorial_payload", table_name="asset_editorial")
+    op.drop_index("ix_assets_schedulable_keyset", table_name="assets")
@@ -0,0 +1,30 @@
+"""transmission_log end_utc_ms index
+
+Revision ID: c4d8e2f61a37
+Revises: b7e3c91d4a52
+Create Date: 2026-10-18 00:00:00.000000
+
+The schedule retention job deletes Tier 2 rows by end_utc_ms across all
+channels in bounded batches; ix_transmission_log_channel_day does not
+cover that predicate.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4d8e2f61a37"
+down_revision = "b7e3c91d4a52"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transmission_log_end_utc_ms",
+        "transmission_log",
+        ["end_utc_ms"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transmission_log_end_utc_ms", table_name="transmission_log")
@@ -0,0 +1,35 @@
+"""packed segment payloads
+
+Revision ID: d9a1f3b7c2e8
+Revises: c4d8e2f61a37
+Create Date: 2026-10-18 00:00:00.000000
+
+Adds nullable segment_codec payload columns next to the JSONB segment
+lists. Readers prefer the packed column and fall back to JSONB, so
+existing rows need no backfill.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9a1f3b7c2e8"
+down_revision = "c4d8e2f61a37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transmission_log",
+        sa.Column("segments_packed", sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        "compiled_program_log",
+        sa.Column("segmented_packed", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("compiled_program_log", "segmented_packed")
+    op.drop_column("transmission_log", "segments_packed")
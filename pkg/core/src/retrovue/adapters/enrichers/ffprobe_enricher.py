@@ -3,6 +3,9 @@ FFprobe enricher for extracting media metadata.
 
 This enricher uses FFprobe to extract technical metadata from media files,
 including duration, codecs, container format, and chapter markers.
+
+Raw ffprobe JSON is kept in the probe cache (see probe_cache.py), so an
+unchanged file is not probed again on re-ingest or reprobe.
 """
 
 from __future__ import annotations
@@ -15,6 +18,10 @@ from urllib.parse import unquote, urlparse
 
 from ..importers.base import DiscoveredItem
 from .base import BaseEnricher, EnricherConfig, EnricherConfigurationError, EnricherError
+from .probe_cache import ProbeCache, get_probe_cache
+
+# Probe cache variant: bump when the ffprobe arguments below change.
+FFPROBE_CACHE_VARIANT = "format+streams+chapters/v1"
 
 
 class FFprobeEnricher(BaseEnricher):
@@ -28,17 +35,19 @@ class FFprobeEnricher(BaseEnricher):
     name = "ffprobe"
     scope = "ingest"
 
-    def __init__(self, ffprobe_path: str = "ffprobe", timeout: int = 30):
+    def __init__(self, ffprobe_path: str = "ffprobe", timeout: int = 30, use_cache: bool = True):
         """
         Initialize the FFprobe enricher.
 
         Args:
             ffprobe_path: Path to the ffprobe executable
             timeout: Timeout in seconds for FFprobe operations
+            use_cache: Reuse cached results for unchanged files
         """
-        super().__init__(ffprobe_path=ffprobe_path, timeout=timeout)
+        super().__init__(ffprobe_path=ffprobe_path, timeout=timeout, use_cache=use_cache)
         self.ffprobe_path = ffprobe_path
         self.timeout = timeout
+        self.cache: ProbeCache | None = get_probe_cache() if use_cache else None
 
     def enrich(self, discovered_item: DiscoveredItem) -> DiscoveredItem:
         """
@@ -77,8 +86,8 @@ class FFprobeEnricher(BaseEnricher):
             if not file_path.exists():
                 raise EnricherError(f"File does not exist: {file_path}")
 
-            # Run FFprobe to get metadata (raw ffprobe JSON)
-            metadata = self._run_ffprobe(file_path)
+            # Run FFprobe to get metadata (raw ffprobe JSON), or reuse it
+            metadata = self._probe(file_path, discovered_item.hash_sha256)
 
             # Convert metadata to labels
             additional_labels = self._metadata_to_labels(metadata)
@@ -124,7 +133,12 @@ class FFprobeEnricher(BaseEnricher):
                     "name": "timeout",
                     "description": "Timeout in seconds for FFprobe operations",
                     "default": "30",
-                }
+                },
+                {
+                    "name": "use_cache",
+                    "description": "Reuse cached results for files whose size and mtime are unchanged",
+                    "default": "true",
+                },
             ],
             scope=cls.scope,
             description="Extracts technical media metadata (duration, codecs, resolution) using FFprobe",
@@ -142,6 +156,33 @@ class FFprobeEnricher(BaseEnricher):
         if not isinstance(timeout, int) or timeout <= 0:
             raise EnricherConfigurationError("timeout must be a positive integer")
 
+        use_cache = self._safe_get_config("use_cache", True)
+        if not isinstance(use_cache, bool):
+            raise EnricherConfigurationError("use_cache must be a boolean")
+
+    def _probe(self, file_path: Path, sha256: str | None = None) -> dict[str, Any]:
+        """Return ffprobe JSON for *file_path*, from the probe cache when still valid."""
+        cache = self.cache
+        if cache is None:
+            return self._run_ffprobe(file_path)
+
+        cached = cache.get("ffprobe", file_path, variant=FFPROBE_CACHE_VARIANT, sha256=sha256)
+        if isinstance(cached, dict):
+            return cached
+
+        # Stat before probing so a file replaced mid-probe is not cached.
+        try:
+            st = file_path.stat()
+        except OSError:
+            st = None
+        metadata = self._run_ffprobe(file_path)
+        if st is not None:
+            cache.put(
+                "ffprobe", file_path, metadata,
+                variant=FFPROBE_CACHE_VARIANT, sha256=sha256, stat=st,
+            )
+        return metadata
+
     def _run_ffprobe(self, file_path: Path) -> dict[str, Any]:
         """
         Run FFprobe on a file and return parsed metadata.
@@ -6,16 +6,22 @@ and computes gain_db = target_lufs - integrated_lufs. The result is stored in
 the probed payload under the "loudness" key.
 
 Target: -24 LUFS integrated (ATSC A/85).
+
+Measured integrated loudness is kept in the probe cache (see probe_cache.py);
+gain_db is recomputed from it on every read, so changing TARGET_LUFS does not
+require re-measuring.
 """
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 from typing import Any
 
 from ..importers.base import DiscoveredItem
 from .base import BaseEnricher, EnricherConfig, EnricherError
+from .probe_cache import ProbeCache, get_probe_cache
 
 # ATSC A/85 target (CALM Act, US broadcast standard)
 TARGET_LUFS: float = -24.0
@@ -23,6 +29,9 @@ TARGET_LUFS: float = -24.0
 # Regex to parse integrated loudness from ffmpeg ebur128 stderr
 _INTEGRATED_RE = re.compile(r"I:\s+([-\d.]+)\s+LUFS")
 
+# Probe cache variant: bump when the ebur128 filter chain below changes.
+LOUDNESS_CACHE_VARIANT = "ebur128/stereo/v1"
+
 
 def compute_gain_db(integrated_lufs: float) -> float:
     """Compute loudness normalization gain.
@@ -62,10 +71,13 @@ class LoudnessEnricher(BaseEnricher):
     name = "loudness"
     scope = "ingest"
 
-    def __init__(self, ffmpeg_path: str = "ffmpeg", timeout: int = 600) -> None:
-        super().__init__(ffmpeg_path=ffmpeg_path, timeout=timeout)
+    def __init__(
+        self, ffmpeg_path: str = "ffmpeg", timeout: int = 600, use_cache: bool = True
+    ) -> None:
+        super().__init__(ffmpeg_path=ffmpeg_path, timeout=timeout, use_cache=use_cache)
         self.ffmpeg_path = ffmpeg_path
         self.timeout = timeout
+        self.cache: ProbeCache | None = get_probe_cache() if use_cache else None
 
     def enrich(self, discovered_item: DiscoveredItem) -> DiscoveredItem:
         """Enrich a discovered item with loudness measurement."""
@@ -81,7 +93,7 @@ class LoudnessEnricher(BaseEnricher):
             file_path = unquote(parsed.path or raw[7:])
 
         try:
-            loudness = self.measure_loudness(file_path)
+            loudness = self.measure_loudness(file_path, sha256=discovered_item.hash_sha256)
         except EnricherError:
             raise
         except Exception as e:
@@ -104,12 +116,38 @@ class LoudnessEnricher(BaseEnricher):
             probed=merged_probed,
         )
 
-    def measure_loudness(self, file_path: str) -> dict[str, Any]:
-        """Run ffmpeg ebur128 measurement and return loudness dict.
+    def measure_loudness(self, file_path: str, *, sha256: str | None = None) -> dict[str, Any]:
+        """Measure loudness (or reuse a cached measurement) and return loudness dict.
 
         Returns:
             {"integrated_lufs": float, "gain_db": float, "target_lufs": -24.0}
         """
+        cache = self.cache
+        cached = None
+        if cache is not None:
+            cached = cache.get("loudness", file_path, variant=LOUDNESS_CACHE_VARIANT, sha256=sha256)
+        if isinstance(cached, dict) and isinstance(cached.get("integrated_lufs"), (int, float)):
+            integrated_lufs = float(cached["integrated_lufs"])
+        else:
+            try:
+                st = os.stat(file_path) if cache is not None else None
+            except OSError:
+                st = None
+            integrated_lufs = self._run_ebur128(file_path)
+            if cache is not None and st is not None:
+                cache.put(
+                    "loudness", file_path, {"integrated_lufs": integrated_lufs},
+                    variant=LOUDNESS_CACHE_VARIANT, sha256=sha256, stat=st,
+                )
+
+        return {
+            "integrated_lufs": integrated_lufs,
+            "gain_db": compute_gain_db(integrated_lufs),
+            "target_lufs": TARGET_LUFS,
+        }
+
+    def _run_ebur128(self, file_path: str) -> float:
+        """Run ffmpeg ebur128 and return integrated loudness in LUFS."""
         cmd = [
             self.ffmpeg_path,
             "-i", file_path,
@@ -137,14 +175,7 @@ class LoudnessEnricher(BaseEnricher):
                 "Could not parse integrated loudness from ffmpeg ebur128 output"
             )
 
-        integrated_lufs = float(match.group(1))
-        gain_db = compute_gain_db(integrated_lufs)
-
-        return {
-            "integrated_lufs": integrated_lufs,
-            "gain_db": gain_db,
-            "target_lufs": TARGET_LUFS,
-        }
+        return float(match.group(1))
 
     @classmethod
     def get_config_schema(cls) -> EnricherConfig:
@@ -161,6 +192,11 @@ class LoudnessEnricher(BaseEnricher):
                     "description": "Timeout in seconds for loudness measurement",
                     "default": "120",
                 },
+                {
+                    "name": "use_cache",
+                    "description": "Reuse cached measurements for files whose size and mtime are unchanged",
+                    "default": "true",
+                },
             ],
             scope=cls.scope,
             description="Measures integrated loudness (EBU R128) and computes ATSC A/85 normalization gain",
@@ -175,3 +211,7 @@ class LoudnessEnricher(BaseEnricher):
         if not isinstance(timeout, int) or timeout <= 0:
             from .base import EnricherConfigurationError
             raise EnricherConfigurationError("timeout must be a positive integer")
+        use_cache = self._safe_get_config("use_cache", True)
+        if not isinstance(use_cache, bool):
+            from .base import EnricherConfigurationError
+            raise EnricherConfigurationError("use_cache must be a boolean")
@@ -0,0 +1,230 @@
+"""
+Probe cache — persistent ffprobe / loudness results keyed by file identity.
+
+FFprobeEnricher and LoudnessEnricher used to spawn a subprocess for every
+asset on every ingest or reprobe, even when the file had not changed.  The
+cache stores each tool's result under:
+
+    (kind, variant, path)  with the file's size and mtime_ns at probe time
+    (kind, variant, sha256) when the caller knows the content hash
+
+A lookup stats the file; the path entry is a hit only if size and mtime_ns
+still match.  If the path misses but a content hash is supplied, an entry
+recorded under the same hash (e.g. the file was moved or re-mounted) is
+reused and re-keyed to the new path.  ``variant`` names the tool invocation
+(arguments / output shape) so changing it invalidates old entries.
+
+Storage is a single SQLite file in WAL mode, so concurrent enrichment
+workers and processes (ingest, reprobe, background loudness) share it.
+Cache failures never fail enrichment: errors are logged and treated as a
+miss.
+
+Location: ``RETROVUE_PROBE_CACHE`` (a file path, or ``off`` to disable),
+default ``$XDG_CACHE_HOME/retrovue/probe-cache.sqlite3``.
+
+INV-PROBE-CACHE-IDENTITY-001: A cached result is returned only for a file
+whose current (size, mtime_ns) or content hash equals the one recorded when
+the result was produced.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROBE_CACHE_ENV = "RETROVUE_PROBE_CACHE"
+_DISABLED_VALUES = {"", "0", "off", "false", "none", "disabled"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probe_results (
+    kind     TEXT    NOT NULL,
+    variant  TEXT    NOT NULL,
+    path     TEXT    NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256   TEXT,
+    result   TEXT    NOT NULL,
+    probed_at REAL   NOT NULL,
+    PRIMARY KEY (kind, variant, path)
+);
+CREATE INDEX IF NOT EXISTS ix_probe_results_sha256
+    ON probe_results (kind, variant, sha256) WHERE sha256 IS NOT NULL;
+"""
+
+
+def default_probe_cache_path() -> Path | None:
+    """Return the configured cache file, or None when the cache is disabled."""
+    configured = os.getenv(PROBE_CACHE_ENV)
+    if configured is not None:
+        if configured.strip().lower() in _DISABLED_VALUES:
+            return None
+        return Path(configured).expanduser()
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "retrovue" / "probe-cache.sqlite3"
+
+
+class ProbeCache:
+    """SQLite-backed store of probe results.  Safe to share between threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection (other threads' close on exit)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        kind: str,
+        path: str | Path,
+        *,
+        variant: str = "",
+        sha256: str | None = None,
+    ) -> Any | None:
+        """Return the cached result for *path*, or None (INV-PROBE-CACHE-IDENTITY-001)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = str(path)
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT size, mtime_ns, result FROM probe_results "
+                "WHERE kind = ? AND variant = ? AND path = ?",
+                (kind, variant, key),
+            ).fetchone()
+            if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                return json.loads(row[2])
+            if not sha256:
+                return None
+            row = conn.execute(
+                "SELECT result FROM probe_results "
+                "WHERE kind = ? AND variant = ? AND sha256 = ? LIMIT 1",
+                (kind, variant, sha256),
+            ).fetchone()
+            if row is None:
+                return None
+            result = json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning("Probe cache lookup failed (%s): %s", self.path, e)
+            return None
+        # Same content under a new path or identity: remember it there too.
+        self._store(kind, variant, key, st, sha256, result)
+        return result
+
+    def put(
+        self,
+        kind: str,
+        path: str | Path,
+        result: Any,
+        *,
+        variant: str = "",
+        sha256: str | None = None,
+        stat: os.stat_result | None = None,
+    ) -> None:
+        """Record *result* for *path*.
+
+        Pass the ``stat`` taken before probing when available, so a file
+        modified while the tool ran is not recorded under its new identity.
+        """
+        try:
+            st = stat if stat is not None else os.stat(path)
+        except OSError:
+            return
+        self._store(kind, variant, str(path), st, sha256, result)
+
+    def invalidate(self, path: str | Path, *, kind: str | None = None) -> int:
+        """Drop entries for *path* (all kinds unless *kind* is given)."""
+        sql = "DELETE FROM probe_results WHERE path = ?"
+        params: tuple[Any, ...] = (str(path),)
+        if kind is not None:
+            sql += " AND kind = ?"
+            params += (kind,)
+        try:
+            return self._conn().execute(sql, params).rowcount
+        except sqlite3.Error as e:
+            logger.warning("Probe cache invalidate failed (%s): %s", self.path, e)
+            return 0
+
+    def _store(
+        self,
+        kind: str,
+        variant: str,
+        path: str,
+        st: os.stat_result,
+        sha256: str | None,
+        result: Any,
+    ) -> None:
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO probe_results "
+                "(kind, variant, path, size, mtime_ns, sha256, result, probed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    variant,
+                    path,
+                    st.st_size,
+                    st.st_mtime_ns,
+                    sha256,
+                    json.dumps(result, separators=(",", ":")),
+                    time.time(),
+                ),
+            )
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning("Probe cache write failed (%s): %s", self.path, e)
+
+
+_default_cache: ProbeCache | None = None
+_default_cache_path: Path | None = None
+_default_lock = threading.Lock()
+
+
+def get_probe_cache() -> ProbeCache | None:
+    """Return the process-wide cache for the configured location (None if disabled)."""
+    global _default_cache, _default_cache_path
+    path = default_probe_cache_path()
+    if path is None:
+        return None
+    with _default_lock:
+        if _default_cache is None or _default_cache_path != path:
+            _default_cache = ProbeCache(path)
+            _default_cache_path = path
+        return _default_cache
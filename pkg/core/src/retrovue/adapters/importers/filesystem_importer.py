@@ -4,13 +4,26 @@ Filesystem importer for discovering content from local file systems.
 This importer scans local directories for media files and returns them as discovered items.
 It supports glob patterns and can extract basic metadata from file system attributes.
 It also supports directory-based tag inference for interstitial content classification.
+
+Discovery walks each root with a parallel ``os.scandir`` walker: every
+directory is listed exactly once, files are matched against all glob
+patterns in that single pass, and sidecars are looked up in the same
+listing.  When ``manifest_path`` is configured, a ScanManifest of the
+previous ingest lets discovery skip unchanged files entirely (see
+scan_manifest.py).
 """
 
 from __future__ import annotations
 
 import hashlib
+import logging
+import os
 import re
+import stat as _stat
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -22,10 +35,19 @@ from .base import (
     ImporterError,
     UpdateFieldSpec,
 )
+from .scan_manifest import ManifestEntry, ScanManifest
 
 if TYPE_CHECKING:
     from ...domain.entities import Collection
 
+logger = logging.getLogger(__name__)
+
+# Directory listings and per-file item construction are I/O bound.
+DEFAULT_SCAN_WORKERS = 8
+
+# Sidecar suffixes appended to the media file name, in lookup order.
+SIDECAR_EXTENSIONS = (".retrovue.json", ".json", ".yaml", ".yml")
+
 
 # Default inference rules for interstitial content classification.
 # Maps directory name patterns (case-insensitive) to canonical tags.
@@ -67,6 +89,44 @@ DEFAULT_INFERENCE_RULES: dict[str, list[dict[str, Any]]] = {
 }
 
 
+def _split_glob(pattern: str) -> tuple[str, ...] | None:
+    """Split a pathlib-style glob into path components.
+
+    Returns None for patterns that cannot match a file (e.g. a trailing
+    ``**``, which pathlib resolves to directories only).
+    """
+    parts = tuple(p for p in pattern.replace("\\", "/").split("/") if p and p != ".")
+    if not parts or parts[-1] == "**":
+        return None
+    return parts
+
+
+def _glob_match(pattern: tuple[str, ...], parts: tuple[str, ...]) -> bool:
+    """Match root-relative path components against a split glob.
+
+    ``**`` matches zero or more directories; every other component is an
+    fnmatch pattern that never crosses a ``/`` (same rules as Path.glob).
+    """
+    if not pattern:
+        return not parts
+    head = pattern[0]
+    if head == "**":
+        return any(_glob_match(pattern[1:], parts[i:]) for i in range(len(parts)))
+    return bool(parts) and fnmatch(parts[0], head) and _glob_match(pattern[1:], parts[1:])
+
+
+@dataclass(frozen=True)
+class _ScannedFile:
+    """A matched file as seen by one directory listing."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+    listing: frozenset[str]  # names in the containing directory
+    sidecar: str | None  # "<name>:<mtime_ns>" of the first matching sidecar
+
+
 class FilesystemImporter(BaseImporter):
     """
     Filesystem importer for discovering content from local file systems.
@@ -89,6 +149,8 @@ class FilesystemImporter(BaseImporter):
         calculate_hash: bool = False,
         inference_rules: dict[str, list[dict[str, Any]]] | None = None,
         tag_from_path_segments: bool = False,
+        manifest_path: str | None = None,
+        scan_workers: int = DEFAULT_SCAN_WORKERS,
     ):
         """
         Initialize the filesystem importer.
@@ -106,6 +168,10 @@ class FilesystemImporter(BaseImporter):
                 configured root and the file's parent (inclusive) is emitted as a
                 normalized ``tag:{component}`` label. Interstitial inference is skipped.
                 See: INV-INGEST-PATH-SEGMENT-TAG-001.
+            manifest_path: Optional path of a ScanManifest.  When set, files whose
+                size, mtime, inode and sidecar are unchanged since the last committed
+                scan are not emitted.  See commit_scan_manifest().
+            scan_workers: Threads used for directory listing, hashing and item creation.
         """
         super().__init__(
             source_name=source_name,
@@ -114,6 +180,8 @@ class FilesystemImporter(BaseImporter):
             include_hidden=include_hidden,
             calculate_hash=calculate_hash,
             inference_rules=inference_rules,
+            manifest_path=manifest_path,
+            scan_workers=scan_workers,
         )
 
         self.source_name = source_name
@@ -136,6 +204,17 @@ class FilesystemImporter(BaseImporter):
             inference_rules if inference_rules is not None else DEFAULT_INFERENCE_RULES
         )
         self.tag_from_path_segments: bool = tag_from_path_segments
+        self.manifest_path: str | None = manifest_path
+        self.scan_workers: int = max(1, int(scan_workers))
+        self._patterns = [p for p in map(_split_glob, self.glob_patterns) if p is not None]
+        # Deepest relative directory any pattern can reach (None = unbounded)
+        self._max_depth: int | None = (
+            None
+            if any("**" in p for p in self.glob_patterns)
+            else max((p.replace("\\", "/").count("/") for p in self.glob_patterns), default=0)
+        )
+        self._scan_context: str | None = None
+        self._staged_manifest: ScanManifest | None = None
 
     # ------------------------------------------------------------------
     # Collection discovery
@@ -180,6 +259,10 @@ class FilesystemImporter(BaseImporter):
         """
         Discover media files from the configured file system paths.
 
+        With a ``manifest_path``, only files that are new or changed since the
+        last committed scan are returned; the full scan result is staged for
+        commit_scan_manifest().
+
         Returns:
             List of discovered media files
 
@@ -187,8 +270,7 @@ class FilesystemImporter(BaseImporter):
             ImporterError: If discovery fails
         """
         try:
-            discovered_items = []
-
+            roots: list[Path] = []
             for root_path in self.root_paths:
                 root = Path(root_path).resolve()
 
@@ -198,18 +280,174 @@ class FilesystemImporter(BaseImporter):
                 if not root.is_dir():
                     raise ImporterError(f"Root path is not a directory: {root}")
 
-                for pattern in self.glob_patterns:
-                    for file_path in root.glob(pattern):
-                        if self._should_include_file(file_path):
-                            item = self._create_discovered_item(file_path)
-                            if item:
-                                discovered_items.append(item)
+                roots.append(root)
+
+            scanned = self._scan(roots)
+
+            previous = self._load_manifest()
+            staged: dict[str, ManifestEntry] = {}
+            changed: list[_ScannedFile] = []
+            for f in scanned:
+                key = str(f.path)
+                seen = ManifestEntry(f.size, f.mtime_ns, f.inode, None, f.sidecar)
+                prev = previous.entries.get(key) if previous is not None else None
+                if prev is not None and prev.same_file(seen):
+                    staged[key] = prev
+                else:
+                    changed.append(f)
+
+            with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+                created = list(pool.map(self._create_from_scan, changed))
+
+            discovered_items = []
+            for f, item in zip(changed, created):
+                if item is None:
+                    continue  # not staged: retried on the next scan
+                staged[str(f.path)] = ManifestEntry(
+                    f.size, f.mtime_ns, f.inode, item.hash_sha256, f.sidecar
+                )
+                discovered_items.append(item)
+
+            if self.manifest_path:
+                self._staged_manifest = ScanManifest(self.manifest_path, staged)
+                logger.info(
+                    "Filesystem scan %s: %d files, %d new or changed",
+                    self.source_name, len(scanned), len(discovered_items),
+                )
 
             return discovered_items
 
         except Exception as e:
             raise ImporterError(f"Failed to discover files: {str(e)}") from e
 
+    # ------------------------------------------------------------------
+    # Scan manifest
+    # ------------------------------------------------------------------
+
+    def set_scan_context(self, context: str | None) -> None:
+        """Tie the manifest to the consumer's state (e.g. enricher pipeline).
+
+        A manifest committed under a different context is ignored, so every
+        file is re-emitted.  ``None`` forces a full scan.
+        """
+        self._scan_context = context
+
+    def commit_scan_manifest(self) -> bool:
+        """Persist the manifest staged by the last discover().
+
+        INV-SCAN-MANIFEST-COMMIT-001: call only after the discovered items
+        have been durably ingested.  Returns True when a manifest was written.
+        """
+        staged, self._staged_manifest = self._staged_manifest, None
+        if staged is None or self._scan_context is None:
+            return False
+        staged.context = self._scan_context
+        staged.save()
+        return True
+
+    def _load_manifest(self) -> ScanManifest | None:
+        if not self.manifest_path or self._scan_context is None:
+            return None
+        manifest = ScanManifest.load(self.manifest_path)
+        if manifest.context != self._scan_context:
+            return None
+        return manifest
+
+    # ------------------------------------------------------------------
+    # Directory walk
+    # ------------------------------------------------------------------
+
+    def _matches(self, rel_path: str) -> bool:
+        parts = tuple(rel_path.split("/"))
+        return any(_glob_match(p, parts) for p in self._patterns)
+
+    def _scan(self, roots: list[Path]) -> list[_ScannedFile]:
+        """Walk all roots in parallel; return matched files sorted by path.
+
+        Each directory is listed once.  Symlinked directories are not
+        descended into; symlinked files are followed.
+        """
+        found: dict[str, _ScannedFile] = {}
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+            pending = set()
+            for root in roots:
+                if not self.include_hidden and any(part.startswith(".") for part in root.parts):
+                    continue
+                pending.add(pool.submit(self._scan_directory, str(root), "", 0))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    files, subdirs = fut.result()
+                    for f in files:
+                        found.setdefault(str(f.path), f)
+                    for path, rel, depth in subdirs:
+                        pending.add(pool.submit(self._scan_directory, path, rel, depth))
+        return [found[k] for k in sorted(found)]
+
+    def _scan_directory(
+        self, directory: str, rel: str, depth: int
+    ) -> tuple[list[_ScannedFile], list[tuple[str, str, int]]]:
+        """List one directory: matched files plus subdirectories to descend into."""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("Cannot list %s: %s", directory, e)
+            return [], []
+
+        listing = frozenset(e.name for e in entries)
+        files: list[_ScannedFile] = []
+        subdirs: list[tuple[str, str, int]] = []
+        for entry in entries:
+            if not self.include_hidden and entry.name.startswith("."):
+                continue
+            rel_path = rel + entry.name
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink() and (
+                        self._max_depth is None or depth < self._max_depth
+                    ):
+                        subdirs.append((entry.path, rel_path + "/", depth + 1))
+                    continue
+                if not self._matches(rel_path):
+                    continue
+                st = entry.stat()  # follows symlinks; broken links raise
+            except OSError:
+                continue
+            if not _stat.S_ISREG(st.st_mode):
+                continue
+            sidecar = self._find_sidecar(entry.name, listing)
+            sidecar_sig = None
+            if sidecar is not None:
+                try:
+                    sc_mtime = os.stat(os.path.join(directory, sidecar)).st_mtime_ns
+                    sidecar_sig = f"{sidecar}:{sc_mtime}"
+                except OSError:
+                    pass
+            files.append(
+                _ScannedFile(
+                    path=Path(entry.path),
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    inode=st.st_ino,
+                    listing=listing,
+                    sidecar=sidecar_sig,
+                )
+            )
+        return files, subdirs
+
+    @staticmethod
+    def _find_sidecar(file_name: str, listing: frozenset[str]) -> str | None:
+        for ext in SIDECAR_EXTENSIONS:
+            if file_name + ext in listing:
+                return file_name + ext
+        return None
+
+    def _create_from_scan(self, f: _ScannedFile) -> DiscoveredItem | None:
+        return self._create_discovered_item(
+            f.path, size=f.size, mtime_ns=f.mtime_ns, listing=f.listing
+        )
+
     # Contract hook used by collection ingest to validate ingestibility before discovery
     def validate_ingestible(self, collection: Collection) -> bool:
         """
@@ -379,6 +617,19 @@ class FilesystemImporter(BaseImporter):
                     ),
                     "default": "false",
                 },
+                {
+                    "name": "manifest_path",
+                    "description": (
+                        "Path of the scan manifest. When set, files unchanged since the "
+                        "last successful ingest are skipped during discovery."
+                    ),
+                    "default": "None (every scan emits every file)",
+                },
+                {
+                    "name": "scan_workers",
+                    "description": "Threads used for directory listing and file processing",
+                    "default": str(DEFAULT_SCAN_WORKERS),
+                },
             ],
             description="Scan local filesystem directories for media files and discover content",
         )
@@ -440,6 +691,22 @@ class FilesystemImporter(BaseImporter):
                 is_sensitive=False,
                 is_immutable=False,
             ),
+            UpdateFieldSpec(
+                config_key="manifest_path",
+                cli_flag="--manifest-path",
+                help="Scan manifest path enabling incremental discovery",
+                field_type="string",
+                is_sensitive=False,
+                is_immutable=False,
+            ),
+            UpdateFieldSpec(
+                config_key="scan_workers",
+                cli_flag="--scan-workers",
+                help="Threads used for directory listing and file processing",
+                field_type="integer",
+                is_sensitive=False,
+                is_immutable=False,
+            ),
         ]
 
     @classmethod
@@ -494,6 +761,16 @@ class FilesystemImporter(BaseImporter):
             if not isinstance(val, bool):
                 raise ImporterConfigurationError("tag_from_path_segments must be a boolean")
 
+        if "manifest_path" in partial_config:
+            val = partial_config["manifest_path"]
+            if val is not None and (not isinstance(val, str) or not val):
+                raise ImporterConfigurationError("manifest_path must be a non-empty string")
+
+        if "scan_workers" in partial_config:
+            val = partial_config["scan_workers"]
+            if isinstance(val, bool) or not isinstance(val, int) or val < 1:
+                raise ImporterConfigurationError("scan_workers must be a positive integer")
+
     def _validate_parameter_types(self) -> None:
         """
         Validate configuration parameter types and values.
@@ -544,6 +821,19 @@ class FilesystemImporter(BaseImporter):
                 "calculate_hash configuration parameter must be a boolean"
             )
 
+        # Validate manifest_path / scan_workers
+        manifest_path = self._safe_get_config("manifest_path")
+        if manifest_path is not None and (not isinstance(manifest_path, str) or not manifest_path):
+            raise ImporterConfigurationError(
+                "manifest_path configuration parameter must be a non-empty string"
+            )
+
+        scan_workers = self._safe_get_config("scan_workers", DEFAULT_SCAN_WORKERS)
+        if isinstance(scan_workers, bool) or not isinstance(scan_workers, int) or scan_workers < 1:
+            raise ImporterConfigurationError(
+                "scan_workers configuration parameter must be a positive integer"
+            )
+
     def _get_examples(self) -> list[str]:
         """
         Get example usage strings for the filesystem importer.
@@ -587,14 +877,7 @@ class FilesystemImporter(BaseImporter):
 
                 # For filesystem, each root path is an asset group
                 # Count files in this directory
-                file_count = 0
-                for pattern in self.glob_patterns:
-                    try:
-                        file_count += len(
-                            [f for f in root.glob(pattern) if self._should_include_file(f)]
-                        )
-                    except Exception:
-                        continue
+                file_count = len(self._scan([root]))
 
                 asset_groups.append(
                     {
@@ -697,35 +980,14 @@ class FilesystemImporter(BaseImporter):
         except Exception:
             return ""
 
-    def _should_include_file(self, file_path: Path) -> bool:
-        """
-        Determine if a file should be included in discovery.
-
-        Args:
-            file_path: Path to the file
-
-        Returns:
-            True if the file should be included
-        """
-        # Skip hidden files if not including them
-        if not self.include_hidden and any(part.startswith(".") for part in file_path.parts):
-            return False
-
-        # Skip directories
-        if file_path.is_dir():
-            return False
-
-        # Skip if file doesn't exist (broken symlinks, etc.)
-        if not file_path.exists():
-            return False
-
-        # Skip if not a file
-        if not file_path.is_file():
-            return False
-
-        return True
-
-    def _create_discovered_item(self, file_path: Path) -> DiscoveredItem | None:
+    def _create_discovered_item(
+        self,
+        file_path: Path,
+        *,
+        size: int | None = None,
+        mtime_ns: int | None = None,
+        listing: frozenset[str] | None = None,
+    ) -> DiscoveredItem | None:
         """
         Create a DiscoveredItem from a file path.
 
@@ -735,15 +997,20 @@ class FilesystemImporter(BaseImporter):
 
         Args:
             file_path: Path to the file
+            size: File size from the directory walk (stat()ed when omitted)
+            mtime_ns: Modification time from the directory walk
+            listing: Names in the file's directory; sidecars are looked up here
+                instead of probing the filesystem
 
         Returns:
             DiscoveredItem or None if creation fails
         """
         try:
             # Get file stats
-            stat = file_path.stat()
-            size = stat.st_size
-            last_modified = datetime.fromtimestamp(stat.st_mtime)
+            if size is None or mtime_ns is None:
+                st = file_path.stat()
+                size, mtime_ns = st.st_size, st.st_mtime_ns
+            last_modified = datetime.fromtimestamp(mtime_ns / 1e9)
 
             # Create file URI
             path_uri = f"file://{file_path.as_posix()}"
@@ -782,9 +1049,13 @@ class FilesystemImporter(BaseImporter):
             # Try loading a JSON/YAML sidecar adjacent to the file
             sidecar: dict[str, Any] | None = None
             try:
-                for ext in (".retrovue.json", ".json", ".yaml", ".yml"):
-                    candidate = file_path.with_suffix(file_path.suffix + ext) if ext.startswith(".") else None
-                    if candidate and candidate.exists():
+                for ext in SIDECAR_EXTENSIONS:
+                    candidate = file_path.with_suffix(file_path.suffix + ext)
+                    if (
+                        candidate.name in listing
+                        if listing is not None
+                        else candidate.exists()
+                    ):
                         if candidate.suffix.lower() in (".json", ".retrovue.json"):
                             import json as _json
                             with candidate.open("r", encoding="utf-8") as fp:
@@ -810,7 +1081,7 @@ class FilesystemImporter(BaseImporter):
 
         except Exception as e:
             # Log error but continue with other files
-            print(f"Warning: Failed to process file {file_path}: {e}")
+            logger.warning("Failed to process file %s: %s", file_path, e)
             return None
 
     def _calculate_file_hash(self, file_path: Path) -> str:
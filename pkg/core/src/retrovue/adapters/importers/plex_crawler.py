@@ -0,0 +1,280 @@
+"""
+Plex library crawler — paginated, flattened, bounded-concurrency enumeration.
+
+PlexClient used to walk show → season → episode with one blocking request
+per node, so a large TV library cost (shows + seasons) sequential round
+trips.  The crawler instead:
+
+    - reads episodes from flattened endpoints: ``/library/sections/{key}/all?type=4``
+      for a whole library, ``/library/metadata/{show}/allLeaves`` for one show
+    - pages every container with X-Plex-Container-Start/Size; the first
+      page reports ``totalSize`` and the remaining pages are fetched
+      concurrently (at most ``max_workers`` requests in flight)
+    - filters on ``updatedAt`` server-side (``updatedAt>>=``) and
+      client-side, so an incremental sync only transfers changed items
+
+All requests go through the owning PlexClient's pooled requests.Session,
+so connections are reused across pages and workers.
+
+Incremental sync state (PlexSyncState) keeps the highest ``updatedAt`` seen
+per library.  Like the filesystem ScanManifest it is staged by discover()
+and only committed after the ingest that consumed it has been persisted
+(INV-SCAN-MANIFEST-COMMIT-001) and is keyed by a consumer context
+(INV-SCAN-MANIFEST-CONTEXT-001).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .plex_importer import PlexClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 200
+DEFAULT_MAX_WORKERS = 8
+
+# Plex metadata type codes for ``/library/sections/{key}/all?type=``
+PLEX_TYPE_SHOW = 2
+PLEX_TYPE_EPISODE = 4
+
+SYNC_STATE_FORMAT_VERSION = 1
+
+
+def _parse_video(video: ET.Element, show_title: str | None = None) -> dict[str, Any] | None:
+    """Convert a <Video> element into the PlexClient item dict (None without a file)."""
+    rating_key = video.get("ratingKey")
+    title = video.get("title")
+    file_path = None
+    file_size = None
+    duration = None
+    media = video.find("Media")
+    if media is not None:
+        part = media.find("Part")
+        if part is not None:
+            file_path = part.get("file")
+            file_size = part.get("size")
+        duration = media.get("duration")
+    if not (rating_key and title and file_path):
+        return None
+
+    item: dict[str, Any] = {
+        "ratingKey": rating_key,
+        "title": title,
+        "year": video.get("year"),
+        "type": video.get("type"),
+        "file_path": file_path,
+        "fileSize": file_size,
+        "duration": duration,
+        "updatedAt": video.get("updatedAt"),
+    }
+    if video.get("type") == "episode":
+        item["show_title"] = video.get("grandparentTitle") or show_title
+        item["season_title"] = video.get("parentTitle")
+        item["season_index"] = video.get("parentIndex")
+        item["episode_index"] = video.get("index")
+    return item
+
+
+def _updated_at(el: ET.Element | dict[str, Any]) -> int:
+    try:
+        return int(el.get("updatedAt") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class PlexLibraryCrawler:
+    """Enumerates a Plex library's playable items with paged, concurrent requests."""
+
+    def __init__(
+        self,
+        client: PlexClient,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.client = client
+        self.page_size = max(1, int(page_size))
+        self.max_workers = max(1, int(max_workers))
+
+    # ------------------------------------------------------------------
+    # Paging
+    # ------------------------------------------------------------------
+
+    def fetch_container(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        pool: ThreadPoolExecutor | None = None,
+    ) -> tuple[ET.Element, list[ET.Element]]:
+        """Fetch every page of a MediaContainer.
+
+        Returns (first page root, children of all pages in server order).
+        With *pool*, pages after the first are requested concurrently.
+        """
+        first = self.client.get_container_page(path, 0, self.page_size, params)
+        children = list(first)
+        total = first.get("totalSize")
+        if total is None or len(children) < self.page_size:
+            return first, children
+
+        offsets = range(len(children), int(total), self.page_size)
+
+        def _page(start: int) -> list[ET.Element]:
+            return list(self.client.get_container_page(path, start, self.page_size, params))
+
+        pages = pool.map(_page, offsets) if pool is not None else map(_page, offsets)
+        for page in pages:
+            children.extend(page)
+        return first, children
+
+    # ------------------------------------------------------------------
+    # Libraries
+    # ------------------------------------------------------------------
+
+    def library_type(self, library_key: str) -> str:
+        """Return the section type ("show", "movie", ...) with a zero-size request."""
+        root = self.client.get_container_page(f"/library/sections/{library_key}/all", 0, 0)
+        return root.get("viewGroup") or root.get("type") or ""
+
+    def crawl_library(
+        self,
+        library_key: str,
+        *,
+        library_type: str | None = None,
+        title_filter: str | None = None,
+        season_filter: int | None = None,
+        episode_filter: int | None = None,
+        updated_since: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return item dicts for every playable item in a library.
+
+        ``updated_since`` (epoch seconds, inclusive) restricts the result to
+        items whose ``updatedAt`` is at or after that time.
+        """
+        if library_type is None:
+            library_type = self.library_type(library_key)
+
+        since_params: dict[str, Any] = {}
+        if updated_since:
+            since_params["updatedAt>>"] = int(updated_since)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            if library_type == "show":
+                videos = self._library_episodes(
+                    library_key, title_filter, since_params, pool
+                )
+            else:
+                _, videos = self.fetch_container(
+                    f"/library/sections/{library_key}/all", since_params, pool=pool
+                )
+
+        items: list[dict[str, Any]] = []
+        for video in videos:
+            if video.tag != "Video":
+                continue
+            if updated_since and _updated_at(video) < updated_since:
+                continue
+            item = _parse_video(video)
+            if item is None:
+                continue
+            if season_filter is not None and item.get("season_index") is not None:
+                if int(item["season_index"]) != season_filter:
+                    continue
+            if episode_filter is not None and item.get("episode_index") is not None:
+                if int(item["episode_index"]) != episode_filter:
+                    continue
+            items.append(item)
+        return items
+
+    def _library_episodes(
+        self,
+        library_key: str,
+        title_filter: str | None,
+        since_params: dict[str, Any],
+        pool: ThreadPoolExecutor,
+    ) -> list[ET.Element]:
+        if title_filter is None:
+            _, videos = self.fetch_container(
+                f"/library/sections/{library_key}/all",
+                {"type": PLEX_TYPE_EPISODE, **since_params},
+                pool=pool,
+            )
+            return videos
+
+        # Scoped: match shows by title, then flatten each match with allLeaves.
+        _, shows = self.fetch_container(
+            f"/library/sections/{library_key}/all", {"type": PLEX_TYPE_SHOW}, pool=pool
+        )
+        needle = title_filter.lower()
+        keys = [
+            s.get("ratingKey")
+            for s in shows
+            if s.get("ratingKey") and needle in (s.get("title") or "").lower()
+        ]
+        # Pages within one show stay sequential: the pool is busy with shows.
+        leaves = pool.map(
+            lambda rk: self.fetch_container(f"/library/metadata/{rk}/allLeaves", since_params)[1],
+            keys,
+        )
+        return [v for videos in leaves for v in videos]
+
+
+class PlexSyncState:
+    """Per-library ``updatedAt`` high-water marks for incremental Plex sync."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        libraries: dict[str, int] | None = None,
+        context: str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.libraries: dict[str, int] = libraries if libraries is not None else {}
+        self.context = context
+
+    @classmethod
+    def load(cls, path: str | Path) -> PlexSyncState:
+        """Read sync state from disk.  Missing or invalid files load empty."""
+        p = Path(path)
+        try:
+            raw = json.loads(p.read_text(encoding="utf-8"))
+            if raw.get("version") != SYNC_STATE_FORMAT_VERSION:
+                return cls(p)
+            libraries = {str(k): int(v) for k, v in raw.get("libraries", {}).items()}
+            return cls(p, libraries, raw.get("context"))
+        except FileNotFoundError:
+            return cls(p)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable Plex sync state %s: %s", p, e)
+            return cls(p)
+
+    def save(self) -> None:
+        """Write the state atomically (temp file + os.replace)."""
+        body = {
+            "version": SYNC_STATE_FORMAT_VERSION,
+            "context": self.context,
+            "libraries": self.libraries,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(body, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
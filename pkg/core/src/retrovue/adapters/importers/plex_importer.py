@@ -9,7 +9,10 @@ from __future__ import annotations
 import warnings
 
 import logging
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import requests
@@ -25,6 +28,12 @@ from .base import (
     ImporterError,
     UpdateFieldSpec,
 )
+from .plex_crawler import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PAGE_SIZE,
+    PlexLibraryCrawler,
+    PlexSyncState,
+)
 
 if TYPE_CHECKING:
     from ...domain.entities import Collection
@@ -35,18 +44,30 @@ logger = logging.getLogger(__name__)
 class PlexClient:
     """Plex HTTP client for fetching libraries and items."""
 
-    def __init__(self, base_url: str, token: str, library_key: str | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        library_key: str | None = None,
+        *,
+        pool_size: int = DEFAULT_MAX_WORKERS,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
         """
         Initialize Plex client.
 
         Args:
             base_url: Plex server base URL (e.g., "http://127.0.0.1:32400")
             token: Plex authentication token
+            pool_size: Concurrent requests (and pooled keep-alive connections)
+            page_size: X-Plex-Container-Size used when paging library listings
         """
         # Be resilient to accidental whitespace/newlines
         self.base_url = base_url.strip().rstrip("/")
         self.token = token.strip()
+        self.pool_size = max(1, int(pool_size))
         self.session = self._create_session()
+        self.crawler = PlexLibraryCrawler(self, page_size=page_size, max_workers=self.pool_size)
 
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry logic and Plex headers."""
@@ -62,7 +83,12 @@ class PlexClient:
             status_forcelist=[429, 500, 502, 503, 504],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One keep-alive connection per concurrent crawler worker
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -132,18 +158,66 @@ class PlexClient:
         except requests.RequestException as e:
             raise ImporterError(f"Failed to fetch libraries: {e}") from e
 
+    def get_container_page(
+        self,
+        path: str,
+        start: int,
+        size: int,
+        params: dict[str, Any] | None = None,
+    ) -> ET.Element:
+        """
+        Fetch one page of a MediaContainer.
+
+        Args:
+            path: Endpoint path (e.g. "/library/sections/1/all")
+            start: X-Plex-Container-Start
+            size: X-Plex-Container-Size (0 returns only container attributes)
+            params: Extra query parameters (filters such as ``type``)
+
+        Returns:
+            The parsed MediaContainer root element
+
+        Raises:
+            ImporterError: If the request fails
+        """
+        try:
+            query: dict[str, Any] = {"X-Plex-Token": self.token, **(params or {})}
+            headers = {
+                "X-Plex-Token": self.token,
+                "X-Plex-Container-Start": str(start),
+                "X-Plex-Container-Size": str(size),
+            }
+            response = self.session.get(
+                f"{self.base_url}{path}", params=query, headers=headers, timeout=20
+            )
+            response.raise_for_status()
+            return ET.fromstring(response.content)
+        except requests.RequestException as e:
+            raise ImporterError(f"Failed to fetch {path}: {e}") from e
+
     def get_library_items(
         self,
         library_key: str,
         title_filter: str | None = None,
         season_filter: int | None = None,
         episode_filter: int | None = None,
+        *,
+        library_type: str | None = None,
+        updated_since: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all items from a specific library.
 
+        TV libraries are read from flattened episode listings rather than
+        show → season → episode; see PlexLibraryCrawler.
+
         Args:
             library_key: The library key to fetch items from
+            title_filter: Case-insensitive show title substring
+            season_filter: Season number
+            episode_filter: Episode number
+            library_type: Section type if already known (saves one request)
+            updated_since: Only items with updatedAt >= this epoch second
 
         Returns:
             List of item information dictionaries
@@ -152,173 +226,17 @@ class PlexClient:
             ImporterError: If the request fails
         """
         try:
-            # Get library content to determine type
-            url = f"{self.base_url}/library/sections/{library_key}/all"
-            params = {"X-Plex-Token": self.token}
-            headers = {"X-Plex-Token": self.token}
-            response = self.session.get(url, params=params, headers=headers, timeout=20)
-            response.raise_for_status()
-
-            import xml.etree.ElementTree as ET
-
-            root = ET.fromstring(response.content)
-            library_type = root.get("type", "")
-            view_group = root.get("viewGroup", "")
-
-            items = []
-
-            # If it's a TV show library, drill down to get episodes
-            if library_type == "show" or view_group == "show":
-                # Use the shows we already have from the root
-                shows = root.findall("Directory")
-
-                # For each show, get its seasons and episodes
-                for show in shows:
-                    show_key = show.get("ratingKey")
-                    show_title = show.get("title")
-
-                    # Apply title filter if specified
-                    if (
-                        title_filter is not None
-                        and show_title is not None
-                        and title_filter.lower() not in show_title.lower()
-                    ):
-                        continue
-
-                    # Get seasons for this show
-                    seasons_url = f"{self.base_url}/library/metadata/{show_key}/children"
-                    seasons_response = self.session.get(
-                        seasons_url, params=params, headers={"X-Plex-Token": self.token}, timeout=20
-                    )
-                    seasons_response.raise_for_status()
-
-                    seasons_root = ET.fromstring(seasons_response.content)
-                    seasons = seasons_root.findall("Directory")
-
-                    # For each season, get its episodes
-                    for season in seasons:
-                        season_key = season.get("ratingKey")
-                        season_title = season.get("title")
-                        season_index = season.get("index")
-
-                        # Skip seasons without valid rating key
-                        if not season_key:
-                            continue
-
-                        # Apply season filter if specified
-                        if (
-                            season_filter is not None
-                            and season_index is not None
-                            and int(season_index) != season_filter
-                        ):
-                            continue
-
-                        # Get episodes for this season
-                        episodes_url = f"{self.base_url}/library/metadata/{season_key}/children"
-                        episodes_response = self.session.get(
-                            episodes_url,
-                            params=params,
-                            headers={"X-Plex-Token": self.token},
-                            timeout=20,
-                        )
-                        episodes_response.raise_for_status()
-
-                        episodes_root = ET.fromstring(episodes_response.content)
-                        episodes = episodes_root.findall("Video")
-
-                        # Process each episode
-                        for episode in episodes:
-                            rating_key = episode.get("ratingKey")
-                            title = episode.get("title")
-                            year = episode.get("year")
-                            type_attr = episode.get("type")
-                            episode_index = episode.get("index")
-
-                            # Apply episode filter if specified
-                            if (
-                                episode_filter is not None
-                                and episode_index is not None
-                                and int(episode_index) != episode_filter
-                            ):
-                                continue
-
-                            # Get file information
-                            media = episode.find("Media")
-                            file_path = None
-                            file_size = None
-                            duration = None
-
-                            if media is not None:
-                                part = media.find("Part")
-                                if part is not None:
-                                    file_path = part.get("file")
-                                    file_size = part.get("size")
-                                duration = media.get("duration")
-
-                            if rating_key and title and file_path:
-                                items.append(
-                                    {
-                                        "ratingKey": rating_key,
-                                        "title": title,
-                                        "year": year,
-                                        "type": type_attr,
-                                        "file_path": file_path,
-                                        "fileSize": file_size,
-                                        "duration": duration,
-                                        "updatedAt": episode.get("updatedAt"),
-                                        "show_title": show_title,
-                                        "season_title": season_title,
-                                        "season_index": season_index,
-                                        "episode_index": episode.get("index"),
-                                    }
-                                )
-            else:
-                # For movie libraries, get movies directly
-                url = f"{self.base_url}/library/sections/{library_key}/all"
-                response = self.session.get(
-                    url, params=params, headers={"X-Plex-Token": self.token}, timeout=20
-                )
-                response.raise_for_status()
-
-                root = ET.fromstring(response.content)
-
-                # Handle Video elements (movies)
-                for video in root.findall("Video"):
-                    rating_key = video.get("ratingKey")
-                    title = video.get("title")
-                    year = video.get("year")
-                    type_attr = video.get("type")
-
-                    # Get file information
-                    media = video.find("Media")
-                    file_path = None
-                    file_size = None
-                    duration = None
-
-                    if media is not None:
-                        part = media.find("Part")
-                        if part is not None:
-                            file_path = part.get("file")
-                            file_size = part.get("size")
-                        duration = media.get("duration")
-
-                    if rating_key and title and file_path:
-                        items.append(
-                            {
-                                "ratingKey": rating_key,
-                                "title": title,
-                                "year": year,
-                                "type": type_attr,
-                                "file_path": file_path,
-                                "fileSize": file_size,
-                                "duration": duration,
-                                "updatedAt": video.get("updatedAt"),
-                            }
-                        )
-
-            return items
-
-        except requests.RequestException as e:
+            return self.crawler.crawl_library(
+                library_key,
+                library_type=library_type,
+                title_filter=title_filter,
+                season_filter=season_filter,
+                episode_filter=episode_filter,
+                updated_since=updated_since,
+            )
+        except ImporterError:
+            raise
+        except (requests.RequestException, ET.ParseError) as e:
             raise ImporterError(f"Failed to fetch library items: {e}") from e
 
     def get_metadata(self, rating_key: int) -> dict[str, Any]:
@@ -784,27 +702,55 @@ class PlexImporter(BaseImporter):
 
     name = "plex"
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        manifest_path: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
         """
         Initialize the Plex importer.
 
         Args:
             base_url: Plex server base URL
             token: Plex authentication token
+            manifest_path: Optional directory for PlexSyncState files (one per library
+                scope).  When set, discovery only returns items whose updatedAt is at
+                or after the last committed sync.
+            max_workers: Concurrent requests to the Plex server
+            page_size: Items per X-Plex-Container page
         """
         # Normalize early so both BaseImporter and client get clean values
         cleaned_base_url = base_url.strip()
         cleaned_token = token.strip()
-        super().__init__(base_url=cleaned_base_url, token=cleaned_token)
+        super().__init__(
+            base_url=cleaned_base_url,
+            token=cleaned_token,
+            manifest_path=manifest_path,
+            max_workers=max_workers,
+            page_size=page_size,
+        )
         self.base_url = cleaned_base_url
         self.token = cleaned_token
-        self.client = PlexClient(cleaned_base_url, cleaned_token)
+        self.manifest_path = manifest_path
+        self.max_workers = max(1, int(max_workers))
+        self.client = PlexClient(
+            cleaned_base_url, cleaned_token, pool_size=self.max_workers, page_size=page_size
+        )
         self.library_key: str | None = None  # Set externally via attribute assignment
+        self._scan_context: str | None = None
+        self._staged_sync_state: PlexSyncState | None = None
 
     def discover(self) -> list[DiscoveredItem]:
         """
         Discover content items from the Plex server.
 
+        With a ``manifest_path``, each library is only read from its last
+        committed ``updatedAt`` high-water mark; the new marks are staged for
+        commit_scan_manifest().
+
         Returns:
             List of discovered content items
 
@@ -817,7 +763,6 @@ class PlexImporter(BaseImporter):
             if not self._test_connection():
                 raise ImporterConnectionError("Cannot connect to Plex server")
 
-            discovered_items = []
             libraries = self.client.get_libraries()
             # If scoped to a specific library, filter to that key
             if self.library_key is not None:
@@ -825,22 +770,80 @@ class PlexImporter(BaseImporter):
                     lib for lib in libraries if str(lib.get("key")) == str(self.library_key)
                 ]
 
+            previous = self._load_sync_state()
+            staged = dict(previous.libraries) if previous is not None else {}
+            discovered_items: list[DiscoveredItem] = []
             for library in libraries:
+                key = str(library["key"])
+                since = previous.libraries.get(key) if previous is not None else None
                 try:
-                    items = self.client.get_library_items(library["key"])
-                    for item in items:
-                        discovered_item = self._create_discovered_item(item, library)
-                        if discovered_item:
-                            discovered_items.append(discovered_item)
+                    items = self.client.get_library_items(
+                        key, library_type=library.get("type"), updated_since=since
+                    )
+                    discovered_items.extend(self._create_discovered_items(items, library))
                 except Exception as e:
                     logger.warning(f"Failed to discover items from library {library['title']}: {e}")
+                    staged.pop(key, None)  # next sync re-reads this library in full
                     continue
+                newest = max((int(i.get("updatedAt") or 0) for i in items), default=0)
+                if newest or since:
+                    staged[key] = max(newest, since or 0)
+
+            if self.manifest_path:
+                self._staged_sync_state = PlexSyncState(self._sync_state_path(), staged)
 
             return discovered_items
 
         except Exception as e:
             raise ImporterError(f"Failed to discover content from Plex: {str(e)}") from e
 
+    def _create_discovered_items(
+        self, items: list[dict[str, Any]], library: dict[str, Any]
+    ) -> list[DiscoveredItem]:
+        """Build DiscoveredItems concurrently (each needs a metadata request)."""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            created = pool.map(lambda item: self._create_discovered_item(item, library), items)
+            return [di for di in created if di]
+
+    # ------------------------------------------------------------------
+    # Incremental sync state
+    # ------------------------------------------------------------------
+
+    def set_scan_context(self, context: str | None) -> None:
+        """Tie sync state to the consumer's state; ``None`` forces a full sync.
+
+        See INV-SCAN-MANIFEST-CONTEXT-001.
+        """
+        self._scan_context = context
+
+    def commit_scan_manifest(self) -> bool:
+        """Persist the sync state staged by the last discover().
+
+        INV-SCAN-MANIFEST-COMMIT-001: call only after the discovered items
+        have been durably ingested.  Returns True when state was written.
+        """
+        staged, self._staged_sync_state = self._staged_sync_state, None
+        if staged is None or self._scan_context is None:
+            return False
+        staged.context = self._scan_context
+        staged.save()
+        return True
+
+    def _sync_state_path(self) -> Path:
+        # Collections of one source are separate libraries; keep their marks apart.
+        scope = self.library_key if self.library_key is not None else "all"
+        return Path(str(self.manifest_path)) / f"library-{scope}.json"
+
+    def _load_sync_state(self) -> PlexSyncState | None:
+        if not self.manifest_path or self._scan_context is None:
+            return None
+        state = PlexSyncState.load(self._sync_state_path())
+        if state.context != self._scan_context:
+            return None
+        return state
+
     # Optional fast path for targeted ingest
     def discover_scoped(
         self, *, title: str | None = None, season: int | None = None, episode: int | None = None
@@ -862,10 +865,11 @@ class PlexImporter(BaseImporter):
                     season_filter=season,
                     episode_filter=episode,
                 )
-                for item in items:
-                    di = self._create_discovered_item(item, {"title": "scoped", "key": self.library_key})
-                    if di:
-                        discovered_items.append(di)
+                discovered_items.extend(
+                    self._create_discovered_items(
+                        items, {"title": "scoped", "key": self.library_key}
+                    )
+                )
                 return discovered_items
 
             # Fallback: try series search path when full library filter isn't available
@@ -933,7 +937,26 @@ class PlexImporter(BaseImporter):
                 },
                 {"name": "token", "description": "Plex authentication token"},
             ],
-            optional_params=[],
+            optional_params=[
+                {
+                    "name": "manifest_path",
+                    "description": (
+                        "Directory for incremental sync state. When set, only items updated "
+                        "since the last successful ingest are discovered."
+                    ),
+                    "default": "None (every sync reads every item)",
+                },
+                {
+                    "name": "max_workers",
+                    "description": "Concurrent requests to the Plex server",
+                    "default": str(DEFAULT_MAX_WORKERS),
+                },
+                {
+                    "name": "page_size",
+                    "description": "Items per X-Plex-Container page",
+                    "default": str(DEFAULT_PAGE_SIZE),
+                },
+            ],
             description="Connect to Plex Media Server instances and discover content from their libraries",
         )
 
@@ -970,6 +993,30 @@ class PlexImporter(BaseImporter):
                 is_sensitive=False,
                 is_immutable=False,
             ),
+            UpdateFieldSpec(
+                config_key="manifest_path",
+                cli_flag="--manifest-path",
+                help="Sync state directory enabling incremental (updatedAt) discovery",
+                field_type="string",
+                is_sensitive=False,
+                is_immutable=False,
+            ),
+            UpdateFieldSpec(
+                config_key="max_workers",
+                cli_flag="--max-workers",
+                help="Concurrent requests to the Plex server",
+                field_type="integer",
+                is_sensitive=False,
+                is_immutable=False,
+            ),
+            UpdateFieldSpec(
+                config_key="page_size",
+                cli_flag="--page-size",
+                help="Items per X-Plex-Container page",
+                field_type="integer",
+                is_sensitive=False,
+                is_immutable=False,
+            ),
         ]
 
     @classmethod
@@ -1002,6 +1049,17 @@ class PlexImporter(BaseImporter):
             if not isinstance(servers, list):
                 raise ImporterConfigurationError("servers must be a JSON array")
 
+        if "manifest_path" in partial_config:
+            val = partial_config["manifest_path"]
+            if val is not None and (not isinstance(val, str) or not val):
+                raise ImporterConfigurationError("manifest_path must be a non-empty string")
+
+        for key in ("max_workers", "page_size"):
+            if key in partial_config:
+                val = partial_config[key]
+                if isinstance(val, bool) or not isinstance(val, int) or val < 1:
+                    raise ImporterConfigurationError(f"{key} must be a positive integer")
+
     def _validate_parameter_types(self) -> None:
         """
         Validate configuration parameter types and values.
@@ -1028,6 +1086,13 @@ class PlexImporter(BaseImporter):
                 "token configuration parameter must be a non-empty string"
             )
 
+        for key, default in (("max_workers", DEFAULT_MAX_WORKERS), ("page_size", DEFAULT_PAGE_SIZE)):
+            val = self._safe_get_config(key, default)
+            if isinstance(val, bool) or not isinstance(val, int) or val < 1:
+                raise ImporterConfigurationError(
+                    f"{key} configuration parameter must be a positive integer"
+                )
+
     def _get_examples(self) -> list[str]:
         """
         Get example usage strings for the Plex importer.
@@ -0,0 +1,123 @@
+"""
+Scan manifest — what a filesystem source looked like at the last ingest.
+
+FilesystemImporter records, per discovered file, the stat signature it
+saw (size, mtime_ns, inode), the SHA-256 it computed (if any) and a
+signature of the adjacent sidecar.  On the next scan a file whose
+signature is unchanged is skipped before any per-file work happens;
+only new or modified files become DiscoveredItems.
+
+File format (JSON)::
+
+    {"version": 1,
+     "context": "<consumer state, e.g. collection + enricher pipeline>",
+     "entries": {"/abs/path.mkv": [size, mtime_ns, inode, hash|null, sidecar|null]}}
+
+Invariants:
+    INV-SCAN-MANIFEST-COMMIT-001: discover() never writes the manifest.
+    The scan result is staged and only committed once the ingest that
+    consumed it has been persisted, so a failed or rolled-back ingest
+    re-emits the same files on the next scan.
+
+    INV-SCAN-MANIFEST-CONTEXT-001: A manifest is only trusted when its
+    context matches the consumer's current one.  Changing the enricher
+    pipeline (or wiping the collection) therefore re-emits every file.
+
+    INV-SCAN-MANIFEST-ATOMIC-001: The manifest is written to a temp file
+    and renamed into place.  A missing or corrupt manifest is treated as
+    empty (full scan), never as an error.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Stat signature of one file at scan time."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    hash_sha256: str | None = None
+    sidecar: str | None = None  # "<name>:<mtime_ns>" of the matched sidecar
+
+    def same_file(self, other: ManifestEntry) -> bool:
+        """True when *other* describes the same file contents (hash excluded)."""
+        return (
+            self.size == other.size
+            and self.mtime_ns == other.mtime_ns
+            and self.inode == other.inode
+            and self.sidecar == other.sidecar
+        )
+
+
+class ScanManifest:
+    """Persisted path → ManifestEntry map for one filesystem source."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        entries: dict[str, ManifestEntry] | None = None,
+        context: str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.entries: dict[str, ManifestEntry] = entries if entries is not None else {}
+        self.context = context
+
+    @classmethod
+    def load(cls, path: str | Path) -> ScanManifest:
+        """Read a manifest from disk.  Missing or invalid files load empty."""
+        p = Path(path)
+        try:
+            raw = json.loads(p.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(p)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable scan manifest %s: %s", p, e)
+            return cls(p)
+        if not isinstance(raw, dict) or raw.get("version") != MANIFEST_FORMAT_VERSION:
+            logger.info("Scan manifest %s has an unknown format; rescanning", p)
+            return cls(p)
+        entries: dict[str, ManifestEntry] = {}
+        try:
+            for file_path, row in raw.get("entries", {}).items():
+                entries[file_path] = ManifestEntry(*row)
+        except (TypeError, ValueError) as e:
+            logger.warning("Ignoring corrupt scan manifest %s: %s", p, e)
+            return cls(p)
+        return cls(p, entries, raw.get("context"))
+
+    def save(self) -> None:
+        """Write the manifest atomically (INV-SCAN-MANIFEST-ATOMIC-001)."""
+        body = {
+            "version": MANIFEST_FORMAT_VERSION,
+            "context": self.context,
+            "entries": {
+                k: [e.size, e.mtime_ns, e.inode, e.hash_sha256, e.sidecar]
+                for k, e in self.entries.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(body, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
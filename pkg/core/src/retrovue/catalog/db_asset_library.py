@@ -20,20 +20,19 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from retrovue.catalog.traffic_play_history import (
+    TrafficPlay,
+    TrafficPlayBuffer,
+    TrafficPlayHistory,
+    get_traffic_play_history,
+)
 from retrovue.runtime.planning_pipeline import FillerAsset, MarkerInfo
-
-
-# Default traffic policy when no YAML config exists
-DEFAULT_TRAFFIC_POLICY: dict[str, Any] = {
-    "allowed_types": ["commercial", "promo", "station_id", "psa",
-                       "stinger", "bumper", "filler"],
-    "default_cooldown_seconds": 3600,
-    "type_cooldowns": {},
-    "max_plays_per_day": 0,
-}
+from retrovue.runtime.providers.yaml_channel_config_provider import (
+    DEFAULT_TRAFFIC_POLICY,  # re-exported: default when no YAML config exists
+    shared_provider,
+)
 
 # Where channel YAML configs live
 CHANNEL_CONFIG_DIR = Path("/opt/retrovue/config/channels")
@@ -43,32 +42,13 @@ def _load_channel_traffic_policy(
     channel_slug: str,
     config_dir: Path = CHANNEL_CONFIG_DIR,
 ) -> dict[str, Any]:
-    """Load traffic policy from channel YAML config.
+    """Traffic policy for a channel from the shared config snapshot.
 
-    Uses the same !include-aware loader as the rest of RetroVue.
-    Falls back to _defaults.yaml, then hardcoded defaults.
+    _defaults.yaml `traffic` overlaid by the channel YAML `traffic`, falling
+    back to hardcoded defaults.  Parsing happens once per config change
+    (see YamlChannelConfigProvider); this is a dictionary read.
     """
-    from retrovue.runtime.providers.yaml_channel_config_provider import (
-        _load_yaml_with_includes,
-    )
-
-    policy = dict(DEFAULT_TRAFFIC_POLICY)
-
-    # Try loading defaults first
-    defaults_path = config_dir / "_defaults.yaml"
-    if defaults_path.exists():
-        defaults = _load_yaml_with_includes(defaults_path)
-        if "traffic" in defaults:
-            policy.update(defaults["traffic"])
-
-    # Then overlay channel-specific config
-    channel_path = config_dir / f"{channel_slug}.yaml"
-    if channel_path.exists():
-        channel_cfg = _load_yaml_with_includes(channel_path)
-        if "traffic" in channel_cfg:
-            policy.update(channel_cfg["traffic"])
-
-    return policy
+    return shared_provider(config_dir).get_traffic_policy(channel_slug)
 
 
 class DatabaseAssetLibrary:
@@ -84,6 +64,7 @@ class DatabaseAssetLibrary:
         channel_slug: str | None = None,
         interstitial_collection_name: str = "Interstitials",
         config_dir: Path | str | None = None,
+        play_history: TrafficPlayHistory | None = None,
     ) -> None:
         self._db = db
         self._channel_slug = channel_slug
@@ -91,6 +72,9 @@ class DatabaseAssetLibrary:
         self._config_dir = Path(config_dir) if config_dir else CHANNEL_CONFIG_DIR
         self._interstitial_collection_uuid: str | None = None
         self._policy: dict | None = None
+        self._play_history = play_history
+        # Plays logged by this library's fill, answered until its session commits
+        self._play_buffer = TrafficPlayBuffer()
 
     def _get_interstitial_collection_uuid(self) -> str | None:
         if self._interstitial_collection_uuid is not None:
@@ -118,72 +102,27 @@ class DatabaseAssetLibrary:
 
         return self._policy
 
-    def _get_cooled_down_uris(self) -> set[str]:
-        """Get asset URIs still in cooldown on this channel (from DB)."""
-        if not self._channel_slug:
-            return set()
+    def _get_play_history(self, air_time: datetime) -> TrafficPlayHistory | None:
+        """This channel's play window around *air_time*: the longest cooldown and its day.
 
-        from retrovue.domain.entities import TrafficPlayLog
+        INV-TRAFFIC-PLAY-HISTORY-001: replaces the per-pick traffic_play_log
+        queries for cooldowns and daily caps.
+        """
+        if not self._channel_slug:
+            return None
+        if self._play_history is None:
+            self._play_history = get_traffic_play_history(self._channel_slug)
 
         policy = self._get_channel_policy()
         max_cooldown = max(
             policy.get("default_cooldown_seconds", 3600),
             max((policy.get("type_cooldowns") or {}).values(), default=0),
+            0,
         )
-        if max_cooldown <= 0:
-            return set()
-
-        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_cooldown)
-
-        recent_plays = self._db.query(
-            TrafficPlayLog.asset_uri,
-            TrafficPlayLog.asset_type,
-            TrafficPlayLog.played_at,
-        ).filter(
-            TrafficPlayLog.channel_slug == self._channel_slug,
-            TrafficPlayLog.played_at >= cutoff,
-        ).all()
-
-        cooled = set()
-        now = datetime.now(timezone.utc)
-        type_cooldowns = policy.get("type_cooldowns") or {}
-        default_cd = policy.get("default_cooldown_seconds", 3600)
-
-        for uri, asset_type, played_at in recent_plays:
-            cooldown_secs = type_cooldowns.get(asset_type, default_cd)
-            if (now - played_at).total_seconds() < cooldown_secs:
-                cooled.add(uri)
-
-        return cooled
-
-    def _get_daily_capped_uuids(self) -> set[str]:
-        """Get asset UUIDs that hit their daily play cap on this channel."""
-        if not self._channel_slug:
-            return set()
-
-        policy = self._get_channel_policy()
-        cap = policy.get("max_plays_per_day", 0)
-        if cap <= 0:
-            return set()
-
-        from retrovue.domain.entities import TrafficPlayLog
-
-        today_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        capped = self._db.query(
-            TrafficPlayLog.asset_uuid,
-        ).filter(
-            TrafficPlayLog.channel_slug == self._channel_slug,
-            TrafficPlayLog.played_at >= today_start,
-        ).group_by(
-            TrafficPlayLog.asset_uuid,
-        ).having(
-            func.count(TrafficPlayLog.id) >= cap,
-        ).all()
-
-        return {str(row[0]) for row in capped}
+        day_start = air_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        since = min(air_time - timedelta(seconds=max_cooldown), day_start)
+        self._play_history.ensure_loaded(self._db, since)
+        return self._play_history
 
     # ── AssetLibrary protocol ──
 
@@ -216,11 +155,15 @@ class DatabaseAssetLibrary:
         ]
 
     def get_filler_assets(
-        self, max_duration_ms: int, count: int = 1
+        self, max_duration_ms: int, count: int = 1, air_time: datetime | None = None
     ) -> list[FillerAsset]:
         """Get interstitial assets respecting channel policy and cooldowns.
 
-        Policy from YAML, cooldown state from DB.
+        Policy from YAML, cooldown state from the channel's play window.
+        Cooldowns and daily caps are judged at *air_time* (the break's
+        scheduled start; defaults to now): a spot is excluded if any play
+        of it lies within its cooldown of that time, or if its plays on
+        that UTC day reached the cap.
         """
         coll_uuid = self._get_interstitial_collection_uuid()
         if not coll_uuid:
@@ -230,8 +173,13 @@ class DatabaseAssetLibrary:
 
         policy = self._get_channel_policy()
         allowed_types = set(policy.get("allowed_types", []))
-        cooled_uris = self._get_cooled_down_uris()
-        capped_uuids = self._get_daily_capped_uuids()
+        at = air_time or datetime.now(timezone.utc)
+        history = self._get_play_history(at)
+        buffer = self._play_buffer
+        type_cooldowns = policy.get("type_cooldowns") or {}
+        default_cd = policy.get("default_cooldown_seconds", 3600)
+        daily_cap = policy.get("max_plays_per_day", 0)
+        air_day = at.date()
 
         rows = (
             self._db.query(
@@ -261,15 +209,23 @@ class DatabaseAssetLibrary:
 
             if interstitial_type not in allowed_types:
                 continue
-            if uri in cooled_uris:
-                continue
-            if str(asset_uuid) in capped_uuids:
-                continue
+            if history is not None:
+                if (
+                    history.is_cooling(uri, at, type_cooldowns, default_cd)
+                    or buffer.is_cooling(uri, at, type_cooldowns, default_cd)
+                ):
+                    continue
+                if daily_cap > 0 and (
+                    history.plays_on(str(asset_uuid), air_day)
+                    + buffer.plays_on(str(asset_uuid), air_day)
+                ) >= daily_cap:
+                    continue
 
             candidates.append(FillerAsset(
                 asset_uri=uri,
                 duration_ms=duration_ms,
                 asset_type=interstitial_type,
+                asset_uuid=str(asset_uuid),
             ))
 
         random.shuffle(candidates)
@@ -285,20 +241,33 @@ class DatabaseAssetLibrary:
         block_id: str | None = None,
         played_at: datetime | None = None,
     ) -> None:
-        """Record an interstitial play for cooldown tracking (writes to DB)."""
+        """Record an interstitial play for cooldown tracking.
+
+        The play counts toward this library's later picks immediately; it
+        reaches traffic_play_log on the next flush_plays() and other fills
+        once this library's session commits.
+        """
         if not self._channel_slug:
             return
 
-        from retrovue.domain.entities import TrafficPlayLog
-
-        log = TrafficPlayLog(
-            channel_slug=self._channel_slug,
-            asset_uuid=UUID(asset_uuid) if isinstance(asset_uuid, str) else asset_uuid,
+        self._play_buffer.record(TrafficPlay(
             asset_uri=asset_uri,
+            asset_uuid=str(asset_uuid),
             asset_type=asset_type,
             played_at=played_at or datetime.now(timezone.utc),
+            duration_ms=duration_ms,
             break_index=break_index,
             block_id=block_id,
-            duration_ms=duration_ms,
-        )
-        self._db.add(log)
+        ))
+
+    def flush_plays(self) -> int:
+        """Add plays recorded since the last flush to the session in one batch.
+
+        They are published to the channel's play window when the session
+        commits, and dropped if it rolls back.
+        """
+        if not self._channel_slug:
+            return 0
+        if self._play_history is None:
+            self._play_history = get_traffic_play_history(self._channel_slug)
+        return self._play_buffer.flush(self._db, self._channel_slug, self._play_history)
@@ -11,6 +11,7 @@ Usage:
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 from retrovue.runtime.planning_pipeline import FillerAsset, MarkerInfo
@@ -60,7 +61,7 @@ class StaticAssetLibrary:
         return list(self._markers.get(asset_uri, []))
 
     def get_filler_assets(
-        self, max_duration_ms: int, count: int = 1
+        self, max_duration_ms: int, count: int = 1, air_time: datetime | None = None
     ) -> list[FillerAsset]:
         eligible = [f for f in self._fillers if f.duration_ms <= max_duration_ms]
         return eligible[:count]
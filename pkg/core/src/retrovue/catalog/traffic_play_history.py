@@ -0,0 +1,355 @@
+"""
+In-memory play-history window for traffic cooldowns and daily caps.
+
+DatabaseAssetLibrary used to query traffic_play_log twice per pick (recent
+plays for cooldowns, today's counts for daily caps), so filling a long
+horizon cost two play-history round trips per spot. TrafficPlayHistory
+loads a channel's committed plays once and keeps two indexes answering
+the same questions without a query:
+
+- play times per (asset_uri, asset_type), sorted, for cooldowns
+- plays per (asset_uuid, UTC day), for daily caps
+
+Spots are logged at their scheduled air time, which the Tier 2 daemon
+places hours ahead, so plays in the window may be future-dated. Both
+questions are asked about a break's air time, not the wall clock:
+
+- a spot is cooling when any play of it lies within its type's cooldown
+  of the air time, on either side
+- a daily cap counts only plays on the air time's UTC day
+
+Plays made during a fill go to that fill's TrafficPlayBuffer, which the
+fill also consults. flush() adds them to the fill's session; they enter
+the shared window only after that session commits, so a rollback never
+leaves phantom plays and concurrent fills never flush each other's plays.
+
+INV-TRAFFIC-PLAY-HISTORY-001: Cooldown and cap answers equal those of the
+same rules applied to the committed traffic_play_log rows plus the fill's
+own buffer. The window reloads from the DB every
+RETROVUE_TRAFFIC_HISTORY_RELOAD_S seconds (0 reloads on every fill) to
+pick up plays committed by other processes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import threading
+import time
+import uuid as uuid_module
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_S = 900.0
+
+
+@dataclass(frozen=True)
+class TrafficPlay:
+    """One interstitial play, as stored in traffic_play_log."""
+
+    asset_uri: str
+    asset_uuid: str
+    asset_type: str
+    played_at: datetime
+    duration_ms: int = 0
+    break_index: int | None = None
+    block_id: str | None = None
+    play_id: str | None = None  # traffic_play_log.id once written
+
+
+class _PlayIndex:
+    """Cooldown and cap indexes over a set of plays. Not thread-safe."""
+
+    def __init__(self) -> None:
+        self._times: dict[str, dict[str, list[datetime]]] = {}
+        self._daily: dict[str, dict[date, int]] = {}
+        self._ids: dict[str, datetime] = {}
+
+    def clear(self) -> None:
+        self._times.clear()
+        self._daily.clear()
+        self._ids.clear()
+
+    def add(self, play: TrafficPlay) -> None:
+        if play.play_id is not None:
+            if play.play_id in self._ids:
+                return
+            self._ids[play.play_id] = play.played_at
+        insort(self._times.setdefault(play.asset_uri, {}).setdefault(play.asset_type, []), play.played_at)
+        days = self._daily.setdefault(play.asset_uuid, {})
+        day = play.played_at.date()
+        days[day] = days.get(day, 0) + 1
+
+    def prune(self, since: datetime) -> None:
+        """Drop plays before *since* (and cap counts for earlier days)."""
+        for uri in list(self._times):
+            by_type = self._times[uri]
+            for asset_type in list(by_type):
+                times = by_type[asset_type]
+                del times[:bisect_left(times, since)]
+                if not times:
+                    del by_type[asset_type]
+            if not by_type:
+                del self._times[uri]
+        for play_id in [i for i, played_at in self._ids.items() if played_at < since]:
+            del self._ids[play_id]
+        first_day = since.date()
+        for asset_uuid in list(self._daily):
+            days = self._daily[asset_uuid]
+            for day in [d for d in days if d < first_day]:
+                del days[day]
+            if not days:
+                del self._daily[asset_uuid]
+
+    def is_cooling(
+        self,
+        asset_uri: str,
+        air_time: datetime,
+        type_cooldowns: dict[str, int],
+        default_cooldown_seconds: int,
+    ) -> bool:
+        by_type = self._times.get(asset_uri)
+        if not by_type:
+            return False
+        for asset_type, times in by_type.items():
+            cooldown = type_cooldowns.get(asset_type, default_cooldown_seconds)
+            i = bisect_left(times, air_time)
+            # Nearest plays on either side of the air time
+            for j in (i - 1, i):
+                if 0 <= j < len(times) and abs((air_time - times[j]).total_seconds()) < cooldown:
+                    return True
+        return False
+
+    def plays_on(self, asset_uuid: str, day: date) -> int:
+        return self._daily.get(str(asset_uuid), {}).get(day, 0)
+
+
+class TrafficPlayHistory:
+    """Committed plays for one channel, shared by every fill in the process."""
+
+    def __init__(
+        self,
+        channel_slug: str,
+        *,
+        reload_after_s: float = DEFAULT_RELOAD_S,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._channel_slug = channel_slug
+        self._reload_after_s = reload_after_s
+        self._monotonic = monotonic
+        self._lock = threading.RLock()
+        self._index = _PlayIndex()
+        self._loaded_since: datetime | None = None
+        self._loaded_at: float | None = None
+
+    @property
+    def channel_slug(self) -> str:
+        return self._channel_slug
+
+    def ensure_loaded(self, db: Any, since: datetime) -> None:
+        """Make the window cover plays at or after *since*.
+
+        Queries traffic_play_log only when the window is empty, too short
+        or older than the reload interval; otherwise drops plays that
+        fell out of the window.
+        """
+        with self._lock:
+            if (
+                self._loaded_since is not None
+                and self._loaded_since <= since
+                and self._monotonic() - self._loaded_at < self._reload_after_s
+            ):
+                self._index.prune(since)
+                self._loaded_since = since
+                return
+            self._load(db, since)
+
+    def _load(self, db: Any, since: datetime) -> None:
+        from retrovue.domain.entities import TrafficPlayLog
+
+        rows = db.query(
+            TrafficPlayLog.id,
+            TrafficPlayLog.asset_uri,
+            TrafficPlayLog.asset_uuid,
+            TrafficPlayLog.asset_type,
+            TrafficPlayLog.played_at,
+        ).filter(
+            TrafficPlayLog.channel_slug == self._channel_slug,
+            TrafficPlayLog.played_at >= since,
+        ).all()
+
+        self._index.clear()
+        for play_id, uri, asset_uuid, asset_type, played_at in rows:
+            self._index.add(TrafficPlay(uri, str(asset_uuid), asset_type, played_at, play_id=str(play_id)))
+        self._loaded_since = since
+        self._loaded_at = self._monotonic()
+        logger.debug(
+            "Traffic play history for %s: loaded %d plays since %s",
+            self._channel_slug, len(rows), since.isoformat(),
+        )
+
+    def is_cooling(
+        self,
+        asset_uri: str,
+        air_time: datetime,
+        type_cooldowns: dict[str, int],
+        default_cooldown_seconds: int,
+    ) -> bool:
+        """True if a play of *asset_uri* is within its type's cooldown of *air_time*."""
+        with self._lock:
+            return self._index.is_cooling(asset_uri, air_time, type_cooldowns, default_cooldown_seconds)
+
+    def plays_on(self, asset_uuid: str, day: date) -> int:
+        """Plays of *asset_uuid* on UTC day *day*."""
+        with self._lock:
+            return self._index.plays_on(asset_uuid, day)
+
+    def publish(self, plays: Iterable[TrafficPlay]) -> None:
+        """Index plays whose traffic_play_log rows have been committed."""
+        with self._lock:
+            if self._loaded_since is None:
+                return  # the first load reads them from the table
+            for play in plays:
+                if play.played_at >= self._loaded_since:
+                    self._index.add(play)
+
+
+class TrafficPlayBuffer:
+    """Plays logged by one fill that are not committed yet.
+
+    Owned by a single DatabaseAssetLibrary (one fill, one session). It
+    answers for both unflushed plays and plays flushed into a session that
+    has not committed; committed plays are answered by the history.
+    """
+
+    def __init__(self) -> None:
+        self._unflushed: list[TrafficPlay] = []
+        self._uncommitted: list[TrafficPlay] = []
+        self._index = _PlayIndex()
+
+    def record(self, play: TrafficPlay) -> None:
+        play = dataclasses.replace(play, play_id=str(uuid_module.uuid4()))
+        self._unflushed.append(play)
+        self._index.add(play)
+
+    @property
+    def pending(self) -> int:
+        return len(self._unflushed) + len(self._uncommitted)
+
+    def is_cooling(
+        self,
+        asset_uri: str,
+        air_time: datetime,
+        type_cooldowns: dict[str, int],
+        default_cooldown_seconds: int,
+    ) -> bool:
+        return self._index.is_cooling(asset_uri, air_time, type_cooldowns, default_cooldown_seconds)
+
+    def plays_on(self, asset_uuid: str, day: date) -> int:
+        return self._index.plays_on(asset_uuid, day)
+
+    def flush(self, db: Any, channel_slug: str, history: TrafficPlayHistory | None) -> int:
+        """Add unflushed plays to *db* as one batch; the caller's session commits.
+
+        The plays move to *history* when that session commits and are
+        dropped if it rolls back.
+        """
+        if not self._unflushed:
+            return 0
+        from retrovue.domain.entities import TrafficPlayLog
+
+        plays = self._unflushed
+        db.add_all([
+            TrafficPlayLog(
+                id=UUID(p.play_id),
+                channel_slug=channel_slug,
+                asset_uuid=UUID(p.asset_uuid),
+                asset_uri=p.asset_uri,
+                asset_type=p.asset_type,
+                played_at=p.played_at,
+                break_index=p.break_index,
+                block_id=p.block_id,
+                duration_ms=p.duration_ms,
+            )
+            for p in plays
+        ])
+        self._unflushed = []
+        self._uncommitted.extend(plays)
+
+        def settle(committed: bool) -> None:
+            ids = {p.play_id for p in plays}
+            self._uncommitted = [p for p in self._uncommitted if p.play_id not in ids]
+            self._index.clear()
+            for p in self._unflushed + self._uncommitted:
+                self._index.add(p)
+            if committed and history is not None:
+                history.publish(plays)
+
+        _on_transaction_end(db, settle, channel_slug, len(plays))
+        return len(plays)
+
+
+_SETTLE_KEY = "retrovue.traffic_play_settles"
+
+
+def _on_transaction_end(db: Any, settle: Callable[[bool], None], channel_slug: str, count: int) -> None:
+    """Call settle(True) when *db* commits or settle(False) when it rolls back."""
+    from sqlalchemy import event
+    from sqlalchemy.exc import InvalidRequestError
+
+    try:
+        if not event.contains(db, "after_commit", _settle_committed):
+            event.listen(db, "after_commit", _settle_committed)
+            event.listen(db, "after_rollback", _settle_rolled_back)
+    except InvalidRequestError:
+        logger.warning(
+            "Traffic play history for %s: %r has no transaction events; "
+            "%d plays become visible on the next reload",
+            channel_slug, db, count,
+        )
+        return
+    db.info.setdefault(_SETTLE_KEY, []).append(settle)
+
+
+def _settle(session: Any, committed: bool) -> None:
+    for settle in session.info.pop(_SETTLE_KEY, ()):
+        settle(committed)
+
+
+def _settle_committed(session: Any) -> None:
+    _settle(session, True)
+
+
+def _settle_rolled_back(session: Any) -> None:
+    _settle(session, False)
+
+
+def _reload_from_env() -> float:
+    val = os.environ.get("RETROVUE_TRAFFIC_HISTORY_RELOAD_S")
+    if val is not None:
+        try:
+            return max(0.0, float(val))
+        except ValueError:
+            logger.warning("Ignoring invalid RETROVUE_TRAFFIC_HISTORY_RELOAD_S=%r", val)
+    return DEFAULT_RELOAD_S
+
+
+_lock = threading.Lock()
+_histories: dict[str, TrafficPlayHistory] = {}
+
+
+def get_traffic_play_history(channel_slug: str) -> TrafficPlayHistory:
+    """Process-wide play window for a channel."""
+    with _lock:
+        history = _histories.get(channel_slug)
+        if history is None:
+            history = TrafficPlayHistory(channel_slug, reload_after_s=_reload_from_env())
+            _histories[channel_slug] = history
+        return history
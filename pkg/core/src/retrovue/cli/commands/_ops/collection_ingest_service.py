@@ -34,6 +34,7 @@ from ....infra.canonical import canonical_hash, canonical_key_for
 from ....infra.exceptions import IngestError
 from ....usecases.metadata_handler import handle_ingest
 from ....usecases.asset_path_resolver import AssetPathResolver
+from ....usecases.enrichment_pool import EnrichmentPool
 
 logger = structlog.get_logger(__name__)
 
@@ -271,6 +272,37 @@ class CollectionIngestService:
         """
         self.db = db
 
+    def _collection_has_assets(self, collection: Collection) -> bool:
+        if not isinstance(self.db, Session):
+            return False
+        try:
+            stmt = select(Asset.uuid).where(Asset.collection_uuid == collection.uuid).limit(1)
+            return self.db.scalar(stmt) is not None
+        except Exception:
+            return False
+
+    def _run_after_commit(self, fn: Any) -> None:
+        """Run *fn* once the session's current transaction commits (never on rollback)."""
+        if not isinstance(self.db, Session):
+            return
+        from sqlalchemy import event
+
+        pending = [fn]
+
+        def _after_commit(_session: Session) -> None:
+            if not pending:
+                return
+            try:
+                pending.pop()()
+            except Exception as e:
+                logger.warning("post_commit_hook_failed", error=str(e))
+
+        def _after_rollback(_session: Session) -> None:
+            pending.clear()
+
+        event.listen(self.db, "after_commit", _after_commit, once=True)
+        event.listen(self.db, "after_rollback", _after_rollback, once=True)
+
     def ingest_collection(
         self,
         collection: Collection | str,
@@ -412,6 +444,16 @@ class CollectionIngestService:
         except Exception:
             pipeline_checksum = None
 
+        # INV-SCAN-MANIFEST-CONTEXT-001: incremental importers only trust a scan
+        # manifest recorded for this collection and enricher pipeline.  An empty
+        # collection (first ingest, or after a wipe) always gets a full scan.
+        set_scan_context = getattr(importer, "set_scan_context", None)
+        if callable(set_scan_context) and getattr(importer, "manifest_path", None):
+            scan_context = None
+            if scope == "collection" and self._collection_has_assets(collection):
+                scan_context = f"{collection.uuid}:{pipeline_checksum}"
+            set_scan_context(scan_context)
+
         # Discover items from importer (importers must not persist)
         try:
             # Use scoped discovery when title/season/episode filters are provided and the importer supports it
@@ -542,8 +584,18 @@ class CollectionIngestService:
                 return 1.0
             return score
 
-        for item in discovered_items or []:
-            stats.assets_discovered += 1
+        try:
+            collection_locations = (collection.config or {}).get("locations", [])
+        except Exception:
+            collection_locations = []
+        enrich_pool = EnrichmentPool([enr for _, _, enr in pipeline])
+
+        def _prepare(item: Any) -> tuple[Any, str | None, Any, list[str]]:
+            """Resolve the local path and run the enricher pipeline (no DB access).
+
+            Runs on the enrichment pool; the caller consumes results in
+            discovery order (INV-ENRICH-POOL-ORDER-001).
+            """
             # Capture source_uri before any local resolution
             try:
                 source_uri_val = _get_uri(item)
@@ -551,7 +603,6 @@ class CollectionIngestService:
                 source_uri_val = None
             # Resolve local file URI for enrichment via AssetPathResolver
             try:
-                collection_locations = (collection.config or {}).get("locations", [])
                 plex_client = getattr(importer, "client", None)
                 resolver = AssetPathResolver(
                     path_mappings=path_mappings,
@@ -573,36 +624,31 @@ class CollectionIngestService:
                 pass
             # Snapshot importer editorial BEFORE pipeline runs
             try:
-                try:
-                    importer_editorial = (
-                        item.get("editorial") if isinstance(item, dict) else getattr(item, "editorial", None)
-                    )
-                except Exception:
-                    importer_editorial = None
+                importer_editorial = (
+                    item.get("editorial") if isinstance(item, dict) else getattr(item, "editorial", None)
+                )
             except Exception:
                 importer_editorial = None
 
-            # Apply enricher pipeline (unchanged order)
+            # Apply enricher pipeline (unchanged order within the item)
+            errors: list[str] = []
+            if pipeline:
+                outcome = enrich_pool.run_pipeline(item)
+                item = outcome.item
+                errors = [str(e) for _, e in outcome.errors]
+            # Attach pipeline checksum so ingest can detect enricher changes
             try:
-                if pipeline:
-                    try:
-                        enriched = item
-                        for _, _, enr in pipeline:
-                            try:
-                                enriched = enr.enrich(enriched)
-                            except Exception as enr_exc:
-                                stats.errors.append(str(enr_exc))
-                        item = enriched
-                    except Exception:
-                        pass
-                # Attach pipeline checksum so ingest can detect enricher changes
-                try:
-                    if pipeline_checksum:
-                        item.enricher_checksum = pipeline_checksum
-                except Exception:
-                    pass
+                if pipeline_checksum:
+                    item.enricher_checksum = pipeline_checksum
             except Exception:
                 pass
+            return item, source_uri_val, importer_editorial, errors
+
+        for item, source_uri_val, importer_editorial, enrich_errors in enrich_pool.ordered(
+            _prepare, discovered_items or []
+        ):
+            stats.assets_discovered += 1
+            stats.errors.extend(enrich_errors)
 
             # Build payload for unified metadata handler AFTER pipeline
             try:
@@ -932,6 +978,21 @@ class CollectionIngestService:
                     pass
                 created_assets.append(asset_record)
 
+        # INV-SCAN-MANIFEST-COMMIT-001: the manifest may only record items that
+        # were actually persisted, so commit it with the enclosing transaction
+        # and only when every discovered item was processed.
+        if (
+            not dry_run
+            and not test_db
+            and scope == "collection"
+            and max_new is None
+            and max_updates is None
+            and not stats.errors
+        ):
+            commit_manifest = getattr(importer, "commit_scan_manifest", None)
+            if callable(commit_manifest):
+                self._run_after_commit(commit_manifest)
+
         result = CollectionIngestResult(
             collection_id=str(collection.uuid),
             collection_name=collection.name,
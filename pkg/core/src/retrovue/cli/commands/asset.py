@@ -15,6 +15,7 @@ from ...domain.entities import Asset, AssetTag
 from ...domain.tag_normalization import normalize_tag_set
 from ...infra.uow import session
 from ...usecases import asset_attention as _uc_asset_attention
+from ...usecases import asset_reprobe as _uc_asset_reprobe
 from ...usecases import asset_update as _uc_asset_update
 
 app = typer.Typer(name="asset", help="Asset inspection and review operations")
@@ -212,3 +213,113 @@ def update_asset(
     except Exception as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(1)
+
+
+@app.command("reprobe")
+def reprobe_assets(
+    asset_id: str | None = typer.Argument(None, help="Asset UUID to reprobe"),
+    collection: str | None = typer.Option(
+        None, "--collection", help="Reprobe every asset in this collection (UUID)"
+    ),
+    include_ready: bool = typer.Option(
+        False, "--include-ready", help="Also reprobe assets already in 'ready' state"
+    ),
+    limit: int | None = typer.Option(None, "--limit", help="Max assets to reprobe"),
+    workers: int = typer.Option(
+        _uc_asset_reprobe.DEFAULT_REPROBE_WORKERS,
+        "--workers",
+        min=1,
+        help="Worker processes for --collection",
+    ),
+    resume_after: str | None = typer.Option(
+        None, "--resume-after", help="Checkpoint printed by an interrupted run"
+    ),
+    refresh_cache: bool = typer.Option(
+        False, "--refresh-cache", help="Ignore cached ffprobe/loudness results"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON (one object per line for --collection)"
+    ),
+):
+    """
+    Re-run enrichment for one asset or a whole collection.
+
+    Collection reprobes commit each asset separately and print results as
+    they complete.  After an interrupt, rerun with the printed
+    --resume-after checkpoint to continue.
+
+    Examples:
+        retrovue asset reprobe <uuid>
+        retrovue asset reprobe --collection <uuid> --workers 8
+        retrovue asset reprobe --collection <uuid> --resume-after <checkpoint>
+    """
+    if (asset_id is None) == (collection is None):
+        typer.echo("Error: pass exactly one of ASSET_ID or --collection", err=True)
+        raise typer.Exit(1)
+
+    if asset_id is not None:
+        try:
+            with session() as db:
+                result = _uc_asset_reprobe.reprobe_asset(
+                    db, asset_uuid=asset_id, refresh_cache=refresh_cache
+                )
+        except ValueError as exc:
+            typer.echo(f"Error: {exc}", err=True)
+            raise typer.Exit(1)
+        if json_output:
+            typer.echo(json.dumps({"status": "ok", "asset": result}, indent=2, default=str))
+        else:
+            typer.echo(
+                f"{result['uuid']}  {result['old_state']} -> {result['new_state']}  "
+                f"duration_ms={result['new_duration_ms']}"
+            )
+        raise typer.Exit(0)
+
+    total = failed = 0
+    checkpoint = resume_after
+    try:
+        with session() as db:
+            results = _uc_asset_reprobe.iter_reprobe_collection(
+                db,
+                collection_uuid=collection,
+                include_ready=include_ready,
+                limit=limit,
+                refresh_cache=refresh_cache,
+                workers=workers,
+                resume_after=resume_after,
+            )
+            for r in results:
+                total += 1
+                checkpoint = r["checkpoint"]
+                if "error" in r:
+                    failed += 1
+                if json_output:
+                    typer.echo(json.dumps(r, default=str))
+                elif "error" in r:
+                    typer.echo(f"FAILED  {r['uuid']}  {r.get('uri')}: {r['error']}", err=True)
+                else:
+                    typer.echo(
+                        f"{r['uuid']}  {r['old_state']} -> {r['new_state']}  "
+                        f"duration_ms={r['new_duration_ms']}"
+                    )
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        typer.echo(
+            f"Interrupted after {total} assets. Resume with --resume-after {checkpoint}"
+            if checkpoint
+            else f"Interrupted after {total} assets.",
+            err=True,
+        )
+        raise typer.Exit(130)
+
+    if json_output:
+        typer.echo(
+            json.dumps(
+                {"status": "ok", "total": total, "failed": failed, "checkpoint": checkpoint}
+            )
+        )
+    else:
+        typer.echo(f"Reprobed {total} assets ({failed} failed)")
+    raise typer.Exit(1 if failed else 0)
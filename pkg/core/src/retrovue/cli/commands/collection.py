@@ -81,6 +81,9 @@ def construct_importer_for_collection(collection, db):
                             f"Plex server configuration incomplete for source '{source.name}'. "
                             "Use: retrovue source update <source> --base-url <url> --token <token>"
                         )
+                    for key in ("manifest_path", "max_workers", "page_size"):
+                        if key in config:
+                            importer_config[key] = config[key]
                     # Capture collection library key for Plex (do not pass to constructor for backward compatibility)
                     collection_library_key = getattr(collection, "external_id", None)
                 elif source.type == "filesystem":
@@ -89,6 +92,9 @@ def construct_importer_for_collection(collection, db):
                     importer_config["root_paths"] = config.get("root_paths", [])
                     if "tag_from_path_segments" in config:
                         importer_config["tag_from_path_segments"] = config["tag_from_path_segments"]
+                    for key in ("manifest_path", "scan_workers"):
+                        if key in config:
+                            importer_config[key] = config[key]
                 else:
                     raise ValueError(f"Unsupported source type '{source.type}'")
 
@@ -10,6 +10,12 @@ is no separate daemon. Single HTTP server, single port.
 import logging
 import typer
 from pathlib import Path
+from retrovue.runtime.channel_shards import (
+    ChannelSource,
+    ShardedProgramDirector,
+    ShardWorker,
+    build_shard_specs,
+)
 from retrovue.runtime.program_director import ProgramDirector
 from retrovue.runtime.config import RuntimeConfig
 from retrovue.runtime.providers import FileChannelConfigProvider, YamlChannelConfigProvider
@@ -32,6 +38,10 @@ def start(
     asset_a: str = typer.Option(None, help="Mock A/B: Path to asset A (e.g. SampleA.mp4)"),
     asset_b: str = typer.Option(None, help="Mock A/B: Path to asset B (e.g. SampleB.mp4)"),
     segment_seconds: float = typer.Option(10.0, help="Mock A/B: Segment length in seconds (default: 10)"),
+    workers: int = typer.Option(
+        1, "--workers", envvar="RETROVUE_PD_WORKERS", min=1,
+        help="Channel shard processes; >1 runs a routing front-end on --port and workers on the ports after it",
+    ),
 ):
     """
     Starts RetroVue with ProgramDirector as the control plane.
@@ -59,10 +69,19 @@ def start(
     - Alternating asset A and B every N seconds, 24/7
     - Requires --asset-a and --asset-b; optional --segment-seconds (default 10)
     - Mutually exclusive with --mock-schedule-grid.
+
+    Sharding (--workers N, N > 1):
+    - Channels are split across N ProgramDirector processes (ports PORT+1..PORT+N)
+    - A front-end on PORT redirects streams to the owning worker and
+      aggregates /channels, /api/epg and /health
+    - Not available with the mock schedules
     """
     if mock_schedule_ab and mock_schedule_grid:
         typer.echo("Error: Use either --mock-schedule-ab or --mock-schedule-grid, not both", err=True)
         raise typer.Exit(1)
+    if workers > 1 and (mock_schedule_ab or mock_schedule_grid):
+        typer.echo("Error: --workers cannot be combined with a mock schedule", err=True)
+        raise typer.Exit(1)
 
     # Ensure INFO logs (channel create/destroy, subscriber count) are visible in the console
     logging.basicConfig(
@@ -79,13 +98,16 @@ def start(
 
     # Load channel config provider — prefer YAML channels dir, fall back to channels.json
     channel_config_provider = None
+    channel_source = None
     yaml_channels_dir = Path("/opt/retrovue/config/channels")
     if yaml_channels_dir.is_dir():
         channel_config_provider = YamlChannelConfigProvider(yaml_channels_dir)
+        channel_source = ChannelSource("yaml", str(yaml_channels_dir))
     else:
         channels_config_path = runtime_config.get_channels_config_path()
         if channels_config_path.exists():
             channel_config_provider = FileChannelConfigProvider(channels_config_path)
+            channel_source = ChannelSource("json", str(channels_config_path))
 
     if not mock_schedule_ab and not mock_schedule_grid and channel_config_provider is None:
         typer.echo(
@@ -128,7 +150,15 @@ def start(
             typer.echo(f"Error: Filler asset not found: {filler_asset}", err=True)
             raise typer.Exit(1)
     # Create ProgramDirector with embedded ChannelManager registry (single component, single port)
-    if mock_schedule_ab:
+    if workers > 1:
+        specs = build_shard_specs(workers, channel_source, host="0.0.0.0", port=http_port)
+        program_director = ShardedProgramDirector(
+            channel_config_provider,
+            [ShardWorker(spec) for spec in specs],
+            host="0.0.0.0",
+            port=http_port,
+        )
+    elif mock_schedule_ab:
         program_director = ProgramDirector(
             host="0.0.0.0",
             port=http_port,
@@ -161,6 +191,8 @@ def start(
     try:
         import time
         print(f"ProgramDirector started on port {http_port}")
+        if workers > 1:
+            print(f"Channel shards: {workers} workers on ports {http_port + 1}-{http_port + workers}")
         print("Press Ctrl+C to stop...")
         while True:
             time.sleep(1)
@@ -6,31 +6,20 @@ calling application services and outputting JSON when requested.
 
 All command groups are registered through the centralized CliRouter,
 ensuring explicit registration and documentation mapping.
+
+Command groups are registered by import path and loaded only when invoked
+(see router.LazyTyperGroup), so ``retrovue --help`` and single commands in
+scripts do not import every command module.  Keep module-level imports here
+limited to Typer.
 """
 
 from __future__ import annotations
 
 import typer
 
-# Ensure registry is populated
-import retrovue.adapters.importers  # noqa: F401
-
-from .commands import asset as asset_cmd
-from .commands import (
-    channel,
-    channel_manager,
-    collection,
-    enricher,
-    producer,
-    program_director,
-    runtime,
-    source,
-    zone,
-    programming,
-)
-from .router import get_router
+from .router import LazyTyperGroup, get_router
 
-app = typer.Typer(help="RetroVue operator CLI")
+app = typer.Typer(help="RetroVue operator CLI", cls=LazyTyperGroup)
 
 # Initialize router and register all command groups
 router = get_router(app)
@@ -38,77 +27,77 @@ router = get_router(app)
 # Register command groups with explicit documentation mapping
 router.register(
     "source",
-    source.app,
+    "retrovue.cli.commands.source:app",
     help_text="Source and collection management operations",
     doc_path="source.md",
 )
 
 router.register(
     "channel",
-    channel.app,
+    "retrovue.cli.commands.channel:app",
     help_text="Broadcast channel operations",
     doc_path="channel.md",
 )
 
 router.register(
     "collection",
-    collection.app,
+    "retrovue.cli.commands.collection:app",
     help_text="Collection management operations",
     doc_path="collection.md",
 )
 
 router.register(
     "asset",
-    asset_cmd.app,
+    "retrovue.cli.commands.asset:app",
     help_text="Asset inspection and review operations",
     doc_path="asset.md",
 )
 
 router.register(
     "enricher",
-    enricher.app,
+    "retrovue.cli.commands.enricher:app",
     help_text="Enricher management operations",
     doc_path="enricher.md",
 )
 
 router.register(
     "producer",
-    producer.app,
+    "retrovue.cli.commands.producer:app",
     help_text="Producer management operations",
     doc_path="producer.md",
 )
 
 router.register(
     "runtime",
-    runtime.app,
+    "retrovue.cli.commands.runtime:app",
     help_text="Runtime diagnostics and validation operations",
     doc_path="runtime.md",
 )
 
 router.register(
     "channel-manager",
-    channel_manager.app,
+    "retrovue.cli.commands.channel_manager:app",
     help_text="RetroVue Core runtime operations (internal)",
     doc_path="channel-manager.md",
 )
 
 router.register(
     "program-director",
-    program_director.app,
+    "retrovue.cli.commands.program_director:app",
     help_text="Program Director operations (control plane)",
     doc_path="program-director.md",
 )
 
 router.register(
     "zone",
-    zone.app,
+    "retrovue.cli.commands.zone:app",
     help_text="Zone (daypart) management operations",
     doc_path="zone.md",
 )
 
 router.register(
     "programming",
-    programming.app,
+    "retrovue.cli.commands.programming:app",
     help_text="Programming DSL compile and validate operations",
     doc_path="programming.md",
 )
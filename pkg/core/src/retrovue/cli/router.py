@@ -9,14 +9,26 @@ The router ensures:
 - Domain ownership is clear (each command group owns its domain)
 - Command registration is explicit and discoverable
 - CLI structure is documented and maintainable
+
+Lazy loading:
+    A command group may be registered by import path
+    (``"retrovue.cli.commands.source:app"``) instead of a Typer instance.
+    Its module is imported only when that group is invoked, so
+    ``retrovue --help`` and unrelated commands do not pay for importing
+    SQLAlchemy models, FastAPI or the runtime.  The root Typer app must be
+    created with ``cls=LazyTyperGroup`` for lazily registered groups to be
+    resolvable.
 """
 
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import click
 import typer
+from typer.core import TyperGroup
 
 if TYPE_CHECKING:
     from typing import Any
@@ -43,7 +55,7 @@ class CliRouter:
     def register(
         self,
         name: str,
-        command_group: typer.Typer,
+        command_group: typer.Typer | str,
         *,
         help_text: str | None = None,
         doc_path: str | None = None,
@@ -53,15 +65,17 @@ class CliRouter:
         
         Args:
             name: Command group name (e.g., "channel", "source")
-            command_group: Typer app instance for this command group
+            command_group: Typer app instance for this command group, or a
+                "module:attribute" import path to load it lazily
             help_text: Help text for the command group
             doc_path: Path to documentation file (relative to docs/cli/)
         """
         if name in self._registered_groups:
             raise ValueError(f"Command group '{name}' is already registered")
 
-        # Register with Typer
-        self.root_app.add_typer(command_group, name=name, help=help_text)
+        # Register with Typer (lazy groups are resolved by LazyTyperGroup)
+        if not isinstance(command_group, str):
+            self.root_app.add_typer(command_group, name=name, help=help_text)
 
         # Track registration metadata
         self._registered_groups[name] = {
@@ -71,6 +85,27 @@ class CliRouter:
             "command_group": command_group,
         }
 
+    def lazy_group_names(self) -> list[str]:
+        """Names of groups registered by import path, in registration order."""
+        return [
+            name
+            for name, meta in self._registered_groups.items()
+            if isinstance(meta["command_group"], str)
+        ]
+
+    def load_group(self, name: str) -> click.Command | None:
+        """Import a lazily registered group and build its Click command."""
+        meta = self._registered_groups.get(name)
+        if meta is None or not isinstance(meta["command_group"], str):
+            return None
+        module_name, _, attr = meta["command_group"].partition(":")
+        sub_app = getattr(importlib.import_module(module_name), attr or "app")
+        group = typer.main.get_group(sub_app)
+        group.name = name
+        if meta["help"] is not None:
+            group.help = meta["help"]
+        return group
+
     def get_registered_groups(self) -> dict[str, dict[str, Any]]:
         """
         Get all registered command groups.
@@ -150,3 +185,42 @@ def get_router(root_app: typer.Typer) -> CliRouter:
         _router = CliRouter(root_app)
     return _router
 
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports router-registered groups on demand.
+
+    Listing help renders lazy groups from their registered help text
+    without importing them; any other lookup (invocation, completion,
+    ``<group> --help``) imports the group once and caches it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._formatting_help = False
+
+    def _router_groups(self) -> list[str]:
+        return _router.lazy_group_names() if _router is not None else []
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [n for n in self._router_groups() if n not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or _router is None or cmd_name not in self._router_groups():
+            return cmd
+        if self._formatting_help:
+            # Placeholder carrying only the help text; nothing imported.
+            meta = _router.get_registered_groups()[cmd_name]
+            return TyperGroup(name=cmd_name, help=meta["help"])
+        cmd = _router.load_group(cmd_name)
+        if cmd is not None:
+            self.add_command(cmd, cmd_name)
+        return cmd
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
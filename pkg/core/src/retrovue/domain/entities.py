@@ -230,7 +230,7 @@ class Asset(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # Relationships
@@ -300,6 +300,15 @@ class Asset(Base):
                 "state = 'ready' AND approved_for_broadcast = true AND is_deleted = false"
             ),
         ),
+        # Keyset order of the scheduling asset listing (discovered_at DESC, uuid DESC)
+        Index(
+            "ix_assets_schedulable_keyset",
+            sa.text("discovered_at DESC"),
+            sa.text("uuid DESC"),
+            postgresql_where=sa.text(
+                "state = 'ready' AND approved_for_broadcast = true AND is_deleted = false"
+            ),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -318,6 +327,16 @@ class AssetEditorial(Base):
 
     asset: Mapped[Asset] = relationship("Asset", back_populates="editorial_meta")
 
+    __table_args__ = (
+        # Containment filters (payload @> ...) from the asset listing API
+        Index(
+            "ix_asset_editorial_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
+
 
 class AssetProbed(Base):
     __tablename__ = "asset_probed"
@@ -940,6 +959,8 @@ class CompiledProgramLog(Base):
     broadcast_day: Mapped[date] = mapped_column(Date, nullable=False)
     schedule_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     compiled_json: Mapped[dict[str, Any]] = mapped_column(PG_JSONB, nullable=False)
+    # segment_codec payload of compiled_json["segmented_blocks"]; NULL on legacy rows
+    segmented_packed: Mapped[bytes | None] = mapped_column(sa.LargeBinary, nullable=True)
     locked: Mapped[bool] = mapped_column(
         Boolean, nullable=False, server_default=sa.text("true")
     )
@@ -1032,12 +1053,15 @@ class TransmissionLog(Base):
     start_utc_ms: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
     end_utc_ms: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
     segments: Mapped[list[dict[str, Any]]] = mapped_column(PG_JSONB, nullable=False)
+    # segment_codec payload of the block; NULL on legacy rows
+    segments_packed: Mapped[bytes | None] = mapped_column(sa.LargeBinary, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=True
     )
 
     __table_args__ = (
         Index("ix_transmission_log_channel_day", "channel_slug", "broadcast_day"),
+        Index("ix_transmission_log_end_utc_ms", "end_utc_ms"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,265 @@
+"""
+IPTV guide generation — streamed XMLTV and M3U from the compiled horizon.
+
+IPTV clients refresh a multi-day guide for every channel, often every few
+minutes.  Output is produced incrementally: the XMLTV document is yielded
+one channel at a time, each channel's programmes read from the canonical
+compiled schedule (CompiledProgramLog) only when its turn comes, so memory
+is bounded by one channel's window rather than the whole guide.
+
+Revalidation is cheap.  ``guide_version()`` derives a validator from the
+CompiledProgramLog row identities overlapping the window (no compiled_json
+is loaded); an unchanged horizon answers 304 without reading a schedule or
+the catalog.
+
+INV-EPG-READS-CANONICAL-SCHEDULE-001: programmes come from
+DslScheduleService.get_canonical_epg(); nothing here compiles a schedule.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+from xml.sax.saxutils import escape, quoteattr
+from zoneinfo import ZoneInfo
+
+GUIDE_TZ = ZoneInfo("America/New_York")
+PROGRAMMING_DAY_START_HOUR = 6  # 06:00 local, as /api/epg
+DEFAULT_GUIDE_DAYS = 7
+MAX_GUIDE_DAYS = 14
+
+BlockReader = Callable[[str, datetime, datetime], "list[dict] | None"]
+
+
+@dataclass(frozen=True)
+class GuideVersion:
+    """Validators for one rendering of the guide."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self) -> dict[str, str]:
+        out = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            out["Last-Modified"] = format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return out
+
+
+def guide_window(days: int = DEFAULT_GUIDE_DAYS, now: datetime | None = None) -> tuple[datetime, datetime]:
+    """Return [start, end) covering *days* broadcast days from the current one."""
+    now = (now or datetime.now(GUIDE_TZ)).astimezone(GUIDE_TZ)
+    day = now.date()
+    if now.hour < PROGRAMMING_DAY_START_HOUR:
+        day -= timedelta(days=1)
+    start = datetime(day.year, day.month, day.day, PROGRAMMING_DAY_START_HOUR, tzinfo=GUIDE_TZ)
+    return start, start + timedelta(days=days)
+
+
+def version_from_rows(
+    rows: Iterable[tuple[str, date, str, datetime]],
+    channel_ids: Iterable[str],
+    window_start: datetime,
+    window_end: datetime,
+) -> GuideVersion:
+    """Build validators from (channel_id, broadcast_day, schedule_hash, created_at) rows.
+
+    The ETag is weak: catalog metadata (titles, descriptions) can change
+    without a recompile, and is only refreshed when the horizon moves.
+    """
+    h = hashlib.sha256()
+    h.update(f"{window_start.isoformat()}|{window_end.isoformat()}".encode())
+    for cid in channel_ids:
+        h.update(b"\0c" + cid.encode())
+    last_modified: datetime | None = None
+    for channel_id, broadcast_day, schedule_hash, created_at in sorted(
+        rows, key=lambda r: (r[0], r[1])
+    ):
+        h.update(f"\0r{channel_id}|{broadcast_day}|{schedule_hash}|{created_at.isoformat()}".encode())
+        if last_modified is None or created_at > last_modified:
+            last_modified = created_at
+    if last_modified is not None:
+        last_modified = last_modified.replace(microsecond=0)
+    return GuideVersion(etag=f'W/"{h.hexdigest()[:32]}"', last_modified=last_modified)
+
+
+def guide_version(channel_ids: list[str], window_start: datetime, window_end: datetime) -> GuideVersion:
+    """Validators for the compiled horizon of *channel_ids* over the window.
+
+    Reads only row identity columns, never compiled_json.
+    """
+    from retrovue.domain.entities import CompiledProgramLog
+    from retrovue.infra.uow import session
+
+    with session() as db:
+        rows = db.query(
+            CompiledProgramLog.channel_id,
+            CompiledProgramLog.broadcast_day,
+            CompiledProgramLog.schedule_hash,
+            CompiledProgramLog.created_at,
+        ).filter(
+            CompiledProgramLog.channel_id.in_(channel_ids),
+            CompiledProgramLog.locked == True,  # noqa: E712
+            CompiledProgramLog.range_start < window_end,
+            CompiledProgramLog.range_end > window_start,
+        ).all()
+    return version_from_rows(rows, channel_ids, window_start, window_end)
+
+
+def playlist_version(channels: list[dict[str, Any]], stream_url: str) -> GuideVersion:
+    """Validators for the M3U playlist (depends only on the channel lineup)."""
+    h = hashlib.sha256(stream_url.encode())
+    for ch in channels:
+        h.update(f"\0{ch['channel_id']}|{ch.get('name', '')}|{ch.get('channel_id_int', '')}".encode())
+    return GuideVersion(etag=f'"{h.hexdigest()[:32]}"')
+
+
+def is_not_modified(headers: Mapping[str, str], version: GuideVersion) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since (RFC 9110 §13.2.2).
+
+    If-None-Match takes precedence; If-Modified-Since is consulted only
+    when it is absent.  ETags are compared weakly.
+    """
+    inm = headers.get("if-none-match")
+    if inm is not None:
+        if inm.strip() == "*":
+            return True
+        ours = _opaque(version.etag)
+        return any(_opaque(tag) == ours for tag in inm.split(","))
+    ims = headers.get("if-modified-since")
+    if ims and version.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return version.last_modified <= since
+    return False
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+# ---------------------------------------------------------------------------
+# M3U
+# ---------------------------------------------------------------------------
+
+
+def iter_m3u(
+    channels: list[dict[str, Any]],
+    stream_url: Callable[[str], str],
+    *,
+    guide_url: str | None = None,
+) -> Iterator[str]:
+    """Yield an extended M3U playlist, one entry per channel."""
+    header = "#EXTM3U"
+    if guide_url:
+        header += f' url-tvg="{guide_url}"'
+    yield header + "\n"
+    for ch in channels:
+        cid = ch["channel_id"]
+        name = ch.get("name") or cid
+        attrs = f'tvg-id="{_m3u_attr(cid)}" tvg-name="{_m3u_attr(name)}"'
+        if ch.get("channel_id_int") is not None:
+            attrs += f' tvg-chno="{ch["channel_id_int"]}"'
+        yield f"#EXTINF:-1 {attrs},{name}\n{stream_url(cid)}\n"
+
+
+def _m3u_attr(value: str) -> str:
+    return str(value).replace('"', "'").replace("\n", " ")
+
+
+# ---------------------------------------------------------------------------
+# XMLTV
+# ---------------------------------------------------------------------------
+
+
+def iter_xmltv(
+    channels: list[dict[str, Any]],
+    window_start: datetime,
+    window_end: datetime,
+    *,
+    metadata: Callable[[], Mapping[str, Any]] | None = None,
+    read_blocks: BlockReader | None = None,
+) -> Iterator[str]:
+    """Yield an XMLTV document: all ``<channel>`` elements, then programmes per channel.
+
+    ``metadata`` is called once, on the first channel with programmes, and
+    returns catalog entries by canonical asset id (series_title, title,
+    season, episode, description).  ``read_blocks`` defaults to
+    DslScheduleService.get_canonical_epg.
+    """
+    if read_blocks is None:
+        from retrovue.runtime.dsl_schedule_service import DslScheduleService
+
+        read_blocks = DslScheduleService.get_canonical_epg
+
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<!DOCTYPE tv SYSTEM "xmltv.dtd">\n'
+        '<tv generator-info-name="RetroVue">\n'
+    )
+    yield "".join(
+        f"  <channel id={quoteattr(ch['channel_id'])}>\n"
+        f"    <display-name>{escape(ch.get('name') or ch['channel_id'])}</display-name>\n"
+        "  </channel>\n"
+        for ch in channels
+    )
+
+    catalog: Mapping[str, Any] | None = None
+    for ch in channels:
+        blocks = read_blocks(ch["channel_id"], window_start, window_end)
+        if not blocks:
+            continue
+        if catalog is None:
+            catalog = metadata() if metadata is not None else {}
+        yield "".join(_programme(ch["channel_id"], b, catalog.get(b["asset_id"])) for b in blocks)
+    yield "</tv>\n"
+
+
+def _programme(channel_id: str, block: dict[str, Any], entry: Any | None) -> str:
+    start = datetime.fromisoformat(block["start_at"])
+    stop = start + timedelta(seconds=block["slot_duration_sec"])
+    title = block.get("title", "")
+    sub_title = description = ""
+    season = episode = None
+    if entry is not None:
+        title = getattr(entry, "series_title", "") or title
+        sub_title = getattr(entry, "title", "") or ""
+        description = getattr(entry, "description", "") or ""
+        season = getattr(entry, "season", None)
+        episode = getattr(entry, "episode", None)
+
+    parts = [
+        f"  <programme start={quoteattr(_xmltv_time(start))} "
+        f"stop={quoteattr(_xmltv_time(stop))} channel={quoteattr(channel_id)}>\n",
+        f"    <title>{escape(title or '')}</title>\n",
+    ]
+    if sub_title and sub_title != title:
+        parts.append(f"    <sub-title>{escape(sub_title)}</sub-title>\n")
+    if description:
+        parts.append(f"    <desc>{escape(description)}</desc>\n")
+    if season is None:
+        parts.append("    <category>Movie</category>\n")
+    else:
+        # xmltv_ns numbering is zero-based
+        ep = f"{max(episode - 1, 0)}" if episode else ""
+        parts.append(f'    <episode-num system="xmltv_ns">{max(season - 1, 0)}.{ep}.</episode-num>\n')
+        if episode:
+            parts.append(f'    <episode-num system="onscreen">S{season:02d}E{episode:02d}</episode-num>\n')
+    parts.append("  </programme>\n")
+    return "".join(parts)
+
+
+def _xmltv_time(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.strftime("%Y%m%d%H%M%S %z")
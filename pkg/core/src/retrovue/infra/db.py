@@ -1,4 +1,15 @@
+"""
+Database engine and session factories.
+
+The application engine is created on first use, not at import time, so
+importing models or the CLI does not build a connection pool.  ``engine``
+remains available as a module attribute (resolved lazily) and
+``SessionLocal`` binds itself to it on its first call.
+"""
+
+import threading
 from collections.abc import Generator
+from typing import Any
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -21,28 +32,55 @@ class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=NAMING_CONVENTION)
 
 
-engine = create_engine(
-    settings.database_url,
-    echo=settings.echo_sql,
-    pool_pre_ping=True,
-    future=True,
-    pool_size=settings.pool_size,
-    max_overflow=settings.max_overflow,
-    pool_timeout=settings.pool_timeout,
-    connect_args={"connect_timeout": settings.connect_timeout}
-    if "postgresql" in settings.database_url
-    else {},
-)
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
 
 
-@event.listens_for(engine, "connect")
 def _set_search_path(dbapi_conn, _):
     with dbapi_conn.cursor() as cur:
         cur.execute("SET search_path TO public")
 
 
-SessionLocal = sessionmaker(
-    bind=engine,
+def _default_engine() -> Engine:
+    """Create the application engine on first call; return it thereafter."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                eng = create_engine(
+                    settings.database_url,
+                    echo=settings.echo_sql,
+                    pool_pre_ping=True,
+                    future=True,
+                    pool_size=settings.pool_size,
+                    max_overflow=settings.max_overflow,
+                    pool_timeout=settings.pool_timeout,
+                    connect_args={"connect_timeout": settings.connect_timeout}
+                    if "postgresql" in settings.database_url
+                    else {},
+                )
+                event.listen(eng, "connect", _set_search_path)
+                _engine = eng
+    return _engine
+
+
+def __getattr__(name: str) -> Any:
+    # ``from retrovue.infra.db import engine`` keeps working, lazily.
+    if name == "engine":
+        return _default_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _DeferredSessionmaker(sessionmaker):
+    """sessionmaker that binds to the application engine on first use."""
+
+    def __call__(self, **local_kw: Any) -> Session:
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.configure(bind=_default_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _DeferredSessionmaker(
     autoflush=False,
     autocommit=False,
     future=True,
@@ -65,7 +103,7 @@ def get_engine(db_url: str | None = None, for_test: bool = False) -> Engine:
 
     # If we're using the default app engine URL and not forcing test, reuse global engine
     if not db_url and not for_test and chosen_url == settings.database_url:
-        return engine
+        return _default_engine()
 
     connect_args: dict[str, object] = {}
     if "sqlite" in chosen_url:
@@ -82,6 +82,11 @@ class AsRunLogger:
         """
         self.schedule_service = schedule_service
         self.events: list[AsRunEvent] = []
+        # Positions in self.events; events are only appended or replaced
+        # in place, so positions never move.
+        self._index_by_id: dict[str, int] = {}
+        self._index_by_day: dict[tuple[str, str], list[int]] = {}
+        self._index_by_channel: dict[str, list[int]] = {}
 
     def log_playout_start(
         self,
@@ -135,7 +140,11 @@ class AsRunLogger:
             metadata=metadata or {},
         )
 
+        position = len(self.events)
         self.events.append(event)
+        self._index_by_id.setdefault(event_id, position)
+        self._index_by_day.setdefault((channel_id, broadcast_day_str), []).append(position)
+        self._index_by_channel.setdefault(channel_id, []).append(position)
         return event_id
 
     def log_playout_end(self, event_id: str, end_time_utc: datetime) -> AsRunEvent | None:
@@ -159,16 +168,20 @@ class AsRunLogger:
         if end_time_utc.tzinfo is None:
             raise ValueError("datetime must be timezone-aware")
 
-        for i, event in enumerate(self.events):
-            if event.event_id == event_id:
-                updated = replace(
-                    event,
-                    end_time_utc=end_time_utc,
-                    duration_seconds=(end_time_utc - event.start_time_utc).total_seconds(),
-                )
-                self.events[i] = updated
-                return updated
-        return None
+        i = self._index_by_id.get(event_id)
+        if i is None:
+            return None
+        event = self.events[i]
+        updated = replace(
+            event,
+            end_time_utc=end_time_utc,
+            duration_seconds=(end_time_utc - event.start_time_utc).total_seconds(),
+        )
+        self.events[i] = updated
+        return updated
+
+    def _channel_events(self, channel_id: str) -> list[AsRunEvent]:
+        return [self.events[i] for i in self._index_by_channel.get(channel_id, [])]
 
     def log_broadcast_day_rollover(self, channel_id: str, rollover_time_utc: datetime) -> None:
         """
@@ -203,11 +216,7 @@ class AsRunLogger:
         Returns:
             List of AsRunEvent records for that broadcast day
         """
-        return [
-            event
-            for event in self.events
-            if event.channel_id == channel_id and event.broadcast_day == broadcast_day
-        ]
+        return [self.events[i] for i in self._index_by_day.get((channel_id, broadcast_day), [])]
 
     def get_events_for_time_range(
         self, channel_id: str, start_time_utc: datetime, end_time_utc: datetime
@@ -228,10 +237,9 @@ class AsRunLogger:
 
         return [
             event
-            for event in self.events
+            for event in self._channel_events(channel_id)
             if (
-                event.channel_id == channel_id
-                and event.start_time_utc >= start_time_utc
+                event.start_time_utc >= start_time_utc
                 and event.end_time_utc <= end_time_utc
             )
         ]
@@ -255,10 +263,9 @@ class AsRunLogger:
             raise ValueError("datetime must be timezone-aware")
 
         # Find events that started before rollover and end after rollover
-        for event in self.events:
+        for event in self._channel_events(channel_id):
             if (
-                event.channel_id == channel_id
-                and event.start_time_utc < rollover_time_utc
+                event.start_time_utc < rollover_time_utc
                 and event.end_time_utc > rollover_time_utc
             ):
                 return event
@@ -2,15 +2,26 @@
 As-Run reconciliation: compare TransmissionLog (plan) to AsRunLog (actual).
 
 Enforces AsRunReconciliationContract v0.1. Deterministic, no mutation, no Horizon/AIR.
+
+reconcile_transmission_log compares one in-memory day. reconcile_block_streams
+applies the same per-block checks to two block-ordered iterators (see
+asrun_stream for the file and Tier 2 sources), holding only the blocks inside
+the match window, so ranges of any length reconcile in bounded memory.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from retrovue.runtime.asrun_types import AsRunBlock, AsRunLog, AsRunSegment
 from retrovue.runtime.planning_pipeline import TransmissionLog, TransmissionLogEntry
 
+# Plan and as-run blocks further apart than this are never paired; a block
+# outside the window of every as-run block is reported missing.
+DEFAULT_MATCH_WINDOW_MS = 6 * 3_600_000
+
 
 class AsRunReconciliationError(Exception):
     """Raised when reconciliation encounters an unrecoverable error (e.g. invalid input)."""
@@ -22,6 +33,41 @@ class ReconciliationReport:
     success: bool
     errors: list[str]
     classification: list[str]
+    # Errors beyond the caller's max_errors are counted here, not listed
+    suppressed_errors: int = 0
+    planned_blocks: int = 0
+    as_run_blocks: int = 0
+
+
+class _ReportBuilder:
+    """Accumulates errors and first-seen classifications."""
+
+    def __init__(self, max_errors: int | None = None) -> None:
+        self.errors: list[str] = []
+        self.classification: list[str] = []
+        self.suppressed = 0
+        self._max_errors = max_errors
+
+    def fail(self, error: str, classification: str) -> None:
+        if self._max_errors is None or len(self.errors) < self._max_errors:
+            self.errors.append(error)
+        else:
+            self.suppressed += 1
+        self.classify(classification)
+
+    def classify(self, classification: str) -> None:
+        if classification not in self.classification:
+            self.classification.append(classification)
+
+    def build(self, planned_blocks: int = 0, as_run_blocks: int = 0) -> ReconciliationReport:
+        return ReconciliationReport(
+            success=not self.errors and not self.suppressed,
+            errors=self.errors,
+            classification=self.classification,
+            suppressed_errors=self.suppressed,
+            planned_blocks=planned_blocks,
+            as_run_blocks=as_run_blocks,
+        )
 
 
 def _planned_segment_key(seg: dict) -> tuple[str, str | None, int | None, int]:
@@ -44,6 +90,77 @@ def _asrun_segment_key(seg: AsRunSegment) -> tuple[str, str | None, int | None,
     )
 
 
+def _check_block_timing(
+    report: _ReportBuilder, plan_entry: TransmissionLogEntry, asrun_block: AsRunBlock,
+) -> None:
+    """INV-ASRUN-002: Block timing fidelity."""
+    bid = plan_entry.block_id
+    if asrun_block.start_utc_ms != plan_entry.start_utc_ms:
+        report.fail(
+            f"Block {bid!r}: start_utc_ms mismatch "
+            f"(planned={plan_entry.start_utc_ms}, as_run={asrun_block.start_utc_ms})",
+            "BLOCK_TIME_MISMATCH",
+        )
+    if asrun_block.end_utc_ms != plan_entry.end_utc_ms:
+        report.fail(
+            f"Block {bid!r}: end_utc_ms mismatch "
+            f"(planned={plan_entry.end_utc_ms}, as_run={asrun_block.end_utc_ms})",
+            "BLOCK_TIME_MISMATCH",
+        )
+
+
+def _check_block_segments(
+    report: _ReportBuilder, plan_entry: TransmissionLogEntry, asrun_block: AsRunBlock,
+) -> None:
+    """INV-ASRUN-003, INV-ASRUN-004: Segment sequence and no phantoms."""
+    bid = plan_entry.block_id
+    planned_segments = [_planned_segment_key(s) for s in plan_entry.segments]
+    # As-run segments not marked runtime_recovery must match plan in order
+    asrun_non_recovery: list[AsRunSegment] = [
+        s for s in asrun_block.segments if not s.runtime_recovery
+    ]
+    if any(s.runtime_recovery for s in asrun_block.segments):
+        report.classify("RUNTIME_RECOVERY")
+    if any(s.runtime_recovery and s.runway_degradation for s in asrun_block.segments):
+        report.classify("RUNWAY_DEGRADATION")
+
+    plan_idx = 0
+    for aseg in asrun_non_recovery:
+        if plan_idx >= len(planned_segments):
+            report.fail(
+                f"Block {bid!r}: phantom segment "
+                f"(segment_type={aseg.segment_type!r}, no matching planned segment)",
+                "PHANTOM_SEGMENT",
+            )
+            continue
+        planned_key = planned_segments[plan_idx]
+        asrun_key = _asrun_segment_key(aseg)
+        if asrun_key != planned_key:
+            report.fail(
+                f"Block {bid!r}: segment sequence mismatch at index {plan_idx} "
+                f"(planned={planned_key!r}, as_run={asrun_key!r})",
+                "SEGMENT_SEQUENCE_MISMATCH",
+            )
+        plan_idx += 1
+    if plan_idx < len(planned_segments):
+        report.fail(
+            f"Block {bid!r}: missing {len(planned_segments) - plan_idx} planned segment(s) in as-run",
+            "SEGMENT_SEQUENCE_MISMATCH",
+        )
+
+
+def _missing(report: _ReportBuilder, block_id: str) -> None:
+    report.fail(f"Missing as-run block for planned block_id={block_id!r}", "MISSING_BLOCK")
+
+
+def _extra(report: _ReportBuilder, block_id: str) -> None:
+    report.fail(f"Extra as-run block not in plan: block_id={block_id!r}", "EXTRA_BLOCK")
+
+
+def _duplicate(report: _ReportBuilder, block_id: str) -> None:
+    report.fail(f"Duplicate block_id in as-run: block_id={block_id!r}", "EXTRA_BLOCK")
+
+
 def reconcile_transmission_log(
     transmission_log: TransmissionLog,
     as_run_log: AsRunLog,
@@ -54,104 +171,105 @@ def reconcile_transmission_log(
     Deterministic. Does not mutate inputs.     Does not depend on Horizon or AIR.
     Returns structured report; does not auto-correct.
     """
-    errors: list[str] = []
-    classification: list[str] = []
+    report = _ReportBuilder()
 
     plan_by_id: dict[str, TransmissionLogEntry] = {
         e.block_id: e for e in transmission_log.entries
     }
-    asrun_blocks_by_id: list[tuple[str, AsRunBlock]] = [
-        (b.block_id, b) for b in as_run_log.blocks
-    ]
-    asrun_block_ids = [bid for bid, _ in asrun_blocks_by_id]
     asrun_id_to_blocks: dict[str, list[AsRunBlock]] = {}
-    for bid, blk in asrun_blocks_by_id:
-        asrun_id_to_blocks.setdefault(bid, []).append(blk)
+    for blk in as_run_log.blocks:
+        asrun_id_to_blocks.setdefault(blk.block_id, []).append(blk)
 
     # INV-ASRUN-001: Block coverage
     for plan_id in plan_by_id:
         if plan_id not in asrun_id_to_blocks:
-            errors.append(f"Missing as-run block for planned block_id={plan_id!r}")
-            if "MISSING_BLOCK" not in classification:
-                classification.append("MISSING_BLOCK")
+            _missing(report, plan_id)
     for bid, blks in asrun_id_to_blocks.items():
         if bid not in plan_by_id:
-            errors.append(f"Extra as-run block not in plan: block_id={bid!r}")
-            if "EXTRA_BLOCK" not in classification:
-                classification.append("EXTRA_BLOCK")
+            _extra(report, bid)
         elif len(blks) > 1:
-            errors.append(f"Duplicate block_id in as-run: block_id={bid!r}")
-            if "EXTRA_BLOCK" not in classification:
-                classification.append("EXTRA_BLOCK")
+            _duplicate(report, bid)
 
     # Build 1:1 mapping plan block_id -> single as-run block (for timing and segment checks)
-    matched: dict[str, tuple[TransmissionLogEntry, AsRunBlock]] = {}
+    matched: list[tuple[TransmissionLogEntry, AsRunBlock]] = []
     for bid, plan_entry in plan_by_id.items():
         blks = asrun_id_to_blocks.get(bid, [])
         if len(blks) == 1:
-            matched[bid] = (plan_entry, blks[0])
+            matched.append((plan_entry, blks[0]))
         # else: already reported missing or duplicate
 
-    # INV-ASRUN-002: Block timing fidelity
-    for bid, (plan_entry, asrun_block) in matched.items():
-        if asrun_block.start_utc_ms != plan_entry.start_utc_ms:
-            errors.append(
-                f"Block {bid!r}: start_utc_ms mismatch "
-                f"(planned={plan_entry.start_utc_ms}, as_run={asrun_block.start_utc_ms})"
-            )
-            if "BLOCK_TIME_MISMATCH" not in classification:
-                classification.append("BLOCK_TIME_MISMATCH")
-        if asrun_block.end_utc_ms != plan_entry.end_utc_ms:
-            errors.append(
-                f"Block {bid!r}: end_utc_ms mismatch "
-                f"(planned={plan_entry.end_utc_ms}, as_run={asrun_block.end_utc_ms})"
-            )
-            if "BLOCK_TIME_MISMATCH" not in classification:
-                classification.append("BLOCK_TIME_MISMATCH")
-
-    # INV-ASRUN-003, INV-ASRUN-004: Segment sequence and no phantoms
-    for bid, (plan_entry, asrun_block) in matched.items():
-        planned_segments = [_planned_segment_key(s) for s in plan_entry.segments]
-        # As-run segments not marked runtime_recovery must match plan in order
-        asrun_non_recovery: list[AsRunSegment] = [
-            s for s in asrun_block.segments if not s.runtime_recovery
-        ]
-        asrun_recovery_count = sum(1 for s in asrun_block.segments if s.runtime_recovery)
-        if asrun_recovery_count > 0 and "RUNTIME_RECOVERY" not in classification:
-            classification.append("RUNTIME_RECOVERY")
-        asrun_runway_degradation_count = sum(
-            1 for s in asrun_block.segments
-            if s.runtime_recovery and s.runway_degradation
-        )
-        if asrun_runway_degradation_count > 0 and "RUNWAY_DEGRADATION" not in classification:
-            classification.append("RUNWAY_DEGRADATION")
-
-        plan_idx = 0
-        for aseg in asrun_non_recovery:
-            if plan_idx >= len(planned_segments):
-                errors.append(
-                    f"Block {bid!r}: phantom segment "
-                    f"(segment_type={aseg.segment_type!r}, no matching planned segment)"
-                )
-                if "PHANTOM_SEGMENT" not in classification:
-                    classification.append("PHANTOM_SEGMENT")
-                continue
-            planned_key = planned_segments[plan_idx]
-            asrun_key = _asrun_segment_key(aseg)
-            if asrun_key != planned_key:
-                errors.append(
-                    f"Block {bid!r}: segment sequence mismatch at index {plan_idx} "
-                    f"(planned={planned_key!r}, as_run={asrun_key!r})"
+    for plan_entry, asrun_block in matched:
+        _check_block_timing(report, plan_entry, asrun_block)
+    for plan_entry, asrun_block in matched:
+        _check_block_segments(report, plan_entry, asrun_block)
+
+    return report.build(len(plan_by_id), len(as_run_log.blocks))
+
+
+def reconcile_block_streams(
+    planned: Iterable[TransmissionLogEntry],
+    as_run: Iterable[AsRunBlock],
+    *,
+    match_window_ms: int = DEFAULT_MATCH_WINDOW_MS,
+    max_errors: int | None = None,
+) -> ReconciliationReport:
+    """Reconcile two block streams, each ordered by start_utc_ms.
+
+    Applies the INV-ASRUN-001..004 checks of reconcile_transmission_log per
+    block as the streams advance. Only plan entries within match_window_ms
+    of the current as-run block, and block_ids matched within that window
+    (for duplicate detection), are held in memory.
+
+    Errors are reported in stream order rather than grouped by invariant.
+    A duplicated as-run block is checked on its first occurrence and each
+    repeat is reported as a duplicate.
+    """
+    report = _ReportBuilder(max_errors)
+    plan_iter: Iterator[TransmissionLogEntry] = iter(planned)
+    plan_head: TransmissionLogEntry | None = next(plan_iter, None)
+    pending: OrderedDict[str, TransmissionLogEntry] = OrderedDict()
+    recently_matched: OrderedDict[str, int] = OrderedDict()
+    planned_count = 0
+    as_run_count = 0
+
+    for blk in as_run:
+        as_run_count += 1
+        horizon = blk.start_utc_ms + match_window_ms
+        while plan_head is not None and plan_head.start_utc_ms <= horizon:
+            if plan_head.block_id in pending:
+                raise AsRunReconciliationError(
+                    f"Duplicate planned block_id={plan_head.block_id!r} in plan stream"
                 )
-                if "SEGMENT_SEQUENCE_MISMATCH" not in classification:
-                    classification.append("SEGMENT_SEQUENCE_MISMATCH")
-            plan_idx += 1
-        if plan_idx < len(planned_segments):
-            errors.append(
-                f"Block {bid!r}: missing {len(planned_segments) - plan_idx} planned segment(s) in as-run"
-            )
-            if "SEGMENT_SEQUENCE_MISMATCH" not in classification:
-                classification.append("SEGMENT_SEQUENCE_MISMATCH")
+            pending[plan_head.block_id] = plan_head
+            planned_count += 1
+            plan_head = next(plan_iter, None)
+
+        # Plan entries (and matched ids) that fell out of the window are final
+        expiry = blk.start_utc_ms - match_window_ms
+        while pending:
+            bid, entry = next(iter(pending.items()))
+            if entry.start_utc_ms >= expiry:
+                break
+            del pending[bid]
+            _missing(report, bid)
+        while recently_matched and next(iter(recently_matched.values())) < expiry:
+            recently_matched.popitem(last=False)
+
+        plan_entry = pending.pop(blk.block_id, None)
+        if plan_entry is not None:
+            _check_block_timing(report, plan_entry, blk)
+            _check_block_segments(report, plan_entry, blk)
+            recently_matched[blk.block_id] = plan_entry.start_utc_ms
+        elif blk.block_id in recently_matched:
+            _duplicate(report, blk.block_id)
+        else:
+            _extra(report, blk.block_id)
+
+    for bid in pending:
+        _missing(report, bid)
+    while plan_head is not None:
+        planned_count += 1
+        _missing(report, plan_head.block_id)
+        plan_head = next(plan_iter, None)
 
-    success = len(errors) == 0
-    return ReconciliationReport(success=success, errors=errors, classification=classification)
+    return report.build(planned_count, as_run_count)
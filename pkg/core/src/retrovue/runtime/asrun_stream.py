@@ -0,0 +1,242 @@
+"""
+Block-ordered sources for streaming as-run reconciliation.
+
+iter_asrun_blocks rebuilds AsRunBlocks from the .asrun.jsonl evidence files
+written by EvidenceServicer, one block at a time. iter_transmission_log_entries
+streams Tier 2 TransmissionLog rows in start order through a server-side
+cursor. reconcile_range feeds both to reconcile_block_streams, so auditing
+weeks of history never materialises more than the match window.
+
+Tier 2 rows are only retained for a few hours (INV-SCHEDULE-RETENTION-001);
+audits over older ranges pass their own ordered ``planned`` iterable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from retrovue.runtime.asrun_reconciler import (
+    DEFAULT_MATCH_WINDOW_MS,
+    ReconciliationReport,
+    reconcile_block_streams,
+)
+from retrovue.runtime.asrun_types import AsRunBlock, AsRunSegment
+from retrovue.runtime.planning_pipeline import TransmissionLogEntry
+
+logger = logging.getLogger(__name__)
+
+# Same default as evidence_server.DEFAULT_ASRUN_DIR (not imported: that
+# module loads the gRPC stubs)
+DEFAULT_ASRUN_DIR = "/opt/retrovue/data/logs/asrun"
+ASRUN_JSONL_SUFFIX = ".asrun.jsonl"
+# An evidence file is named for the day its session opened; a long-running
+# session keeps appending to it, so earlier files can hold blocks in range.
+DEFAULT_LOOKBACK_DAYS = 2
+DEFAULT_FETCH_BATCH = 500
+DEFAULT_MAX_ERRORS = 1000
+
+
+def _utc_date(epoch_ms: int) -> date:
+    return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc).date()
+
+
+def asrun_files(
+    asrun_dir: str | Path,
+    channel_id: str,
+    first_day: date,
+    last_day: date,
+) -> list[Path]:
+    """Evidence files for a channel whose session day lies in [first_day, last_day], oldest first."""
+    base = Path(asrun_dir) / channel_id
+    if not base.is_dir():
+        return []
+    found: list[tuple[date, Path]] = []
+    for path in base.glob(f"*{ASRUN_JSONL_SUFFIX}"):
+        try:
+            day = date.fromisoformat(path.name[: -len(ASRUN_JSONL_SUFFIX)])
+        except ValueError:
+            continue
+        if first_day <= day <= last_day:
+            found.append((day, path))
+    return [path for _, path in sorted(found)]
+
+
+class _OpenBlock:
+    __slots__ = ("block_id", "start_utc_ms", "last_end_utc_ms", "segments")
+
+    def __init__(self, block_id: str, start_utc_ms: int) -> None:
+        self.block_id = block_id
+        self.start_utc_ms = start_utc_ms
+        self.last_end_utc_ms = start_utc_ms
+        self.segments: list[AsRunSegment] = []
+
+    def close(self, end_utc_ms: int | None = None) -> AsRunBlock:
+        return AsRunBlock(
+            block_id=self.block_id,
+            start_utc_ms=self.start_utc_ms,
+            end_utc_ms=self.last_end_utc_ms if end_utc_ms is None else end_utc_ms,
+            segments=self.segments,
+        )
+
+
+def _segment_from_record(rec: dict[str, Any], frame_rate: float | None) -> AsRunSegment:
+    frame = rec.get("asset_start_frame") or 0
+    if frame == 0:
+        offset_ms: int | None = 0
+    elif frame_rate:
+        offset_ms = round(frame * 1000 / frame_rate)
+    else:
+        offset_ms = None
+    return AsRunSegment(
+        segment_type=rec.get("segment_type") or "",
+        asset_uri=rec.get("asset_uri") or None,
+        asset_start_offset_ms=offset_ms,
+        segment_duration_ms=rec.get("scheduled_duration_ms") or 0,
+    )
+
+
+def _blocks_from_records(
+    records: Iterable[dict[str, Any]], frame_rate: float | None,
+) -> Iterator[AsRunBlock]:
+    """Group START / SEG_START / segment end / FENCE records into blocks.
+
+    A block left open by a new START or a TERMINATED record (the session
+    ended before its fence) is emitted ending at its last segment end, so
+    the reconciler reports it as a timing mismatch rather than missing.
+    """
+    current: _OpenBlock | None = None
+    for rec in records:
+        status = rec.get("status")
+        block_id = rec.get("block_id") or ""
+        if status == "START":
+            if current is not None:
+                yield current.close()
+            current = _OpenBlock(block_id, int(rec["actual_start_utc_ms"]))
+        elif status == "TERMINATED":
+            if current is not None:
+                yield current.close()
+                current = None
+        elif current is None or block_id != current.block_id:
+            logger.debug("As-run record for block %r outside an open block; skipped", block_id)
+        elif status == "FENCE":
+            yield current.close(int(rec["actual_end_utc_ms"]))
+            current = None
+        elif status == "SEG_START":
+            current.segments.append(_segment_from_record(rec, frame_rate))
+        elif rec.get("actual_end_utc_ms") is not None:
+            current.last_end_utc_ms = int(rec["actual_end_utc_ms"])
+    if current is not None:
+        yield current.close()
+
+
+def _read_records(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping malformed as-run record %s:%d", path, lineno)
+
+
+def iter_asrun_blocks(
+    asrun_dir: str | Path,
+    channel_id: str,
+    start_utc_ms: int,
+    end_utc_ms: int,
+    *,
+    frame_rate: float | None = None,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+) -> Iterator[AsRunBlock]:
+    """Yield as-run blocks that started in [start_utc_ms, end_utc_ms), in file order.
+
+    Files are read line by line, so memory holds one block at a time.
+    Segment offsets are converted from asset_start_frame using frame_rate;
+    without it only frame 0 (offset 0) is known and other offsets are None.
+    """
+    first_day = _utc_date(start_utc_ms) - timedelta(days=lookback_days)
+    paths = asrun_files(asrun_dir, channel_id, first_day, _utc_date(end_utc_ms))
+    for block in _blocks_from_records(_read_records(paths), frame_rate):
+        if start_utc_ms <= block.start_utc_ms < end_utc_ms:
+            yield block
+
+
+def iter_transmission_log_entries(
+    db: Any,
+    channel_id: str,
+    start_utc_ms: int,
+    end_utc_ms: int,
+    *,
+    batch_size: int = DEFAULT_FETCH_BATCH,
+) -> Iterator[TransmissionLogEntry]:
+    """Yield Tier 2 rows that start in [start_utc_ms, end_utc_ms), ordered by start.
+
+    Rows are fetched batch_size at a time; the broadcast_day bound keeps the
+    scan on ix_transmission_log_channel_day.
+    """
+    from retrovue.domain.entities import TransmissionLog
+
+    query = (
+        db.query(TransmissionLog)
+        .filter(
+            TransmissionLog.channel_slug == channel_id,
+            # A broadcast day labelled D can start late on D and run into D+1
+            TransmissionLog.broadcast_day >= _utc_date(start_utc_ms) - timedelta(days=1),
+            TransmissionLog.broadcast_day <= _utc_date(end_utc_ms),
+            TransmissionLog.start_utc_ms >= start_utc_ms,
+            TransmissionLog.start_utc_ms < end_utc_ms,
+        )
+        .order_by(TransmissionLog.start_utc_ms, TransmissionLog.block_id)
+        .yield_per(batch_size)
+    )
+    for index, row in enumerate(query):
+        yield TransmissionLogEntry(
+            block_id=row.block_id,
+            block_index=index,
+            start_utc_ms=row.start_utc_ms,
+            end_utc_ms=row.end_utc_ms,
+            segments=list(row.segments or []),
+        )
+
+
+def reconcile_range(
+    channel_id: str,
+    start_utc_ms: int,
+    end_utc_ms: int,
+    *,
+    asrun_dir: str | Path = DEFAULT_ASRUN_DIR,
+    planned: Iterable[TransmissionLogEntry] | None = None,
+    session_factory: Callable[[], Any] | None = None,
+    frame_rate: float | None = None,
+    match_window_ms: int = DEFAULT_MATCH_WINDOW_MS,
+    max_errors: int | None = DEFAULT_MAX_ERRORS,
+) -> ReconciliationReport:
+    """Reconcile a channel's as-run evidence against its plan over a time range.
+
+    The plan comes from ``planned`` (ordered by start_utc_ms) or, when not
+    given, from Tier 2 rows read inside one session.
+    """
+    as_run = iter_asrun_blocks(
+        asrun_dir, channel_id, start_utc_ms, end_utc_ms, frame_rate=frame_rate,
+    )
+    if planned is not None:
+        return reconcile_block_streams(
+            planned, as_run, match_window_ms=match_window_ms, max_errors=max_errors,
+        )
+    if session_factory is None:
+        from retrovue.infra.uow import session as session_factory
+    with session_factory() as db:
+        return reconcile_block_streams(
+            iter_transmission_log_entries(db, channel_id, start_utc_ms, end_utc_ms),
+            as_run,
+            match_window_ms=match_window_ms,
+            max_errors=max_errors,
+        )
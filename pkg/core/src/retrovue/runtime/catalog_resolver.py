@@ -456,6 +456,11 @@ class CatalogAssetResolver:
         """Return all registered pool names."""
         return list(self._pools.keys())
 
+    def catalog_entries(self) -> dict[str, _CatalogEntry]:
+        """Catalog entries keyed by canonical asset id (a snapshot)."""
+        with self._lock:
+            return {entry.canonical_id: entry for entry in self._catalog}
+
     @property
     def stats(self) -> dict[str, int]:
         """Summary stats for debugging."""
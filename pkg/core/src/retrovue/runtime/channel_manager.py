@@ -1648,6 +1648,9 @@ class BlockPlanProducer(Producer):
 
         # INV-FEED-QUEUE-002: Pending block slot for QUEUE_FULL retry
         self._pending_block: "BlockPlan | None" = None
+        # INV-FEED-NONBLOCKING-001: Block whose FeedBlockPlan answer is
+        # outstanding.  One at a time, so AIR receives blocks in order.
+        self._feed_in_flight: "BlockPlan | None" = None
 
         # ---- Feed-ahead controller state ----
         self._feed_state: _FeedState = _FeedState.CREATED
@@ -1790,6 +1793,7 @@ class BlockPlanProducer(Producer):
                     on_session_end=self._on_session_end,
                     on_block_started=self._on_block_started,
                     evidence_endpoint=self._evidence_endpoint,
+                    on_feed_result=self._on_feed_result,
                 )
 
                 # Start AIR subprocess
@@ -1960,6 +1964,7 @@ class BlockPlanProducer(Producer):
         self._session_end_reason = None
         self._fed_block_ids.clear()
         self._pending_block = None  # INV-FEED-QUEUE-002: Clear pending slot
+        self._feed_in_flight = None
 
         # Reset feed-ahead controller state
         self._feed_state = _FeedState.CREATED
@@ -2117,12 +2122,21 @@ class BlockPlanProducer(Producer):
         INV-FEED-QUEUE-001: Cursor advances only on ACCEPTED.
         INV-FEED-QUEUE-002: Rejected block stored in _pending_block.
         INV-FEED-CREDIT-001: Credits decremented on ACCEPTED, zeroed on QUEUE_FULL.
+        INV-FEED-NONBLOCKING-001: PENDING parks the block in _feed_in_flight;
+        the outcome is applied by _on_feed_result.
         """
         if not self._session:
             return FeedResult.ERROR
 
         result = self._session.feed(block)
 
+        if result == FeedResult.PENDING:
+            self._feed_in_flight = block
+            return FeedResult.PENDING
+        return self._apply_feed_result(block, result)
+
+    def _apply_feed_result(self, block: "BlockPlan", result: FeedResult) -> FeedResult:
+        """Apply AIR's answer for *block* (cursor, credits, pending slot, backoff)."""
         if result == FeedResult.ACCEPTED:
             self._advance_cursor(block)
             self._pending_block = None
@@ -2179,6 +2193,53 @@ class BlockPlanProducer(Producer):
             )
             return FeedResult.ERROR
 
+    def _on_feed_result(self, block: "BlockPlan", result: FeedResult) -> None:
+        """PlayoutSession callback: AIR answered an asynchronous feed.
+
+        INV-FEED-NONBLOCKING-001: Runs on a gRPC thread.  Applies the result
+        exactly as a synchronous feed would, then continues feeding ahead
+        while credits remain, so the pipeline advances on acknowledgements
+        rather than on a thread blocked waiting for them.
+        """
+        with self._lock:
+            if self._feed_in_flight is not block:
+                return  # session restarted since this feed was issued
+            self._feed_in_flight = None
+            if self._feed_state != _FeedState.RUNNING or self._session_ended:
+                return
+            if self._apply_feed_result(block, result) != FeedResult.ACCEPTED:
+                self._logger.info(
+                    "FEED-AHEAD: %s for %s, credits=%d",
+                    result.value, block.block_id, self._feed_credits,
+                )
+                return
+            self._record_block_delivered(
+                block, int(self.clock.now_utc().timestamp() * 1000)
+            )
+            self._feed_ahead()
+
+    def _record_block_delivered(self, block: "BlockPlan", now_utc_ms: int) -> None:
+        """Bookkeeping after AIR accepted *block* (runway tracker, metrics)."""
+        # Block accepted — reset first-due tracker for next block.
+        self._next_block_first_due_utc_ms = 0
+
+        # Update runway tracker
+        self._max_delivered_end_utc_ms = max(
+            self._max_delivered_end_utc_ms, block.end_utc_ms
+        )
+
+        # Emit metrics
+        new_runway_ms = self._compute_runway_ms()
+        lead_time_ms = max(0, block.start_utc_ms - now_utc_ms)
+        if feed_ahead_horizon_current_ms is not None:
+            feed_ahead_horizon_current_ms.labels(
+                channel_id=self.channel_id
+            ).observe(new_runway_ms)
+        if feed_ahead_horizon_target_ms is not None:
+            feed_ahead_horizon_target_ms.labels(
+                channel_id=self.channel_id
+            ).observe(lead_time_ms)
+
     def _feed_ahead(self) -> None:
         """Deadline-driven feed-ahead: feed blocks whose ready_by deadline
         has arrived or whose absence would let runway drop below horizon.
@@ -2194,6 +2255,8 @@ class BlockPlanProducer(Producer):
         - INV-FEED-QUEUE-003: Retry _pending_block before generating new
         - INV-FEED-QUEUE-001: Cursor advances only on successful feed
         - INV-FEED-NO-FEED-AFTER-END: Gated by _feed_state
+        - INV-FEED-NONBLOCKING-001: Never waits on AIR; while a feed is in
+          flight, returns immediately (its answer resumes feeding)
 
         FLOW CONTROL (credit-based, INV-FEED-CREDIT-*):
           - Credits = available queue slots in AIR, tracked locally.
@@ -2226,6 +2289,8 @@ class BlockPlanProducer(Producer):
             return
         if self._session_ended or not self._started or not self._session:
             return
+        if self._feed_in_flight is not None:
+            return
 
         # Runway controller telemetry
         if feed_credits_current is not None:
@@ -2363,6 +2428,8 @@ class BlockPlanProducer(Producer):
             )
 
             result = self._try_feed_block(block)
+            if result == FeedResult.PENDING:
+                return  # _on_feed_result continues when AIR answers
             if result != FeedResult.ACCEPTED:
                 self._logger.info(
                     "FEED-AHEAD: %s for %s, credits=%d",
@@ -2370,25 +2437,7 @@ class BlockPlanProducer(Producer):
                 )
                 return
 
-            # Block accepted — reset first-due tracker for next block.
-            self._next_block_first_due_utc_ms = 0
-
-            # Update runway tracker
-            self._max_delivered_end_utc_ms = max(
-                self._max_delivered_end_utc_ms, block.end_utc_ms
-            )
-
-            # Emit metrics
-            new_runway_ms = self._compute_runway_ms()
-            lead_time_ms = max(0, block.start_utc_ms - now_utc_ms)
-            if feed_ahead_horizon_current_ms is not None:
-                feed_ahead_horizon_current_ms.labels(
-                    channel_id=self.channel_id
-                ).observe(new_runway_ms)
-            if feed_ahead_horizon_target_ms is not None:
-                feed_ahead_horizon_target_ms.labels(
-                    channel_id=self.channel_id
-                ).observe(lead_time_ms)
+            self._record_block_delivered(block, now_utc_ms)
 
             # Credit re-check after successful feed
             if self._feed_credits <= 0:
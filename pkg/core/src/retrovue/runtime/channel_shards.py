@@ -0,0 +1,537 @@
+"""
+Multi-process channel sharding for ProgramDirector.
+
+One ProgramDirector process holds every ChannelManager, ChannelStream and
+HLS writer under a single GIL, so a busy channel's fanout and health ticks
+add latency to every other channel. With ``--workers N`` the lineup is
+split across N worker processes, each running an ordinary ProgramDirector
+restricted to its own channels on its own port. A thin front-end on the
+public port owns no channels:
+
+- Per-channel routes (TS, HLS, per-channel EPG and debug) answer with a
+  307 redirect to the owning worker, so media bytes never pass through
+  the front-end.
+- Lineup-wide routes (/channels, /api/epg, /debug/startup, /health,
+  /admin/emergency) fan out to every worker and merge the answers.
+- The IPTV playlist/guide, watch page and EPG page are served directly
+  from the full lineup (they read the DB, not the workers).
+
+INV-CHANNEL-SHARD-001: A channel's shard is a pure function of its id and
+the worker count (``shard_for``). Front-end and workers compute it
+independently, and channels added by a config reload land on a stable
+shard without coordination.
+
+INV-CHANNEL-SHARD-ISOLATION-001: Workers share nothing in memory. Each
+has its own evidence gRPC port and tune-history file, and a crashed
+worker is restarted by the front-end's supervisor with exponential
+backoff while the other shards keep serving.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Thread
+from typing import Any, Optional
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import HTMLResponse, RedirectResponse
+from uvicorn import Config, Server
+
+from retrovue.runtime.config import ChannelConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVIDENCE_PORT = 50052
+STATE_DIR = Path("/opt/retrovue/data/state")
+# Supervisor poll period and restart backoff ceiling
+SUPERVISE_INTERVAL_S = 1.0
+MAX_RESTART_BACKOFF_S = 30.0
+# A worker that stayed up this long has its crash count reset
+STABLE_UPTIME_S = 60.0
+# Per-worker timeout for fan-out requests
+FANOUT_TIMEOUT_S = 5.0
+
+
+def shard_for(channel_id: str, workers: int) -> int:
+    """Index of the worker that owns *channel_id* (stable across processes and restarts)."""
+    if workers <= 1:
+        return 0
+    return zlib.crc32(channel_id.encode("utf-8")) % workers
+
+
+def assign_channel_shards(channel_ids: list[str], workers: int) -> list[list[str]]:
+    """Split *channel_ids* into *workers* lists, preserving lineup order within each."""
+    shards: list[list[str]] = [[] for _ in range(max(1, workers))]
+    for cid in channel_ids:
+        shards[shard_for(cid, len(shards))].append(cid)
+    return shards
+
+
+class ShardChannelConfigProvider:
+    """ChannelConfigProvider view that exposes only the channels of one shard.
+
+    Membership is evaluated per call, so channels added or removed by the
+    inner provider's hot reload are picked up. Anything else (e.g.
+    ``get_traffic_policy``) is delegated to the inner provider unchanged.
+    """
+
+    def __init__(self, inner: Any, shard: int, workers: int) -> None:
+        self._inner = inner
+        self._shard = shard
+        self._workers = workers
+
+    def owns(self, channel_id: str) -> bool:
+        return shard_for(channel_id, self._workers) == self._shard
+
+    def list_channel_ids(self) -> list[str]:
+        return [cid for cid in self._inner.list_channel_ids() if self.owns(cid)]
+
+    def get_channel_config(self, channel_id: str) -> ChannelConfig | None:
+        if not self.owns(channel_id):
+            return None
+        return self._inner.get_channel_config(channel_id)
+
+    def to_channels_list(self) -> list[dict[str, Any]]:
+        return [c for c in self._inner.to_channels_list() if self.owns(c["channel_id"])]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+@dataclass(frozen=True)
+class ChannelSource:
+    """Picklable description of where channel configs come from.
+
+    Providers hold locks and caches and cannot cross a process boundary;
+    each worker re-opens its own from this spec.
+    """
+
+    kind: str  # "yaml" (channels directory) or "json" (channels.json)
+    path: str
+
+    def open(self) -> Any:
+        from retrovue.runtime.providers import FileChannelConfigProvider, YamlChannelConfigProvider
+
+        if self.kind == "yaml":
+            return YamlChannelConfigProvider(self.path)
+        if self.kind == "json":
+            return FileChannelConfigProvider(self.path)
+        raise ValueError(f"Unknown channel source kind: {self.kind!r}")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """Everything a worker process needs to run its ProgramDirector."""
+
+    index: int
+    workers: int
+    host: str
+    port: int
+    source: ChannelSource
+    evidence_port: int
+    tune_history_path: str
+
+
+def run_shard(spec: ShardSpec, stop_event: Any, parent_pid: int) -> None:
+    """Worker process entry point: run one ProgramDirector for one shard until stopped."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(levelname)s:     [shard {spec.index}] %(message)s",
+        force=True,
+    )
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from retrovue.runtime.program_director import ProgramDirector
+
+    provider = ShardChannelConfigProvider(spec.source.open(), spec.index, spec.workers)
+    director = ProgramDirector(
+        host=spec.host,
+        port=spec.port,
+        channel_config_provider=provider,
+        evidence_port=spec.evidence_port,
+        tune_history_path=Path(spec.tune_history_path),
+        # Retention covers every channel's rows; one shard runs it
+        schedule_retention=spec.index == 0,
+    )
+    # The watch page is served by the front-end; its HLS requests are
+    # redirected here, i.e. cross-origin.
+    director.fastapi_app.add_middleware(
+        CORSMiddleware, allow_origins=["*"], allow_methods=["GET", "POST"]
+    )
+    director.start()
+    logger.info(
+        "Shard %d/%d serving %d channels on port %d",
+        spec.index, spec.workers, len(provider.list_channel_ids()), spec.port,
+    )
+    try:
+        # Exit with the front-end even if it dies without signalling
+        while not stop_event.wait(SUPERVISE_INTERVAL_S):
+            if os.getppid() != parent_pid:
+                logger.warning("Front-end process exited; shard %d stopping", spec.index)
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        director.stop()
+
+
+class ShardWorker:
+    """Front-end handle on one worker process (start, stop, restart with backoff)."""
+
+    def __init__(self, spec: ShardSpec, *, mp_context: Any = None) -> None:
+        self.spec = spec
+        self._ctx = mp_context or multiprocessing.get_context("spawn")
+        self._process: Optional[Any] = None
+        self._stop_event: Optional[Any] = None
+        self._started_at = 0.0
+        self._next_restart_at = 0.0
+        self.restarts = 0
+        self._crashes = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        self._stop_event = self._ctx.Event()
+        self._process = self._ctx.Process(
+            target=run_shard,
+            args=(self.spec, self._stop_event, os.getpid()),
+            name=f"retrovue-shard-{self.spec.index}",
+            daemon=False,
+        )
+        self._process.start()
+        self._started_at = time.monotonic()
+        logger.info(
+            "Started shard %d (pid %s) on port %d", self.spec.index, self._process.pid, self.spec.port
+        )
+
+    def ensure_running(self, now: Optional[float] = None) -> bool:
+        """Restart the worker if it died; returns True when a restart was issued."""
+        if self._process is None or self.is_alive():
+            return False
+        now = time.monotonic() if now is None else now
+        if self._next_restart_at == 0.0:
+            if now - self._started_at >= STABLE_UPTIME_S:
+                self._crashes = 0
+            backoff = min(MAX_RESTART_BACKOFF_S, 2.0 ** self._crashes)
+            self._crashes += 1
+            self._next_restart_at = now + backoff
+            logger.error(
+                "Shard %d exited (code %s); restarting in %.0fs",
+                self.spec.index, self._process.exitcode, backoff,
+            )
+        if now < self._next_restart_at:
+            return False
+        self._next_restart_at = 0.0
+        self.restarts += 1
+        self.start()
+        return True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        process = self._process
+        if process is None:
+            return
+        if self._stop_event is not None:
+            self._stop_event.set()
+        process.join(timeout)
+        if process.is_alive():
+            logger.warning("Shard %d did not stop within %.1fs; terminating", self.spec.index, timeout)
+            process.terminate()
+            process.join(timeout)
+        self._process = None
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "shard": self.spec.index,
+            "port": self.spec.port,
+            "pid": self.pid,
+            "alive": self.is_alive(),
+            "restarts": self.restarts,
+        }
+
+
+def build_shard_specs(
+    workers: int,
+    source: ChannelSource,
+    *,
+    host: str,
+    port: int,
+    evidence_port: int = DEFAULT_EVIDENCE_PORT,
+    state_dir: Path = STATE_DIR,
+) -> list[ShardSpec]:
+    """Specs for *workers* shards: HTTP ports follow the front-end port, evidence ports follow 50052."""
+    return [
+        ShardSpec(
+            index=i,
+            workers=workers,
+            host=host,
+            port=port + 1 + i,
+            source=source,
+            evidence_port=evidence_port + i,
+            tune_history_path=str(state_dir / f"channel_tune_history.shard{i}.json"),
+        )
+        for i in range(workers)
+    ]
+
+
+def _fetch_json(url: str, *, method: str = "GET", timeout: float = FANOUT_TIMEOUT_S) -> tuple[int, Any]:
+    """(status, decoded body) for *url*; status 0 when the worker is unreachable."""
+    req = urllib.request.Request(url, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, None
+    except (OSError, ValueError) as e:
+        logger.debug("Shard request %s failed: %s", url, e)
+        return 0, None
+
+
+class ShardedProgramDirector:
+    """Front-end that routes and aggregates across channel shard workers."""
+
+    def __init__(
+        self,
+        provider: Any,
+        workers: list[ShardWorker],
+        *,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+    ) -> None:
+        self._provider = provider
+        self._workers = workers
+        self.host = host
+        self.port = port
+        self._fanout = ThreadPoolExecutor(
+            max_workers=max(1, len(workers)), thread_name_prefix="shard-fanout"
+        )
+        self._supervise_stop = threading.Event()
+        self._supervise_thread: Optional[Thread] = None
+        self._server: Optional[Server] = None
+        self._server_thread: Optional[Thread] = None
+        self.fastapi_app = FastAPI(title="RetroVue ProgramDirector (sharded)")
+        self._register_endpoints()
+
+    # -- routing ---------------------------------------------------------------
+
+    def owner(self, channel_id: str) -> Optional[ShardWorker]:
+        """Worker owning *channel_id*, or None when the channel is not in the lineup."""
+        if self._provider.get_channel_config(channel_id) is None:
+            return None
+        return self._workers[shard_for(channel_id, len(self._workers))]
+
+    def _worker_url(self, worker: ShardWorker, path: str) -> str:
+        return f"http://127.0.0.1:{worker.spec.port}{path}"
+
+    def _redirect(self, request: Request, channel_id: str) -> Response:
+        worker = self.owner(channel_id)
+        if worker is None:
+            return Response(
+                content=f"Channel {channel_id} not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        target = request.url.replace(port=worker.spec.port)
+        return RedirectResponse(str(target), status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    def _gather(self, path: str, *, method: str = "GET") -> list[tuple[ShardWorker, int, Any]]:
+        """Issue *path* to every worker concurrently; results in shard order."""
+        futures = [
+            (w, self._fanout.submit(_fetch_json, self._worker_url(w, path), method=method))
+            for w in self._workers
+        ]
+        return [(w, *f.result()) for w, f in futures]
+
+    # -- endpoints -------------------------------------------------------------
+
+    def _register_endpoints(self) -> None:
+        app = self.fastapi_app
+
+        @app.get("/health")
+        def health() -> Response:
+            """Front-end and per-shard liveness."""
+            shards = [w.status() for w in self._workers]
+            alive = sum(1 for s in shards if s["alive"])
+            state = "ok" if alive == len(shards) else ("degraded" if alive else "down")
+            return Response(
+                content=json.dumps({"status": state, "shards": shards}),
+                media_type="application/json",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE if alive == 0 else status.HTTP_200_OK,
+            )
+
+        @app.get("/channels", response_model=None)
+        def get_channels() -> Any:
+            """Union of every shard's channel list (503 until some shard is ready)."""
+            results = self._gather("/channels")
+            if not any(code == 200 for _, code, _ in results):
+                return Response(
+                    content="Server is starting up — schedule prewarm in progress",
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+            channels: list[dict[str, Any]] = []
+            for _, code, body in results:
+                if code == 200 and body:
+                    channels.extend(body.get("channels", []))
+            return {"channels": channels}
+
+        @app.get("/debug/startup")
+        def get_startup_report() -> Any:
+            """Each shard's cold-start report, keyed by shard."""
+            return {
+                "shards": [
+                    {**w.status(), "report": body if code == 200 else None}
+                    for w, code, body in self._gather("/debug/startup")
+                ]
+            }
+
+        @app.get("/api/epg")
+        def get_epg_all(request: Request, channel: Optional[str] = None) -> Any:
+            """Lineup EPG, assembled from the shards in lineup order."""
+            query = f"?{request.url.query}" if request.url.query else ""
+            if channel:
+                worker = self.owner(channel)
+                if worker is None:
+                    return {"broadcast_day": request.query_params.get("date"), "entries": []}
+                code, body = _fetch_json(self._worker_url(worker, "/api/epg" + query))
+                results = [(worker, code, body)]
+            else:
+                results = self._gather("/api/epg" + query)
+
+            broadcast_day = request.query_params.get("date")
+            by_channel: dict[str, list[dict[str, Any]]] = {}
+            for worker, code, body in results:
+                if code != 200 or not body:
+                    logger.warning("EPG fan-out: shard %d answered %s", worker.spec.index, code)
+                    continue
+                broadcast_day = broadcast_day or body.get("broadcast_day")
+                for entry in body.get("entries", []):
+                    by_channel.setdefault(entry["channel_id"], []).append(entry)
+            entries: list[dict[str, Any]] = []
+            for cid in self._provider.list_channel_ids():
+                entries.extend(by_channel.pop(cid, []))
+            for rest in by_channel.values():
+                entries.extend(rest)
+            return {"broadcast_day": broadcast_day, "entries": entries}
+
+        @app.post("/admin/emergency")
+        def emergency_override() -> dict[str, Any]:
+            """Forward the override to every shard."""
+            results = self._gather("/admin/emergency", method="POST")
+            return {
+                "status": "ok" if all(code == 200 for _, code, _ in results) else "partial",
+                "shards": [{"shard": w.spec.index, "status_code": code} for w, code, _ in results],
+            }
+
+        @app.get("/iptv/channels.m3u")
+        def iptv_playlist(request: Request) -> Response:
+            """M3U lineup of all channels; streams resolve through the front-end redirects."""
+            from retrovue.web.api.guide import playlist_response
+
+            return playlist_response(
+                request,
+                self._provider.to_channels_list(),
+                lambda cid: f"/channel/{cid}.ts",
+                guide_path="/iptv/guide.xml",
+            )
+
+        @app.get("/iptv/guide.xml")
+        def iptv_guide(request: Request, days: int = 7, channel: Optional[str] = None) -> Response:
+            """Streamed XMLTV guide for the full lineup (reads CompiledProgramLog)."""
+            from retrovue.epg.guide import MAX_GUIDE_DAYS
+            from retrovue.web.api.guide import guide_response
+
+            channels = self._provider.to_channels_list()
+            if channel:
+                channels = [c for c in channels if c["channel_id"] == channel]
+            return guide_response(request, channels, days=max(1, min(days, MAX_GUIDE_DAYS)))
+
+        @app.get("/watch/{channel_id}", response_class=HTMLResponse)
+        def watch_channel(channel_id: str) -> HTMLResponse:
+            """HLS player page with the full lineup's channel buttons."""
+            from retrovue.runtime.program_director import render_watch_page
+
+            return HTMLResponse(content=render_watch_page(channel_id, self._provider.to_channels_list()))
+
+        @app.get("/epg", response_class=HTMLResponse)
+        def epg_guide_html() -> HTMLResponse:
+            """Serve the EPG HTML page (its /api/epg calls are aggregated here)."""
+            html_path = Path("/opt/retrovue/pkg/core/templates") / "epg" / "guide.html"
+            return HTMLResponse(content=html_path.read_text())
+
+        # Per-channel routes: redirect to the owning shard.
+        @app.get("/channel/{channel_id}.ts")
+        @app.get("/channel/{channel_id}.m3u")
+        @app.get("/api/epg/{channel_id}")
+        @app.get("/debug/channels/{channel_id}/current-segment")
+        @app.get("/debug/horizon/{channel_id}")
+        @app.get("/hls/{channel_id}/live.m3u8")
+        @app.get("/hls/{channel_id}/{segment}")
+        @app.post("/hls/{channel_id}/tune_out")
+        def to_owner(request: Request, channel_id: str) -> Response:
+            return self._redirect(request, channel_id)
+
+    # -- lifecycle -------------------------------------------------------------
+
+    def _supervise(self) -> None:
+        while not self._supervise_stop.wait(SUPERVISE_INTERVAL_S):
+            for worker in self._workers:
+                try:
+                    worker.ensure_running()
+                except Exception:
+                    logger.exception("Failed to restart shard %d", worker.spec.index)
+
+    def start(self) -> None:
+        """Start every worker, the supervisor, and the front-end HTTP server."""
+        for worker in self._workers:
+            worker.start()
+
+        self._supervise_stop.clear()
+        self._supervise_thread = Thread(target=self._supervise, name="shard-supervisor", daemon=True)
+        self._supervise_thread.start()
+
+        def _run_server() -> None:
+            logger.info(
+                "Sharded ProgramDirector front-end on %s:%s (%d workers)",
+                self.host, self.port, len(self._workers),
+            )
+            try:
+                self._server = Server(Config(self.fastapi_app, host=self.host, port=self.port, log_level="info"))
+                self._server.run()
+            finally:
+                logger.info("Sharded ProgramDirector front-end stopped")
+
+        self._server_thread = Thread(target=_run_server, name="shard-frontend-http", daemon=True)
+        self._server_thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the front-end, then each worker (in parallel)."""
+        self._supervise_stop.set()
+        if self._supervise_thread is not None:
+            self._supervise_thread.join(timeout)
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._server_thread is not None:
+            self._server_thread.join(timeout)
+        stoppers = [
+            Thread(target=w.stop, args=(timeout,), name=f"shard-stop-{w.spec.index}")
+            for w in self._workers
+        ]
+        for t in stoppers:
+            t.start()
+        for t in stoppers:
+            t.join()
+        self._fanout.shutdown(wait=False)
@@ -24,6 +24,7 @@ from pathlib import Path
 from queue import Empty, Full, Queue
 from typing import Any, Callable, Literal, Optional, Protocol
 
+from .ts_gop_cache import DEFAULT_GOP_CACHE_MAX_BYTES, TsGopCache
 from .ts_ring_buffer import DEFAULT_RING_BUFFER_MAX_BYTES, TsRingBuffer
 
 # Config from env (bytes-based client buffer; default ~2–4 s at ~2.5 Mbit/s TS)
@@ -47,6 +48,17 @@ def _ring_buffer_bytes() -> int:
     return DEFAULT_RING_BUFFER_MAX_BYTES
 
 
+def _gop_cache_bytes() -> int:
+    """GOP cache cap for tune-in bursts; 0 disables the burst."""
+    val = os.environ.get("HTTP_GOP_CACHE_BYTES")
+    if val is not None:
+        try:
+            return max(0, int(val))
+        except ValueError:
+            pass
+    return DEFAULT_GOP_CACHE_MAX_BYTES
+
+
 class BytesBoundedQueue:
     """
     Thread-safe queue with a byte-size cap. When full, oldest chunks are dropped.
@@ -413,6 +425,7 @@ class ChannelStream:
         ring_buffer_max_bytes: int | None = None,
         client_buffer_max_bytes: int | None = None,
         backpressure_policy: BackpressurePolicy = DEFAULT_BACKPRESSURE_POLICY,
+        gop_cache_max_bytes: int | None = None,
     ):
         """
         Initialize ChannelStream for a channel.
@@ -425,6 +438,8 @@ class ChannelStream:
             ring_buffer_max_bytes: Max ring buffer size (default: HTTP_RING_BUFFER_BYTES or 8MB)
             client_buffer_max_bytes: Per-client queue byte cap (default: HTTP_CLIENT_BUFFER_BYTES or 2MB)
             backpressure_policy: "drop_oldest" (preferred for live) or "disconnect"
+            gop_cache_max_bytes: Cap on the cached GOP a joining client is burst
+                (default: HTTP_GOP_CACHE_BYTES or 4MB; 0 = join at the live edge)
         """
         self.channel_id = channel_id
         self.socket_path = Path(socket_path) if socket_path else None
@@ -459,6 +474,16 @@ class ChannelStream:
         self.subscribers: dict[str, BytesBoundedQueue] = {}
         self.subscribers_lock = threading.Lock()
 
+        # INV-TS-TUNE-BURST-001: GOP cache fed by the fanout thread and read at
+        # subscribe(), both under subscribers_lock, so a joiner's burst is
+        # followed by exactly the next live chunk.
+        gop_bytes = (
+            gop_cache_max_bytes
+            if gop_cache_max_bytes is not None
+            else _gop_cache_bytes()
+        )
+        self._gop_cache: TsGopCache | None = TsGopCache(gop_bytes) if gop_bytes > 0 else None
+
         # Upstream reader thread (UDS → ring buffer) and fanout thread (ring buffer → clients)
         self.reader_thread: threading.Thread | None = None
         self._fanout_thread: threading.Thread | None = None
@@ -666,6 +691,8 @@ class ChannelStream:
                 except Exception:
                     pass
             with self.subscribers_lock:
+                if self._gop_cache is not None:
+                    self._gop_cache.feed(chunk)
                 subscribers_snapshot = list(self.subscribers.items())
             # With 0 subscribers we still consumed one chunk (drain); nothing to put.
             to_remove: list[str] = []
@@ -792,13 +819,20 @@ class ChannelStream:
         """
         queue = BytesBoundedQueue(max_bytes=self._client_buffer_max_bytes)
 
+        burst_bytes = 0
         with self.subscribers_lock:
+            # Start the client at the last random access point rather than mid-GOP
+            if self._gop_cache is not None:
+                burst = self._gop_cache.burst()
+                if burst and len(burst) <= self._client_buffer_max_bytes:
+                    queue.put_nowait(burst)
+                    burst_bytes = len(burst)
             self.subscribers[client_id] = queue
             subscriber_count = len(self.subscribers)
 
         self._logger.info(
-            "[HTTP] CLIENT_CONNECTED id=%s channel=%s subscribers=%d",
-            client_id, self.channel_id, subscriber_count,
+            "[HTTP] CLIENT_CONNECTED id=%s channel=%s subscribers=%d burst_bytes=%d",
+            client_id, self.channel_id, subscriber_count, burst_bytes,
         )
 
         if not self.reader_thread or not self.reader_thread.is_alive():
@@ -836,11 +870,14 @@ class ChannelStream:
         )
 
     def get_ring_buffer_metrics(self) -> dict[str, int]:
-        """Ring buffer metrics: current_bytes, dropped_bytes, high_water_mark."""
+        """Ring buffer metrics: current_bytes, dropped_bytes, high_water_mark, gop_cache_bytes."""
+        with self.subscribers_lock:
+            gop_bytes = self._gop_cache.gop_bytes if self._gop_cache is not None else 0
         return {
             "current_bytes": self._ring_buffer.current_bytes,
             "dropped_bytes": self._ring_buffer.dropped_bytes,
             "high_water_mark": self._ring_buffer.high_water_mark,
+            "gop_cache_bytes": gop_bytes,
         }
 
 
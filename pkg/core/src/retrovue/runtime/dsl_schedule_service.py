@@ -15,9 +15,7 @@ Implements the ScheduleService protocol (get_block_at, get_playout_plan_now).
 from __future__ import annotations
 
 import logging
-import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta, date
 from pathlib import Path
 from typing import Any
@@ -27,7 +25,20 @@ from retrovue.runtime.schedule_compiler import compile_schedule, parse_dsl
 from retrovue.runtime.playout_log_expander import expand_program_block
 from retrovue.runtime.traffic_manager import fill_ad_blocks
 from retrovue.runtime.catalog_resolver import CatalogAssetResolver
+from retrovue.runtime.horizon_snapshot import HorizonSnapshotStore, SnapshotDay, tier1_stamp
+from retrovue.runtime.segment_codec import SegmentCodecError, decode_blocks, pack_blocks
+from retrovue.runtime.uri_resolution_index import (
+    UriResolutionIndex,
+    get_uri_resolution_index,
+)
 from retrovue.adapters.enrichers.loudness_enricher import needs_loudness_measurement
+from retrovue.runtime.loudness_queue import LoudnessQueue, get_loudness_queue
+from retrovue.runtime.schedule_row_cache import (
+    CompiledDay,
+    get_compiled_log_cache,
+    get_transmission_log_cache,
+    read_compiled_day,
+)
 from retrovue.infra.uow import session
 
 import hashlib
@@ -73,6 +84,43 @@ def _serialize_scheduled_block(block: "ScheduledBlock") -> dict:
     }
 
 
+def _deserialize_txlog_row(row: Any) -> ScheduledBlock:
+    """Build a filled ScheduledBlock from a TransmissionLog row.
+
+    INV-SEGMENT-CODEC-001: Decodes segments_packed when present and falls
+    back to the JSONB segments list for legacy or unreadable payloads.
+    """
+    packed = row.segments_packed
+    if packed:
+        try:
+            (block,) = decode_blocks(packed)
+            return block
+        except ValueError as e:  # SegmentCodecError, or not exactly one block
+            logger.warning(
+                "INV-SEGMENT-CODEC-001: Unreadable segments_packed for block=%s: %s",
+                row.block_id, e,
+            )
+    return ScheduledBlock(
+        block_id=row.block_id,
+        start_utc_ms=row.start_utc_ms,
+        end_utc_ms=row.end_utc_ms,
+        segments=tuple(
+            ScheduledSegment(
+                segment_type=s.get("segment_type", "content"),
+                asset_uri=s.get("asset_uri", ""),
+                asset_start_offset_ms=s.get("asset_start_offset_ms", 0),
+                segment_duration_ms=s.get("segment_duration_ms", 0),
+                transition_in=s.get("transition_in", "TRANSITION_NONE"),
+                transition_in_duration_ms=s.get("transition_in_duration_ms", 0),
+                transition_out=s.get("transition_out", "TRANSITION_NONE"),
+                transition_out_duration_ms=s.get("transition_out_duration_ms", 0),
+                gain_db=s.get("gain_db", 0.0),
+            )
+            for s in row.segments
+        ),
+    )
+
+
 def _deserialize_scheduled_block(d: dict) -> "ScheduledBlock":
     """Deserialize a dict back into a ScheduledBlock.
 
@@ -119,6 +167,9 @@ class DslScheduleService:
         programming_day_start_hour: int = 6,
         channel_slug: str | None = None,
         channel_type: str = "network",
+        snapshot_store: HorizonSnapshotStore | None = None,
+        uri_index: UriResolutionIndex | None = None,
+        loudness_queue: LoudnessQueue | None = None,
     ) -> None:
         self._dsl_path = dsl_path
         self._filler_path = filler_path
@@ -132,17 +183,20 @@ class DslScheduleService:
         self._blocks: list[ScheduledBlock] = []
         self._lock = threading.Lock()
         self._uri_cache: dict[str, str] = {}
+        # None = process-wide index (get_uri_resolution_index)
+        self._uri_index = uri_index
 
         # Track which broadcast days have been compiled (set of "YYYY-MM-DD")
         self._compiled_days: set[str] = set()
 
+        # INV-HORIZON-SNAPSHOT-VALIDATE-001: per-day blocks + DSL hash, kept
+        # so the horizon can be written to disk after each extension.
+        self._snapshot_store = snapshot_store
+        self._snapshot_days: dict[str, SnapshotDay] = {}
 
         # Recompile guard: prevent concurrent horizon extensions
         self._extending = False
 
-        # INV-SCHEDULE-RETENTION-001: throttle DB purge to at most once/hour
-        self._last_tier1_purge_utc_ms: int = 0
-
         # Cached CatalogAssetResolver (Part 2B: avoid per-compile reload)
         # TTL-based: resolver is rebuilt if catalog may have changed.
         self._resolver: CatalogAssetResolver | None = None
@@ -154,91 +208,39 @@ class DslScheduleService:
         self._channel_tz = None
 
         # INV-LOUDNESS-NORMALIZED-001: Background loudness measurement
-        # Lazy backfill: unmeasured assets enqueue a background job on first encounter.
-        # _loudness_pending prevents duplicate enqueues.
-        self._loudness_pending: set[str] = set()
-        self._loudness_lock = threading.Lock()
-        self._loudness_executor: ThreadPoolExecutor | None = None
-
-    def _enqueue_loudness_measurement(self, asset_id: str, file_path: str) -> None:
+        # Lazy backfill: unmeasured assets are queued on first encounter.
+        # The queue is durable and shared by every channel in the process
+        # (None = get_loudness_queue()); it dedupes by asset and measures
+        # the soonest-airing assets first.
+        self._loudness_queue = loudness_queue or get_loudness_queue()
+        self._loudness_queue.add_listener(self._on_loudness_measured)
+        if self._loudness_queue.pending():
+            # Resume work journaled before a restart
+            self._loudness_queue.start()
+
+    def _enqueue_loudness_measurement(
+        self, asset_id: str, file_path: str, airtime_utc_ms: int = 0,
+    ) -> None:
         """INV-LOUDNESS-NORMALIZED-001 Rule 5: Enqueue background loudness measurement.
 
-        Deduplicates by asset_id. The background job runs ffmpeg ebur128,
-        computes gain_db, and persists to AssetProbed.
+        *airtime_utc_ms* is when the asset is scheduled to air; the queue
+        measures the earliest airtimes first.
         """
-        with self._loudness_lock:
-            if asset_id in self._loudness_pending:
-                return  # Already in-flight
-            self._loudness_pending.add(asset_id)
-            if self._loudness_executor is None:
-                self._loudness_executor = ThreadPoolExecutor(
-                    max_workers=1, thread_name_prefix="loudness-measure"
-                )
-
-        self._loudness_executor.submit(self._run_loudness_measurement, asset_id, file_path)
-        logger.info(
+        self._loudness_queue.enqueue(asset_id, file_path, airtime_utc_ms)
+        logger.debug(
             "INV-LOUDNESS-NORMALIZED-001: Enqueued background loudness measurement "
-            "for asset=%s path=%s",
-            asset_id, file_path,
+            "for asset=%s path=%s airtime=%d",
+            asset_id, file_path, airtime_utc_ms,
         )
 
-    def _run_loudness_measurement(self, asset_id: str, file_path: str) -> None:
-        """Background task: measure loudness and persist to AssetProbed."""
-        try:
-            from retrovue.adapters.enrichers.loudness_enricher import LoudnessEnricher
-            enricher = LoudnessEnricher()
-            # measure_loudness returns {"integrated_lufs", "gain_db", "target_lufs"}
-            loudness_data = enricher.measure_loudness(file_path)
-
-            # Persist to AssetProbed
-            import uuid as uuid_mod
-            from retrovue.domain.entities import AssetProbed
-            with session() as db:
-                probed = db.query(AssetProbed).filter(
-                    AssetProbed.asset_uuid == uuid_mod.UUID(asset_id),
-                ).first()
-                if probed is None:
-                    probed = AssetProbed(
-                        asset_uuid=uuid_mod.UUID(asset_id),
-                        payload={"loudness": loudness_data},
-                    )
-                    db.add(probed)
-                else:
-                    payload = dict(probed.payload) if probed.payload else {}
-                    payload["loudness"] = loudness_data
-                    probed.payload = payload
-                db.commit()
-
-            logger.info(
-                "INV-LOUDNESS-NORMALIZED-001: Background measurement complete "
-                "asset=%s integrated_lufs=%.1f gain_db=%.1f",
-                asset_id,
-                loudness_data["integrated_lufs"],
-                loudness_data["gain_db"],
-            )
-
-            # Update in-place instead of invalidating: avoids full resolver
-            # rebuild (12k+ assets) which causes UPSTREAM_LOOP spikes on the
-            # event thread via GIL contention.
-            resolver = self._resolver
-            if resolver is not None:
-                resolver.update_asset_loudness(asset_id, loudness_data["gain_db"])
-
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                "INV-LOUDNESS-NORMALIZED-001: Background loudness measurement "
-                "timed out for asset=%s path=%s — will retry on next compile",
-                asset_id, file_path,
-            )
-        except Exception:
-            logger.exception(
-                "INV-LOUDNESS-NORMALIZED-001: Background loudness measurement "
-                "error for asset=%s",
-                asset_id,
-            )
-        finally:
-            with self._loudness_lock:
-                self._loudness_pending.discard(asset_id)
+    def _on_loudness_measured(self, asset_id: str, loudness_data: dict) -> None:
+        """Queue listener: apply a persisted measurement to the cached resolver."""
+        # Update in-place instead of invalidating: avoids full resolver
+        # rebuild (12k+ assets) which causes UPSTREAM_LOOP spikes on the
+        # event thread via GIL contention.
+        resolver = self._resolver
+        if resolver is not None:
+            resolver.update_asset_loudness(asset_id, loudness_data["gain_db"])
 
     def _get_resolver(self) -> CatalogAssetResolver:
         """Return a cached CatalogAssetResolver, rebuilding if TTL expired.
@@ -323,42 +325,14 @@ class DslScheduleService:
         from retrovue.domain.entities import TransmissionLog
         from retrovue.runtime.traffic_manager import fill_ad_blocks
 
-        # Check if already compiled (idempotent fast path)
-        try:
-            with session() as db:
-                row = db.query(TransmissionLog).filter(
-                    TransmissionLog.block_id == block.block_id,
-                ).first()
-                if row is not None:
-                    # Already compiled — deserialize and return
-                    segments = []
-                    for s in row.segments:
-                        segments.append(ScheduledSegment(
-                            segment_type=s.get("segment_type", "content"),
-                            asset_uri=s.get("asset_uri", ""),
-                            asset_start_offset_ms=s.get("asset_start_offset_ms", 0),
-                            segment_duration_ms=s.get("segment_duration_ms", 0),
-                            transition_in=s.get("transition_in", "TRANSITION_NONE"),
-                            transition_in_duration_ms=s.get("transition_in_duration_ms", 0),
-                            transition_out=s.get("transition_out", "TRANSITION_NONE"),
-                            transition_out_duration_ms=s.get("transition_out_duration_ms", 0),
-                            gain_db=s.get("gain_db", 0.0),
-                        ))
-                    logger.debug(
-                        "INV-TIER2-AUTHORITY-001: block %s already compiled (channel=%s)",
-                        block.block_id, channel_id,
-                    )
-                    return ScheduledBlock(
-                        block_id=row.block_id,
-                        start_utc_ms=row.start_utc_ms,
-                        end_utc_ms=row.end_utc_ms,
-                        segments=tuple(segments),
-                    )
-        except Exception as e:
-            logger.warning(
-                "INV-TIER2-AUTHORITY-001: DB check failed for block=%s: %s — compiling anyway",
-                block.block_id, e,
+        # Check if already compiled (idempotent fast path, read-through cache)
+        existing = self._get_filled_block_by_id(block.block_id)
+        if existing is not None:
+            logger.debug(
+                "INV-TIER2-AUTHORITY-001: block %s already compiled (channel=%s)",
+                block.block_id, channel_id,
             )
+            return existing
 
         # Not compiled — fill ads synchronously
         logger.info(
@@ -367,23 +341,28 @@ class DslScheduleService:
             block.block_id, channel_id,
         )
 
-        asset_lib = None
+        # Fill inside the session: plays logged by the library are flushed
+        # into it and commit with it (INV-TRAFFIC-PLAY-HISTORY-001).
         try:
             from retrovue.catalog.db_asset_library import DatabaseAssetLibrary
             with session() as db:
-                asset_lib = DatabaseAssetLibrary(db, channel_slug=channel_id)
+                filled_block = fill_ad_blocks(
+                    block,
+                    filler_uri=self._filler_path,
+                    filler_duration_ms=self._filler_duration_ms,
+                    asset_library=DatabaseAssetLibrary(db, channel_slug=channel_id),
+                )
         except Exception as e:
             logger.warning(
-                "INV-TIER2-AUTHORITY-001: Could not create asset library for %s: %s",
+                "INV-TIER2-AUTHORITY-001: Could not fill from asset library for %s: %s",
                 channel_id, e,
             )
-
-        filled_block = fill_ad_blocks(
-            block,
-            filler_uri=self._filler_path,
-            filler_duration_ms=self._filler_duration_ms,
-            asset_library=asset_lib,
-        )
+            filled_block = fill_ad_blocks(
+                block,
+                filler_uri=self._filler_path,
+                filler_duration_ms=self._filler_duration_ms,
+                asset_library=None,
+            )
 
         # Write to TransmissionLog (idempotent via merge)
         try:
@@ -425,8 +404,11 @@ class DslScheduleService:
                     start_utc_ms=filled_block.start_utc_ms,
                     end_utc_ms=filled_block.end_utc_ms,
                     segments=segments_data,
+                    segments_packed=pack_blocks([filled_block]),
                 )
                 db.merge(row)
+            # INV-SCHEDULE-ROW-CACHE-001: next read hydrates the persisted row
+            get_transmission_log_cache().invalidate(filled_block.block_id)
 
             logger.info(
                 "INV-TIER2-AUTHORITY-001: Compiled and persisted block=%s channel=%s (%d segs)",
@@ -463,45 +445,36 @@ class DslScheduleService:
         Returns a ScheduledBlock with real ad URIs if the Playlog Horizon
         Daemon has already filled this block. Returns None otherwise.
         """
+        cache = get_transmission_log_cache()
+        cached = cache.get(block_id)
+        if cached is not None:
+            return cached
         try:
+            from sqlalchemy.orm import defer
+
             from retrovue.infra.uow import session as db_session_factory
             from retrovue.domain.entities import TransmissionLog
 
             with db_session_factory() as db:
-                row = db.query(TransmissionLog).filter(
+                # The JSONB list is only loaded for rows without a packed payload
+                row = db.query(TransmissionLog).options(
+                    defer(TransmissionLog.segments),
+                ).filter(
                     TransmissionLog.block_id == block_id,
                 ).first()
 
                 if row is None:
                     return None
 
-                # Deserialize TX log segments into ScheduledBlock
-                segments = []
-                for s in row.segments:
-                    segments.append(ScheduledSegment(
-                        segment_type=s.get("segment_type", "content"),
-                        asset_uri=s.get("asset_uri", ""),
-                        asset_start_offset_ms=s.get("asset_start_offset_ms", 0),
-                        segment_duration_ms=s.get("segment_duration_ms", 0),
-                        transition_in=s.get("transition_in", "TRANSITION_NONE"),
-                        transition_in_duration_ms=s.get("transition_in_duration_ms", 0),
-                        transition_out=s.get("transition_out", "TRANSITION_NONE"),
-                        transition_out_duration_ms=s.get("transition_out_duration_ms", 0),
-                        gain_db=s.get("gain_db", 0.0),
-                    ))
-
-                logger.debug(
-                    "INV-CHANNEL-NO-COMPILE-001: Tier 2 hit for "
-                    "block=%s (%d segs)",
-                    row.block_id, len(segments),
-                )
+                filled = _deserialize_txlog_row(row)
 
-                return ScheduledBlock(
-                    block_id=row.block_id,
-                    start_utc_ms=row.start_utc_ms,
-                    end_utc_ms=row.end_utc_ms,
-                    segments=tuple(segments),
-                )
+            logger.debug(
+                "INV-CHANNEL-NO-COMPILE-001: Tier 2 hit for "
+                "block=%s (%d segs)",
+                filled.block_id, len(filled.segments),
+            )
+            cache.put(block_id, filled)
+            return filled
 
         except Exception as e:
             logger.warning(
@@ -598,12 +571,15 @@ class DslScheduleService:
                 "(remaining=%d min)",
                 day_str, channel_id, remaining_ms // 60000,
             )
+            dsl_hash = self._current_dsl_hash()
             new_blocks = self._compile_day(channel_id, day_str)
             if new_blocks:
+                stamp = self._tier1_stamps(channel_id, [day_str]).get(day_str)
                 with self._lock:
                     self._blocks.extend(new_blocks)
                     self._blocks.sort(key=lambda b: b.start_utc_ms)
                     self._compiled_days.add(day_str)
+                    self._record_snapshot_day(day_str, new_blocks, dsl_hash, stamp)
                 logger.info(
                     "Horizon extended: +%d blocks for %s (total=%d)",
                     len(new_blocks), day_str, len(self._blocks),
@@ -612,8 +588,8 @@ class DslScheduleService:
             # Prune old blocks (>24h in the past) to save memory
             self._prune_old_blocks(now_utc_ms)
 
-            # INV-SCHEDULE-RETENTION-001: purge expired Tier 1 DB rows
-            self._purge_expired_tier1(now_utc_ms)
+            if new_blocks:
+                self._write_snapshot(channel_id)
 
         except Exception as e:
             logger.error(
@@ -631,46 +607,13 @@ class DslScheduleService:
             before = len(self._blocks)
             self._blocks = [b for b in self._blocks if b.end_utc_ms > cutoff]
             pruned = before - len(self._blocks)
+            self._snapshot_days = {
+                day: snap for day, snap in self._snapshot_days.items()
+                if snap.blocks and snap.blocks[-1].end_utc_ms > cutoff
+            }
             if pruned > 0:
                 logger.info("Pruned %d old blocks (>24h past)", pruned)
 
-    def _purge_expired_tier1(self, now_utc_ms: int = 0) -> int:
-        """Delete CompiledProgramLog rows with broadcast_day < today - 1.
-
-        INV-SCHEDULE-RETENTION-001: Tier 1 retains only rows where
-        broadcast_day >= today - 1. Throttled to at most once per hour.
-
-        Returns the number of rows deleted (0 if throttled or no-op).
-        """
-        if now_utc_ms == 0:
-            now_utc_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
-
-        # Hourly throttle
-        if (now_utc_ms - self._last_tier1_purge_utc_ms) < 3_600_000:
-            return 0
-
-        from retrovue.domain.entities import CompiledProgramLog
-
-        cutoff = date.today() - timedelta(days=1)
-        try:
-            with session() as db:
-                count = db.query(CompiledProgramLog).filter(
-                    CompiledProgramLog.broadcast_day < cutoff,
-                ).delete()
-            self._last_tier1_purge_utc_ms = now_utc_ms
-            if count > 0:
-                logger.info(
-                    "INV-SCHEDULE-RETENTION-001: Purged %d expired Tier 1 rows "
-                    "(broadcast_day < %s)",
-                    count, cutoff.isoformat(),
-                )
-            return count
-        except Exception as e:
-            logger.warning(
-                "INV-SCHEDULE-RETENTION-001: Tier 1 purge failed: %s", e,
-            )
-            return 0
-
     # ── Build / compile ───────────────────────────────────────────────
 
     def _build_initial(self, channel_id: str) -> None:
@@ -678,6 +621,11 @@ class DslScheduleService:
 
         INV-CHANNEL-STARTUP-NONBLOCKING-001: Idempotent — if blocks are already
         loaded, return immediately without recompilation.
+
+        INV-HORIZON-SNAPSHOT-VALIDATE-001: When a snapshot store is configured,
+        days restored from a valid snapshot skip the compile path; one query
+        confirms their locked Tier 1 rows are unchanged.  Missing or invalid
+        days, and days whose Tier 1 row was deleted or rewritten, are compiled.
         """
         with self._lock:
             if self._blocks:
@@ -705,14 +653,40 @@ class DslScheduleService:
             else:
                 start_date = local_now.date()
 
+        dsl_hash = self._current_dsl_hash()
+        day_strs = [
+            (start_date + timedelta(days=day_offset)).strftime("%Y-%m-%d")
+            for day_offset in range(HORIZON_DAYS)
+        ]
+        restored = self._load_snapshot(channel_id, dsl_hash)
+        stamps = self._tier1_stamps(channel_id, day_strs) if restored else {}
+
         all_blocks: list[ScheduledBlock] = []
-        for day_offset in range(HORIZON_DAYS):
-            day = start_date + timedelta(days=day_offset)
-            day_str = day.strftime("%Y-%m-%d")
+        compiled: dict[str, list[ScheduledBlock]] = {}
+        for day_str in day_strs:
+            snap = restored.get(day_str)
+            if snap is not None and snap.blocks:
+                if snap.tier1_stamp is not None and stamps.get(day_str) == snap.tier1_stamp:
+                    blocks = list(snap.blocks)
+                    all_blocks.extend(blocks)
+                    self._compiled_days.add(day_str)
+                    with self._lock:
+                        self._snapshot_days[day_str] = snap
+                    logger.debug(
+                        "Restored day %s from snapshot: %d blocks for channel=%s",
+                        day_str, len(blocks), channel_id,
+                    )
+                    continue
+                del restored[day_str]
+                logger.info(
+                    "Snapshot day %s for channel=%s no longer matches its Tier 1 row; recompiling",
+                    day_str, channel_id,
+                )
             try:
                 blocks = self._compile_day(channel_id, day_str)
                 all_blocks.extend(blocks)
                 self._compiled_days.add(day_str)
+                compiled[day_str] = blocks
                 logger.debug(
                     "Compiled day %s: %d blocks for channel=%s",
                     day_str, len(blocks), channel_id,
@@ -723,15 +697,107 @@ class DslScheduleService:
                     day_str, channel_id, e, exc_info=True,
                 )
 
+        if compiled and self._snapshot_store is not None:
+            stamps = self._tier1_stamps(channel_id, list(compiled))
+            with self._lock:
+                for day_str, blocks in compiled.items():
+                    self._record_snapshot_day(day_str, blocks, dsl_hash, stamps.get(day_str))
+
         all_blocks.sort(key=lambda b: b.start_utc_ms)
         with self._lock:
             self._blocks = all_blocks
 
+        if compiled:
+            self._write_snapshot(channel_id)
+
         logger.info(
-            "DSL schedule built: %d blocks across %d days for channel=%s",
+            "DSL schedule built: %d blocks across %d days for channel=%s "
+            "(%d restored from snapshot)",
             len(all_blocks), len(self._compiled_days), channel_id,
+            sum(1 for d in self._compiled_days if d in restored),
+        )
+
+    # ── Horizon snapshot ──────────────────────────────────────────────
+
+    def _current_dsl_hash(self) -> str | None:
+        """Hash of the DSL file as it is on disk now (None if unreadable)."""
+        if self._snapshot_store is None:
+            return None
+        try:
+            return self._hash_dsl(Path(self._dsl_path).read_text())
+        except OSError:
+            return None
+
+    def _load_snapshot(self, channel_id: str, dsl_hash: str | None) -> dict[str, SnapshotDay]:
+        if self._snapshot_store is None or dsl_hash is None:
+            return {}
+        from retrovue.runtime.schedule_compiler import COMPILER_VERSION
+        return self._snapshot_store.load(
+            channel_id, compiler_version=COMPILER_VERSION, dsl_hash=dsl_hash,
         )
 
+    def _tier1_stamps(self, channel_id: str, days: list[str]) -> dict[str, str]:
+        """tier1_stamp of each locked CompiledProgramLog row among *days*.
+
+        Days without a locked row are absent.  Returns {} (nothing can be
+        restored) when no snapshot store is configured or the query fails.
+        """
+        if self._snapshot_store is None or not days:
+            return {}
+        from retrovue.domain.entities import CompiledProgramLog
+        try:
+            with session() as db:
+                rows = db.query(
+                    CompiledProgramLog.broadcast_day,
+                    CompiledProgramLog.schedule_hash,
+                    CompiledProgramLog.created_at,
+                ).filter(
+                    CompiledProgramLog.channel_id == channel_id,
+                    CompiledProgramLog.broadcast_day.in_(
+                        [date_type.fromisoformat(d) for d in days]
+                    ),
+                    CompiledProgramLog.locked == True,
+                ).all()
+        except Exception as e:
+            logger.warning("Failed to read Tier 1 rows for snapshot validation: %s", e)
+            return {}
+        return {
+            row.broadcast_day.isoformat(): tier1_stamp(row.schedule_hash, row.created_at)
+            for row in rows
+        }
+
+    def _record_snapshot_day(
+        self,
+        day_str: str,
+        blocks: list[ScheduledBlock],
+        dsl_hash: str | None,
+        stamp: str | None,
+    ) -> None:
+        """Remember a compiled day for the next snapshot write.  Caller holds _lock.
+
+        Days without a locked Tier 1 row (stamp None) are not snapshotted.
+        """
+        if self._snapshot_store is None or dsl_hash is None or stamp is None or not blocks:
+            self._snapshot_days.pop(day_str, None)
+            return
+        self._snapshot_days[day_str] = SnapshotDay(
+            dsl_hash=dsl_hash,
+            blocks=tuple(sorted(blocks, key=lambda b: b.start_utc_ms)),
+            tier1_stamp=stamp,
+        )
+
+    def _write_snapshot(self, channel_id: str) -> None:
+        """INV-HORIZON-SNAPSHOT-ATOMIC-001: persist the current horizon."""
+        if self._snapshot_store is None:
+            return
+        from retrovue.runtime.schedule_compiler import COMPILER_VERSION
+        with self._lock:
+            days = dict(self._snapshot_days)
+        if days:
+            self._snapshot_store.save(
+                channel_id, compiler_version=COMPILER_VERSION, days=days,
+            )
+
     @staticmethod
     def _count_slots_in_dsl(dsl: dict) -> int:
         """Count total episode slots per broadcast day.
@@ -805,29 +871,36 @@ class DslScheduleService:
         Invalidates stale rows compiled by an older COMPILER_VERSION —
         returns None (cache miss) so the caller recompiles and overwrites.
         """
-        from retrovue.domain.entities import CompiledProgramLog
+        entry = self._get_cached_day(channel_id, broadcast_day)
+        return entry.compiled_json if entry is not None else None
+
+    def _get_cached_day(self, channel_id: str, broadcast_day: str) -> CompiledDay | None:
+        """_get_cached_schedule, keeping the row's packed segment payload."""
         from retrovue.runtime.schedule_compiler import COMPILER_VERSION
         try:
             with session() as db:
-                row = db.query(CompiledProgramLog).filter(
-                    CompiledProgramLog.channel_id == channel_id,
-                    CompiledProgramLog.broadcast_day == date_type.fromisoformat(broadcast_day),
-                    CompiledProgramLog.locked == True,
-                ).first()
-                if row:
-                    cached_version = row.compiled_json.get("source", {}).get("compiler_version")
-                    if cached_version != COMPILER_VERSION:
-                        logger.info(
-                            "Invalidating stale cache for %s/%s: compiler %s != %s",
-                            channel_id, broadcast_day, cached_version, COMPILER_VERSION,
-                        )
-                        return None
-                    return row.compiled_json
+                entry = read_compiled_day(db, channel_id, date_type.fromisoformat(broadcast_day))
         except Exception as e:
             logger.warning("Failed to check compiled_program_log cache: %s", e)
-        return None
+            return None
+        if entry is None:
+            return None
+        if entry.compiler_version != COMPILER_VERSION:
+            logger.info(
+                "Invalidating stale cache for %s/%s: compiler %s != %s",
+                channel_id, broadcast_day, entry.compiler_version, COMPILER_VERSION,
+            )
+            return None
+        return entry
 
-    def _save_compiled_schedule(self, channel_id: str, broadcast_day: str, schedule: dict, dsl_hash: str) -> None:
+    def _save_compiled_schedule(
+        self,
+        channel_id: str,
+        broadcast_day: str,
+        schedule: dict,
+        dsl_hash: str,
+        blocks: list[ScheduledBlock] | None = None,
+    ) -> None:
         """Persist a compiled schedule to the DB.
 
         INV-SCHEDULE-HORIZON-001: Stores both program-level metadata
@@ -841,9 +914,14 @@ class DslScheduleService:
         INV-SCHEDULE-RETENTION-001: Uses query-then-update-or-insert to
         correctly handle the (channel_id, broadcast_day) unique constraint.
         The previous db.merge() with a fresh UUID silently failed on conflict.
+
+        INV-SEGMENT-CODEC-001: ``blocks`` (the ScheduledBlocks behind
+        schedule["segmented_blocks"]) are also stored packed; without them
+        the packed column is cleared so it never disagrees with the JSON.
         """
         from retrovue.domain.entities import CompiledProgramLog
         try:
+            packed = pack_blocks(blocks) if blocks is not None else None
             # Compute time range from program blocks
             program_blocks = schedule.get("program_blocks", [])
             range_start = None
@@ -865,6 +943,7 @@ class DslScheduleService:
                 ).first()
                 if existing:
                     existing.compiled_json = schedule
+                    existing.segmented_packed = packed
                     existing.schedule_hash = dsl_hash
                     existing.locked = True
                     existing.range_start = range_start
@@ -875,12 +954,15 @@ class DslScheduleService:
                         broadcast_day=bd,
                         schedule_hash=dsl_hash,
                         compiled_json=schedule,
+                        segmented_packed=packed,
                         locked=True,
                         range_start=range_start,
                         range_end=range_end,
                     ))
         except Exception as e:
             logger.warning("Failed to save compiled schedule to DB: %s", e)
+        finally:
+            get_compiled_log_cache().invalidate((channel_id, date_type.fromisoformat(broadcast_day)))
 
     @staticmethod
     def _hash_dsl(dsl_text: str) -> str:
@@ -894,24 +976,67 @@ class DslScheduleService:
         return blocks from any CompiledProgramLog row whose [range_start, range_end)
         overlaps [window_start, window_end). Returns None if no cached schedule
         covers the requested window.
+
+        INV-SCHEDULE-ROW-CACHE-001: The overlap query selects only row
+        identity; compiled_json is loaded for the days whose identity does
+        not match the compiled-log cache (rows may be rewritten by another
+        process, so the cache is never trusted without this check).
         """
         from retrovue.domain.entities import CompiledProgramLog
+        cache = get_compiled_log_cache()
+        compiler_version = CompiledProgramLog.compiled_json["source"]["compiler_version"].astext
         try:
             with session() as db:
-                rows = db.query(CompiledProgramLog).filter(
+                identities = db.query(
+                    CompiledProgramLog.broadcast_day,
+                    CompiledProgramLog.schedule_hash,
+                    CompiledProgramLog.created_at,
+                    compiler_version.label("compiler_version"),
+                ).filter(
                     CompiledProgramLog.channel_id == channel_id,
                     CompiledProgramLog.locked == True,
                     CompiledProgramLog.range_start < window_end,
                     CompiledProgramLog.range_end > window_start,
                 ).all()
-                if not rows:
+                if not identities:
                     return None
 
+                days: list[CompiledDay] = []
+                missing = []
+                for ident in identities:
+                    entry = cache.get((channel_id, ident.broadcast_day))
+                    if entry is not None and entry.matches(
+                        ident.schedule_hash, ident.created_at, ident.compiler_version,
+                    ):
+                        days.append(entry)
+                    else:
+                        missing.append(ident.broadcast_day)
+
+                if missing:
+                    query = db.query(
+                        CompiledProgramLog.broadcast_day,
+                        CompiledProgramLog.schedule_hash,
+                        CompiledProgramLog.created_at,
+                        CompiledProgramLog.compiled_json,
+                    ).filter(
+                        CompiledProgramLog.channel_id == channel_id,
+                        CompiledProgramLog.locked == True,
+                        CompiledProgramLog.range_start < window_end,
+                        CompiledProgramLog.range_end > window_start,
+                    )
+                    if days:
+                        query = query.filter(CompiledProgramLog.broadcast_day.in_(missing))
+                    for row in query.all():
+                        entry = CompiledDay(row.schedule_hash, row.created_at, row.compiled_json)
+                        days.append(entry)
+                        if entry.compiled_json.get("segmented_blocks"):
+                            cache.put((channel_id, row.broadcast_day), entry)
+
                 # Collect blocks from all overlapping rows, deduplicate
                 all_blocks: list[dict] = []
                 seen: set[tuple] = set()
-                for row in rows:
-                    for pb in row.compiled_json.get("program_blocks", []):
+                for day in days:
+                    for pb in day.compiled_json.get("program_blocks", []):
                         key = (pb["start_at"], pb["slot_duration_sec"], pb["asset_id"])
                         if key not in seen:
                             seen.add(key)
@@ -944,10 +1069,12 @@ class DslScheduleService:
         so episodes are consistent regardless of compilation order.
         """
         # DB-first: check cache
-        cached = self._get_cached_schedule(channel_id, broadcast_day)
+        cached = self._get_cached_day(channel_id, broadcast_day)
         if cached is not None:
             logger.debug("Using cached schedule for %s/%s", channel_id, broadcast_day)
-            return self._hydrate_schedule(cached, channel_id, broadcast_day)
+            return self._hydrate_schedule(
+                cached.compiled_json, channel_id, broadcast_day, packed=cached.segmented_packed,
+            )
 
         dsl_text = Path(self._dsl_path).read_text()
         dsl = parse_dsl(dsl_text)
@@ -994,18 +1121,38 @@ class DslScheduleService:
 
         # Save to DB cache (now includes segmented_blocks)
         dsl_hash = self._hash_dsl(dsl_text)
-        self._save_compiled_schedule(channel_id, broadcast_day, schedule, dsl_hash)
+        self._save_compiled_schedule(channel_id, broadcast_day, schedule, dsl_hash, blocks=blocks)
 
         return blocks
 
-    def _hydrate_schedule(self, schedule: dict, channel_id: str, broadcast_day: str) -> list[ScheduledBlock]:
+    def _hydrate_schedule(
+        self,
+        schedule: dict,
+        channel_id: str,
+        broadcast_day: str,
+        *,
+        packed: bytes | None = None,
+    ) -> list[ScheduledBlock]:
         """Hydrate a cached schedule dict into ScheduledBlocks.
 
         INV-SCHEDULE-HORIZON-001: If segmented_blocks are present in the
         cached schedule, deserialize directly (no re-expansion needed).
         Falls back to expand_program_block if segmented_blocks are absent
         (backward compatibility with pre-Tier-1 cached schedules).
+
+        INV-SEGMENT-CODEC-001: The row's packed payload, when present and
+        readable, is decoded instead of the segmented_blocks dicts.
         """
+        # Fastest path: packed segment payload
+        if packed and schedule.get("segmented_blocks"):
+            try:
+                return decode_blocks(packed)
+            except SegmentCodecError as e:
+                logger.warning(
+                    "INV-SEGMENT-CODEC-001: Unreadable segmented_packed for %s/%s: %s",
+                    channel_id, broadcast_day, e,
+                )
+
         # Fast path: segmented blocks already cached
         if "segmented_blocks" in schedule and schedule["segmented_blocks"]:
             logger.debug(
@@ -1048,7 +1195,7 @@ class DslScheduleService:
                 _serialize_scheduled_block(b) for b in blocks
             ]
             dsl_hash = self._hash_dsl(dsl_text)
-            self._save_compiled_schedule(channel_id, broadcast_day, schedule, dsl_hash)
+            self._save_compiled_schedule(channel_id, broadcast_day, schedule, dsl_hash, blocks=blocks)
             logger.info(
                 "INV-SCHEDULE-RETENTION-001: Backfilled segmented_blocks for "
                 "%s/%s (%d blocks)",
@@ -1107,7 +1254,7 @@ class DslScheduleService:
             gain_db = meta.loudness_gain_db
             # Rule 5: enqueue background measurement for unmeasured assets
             if gain_db == 0.0 and resolver.asset_needs_loudness_measurement(asset_id):
-                self._enqueue_loudness_measurement(asset_id, asset_uri)
+                self._enqueue_loudness_measurement(asset_id, asset_uri, start_utc_ms)
 
             # Expand into acts + ad breaks (empty filler placeholders — Tier 1 data).
             # INV-PLAYLOG-PREFILL-001: Ad fill happens at Tier 2 (PlaylogHorizonDaemon),
@@ -1136,61 +1283,35 @@ class DslScheduleService:
         No external API calls — all data comes from the database.
         Assets store source file paths in canonical_uri (set during ingest).
         PathMappings translate source prefixes to local prefixes.
-        """
-        from retrovue.domain.entities import Asset, Collection, PathMapping
-
-        with session() as db:
-            # Load all path mappings keyed by collection
-            path_mappings: dict[str, list[tuple[str, str]]] = {}
-            for col in db.query(Collection).all():
-                col_uuid = str(col.uuid)
-                pms = db.query(PathMapping).filter(
-                    PathMapping.collection_uuid == col.uuid
-                ).all()
-                if pms:
-                    path_mappings[col_uuid] = [(pm.plex_path, pm.local_path) for pm in pms]
 
-            # Resolve each scheduled asset
-            for block_def in schedule["program_blocks"]:
-                asset_id = block_def["asset_id"]
-                meta = resolver.lookup(asset_id)
-                uri = meta.file_uri
-
-                if uri in self._uri_cache:
-                    continue
+        Lookups go through the process-wide UriResolutionIndex, so a
+        compiled day resolves without DB queries once the index is warm.
+        """
+        index = self._uri_index or get_uri_resolution_index()
+        index.refresh()
 
-                # Normalise file:// prefix
-                source_path = uri.replace("file://", "") if uri.startswith("file://") else uri
+        pending: list[tuple[str, str]] = []
+        for block_def in schedule["program_blocks"]:
+            asset_id = block_def["asset_id"]
+            uri = resolver.lookup(asset_id).file_uri
+            if uri not in self._uri_cache:
+                pending.append((asset_id, uri))
 
-                # For plex:// URIs that weren't migrated yet, look up canonical_uri
-                if uri.startswith("plex://"):
-                    asset = db.query(Asset).filter(Asset.uuid == asset_id).first()
-                    if asset and asset.canonical_uri and not asset.canonical_uri.startswith("plex://"):
-                        source_path = asset.canonical_uri
-                    else:
-                        logger.warning(
-                            "Asset %s has no source file path in canonical_uri; "
-                            "re-ingest to populate. URI: %s", asset_id, uri
-                        )
-                        continue
+        # Assets ingested since the last refresh: re-check the index once
+        if any(not index.has_asset(asset_id) for asset_id, _ in pending):
+            index.refresh(force=True)
 
-                # Apply PathMappings: longest-prefix match
-                asset_obj = db.query(Asset).filter(Asset.uuid == asset_id).first()
-                mapped = False
-                if asset_obj:
-                    col_uuid = str(asset_obj.collection_uuid)
-                    pms = path_mappings.get(col_uuid, [])
-                    # Sort by prefix length descending for longest match
-                    for plex_prefix, local_prefix in sorted(pms, key=lambda x: len(x[0]), reverse=True):
-                        if source_path.startswith(plex_prefix):
-                            local_path = local_prefix + source_path[len(plex_prefix):]
-                            self._uri_cache[uri] = local_path
-                            mapped = True
-                            break
-
-                if not mapped:
-                    # No mapping matched — use source_path as-is (may already be local)
-                    self._uri_cache[uri] = source_path
+        for asset_id, uri in pending:
+            if uri in self._uri_cache:
+                continue
+            local_path = index.resolve(asset_id, uri)
+            if local_path is None:
+                logger.warning(
+                    "Asset %s has no source file path in canonical_uri; "
+                    "re-ingest to populate. URI: %s", asset_id, uri
+                )
+                continue
+            self._uri_cache[uri] = local_path
 
     def _resolve_uri(self, uri: str) -> str:
         """Resolve a single URI, returning local path or original URI."""
@@ -5,7 +5,12 @@ Populated by HorizonManager during horizon extension.  Consumers
 generation.  This enforces the contract principle that automation
 consumes pre-built data and never requests planning.
 
-Phase 1: In-memory, no persistence, no eviction.
+Phase 1: In-memory, no persistence.  Eviction via prune_ended_before().
+
+Seam state (INV-HORIZON-CONTINUOUS-COVERAGE-001) is maintained
+incrementally: every mutation re-checks only the adjacent pairs at the
+join points it touched, so HorizonManager can read the current seam
+breaks and coverage_summary() without re-walking the whole window.
 
 See: docs/domains/HorizonManager_v0.1.md §6 (Data Flow)
      docs/contracts/ScheduleHorizonManagementContract_v0.1.md §4 (Lock Windows)
@@ -74,6 +79,31 @@ class WindowSnapshot:
     entries: list[ExecutionEntry]
 
 
+@dataclass(frozen=True)
+class SeamBreak:
+    """A non-contiguous adjacent pair (gap or overlap) in the window."""
+    left_block_id: str
+    left_end_utc_ms: int
+    right_block_id: str
+    right_start_utc_ms: int
+    delta_ms: int           # right_start - left_end; >0 = gap, <0 = overlap
+
+
+@dataclass
+class CoverageSummary:
+    """Point-in-time coverage of the window, maintained incrementally."""
+    entry_count: int
+    window_start_utc_ms: int
+    window_end_utc_ms: int
+    seam_break_count: int
+    gap_ms: int
+    overlap_ms: int
+
+    @property
+    def is_contiguous(self) -> bool:
+        return self.seam_break_count == 0
+
+
 @dataclass
 class PublishResult:
     """Result of an atomic publish operation."""
@@ -93,12 +123,15 @@ class ExecutionWindowStore:
 
     Write path (HorizonManager only):
         add_entries(entries)
+        prune_ended_before(cutoff_utc_ms)
 
     Read path (consumers):
         get_next_entry(after_utc_ms)
         get_window_start()
         get_window_end()
         get_all_entries()
+        get_seam_breaks()
+        coverage_summary()
     """
 
     def __init__(
@@ -110,6 +143,10 @@ class ExecutionWindowStore:
         override_store: Any | None = None,
     ) -> None:
         self._entries: list[ExecutionEntry] = []
+        # block_id -> position in _entries
+        self._index: dict[str, int] = {}
+        # left block_id -> break between it and its right neighbour
+        self._seam_breaks: dict[str, SeamBreak] = {}
         self._lock = threading.Lock()
         self._enforce_derivation_from_playlist = enforce_derivation_from_playlist
         self._max_generation_id: int = 0
@@ -153,12 +190,85 @@ class ExecutionWindowStore:
                     "Every execution artifact must carry explicit schedule lineage."
                 )
         with self._lock:
-            existing_ids = {e.block_id for e in self._entries}
-            new = [e for e in entries if e.block_id not in existing_ids]
+            new = [e for e in entries if e.block_id not in self._index]
             if not new:
                 return
+            old_len = len(self._entries)
+            appends_in_order = (
+                (old_len == 0 or new[0].start_utc_ms >= self._entries[-1].start_utc_ms)
+                and all(
+                    new[i].start_utc_ms <= new[i + 1].start_utc_ms
+                    for i in range(len(new) - 1)
+                )
+            )
             self._entries.extend(new)
-            self._entries.sort(key=lambda e: e.start_utc_ms)
+            if not appends_in_order:
+                self._rebuild()
+                return
+            # Horizon extension appends in time order: only the old tail
+            # and the new entries have seams to (re)check.
+            self._reindex_from(old_len)
+            for i in range(max(0, old_len - 1), len(self._entries)):
+                self._check_seam_at(i)
+
+    def prune_ended_before(self, cutoff_utc_ms: int) -> int:
+        """Drop leading entries whose end_utc_ms <= *cutoff_utc_ms*.
+
+        Only the aired prefix of the window is evicted; returns the number
+        of entries removed.
+        """
+        with self._lock:
+            n = 0
+            while n < len(self._entries) and self._entries[n].end_utc_ms <= cutoff_utc_ms:
+                n += 1
+            if n == 0:
+                return 0
+            for e in self._entries[:n]:
+                self._index.pop(e.block_id, None)
+                self._seam_breaks.pop(e.block_id, None)
+            del self._entries[:n]
+            self._reindex_from(0)
+            return n
+
+    # ------------------------------------------------------------------
+    # Incremental index / seam maintenance (caller holds _lock)
+    # ------------------------------------------------------------------
+
+    def _reindex_from(self, pos: int) -> None:
+        entries = self._entries
+        for i in range(pos, len(entries)):
+            self._index[entries[i].block_id] = i
+
+    def _check_seam_at(self, i: int) -> None:
+        """Re-evaluate the seam between entries[i] and entries[i+1]."""
+        entries = self._entries
+        if not 0 <= i < len(entries):
+            return
+        left = entries[i]
+        if i + 1 >= len(entries):
+            self._seam_breaks.pop(left.block_id, None)
+            return
+        right = entries[i + 1]
+        delta = right.start_utc_ms - left.end_utc_ms
+        if delta == 0:
+            self._seam_breaks.pop(left.block_id, None)
+        else:
+            self._seam_breaks[left.block_id] = SeamBreak(
+                left_block_id=left.block_id,
+                left_end_utc_ms=left.end_utc_ms,
+                right_block_id=right.block_id,
+                right_start_utc_ms=right.start_utc_ms,
+                delta_ms=delta,
+            )
+
+    def _rebuild(self) -> None:
+        """Full re-sort, re-index and seam walk (out-of-order mutations)."""
+        self._entries.sort(key=lambda e: e.start_utc_ms)
+        self._index = {}
+        self._reindex_from(0)
+        self._seam_breaks = {}
+        for i in range(len(self._entries) - 1):
+            self._check_seam_at(i)
 
     # ------------------------------------------------------------------
     # Read (consumers)
@@ -194,6 +304,36 @@ class ExecutionWindowStore:
         with self._lock:
             return list(self._entries)
 
+    def entry_count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_seam_breaks(self) -> list[SeamBreak]:
+        """Return current seam breaks ordered by position in the window.
+
+        INV-HORIZON-CONTINUOUS-COVERAGE-001: empty when every adjacent pair
+        satisfies E_i.end_utc_ms == E_{i+1}.start_utc_ms.
+        """
+        with self._lock:
+            return sorted(
+                self._seam_breaks.values(),
+                key=lambda b: self._index.get(b.left_block_id, 0),
+            )
+
+    def coverage_summary(self) -> CoverageSummary:
+        """Cheap coverage snapshot for health reports (no window walk)."""
+        with self._lock:
+            gap = sum(b.delta_ms for b in self._seam_breaks.values() if b.delta_ms > 0)
+            overlap = sum(-b.delta_ms for b in self._seam_breaks.values() if b.delta_ms < 0)
+            return CoverageSummary(
+                entry_count=len(self._entries),
+                window_start_utc_ms=self._entries[0].start_utc_ms if self._entries else 0,
+                window_end_utc_ms=self._entries[-1].end_utc_ms if self._entries else 0,
+                seam_break_count=len(self._seam_breaks),
+                gap_ms=gap,
+                overlap_ms=overlap,
+            )
+
     def get_entry_at(
         self,
         utc_ms: int,
@@ -253,11 +393,11 @@ class ExecutionWindowStore:
         Returns True if the entry was found and locked.
         """
         with self._lock:
-            for entry in self._entries:
-                if entry.block_id == block_id:
-                    entry.is_locked = True
-                    return True
-            return False
+            idx = self._index.get(block_id)
+            if idx is None:
+                return False
+            self._entries[idx].is_locked = True
+            return True
 
     def lock_all(self) -> int:
         """Mark all entries as locked.  Returns count of newly locked entries."""
@@ -401,9 +541,10 @@ class ExecutionWindowStore:
                 if not (e.start_utc_ms < range_end_ms and e.end_utc_ms > range_start_ms)
             ]
 
-            # Insert new entries and re-sort
+            # Insert new entries; re-sort, re-index and re-walk seams
+            # (publish is an infrequent, range-wide operation)
             self._entries.extend(new_entries)
-            self._entries.sort(key=lambda e: e.start_utc_ms)
+            self._rebuild()
 
             # Update max generation
             self._max_generation_id = generation_id
@@ -435,11 +576,7 @@ class ExecutionWindowStore:
         3. Otherwise: replace the entry and re-sort.
         """
         with self._lock:
-            idx = None
-            for i, entry in enumerate(self._entries):
-                if entry.block_id == block_id:
-                    idx = i
-                    break
+            idx = self._index.get(block_id)
             if idx is None:
                 raise ValueError(
                     f"ExecutionEntry block_id={block_id!r} not found in store."
@@ -469,9 +606,25 @@ class ExecutionWindowStore:
                     "mutation."
                 )
 
-            # Replace and re-sort
-            self._entries[idx] = new_entry
-            self._entries.sort(key=lambda e: e.start_utc_ms)
+            # Replace in place when ordering is preserved; only the seams
+            # on either side of idx change.  Otherwise fall back to re-sort.
+            entries = self._entries
+            in_order = (
+                (idx == 0 or entries[idx - 1].start_utc_ms <= new_entry.start_utc_ms)
+                and (
+                    idx == len(entries) - 1
+                    or new_entry.start_utc_ms <= entries[idx + 1].start_utc_ms
+                )
+            )
+            entries[idx] = new_entry
+            if not in_order:
+                self._rebuild()
+                return
+            self._index.pop(block_id, None)
+            self._seam_breaks.pop(block_id, None)
+            self._index[new_entry.block_id] = idx
+            self._check_seam_at(idx - 1)
+            self._check_seam_at(idx)
 
 
 # ---------------------------------------------------------------------------
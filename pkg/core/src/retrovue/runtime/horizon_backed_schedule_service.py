@@ -15,14 +15,45 @@ See: docs/contracts/ScheduleExecutionInterfaceContract_v0.1.md
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-from retrovue.runtime.execution_window_store import ExecutionWindowStore
+from retrovue.runtime.execution_window_store import ExecutionEntry, ExecutionWindowStore
 from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+from retrovue.shared.lru_cache import LruCache
 
 logger = logging.getLogger(__name__)
 
+# Blocks around "now" are requested repeatedly (feed-ahead, viewer joins)
+HYDRATED_BLOCK_CACHE_ENTRIES = 32
+# Indexed resolved days; covers a multi-week guide window
+EPG_INDEX_DAYS = 32
+
+
+@dataclass(frozen=True)
+class _EpgDay:
+    """Sorted, immutable EPG events for one resolved day.
+
+    ``max_ends[i]`` is the latest end among events ``0..i``, so the first
+    event that can overlap a window is found by binary search even when
+    events overlap each other.
+    """
+
+    resolved: Any
+    starts: tuple[datetime, ...]
+    ends: tuple[datetime, ...]
+    max_ends: tuple[datetime, ...]
+    payloads: tuple[dict[str, Any], ...]
+
+    def collect(self, start_time: datetime, end_time: datetime, out: list[dict[str, Any]]) -> None:
+        """Append the events overlapping [start_time, end_time) to *out*."""
+        lo = bisect_right(self.max_ends, start_time)
+        hi = bisect_left(self.starts, end_time)
+        ends = self.ends
+        out.extend(self.payloads[i] for i in range(lo, hi) if ends[i] > start_time)
+
 
 class HorizonBackedScheduleService:
     """Schedule service backed by HorizonManager-populated stores.
@@ -51,6 +82,11 @@ class HorizonBackedScheduleService:
         self._day_start_hour = programming_day_start_hour
         self._grid_minutes = grid_block_minutes
         self._channel_id = channel_id
+        # block_id -> (entry it was built from, block)
+        self._hydrated: LruCache[str, tuple[ExecutionEntry, ScheduledBlock]] = LruCache(
+            HYDRATED_BLOCK_CACHE_ENTRIES,
+        )
+        self._epg_index: LruCache[tuple[str, date], _EpgDay] = LruCache(EPG_INDEX_DAYS)
 
     # ------------------------------------------------------------------
     # ScheduleService protocol
@@ -104,6 +140,10 @@ class HorizonBackedScheduleService:
 
         Reads from ResolvedStore only.  Never triggers resolution.
         If no data is available, returns [] with a log.
+
+        Each resolved day is indexed once (see _EpgDay) and answered by
+        binary search; the returned event dicts are shared between
+        callers and must not be mutated.
         """
         if self._resolved_store is None:
             logger.info(
@@ -119,67 +159,99 @@ class HorizonBackedScheduleService:
             end_time = end_time.replace(tzinfo=timezone.utc)
 
         events: list[dict[str, Any]] = []
-        grid_seconds = self._grid_minutes * 60
 
         current = start_time
         while current < end_time:
             bd = self._broadcast_date_for(current)
-            resolved = self._resolved_store.get(channel_id, bd)
-
-            if resolved is None:
+            day = self._epg_day(channel_id, bd)
+            if day is None:
                 logger.info(
                     "HorizonBackedScheduleService: No resolved day "
                     "for channel=%s date=%s (read-only; not resolving)",
                     channel_id,
                     bd.isoformat(),
                 )
-                current += timedelta(days=1)
-                continue
-
-            # Build EPG events from resolved program events
-            if hasattr(resolved, "program_events") and resolved.program_events:
-                slot_idx = 0
-                for pe in resolved.program_events:
-                    if slot_idx >= len(resolved.resolved_slots):
-                        break
-                    first_slot = resolved.resolved_slots[slot_idx]
-                    event_start = self._slot_to_datetime(bd, first_slot.slot_time)
-                    event_end = event_start + timedelta(
-                        seconds=pe.block_span_count * grid_seconds
-                    )
-
-                    if event_start.tzinfo is None:
-                        event_start = event_start.replace(tzinfo=timezone.utc)
-                    if event_end.tzinfo is None:
-                        event_end = event_end.replace(tzinfo=timezone.utc)
-
-                    if event_start < end_time and event_end > start_time:
-                        resolved_asset = pe.resolved_asset or first_slot.resolved_asset
-                        events.append({
-                            "channel_id": channel_id,
-                            "start_time": event_start.isoformat(),
-                            "end_time": event_end.isoformat(),
-                            "title": resolved_asset.title,
-                            "episode_title": resolved_asset.episode_title,
-                            "episode_id": resolved_asset.episode_id,
-                            "programming_day_date": bd.isoformat(),
-                            "asset": {
-                                "file_path": resolved_asset.file_path,
-                                "asset_id": resolved_asset.asset_id,
-                                "duration_seconds": resolved_asset.content_duration_seconds,
-                            },
-                        })
-
-                    slot_idx += pe.block_span_count
-
+            else:
+                day.collect(start_time, end_time, events)
             current += timedelta(days=1)
 
         return events
 
+    def _epg_day(self, channel_id: str, bd: date) -> _EpgDay | None:
+        """The event index for a resolved day, rebuilt when the day is replaced.
+
+        INV-EPG-EVENT-INDEX-001: An index is used only while the store
+        still returns the ResolvedScheduleDay it was built from;
+        force_replace() stores a new object, so the next read rebuilds.
+        """
+        resolved = self._resolved_store.get(channel_id, bd)
+        key = (channel_id, bd)
+        if resolved is None:
+            self._epg_index.invalidate(key)
+            return None
+        day = self._epg_index.get(key)
+        if day is None or day.resolved is not resolved:
+            day = self._build_epg_day(channel_id, bd, resolved)
+            self._epg_index.put(key, day)
+        return day
+
+    def _build_epg_day(self, channel_id: str, bd: date, resolved: Any) -> _EpgDay:
+        grid_seconds = self._grid_minutes * 60
+        rows: list[tuple[datetime, datetime, dict[str, Any]]] = []
+
+        # Build EPG events from resolved program events
+        if hasattr(resolved, "program_events") and resolved.program_events:
+            slot_idx = 0
+            for pe in resolved.program_events:
+                if slot_idx >= len(resolved.resolved_slots):
+                    break
+                first_slot = resolved.resolved_slots[slot_idx]
+                event_start = self._slot_to_datetime(bd, first_slot.slot_time)
+                event_end = event_start + timedelta(
+                    seconds=pe.block_span_count * grid_seconds
+                )
+
+                if event_start.tzinfo is None:
+                    event_start = event_start.replace(tzinfo=timezone.utc)
+                if event_end.tzinfo is None:
+                    event_end = event_end.replace(tzinfo=timezone.utc)
+
+                resolved_asset = pe.resolved_asset or first_slot.resolved_asset
+                rows.append((event_start, event_end, {
+                    "channel_id": channel_id,
+                    "start_time": event_start.isoformat(),
+                    "end_time": event_end.isoformat(),
+                    "title": resolved_asset.title,
+                    "episode_title": resolved_asset.episode_title,
+                    "episode_id": resolved_asset.episode_id,
+                    "programming_day_date": bd.isoformat(),
+                    "asset": {
+                        "file_path": resolved_asset.file_path,
+                        "asset_id": resolved_asset.asset_id,
+                        "duration_seconds": resolved_asset.content_duration_seconds,
+                    },
+                }))
+
+                slot_idx += pe.block_span_count
+
+        # Stable: events that share a start keep program order
+        rows.sort(key=lambda r: r[0])
+        max_ends: list[datetime] = []
+        for _, event_end, _ in rows:
+            max_ends.append(event_end if not max_ends or event_end > max_ends[-1] else max_ends[-1])
+        return _EpgDay(
+            resolved=resolved,
+            starts=tuple(r[0] for r in rows),
+            ends=tuple(r[1] for r in rows),
+            max_ends=tuple(max_ends),
+            payloads=tuple(r[2] for r in rows),
+        )
+
     def get_block_at(self, channel_id: str, utc_ms: int) -> ScheduledBlock | None:
         """Return a ScheduledBlock covering utc_ms from ExecutionWindowStore.
 
-        Pure read — does not trigger schedule generation.
+        Pure read — does not trigger schedule generation.  The block built
+        from an entry is reused until the store replaces that entry.
         """
         entry = self._execution_store.get_entry_at(utc_ms, locked_only=True)
         if entry is None:
@@ -190,7 +262,10 @@ class HorizonBackedScheduleService:
                 channel_id, utc_ms,
             )
             return None
-        return ScheduledBlock(
+        cached = self._hydrated.get(entry.block_id)
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        block = ScheduledBlock(
             block_id=entry.block_id,
             start_utc_ms=entry.start_utc_ms,
             end_utc_ms=entry.end_utc_ms,
@@ -209,6 +284,8 @@ class HorizonBackedScheduleService:
                 for s in entry.segments
             ),
         )
+        self._hydrated.put(entry.block_id, (entry, block))
+        return block
 
     # ------------------------------------------------------------------
     # Internal
@@ -0,0 +1,315 @@
+"""Horizon Coordinator — shared evaluation pool for horizon maintainers.
+
+Replaces the one-thread-per-channel model of HorizonManager.start() and
+PlaylogHorizonDaemon.start().  A fixed pool of worker threads services
+every registered horizon task, so thread count (and the number of DB
+sessions opened concurrently by those tasks) stays flat as channels are
+added.
+
+Scheduling:
+    Each task is due at ``last_eval + min(interval, slack)`` where slack is
+    the task's ``ms_until_below_threshold()`` — the time until its horizon
+    depth falls below the configured minimum.  Among due tasks, the one
+    that starves soonest (smallest absolute starve time) runs first.
+
+    INV-HORIZON-COORDINATOR-STARVING-FIRST-001: When more tasks are due
+    than workers are free, the task closest to starving is serviced first.
+
+    INV-HORIZON-COORDINATOR-SINGLE-FLIGHT-001: A task is never evaluated
+    by more than one worker at a time.
+
+    INV-HORIZON-COORDINATOR-BACKOFF-001: A task whose evaluation fails or
+    leaves it at or below threshold is retried after an exponential
+    backoff (RETRY_BASE_S doubling, capped at its interval), never
+    immediately.  The backoff resets once the task has positive slack.
+
+Lifecycle: register() / unregister() may be called before or after
+start().  stop() joins all workers.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Protocol, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+# First retry delay for a task still below threshold after an evaluation
+RETRY_BASE_S = 1.0
+
+
+@runtime_checkable
+class HorizonTask(Protocol):
+    """What the coordinator needs from a horizon maintainer.
+
+    Implemented by HorizonManager and PlaylogHorizonDaemon.
+    """
+
+    @property
+    def evaluation_interval_seconds(self) -> float:
+        """Maximum time between evaluations (heartbeat)."""
+        ...
+
+    def evaluate_once(self) -> Any:
+        """Evaluate horizon depth and extend if below threshold."""
+        ...
+
+    def ms_until_below_threshold(self) -> int:
+        """Milliseconds until horizon depth falls below the minimum (<= 0 if already below)."""
+        ...
+
+
+@dataclass
+class CoordinatorStats:
+    """Point-in-time snapshot of coordinator activity."""
+    max_workers: int
+    registered_tasks: int
+    in_flight: int
+    due_now: int
+    evaluations: int
+    evaluation_errors: int
+
+
+class HorizonCoordinator:
+    """Bounded worker pool with a starvation-ordered priority queue.
+
+    Thread-safe.  All queue state is guarded by a single condition
+    variable; task evaluation runs outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        *,
+        monotonic_fn: Callable[[], float] = time.monotonic,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._max_workers = max_workers
+        self._monotonic = monotonic_fn
+
+        self._cond = threading.Condition()
+        self._tasks: dict[str, HorizonTask] = {}
+        # Pending heap: (due_at_s, starve_at_s, seq, key, generation)
+        self._pending: list[tuple[float, float, int, str, int]] = []
+        self._generations: dict[str, int] = {}
+        self._in_flight: set[str] = set()
+        self._seq = itertools.count()
+        # key -> delay before the next retry of a task still below threshold
+        self._backoff_s: dict[str, float] = {}
+
+        self._evaluations = 0
+        self._evaluation_errors = 0
+
+        self._stopping = False
+        self._workers: list[threading.Thread] = []
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, key: str, task: HorizonTask, *, evaluate_now: bool = False) -> None:
+        """Add a task to the pool (replaces any existing task with the same key).
+
+        When ``evaluate_now`` is False the task is assumed to have just been
+        evaluated (e.g. by a synchronous readiness gate) and is scheduled
+        from its current slack.
+        """
+        with self._cond:
+            self._tasks[key] = task
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if key not in self._in_flight:
+                now = self._monotonic()
+                if evaluate_now:
+                    self._push(key, now, now)
+                else:
+                    self._schedule(key, task, now)
+            self._cond.notify()
+
+    def unregister(self, key: str) -> None:
+        """Remove a task.  An in-flight evaluation is allowed to finish."""
+        with self._cond:
+            self._tasks.pop(key, None)
+            self._backoff_s.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._cond.notify_all()
+
+    def wake(self, key: str) -> None:
+        """Make a registered task due immediately (e.g. after a config change)."""
+        with self._cond:
+            if key in self._tasks and key not in self._in_flight:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                now = self._monotonic()
+                self._push(key, now, now)
+                self._cond.notify()
+
+    def registered_keys(self) -> list[str]:
+        with self._cond:
+            return list(self._tasks)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the worker pool.  Idempotent."""
+        with self._cond:
+            if self._workers:
+                return
+            self._stopping = False
+            for i in range(self._max_workers):
+                t = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"HorizonCoordinator-{i}",
+                    daemon=True,
+                )
+                self._workers.append(t)
+                t.start()
+        logger.info(
+            "HorizonCoordinator: started (workers=%d, tasks=%d)",
+            self._max_workers, len(self._tasks),
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop all workers and wait for in-flight evaluations to finish."""
+        with self._cond:
+            self._stopping = True
+            workers = list(self._workers)
+            self._cond.notify_all()
+        deadline = self._monotonic() + timeout
+        for t in workers:
+            t.join(timeout=max(0.0, deadline - self._monotonic()))
+            if t.is_alive():
+                logger.warning("HorizonCoordinator: worker %s did not stop within timeout", t.name)
+        with self._cond:
+            self._workers = []
+        logger.info("HorizonCoordinator: stopped")
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers) and not self._stopping
+
+    def get_stats(self) -> CoordinatorStats:
+        with self._cond:
+            now = self._monotonic()
+            due = sum(
+                1 for due_at, _, _, key, gen in self._pending
+                if due_at <= now and self._generations.get(key) == gen
+            )
+            return CoordinatorStats(
+                max_workers=self._max_workers,
+                registered_tasks=len(self._tasks),
+                in_flight=len(self._in_flight),
+                due_now=due,
+                evaluations=self._evaluations,
+                evaluation_errors=self._evaluation_errors,
+            )
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _push(self, key: str, due_at: float, starve_at: float) -> None:
+        heapq.heappush(
+            self._pending,
+            (due_at, starve_at, next(self._seq), key, self._generations[key]),
+        )
+
+    def _schedule(
+        self,
+        key: str,
+        task: HorizonTask,
+        now: float,
+        *,
+        evaluated: bool = False,
+        failed: bool = False,
+    ) -> None:
+        """Compute next due time from the task's slack and push it.  Caller holds lock.
+
+        INV-HORIZON-COORDINATOR-BACKOFF-001: after an evaluation that
+        failed or left no slack, the task waits out its backoff.
+        """
+        try:
+            slack_s = task.ms_until_below_threshold() / 1000.0
+        except Exception:
+            logger.exception("HorizonCoordinator: slack query failed for %s", key)
+            slack_s = 0.0
+        interval_s = float(task.evaluation_interval_seconds)
+        starve_at = now + slack_s
+        if evaluated and (failed or slack_s <= 0):
+            delay_s = self._backoff_s.get(key, min(RETRY_BASE_S, interval_s))
+            self._backoff_s[key] = min(delay_s * 2, interval_s)
+            due_at = now + delay_s
+        else:
+            if slack_s > 0:
+                self._backoff_s.pop(key, None)
+            due_at = now + max(0.0, min(interval_s, slack_s))
+        self._push(key, due_at, starve_at)
+
+    def _next_ready(self) -> tuple[str, HorizonTask] | None:
+        """Block until a task is due, then claim it.  Returns None on stop."""
+        with self._cond:
+            while not self._stopping:
+                now = self._monotonic()
+                # Drop stale heap entries (unregistered or rescheduled keys)
+                while self._pending and (
+                    self._generations.get(self._pending[0][3]) != self._pending[0][4]
+                    or self._pending[0][3] not in self._tasks
+                ):
+                    heapq.heappop(self._pending)
+
+                if self._pending and self._pending[0][0] <= now:
+                    # INV-HORIZON-COORDINATOR-STARVING-FIRST-001: among due
+                    # entries pick the one with the earliest starve time.
+                    best_idx = -1
+                    best_starve = float("inf")
+                    for idx, (due_at, starve_at, _, key, gen) in enumerate(self._pending):
+                        if due_at > now:
+                            continue
+                        if self._generations.get(key) != gen or key not in self._tasks:
+                            continue
+                        if starve_at < best_starve:
+                            best_starve = starve_at
+                            best_idx = idx
+                    if best_idx >= 0:
+                        entry = self._pending[best_idx]
+                        self._pending[best_idx] = self._pending[-1]
+                        self._pending.pop()
+                        heapq.heapify(self._pending)
+                        key = entry[3]
+                        self._in_flight.add(key)
+                        return key, self._tasks[key]
+
+                timeout = None
+                if self._pending:
+                    timeout = max(0.0, self._pending[0][0] - now)
+                self._cond.wait(timeout=timeout)
+            return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            claimed = self._next_ready()
+            if claimed is None:
+                return
+            key, task = claimed
+            failed = False
+            try:
+                task.evaluate_once()
+            except Exception:
+                failed = True
+                logger.exception("HorizonCoordinator: evaluation failed for %s", key)
+            with self._cond:
+                self._in_flight.discard(key)
+                self._evaluations += 1
+                if failed:
+                    self._evaluation_errors += 1
+                current = self._tasks.get(key)
+                if current is not None and not self._stopping:
+                    self._generations[key] = self._generations.get(key, 0) + 1
+                    self._schedule(key, current, self._monotonic(), evaluated=True, failed=failed)
+                self._cond.notify()
@@ -7,8 +7,9 @@ See: docs/domains/HorizonManager_v0.1.md
      docs/contracts/ScheduleHorizonManagementContract_v0.1.md
 
 Phase 1+: Wired into ProgramDirector in shadow and authoritative modes.
-Evaluation via evaluate_once() or a background daemon thread via
-start()/stop().  Provides structured health reports for observability.
+Evaluation via evaluate_once(), a background daemon thread via
+start()/stop(), or a shared HorizonCoordinator pool (ProgramDirector).
+Provides structured health reports for observability.
 """
 
 from __future__ import annotations
@@ -84,6 +85,7 @@ class HorizonHealthReport:
     proactive_extension_triggered: bool
     evaluation_interval_seconds: int
     store_entry_count: int
+    seam_violation_count: int = 0
 
 
 @dataclass
@@ -140,6 +142,7 @@ class HorizonManager:
         execution_store=None,  # Optional ExecutionWindowStore
         locked_window_ms: int = 0,
         proactive_extend_threshold_ms: int = 0,
+        execution_retention_ms: int = 0,
     ):
         self._schedule_manager = schedule_manager
         self._planning_pipeline = planning_pipeline
@@ -151,6 +154,8 @@ class HorizonManager:
         self._execution_store = execution_store
         self._locked_window_ms = locked_window_ms
         self._proactive_extend_threshold_ms = proactive_extend_threshold_ms
+        # 0 = never evict aired entries from the execution store
+        self._execution_retention_ms = execution_retention_ms
         self._logger = logging.getLogger(__name__)
 
         # Internal state
@@ -236,6 +241,11 @@ class HorizonManager:
         """Full log of all execution extension attempts."""
         return list(self._extension_attempt_log)
 
+    @property
+    def evaluation_interval_seconds(self) -> int:
+        """Configured evaluation cadence (heartbeat), in seconds."""
+        return self._eval_interval_s
+
     # ------------------------------------------------------------------
     # Depth queries
     # ------------------------------------------------------------------
@@ -256,6 +266,33 @@ class HorizonManager:
             return 0.0
         return (end_ms - now_ms) / 3_600_000.0
 
+    def ms_until_below_threshold(self) -> int:
+        """Milliseconds until EPG or execution depth falls below its minimum.
+
+        Used by HorizonCoordinator to service the channel closest to
+        starving first.  Zero or negative means already below threshold.
+        """
+        now_ms = self._now_utc_ms()
+        exec_slack = (
+            self._execution_window_end_utc_ms
+            - self._min_execution_hours * 3_600_000
+            - now_ms
+        )
+        epg_slack = (
+            self.epg_window_end_utc_ms
+            - self._min_epg_days * 24 * 3_600_000
+            - now_ms
+        )
+        slack = min(exec_slack, epg_slack)
+        if self._proactive_extend_threshold_ms > 0:
+            slack = min(
+                slack,
+                self._execution_window_end_utc_ms
+                - self._proactive_extend_threshold_ms
+                - now_ms,
+            )
+        return slack
+
     # ------------------------------------------------------------------
     # Health
     # ------------------------------------------------------------------
@@ -273,9 +310,12 @@ class HorizonManager:
         epg_h = self.get_epg_depth_hours()
         exec_h = self.get_execution_depth_hours()
         store_count = 0
+        seam_count = 0
         if self._execution_store is not None:
             try:
-                store_count = len(self._execution_store.get_all_entries())
+                coverage = self._execution_store.coverage_summary()
+                store_count = coverage.entry_count
+                seam_count = coverage.seam_break_count
             except Exception:
                 pass
         return HorizonHealthReport(
@@ -297,6 +337,7 @@ class HorizonManager:
             proactive_extension_triggered=self._proactive_extension_triggered,
             evaluation_interval_seconds=self._eval_interval_s,
             store_entry_count=store_count,
+            seam_violation_count=seam_count,
         )
 
     # ------------------------------------------------------------------
@@ -340,6 +381,10 @@ class HorizonManager:
 
         # --- Seam contiguity (INV-HORIZON-CONTINUOUS-COVERAGE-001) ---
         if self._execution_store is not None:
+            if self._execution_retention_ms > 0:
+                self._execution_store.prune_ended_before(
+                    now_ms - self._execution_retention_ms,
+                )
             self._check_seam_contiguity()
 
         # --- Proactive extension (INV-HORIZON-PROACTIVE-EXTEND-001) ---
@@ -648,36 +693,27 @@ class HorizonManager:
         For every adjacent pair (E_i, E_{i+1}), E_i.end_utc_ms must equal
         E_{i+1}.start_utc_ms exactly.  Violations are recorded as SeamViolation
         and logged as planning faults.
-        """
-        store = self._execution_store
-        entries = store.get_all_entries()  # already sorted by start_utc_ms
-        if len(entries) < 2:
-            self._coverage_compliant = True
-            self._seam_violations = []
-            return
 
+        The store maintains seam breaks incrementally as entries are added,
+        replaced or pruned, so this reads O(violations), not O(entries).
+        """
         violations: list[SeamViolation] = []
-        for i in range(len(entries) - 1):
-            left = entries[i]
-            right = entries[i + 1]
-            delta = right.start_utc_ms - left.end_utc_ms
-            if delta != 0:
-                v = SeamViolation(
-                    left_block_id=left.block_id,
-                    left_end_utc_ms=left.end_utc_ms,
-                    right_block_id=right.block_id,
-                    right_start_utc_ms=right.start_utc_ms,
-                    delta_ms=delta,
-                )
-                violations.append(v)
-                kind = "gap" if delta > 0 else "overlap"
-                self._logger.warning(
-                    "INV-HORIZON-CONTINUOUS-COVERAGE-001-VIOLATED: "
-                    "%s of %d ms between %s (end=%d) and %s (start=%d)",
-                    kind, abs(delta),
-                    left.block_id, left.end_utc_ms,
-                    right.block_id, right.start_utc_ms,
-                )
+        for b in self._execution_store.get_seam_breaks():
+            violations.append(SeamViolation(
+                left_block_id=b.left_block_id,
+                left_end_utc_ms=b.left_end_utc_ms,
+                right_block_id=b.right_block_id,
+                right_start_utc_ms=b.right_start_utc_ms,
+                delta_ms=b.delta_ms,
+            ))
+            kind = "gap" if b.delta_ms > 0 else "overlap"
+            self._logger.warning(
+                "INV-HORIZON-CONTINUOUS-COVERAGE-001-VIOLATED: "
+                "%s of %d ms between %s (end=%d) and %s (start=%d)",
+                kind, abs(b.delta_ms),
+                b.left_block_id, b.left_end_utc_ms,
+                b.right_block_id, b.right_start_utc_ms,
+            )
 
         self._seam_violations = violations
         self._coverage_compliant = len(violations) == 0
@@ -0,0 +1,266 @@
+"""
+Horizon Snapshot — on-disk copy of a channel's compiled horizon.
+
+DslScheduleService keeps its rolling horizon (pre-built ScheduledBlocks)
+in memory only.  Without a snapshot every restart rehydrates or recompiles
+HORIZON_DAYS days per channel before the channel can serve.  The snapshot
+lets startup restore those blocks straight from local disk.
+
+File layout (one file per channel, ``<dir>/<channel_id>.hsnap``)::
+
+    magic      4 bytes   b"RVHS"
+    version    uint16    SNAPSHOT_FORMAT_VERSION (big-endian)
+    body       zlib-compressed UTF-8 JSON
+
+The body interns every string (asset URIs, segment types, transitions)
+into a single table and stores each block's segments as a flat list of
+SEGMENT_STRIDE values, so a day of blocks costs a few KB on disk.
+
+Validation:
+    INV-HORIZON-SNAPSHOT-VALIDATE-001: A snapshotted day is only restored
+    when the snapshot format version, the COMPILER_VERSION and the DSL
+    hash recorded for that day all match the running process, and the
+    locked Tier 1 CompiledProgramLog row the day was built from is still
+    there with the same identity (tier1_stamp: schedule_hash + created_at).
+    A day whose Tier 1 row was deleted or rewritten — e.g. by
+    ``retrovue programming rebuild`` — is recompiled rather than served
+    from disk.  Days that fail validation are dropped individually — the
+    caller recompiles only those days.
+
+    INV-HORIZON-SNAPSHOT-ATOMIC-001: Snapshots are written to a temp file
+    and renamed into place.  A crash mid-write leaves the previous
+    snapshot intact; readers never observe a partial file.
+
+A missing, truncated or corrupt snapshot is never an error: load()
+returns no days and startup falls back to the normal compile path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"RVHS"
+SNAPSHOT_FORMAT_VERSION = 2
+SNAPSHOT_SUFFIX = ".hsnap"
+
+# segment_type, asset_uri, asset_start_offset_ms, segment_duration_ms,
+# transition_in, transition_in_duration_ms, transition_out,
+# transition_out_duration_ms, gain_db
+SEGMENT_STRIDE = 9
+
+_HEADER = struct.Struct(">4sH")
+
+
+@dataclass(frozen=True)
+class SnapshotDay:
+    """One broadcast day of blocks plus the DSL hash and Tier 1 row it came from."""
+    dsl_hash: str
+    blocks: tuple[ScheduledBlock, ...]
+    tier1_stamp: str | None = None
+
+
+def tier1_stamp(schedule_hash: str, created_at: datetime | None) -> str:
+    """Identity of a locked CompiledProgramLog row, as recorded in a SnapshotDay."""
+    return f"{schedule_hash}@{created_at.isoformat() if created_at else ''}"
+
+
+def encode_snapshot(
+    channel_id: str,
+    compiler_version: str,
+    days: dict[str, SnapshotDay],
+) -> bytes:
+    """Encode a channel's horizon into the snapshot byte format."""
+    strings: list[str] = []
+    index: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        i = index.get(s)
+        if i is None:
+            i = len(strings)
+            index[s] = i
+            strings.append(s)
+        return i
+
+    encoded_days: dict[str, dict] = {}
+    for day, snap_day in days.items():
+        blocks = []
+        for b in snap_day.blocks:
+            flat: list = []
+            for s in b.segments:
+                flat.extend((
+                    intern(s.segment_type),
+                    intern(s.asset_uri),
+                    s.asset_start_offset_ms,
+                    s.segment_duration_ms,
+                    intern(s.transition_in),
+                    s.transition_in_duration_ms,
+                    intern(s.transition_out),
+                    s.transition_out_duration_ms,
+                    s.gain_db,
+                ))
+            blocks.append([b.block_id, b.start_utc_ms, b.end_utc_ms, flat])
+        encoded_days[day] = {
+            "dsl_hash": snap_day.dsl_hash,
+            "tier1_stamp": snap_day.tier1_stamp,
+            "blocks": blocks,
+        }
+
+    body = {
+        "channel_id": channel_id,
+        "compiler_version": compiler_version,
+        "written_at_utc_ms": int(time.time() * 1000),
+        "strings": strings,
+        "days": encoded_days,
+    }
+    raw = json.dumps(body, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION) + zlib.compress(raw, 6)
+
+
+def decode_snapshot(
+    data: bytes,
+    *,
+    channel_id: str,
+    compiler_version: str,
+    dsl_hash: str,
+) -> dict[str, SnapshotDay]:
+    """Decode snapshot bytes, returning only the days that pass validation.
+
+    INV-HORIZON-SNAPSHOT-VALIDATE-001: Raises ValueError for a foreign or
+    unreadable file; silently drops days compiled from a different DSL.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("snapshot truncated")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a horizon snapshot")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"snapshot format {version} != {SNAPSHOT_FORMAT_VERSION}")
+
+    body = json.loads(zlib.decompress(data[_HEADER.size:]))
+    if body.get("channel_id") != channel_id:
+        raise ValueError(f"snapshot belongs to channel {body.get('channel_id')!r}")
+    if body.get("compiler_version") != compiler_version:
+        logger.info(
+            "Horizon snapshot for %s is stale: compiler %s != %s",
+            channel_id, body.get("compiler_version"), compiler_version,
+        )
+        return {}
+
+    strings = body["strings"]
+    # Segments are frozen; identical segments across blocks share one object.
+    seg_cache: dict[tuple, ScheduledSegment] = {}
+    result: dict[str, SnapshotDay] = {}
+    for day, d in body["days"].items():
+        if d.get("dsl_hash") != dsl_hash:
+            continue
+        blocks = []
+        for block_id, start_ms, end_ms, flat in d["blocks"]:
+            segments = []
+            for i in range(0, len(flat), SEGMENT_STRIDE):
+                key = tuple(flat[i:i + SEGMENT_STRIDE])
+                seg = seg_cache.get(key)
+                if seg is None:
+                    seg = ScheduledSegment(
+                        strings[key[0]], strings[key[1]], key[2], key[3],
+                        strings[key[4]], key[5], strings[key[6]], key[7], key[8],
+                    )
+                    seg_cache[key] = seg
+                segments.append(seg)
+            blocks.append(ScheduledBlock(block_id, start_ms, end_ms, tuple(segments)))
+        result[day] = SnapshotDay(
+            dsl_hash=d["dsl_hash"], blocks=tuple(blocks), tier1_stamp=d.get("tier1_stamp"),
+        )
+    return result
+
+
+class HorizonSnapshotStore:
+    """Reads and atomically writes per-channel horizon snapshots.
+
+    Thread-safe for distinct channels.  Writes for the same channel are
+    serialized by the owning DslScheduleService (one extension at a time).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def path_for(self, channel_id: str) -> Path:
+        return self._dir / f"{channel_id}{SNAPSHOT_SUFFIX}"
+
+    def load(
+        self,
+        channel_id: str,
+        *,
+        compiler_version: str,
+        dsl_hash: str,
+    ) -> dict[str, SnapshotDay]:
+        """Return the valid snapshotted days for a channel (may be empty)."""
+        path = self.path_for(channel_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.warning("Horizon snapshot unreadable (%s): %s", path, e)
+            return {}
+        try:
+            return decode_snapshot(
+                data,
+                channel_id=channel_id,
+                compiler_version=compiler_version,
+                dsl_hash=dsl_hash,
+            )
+        except Exception as e:
+            logger.warning("Discarding invalid horizon snapshot %s: %s", path, e)
+            return {}
+
+    def save(
+        self,
+        channel_id: str,
+        *,
+        compiler_version: str,
+        days: dict[str, SnapshotDay],
+    ) -> bool:
+        """Write a channel's snapshot.  Returns False (and logs) on failure.
+
+        INV-HORIZON-SNAPSHOT-ATOMIC-001: temp file + os.replace.
+        """
+        path = self.path_for(channel_id)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            data = encode_snapshot(channel_id, compiler_version, days)
+            self._dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            return True
+        except Exception as e:
+            logger.warning("Failed to write horizon snapshot %s: %s", path, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+
+    def delete(self, channel_id: str) -> None:
+        try:
+            self.path_for(channel_id).unlink()
+        except FileNotFoundError:
+            pass
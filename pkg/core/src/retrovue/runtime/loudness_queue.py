@@ -0,0 +1,323 @@
+"""
+Loudness Queue — durable, prioritized background loudness measurement.
+
+INV-LOUDNESS-NORMALIZED-001 Rule 5 lets a compile serve an unmeasured asset
+at gain 0 and measure it in the background.  DslScheduleService used to do
+that on a private single-thread executor, so every asset waited behind all
+others and pending work was lost on restart.  This queue replaces it:
+
+    - jobs live in a local SQLite journal (one row per asset), so a restart
+      resumes pending measurements
+    - one queue per process, shared by every channel; an asset scheduled
+      on several channels is measured once
+    - workers take the job whose earliest scheduled airtime is soonest,
+      so content about to air is normalized first
+    - ``workers`` measurements run concurrently (each is an ffmpeg decode)
+
+Claiming uses a lease: a job taken by a worker is invisible to others until
+its lease expires, so a process that dies mid-measurement releases its jobs
+without any recovery step.  Failures are retried with exponential backoff.
+
+Completed measurements are persisted to AssetProbed and announced to
+registered listeners (DslScheduleService updates its resolver in place).
+
+INV-LOUDNESS-QUEUE-DEDUP-001: At most one job exists per asset.  Enqueueing
+an asset again keeps the earliest airtime and the latest file path.
+
+INV-LOUDNESS-QUEUE-DURABLE-001: A job is removed from the journal only after
+its measurement has been committed to AssetProbed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LOUDNESS_QUEUE_ENV = "RETROVUE_LOUDNESS_QUEUE"
+LOUDNESS_WORKERS_ENV = "RETROVUE_LOUDNESS_WORKERS"
+DEFAULT_QUEUE_PATH = Path("/opt/retrovue/data/state/loudness_queue.sqlite3")
+
+# Concurrent measurements; each is a full audio decode.
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# A claimed job becomes claimable again after this long (covers the
+# LoudnessEnricher timeout plus margin).
+LEASE_MS = 11 * 60 * 1000
+
+# Retry backoff: RETRY_BASE_MS * 2**(attempts-1), capped.
+RETRY_BASE_MS = 5 * 60 * 1000
+RETRY_MAX_MS = 6 * 60 * 60 * 1000
+
+# Idle workers re-check the journal this often (jobs from other processes,
+# expired leases, elapsed backoff).
+IDLE_POLL_S = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS loudness_jobs (
+    asset_id       TEXT    PRIMARY KEY,
+    file_path      TEXT    NOT NULL,
+    airtime_utc_ms INTEGER NOT NULL,
+    enqueued_at_ms INTEGER NOT NULL,
+    attempts       INTEGER NOT NULL DEFAULT 0,
+    not_before_ms  INTEGER NOT NULL DEFAULT 0,
+    lease_until_ms INTEGER NOT NULL DEFAULT 0,
+    last_error     TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_loudness_jobs_airtime
+    ON loudness_jobs (airtime_utc_ms, enqueued_at_ms);
+"""
+
+Listener = Callable[[str, dict[str, Any]], None]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def measure_loudness(file_path: str) -> dict[str, Any]:
+    """Default measurement: LoudnessEnricher (probe-cache aware)."""
+    from retrovue.adapters.enrichers.loudness_enricher import LoudnessEnricher
+
+    return LoudnessEnricher().measure_loudness(file_path)
+
+
+def persist_loudness(asset_id: str, loudness_data: dict[str, Any]) -> None:
+    """Default persistence: merge ``loudness`` into the asset's AssetProbed payload."""
+    import uuid as uuid_mod
+
+    from retrovue.domain.entities import AssetProbed
+    from retrovue.infra.uow import session
+
+    with session() as db:
+        probed = db.query(AssetProbed).filter(
+            AssetProbed.asset_uuid == uuid_mod.UUID(asset_id),
+        ).first()
+        if probed is None:
+            db.add(AssetProbed(
+                asset_uuid=uuid_mod.UUID(asset_id),
+                payload={"loudness": loudness_data},
+            ))
+        else:
+            payload = dict(probed.payload) if probed.payload else {}
+            payload["loudness"] = loudness_data
+            probed.payload = payload
+
+
+class LoudnessQueue:
+    """Journal-backed priority queue of loudness measurements with a worker pool."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        measure: Callable[[str], dict[str, Any]] = measure_loudness,
+        persist: Callable[[str, dict[str, Any]], None] = persist_loudness,
+    ) -> None:
+        self.path = str(path)
+        self.workers = max(1, int(workers))
+        self._measure = measure
+        self._persist = persist
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._wake = threading.Condition()
+        self._listeners: list[Callable[[], Listener | None]] = []
+        self._threads: list[threading.Thread] = []
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, asset_id: str, file_path: str, airtime_utc_ms: int) -> None:
+        """Add or reprioritize a job (INV-LOUDNESS-QUEUE-DEDUP-001) and start workers."""
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT INTO loudness_jobs (asset_id, file_path, airtime_utc_ms, enqueued_at_ms) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(asset_id) DO UPDATE SET "
+                "  file_path = excluded.file_path, "
+                "  airtime_utc_ms = MIN(airtime_utc_ms, excluded.airtime_utc_ms)",
+                (asset_id, file_path, int(airtime_utc_ms), _now_ms()),
+            )
+        self.start()
+        with self._wake:
+            self._wake.notify()
+
+    def add_listener(self, fn: Listener) -> None:
+        """Call ``fn(asset_id, loudness_data)`` after each persisted measurement.
+
+        Bound methods are held weakly, so a discarded service does not stay
+        alive through the queue.
+        """
+        if hasattr(fn, "__self__") and hasattr(fn, "__func__"):
+            self._listeners.append(weakref.WeakMethod(fn))
+        else:
+            self._listeners.append(lambda: fn)
+
+    def pending(self) -> int:
+        """Number of jobs in the journal (including leased ones)."""
+        with self._db_lock:
+            return self._conn.execute("SELECT COUNT(*) FROM loudness_jobs").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start worker threads if not already running (idempotent)."""
+        if self._threads or self._stopping:
+            return
+        with self._wake:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(
+                    target=self._worker_loop, name=f"loudness-measure-{i}", daemon=True
+                )
+                self._threads.append(t)
+                t.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop workers after their current job; pending jobs stay in the journal."""
+        with self._wake:
+            self._stopping = True
+            self._wake.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+
+    def run_once(self) -> bool:
+        """Claim and process the most urgent due job.  Returns False if none was due."""
+        job = self._claim()
+        if job is None:
+            return False
+        asset_id, file_path, attempts = job
+        try:
+            loudness_data = self._measure(file_path)
+            self._persist(asset_id, loudness_data)
+        except Exception as e:
+            self._fail(asset_id, attempts + 1, e)
+            return True
+
+        self._complete(asset_id)
+        logger.info(
+            "INV-LOUDNESS-NORMALIZED-001: Background measurement complete "
+            "asset=%s integrated_lufs=%.1f gain_db=%.1f",
+            asset_id,
+            loudness_data["integrated_lufs"],
+            loudness_data["gain_db"],
+        )
+        for ref in list(self._listeners):
+            fn = ref()
+            if fn is None:
+                continue
+            try:
+                fn(asset_id, loudness_data)
+            except Exception:
+                logger.exception("Loudness listener failed for asset=%s", asset_id)
+        return True
+
+    def _worker_loop(self) -> None:
+        while not self._stopping:
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.exception("INV-LOUDNESS-NORMALIZED-001: loudness worker error")
+            with self._wake:
+                if not self._stopping:
+                    self._wake.wait(IDLE_POLL_S)
+
+    # ------------------------------------------------------------------
+    # Journal operations
+    # ------------------------------------------------------------------
+
+    def _claim(self) -> tuple[str, str, int] | None:
+        now = _now_ms()
+        with self._db_lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT asset_id, file_path, attempts FROM loudness_jobs "
+                    "WHERE not_before_ms <= ? AND lease_until_ms <= ? "
+                    "ORDER BY airtime_utc_ms, enqueued_at_ms LIMIT 1",
+                    (now, now),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE loudness_jobs SET lease_until_ms = ? WHERE asset_id = ?",
+                        (now + LEASE_MS, row[0]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return (row[0], row[1], row[2]) if row is not None else None
+
+    def _complete(self, asset_id: str) -> None:
+        # INV-LOUDNESS-QUEUE-DURABLE-001: only after persist() committed
+        with self._db_lock:
+            self._conn.execute("DELETE FROM loudness_jobs WHERE asset_id = ?", (asset_id,))
+
+    def _fail(self, asset_id: str, attempts: int, error: Exception) -> None:
+        delay = min(RETRY_MAX_MS, RETRY_BASE_MS * 2 ** (attempts - 1))
+        with self._db_lock:
+            self._conn.execute(
+                "UPDATE loudness_jobs SET attempts = ?, not_before_ms = ?, "
+                "lease_until_ms = 0, last_error = ? WHERE asset_id = ?",
+                (attempts, _now_ms() + delay, str(error)[:500], asset_id),
+            )
+        logger.warning(
+            "INV-LOUDNESS-NORMALIZED-001: Background loudness measurement failed "
+            "for asset=%s (attempt %d, retry in %ds): %s",
+            asset_id, attempts, delay // 1000, error,
+        )
+
+
+_QUEUE: LoudnessQueue | None = None
+_QUEUE_LOCK = threading.Lock()
+
+
+def _default_path() -> str:
+    configured = os.getenv(LOUDNESS_QUEUE_ENV)
+    if configured:
+        return configured
+    try:
+        DEFAULT_QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if os.access(DEFAULT_QUEUE_PATH.parent, os.W_OK):
+            return str(DEFAULT_QUEUE_PATH)
+    except OSError:
+        pass
+    fallback = Path(tempfile.gettempdir()) / "retrovue" / DEFAULT_QUEUE_PATH.name
+    fallback.parent.mkdir(parents=True, exist_ok=True)
+    logger.warning(
+        "Loudness queue: %s not writable, using %s", DEFAULT_QUEUE_PATH.parent, fallback
+    )
+    return str(fallback)
+
+
+def get_loudness_queue() -> LoudnessQueue:
+    """Process-wide queue shared by all DslScheduleService instances."""
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            workers = int(os.getenv(LOUDNESS_WORKERS_ENV) or DEFAULT_WORKERS)
+            _QUEUE = LoudnessQueue(_default_path(), workers=workers)
+        return _QUEUE
@@ -172,6 +172,17 @@ try:
         "Current available feed credits",
         ["channel_id"],
     )
+
+    # Schedule log retention (INV-SCHEDULE-RETENTION-001)
+    schedule_retention_rows_purged_total = Counter(
+        "retrovue_schedule_retention_rows_purged_total",
+        "Expired schedule log rows deleted by the retention job",
+        ["tier"],
+    )
+    schedule_retention_rows_per_second = Gauge(
+        "retrovue_schedule_retention_rows_per_second",
+        "Delete throughput of the last retention pass",
+    )
 except ImportError:
     prefeed_lead_time_ms = None
     prefeed_lead_time_violations_total = None
@@ -186,4 +197,6 @@ except ImportError:
     feed_error_backoff_total = None
     feed_queue_depth_current = None
     feed_credits_current = None
+    schedule_retention_rows_purged_total = None
+    schedule_retention_rows_per_second = None
 
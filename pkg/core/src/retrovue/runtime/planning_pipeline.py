@@ -55,6 +55,7 @@ class FillerAsset:
     asset_uri: str
     duration_ms: int
     asset_type: str = "filler"   # "filler", "promo", "ad"
+    asset_uuid: str | None = None  # set by DatabaseAssetLibrary; needed to log plays
 
 
 # =============================================================================
@@ -74,8 +75,10 @@ class AssetLibrary(Protocol):
     def get_duration_ms(self, asset_uri: str) -> int: ...
 
     def get_filler_assets(
-        self, max_duration_ms: int, count: int = 1
-    ) -> list[FillerAsset]: ...
+        self, max_duration_ms: int, count: int = 1, air_time: datetime | None = None
+    ) -> list[FillerAsset]:
+        """Fillers up to max_duration_ms, eligible to air at air_time (default: now)."""
+        ...
 
 
 # =============================================================================
@@ -1083,7 +1086,7 @@ class InMemoryAssetLibrary:
         return self._durations.get(asset_uri, 0)
 
     def get_filler_assets(
-        self, max_duration_ms: int, count: int = 1
+        self, max_duration_ms: int, count: int = 1, air_time: datetime | None = None
     ) -> list[FillerAsset]:
         eligible = [f for f in self._fillers if f.duration_ms <= max_duration_ms]
         return eligible[:count]
@@ -13,7 +13,8 @@ See: docs/architecture/two-tier-horizon.md
      INV-PLAYLOG-PREFILL-001: Ad fill at Tier 2 generation, never at feed time
      INV-CHANNEL-NO-COMPILE-001: ChannelManager never compiles or fills ads
 
-Lifecycle: start()/stop() run a background daemon thread.
+Lifecycle: start()/stop() run a background daemon thread, or the daemon
+           is registered with a shared HorizonCoordinator (ProgramDirector).
            evaluate_once() can be called manually for testing.
 """
 
@@ -25,9 +26,18 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
+from retrovue.runtime.schedule_row_cache import (
+    get_transmission_log_cache,
+    read_compiled_day,
+)
+from retrovue.runtime.segment_codec import pack_blocks
+
+if TYPE_CHECKING:
+    from retrovue.runtime.schedule_types import ScheduledBlock
+
 logger = logging.getLogger(__name__)
 
 # Log INV-PLAYLOG-HORIZON-002 at WARNING only on first consecutive zero; later repeats at DEBUG.
@@ -93,9 +103,6 @@ class PlaylogHorizonDaemon:
         # Suppress repeated "needs recompile" noise: log once per (channel, day)
         self._warned_stale_days: set[date] = set()
 
-        # INV-SCHEDULE-RETENTION-001: throttle DB purge to at most once/hour
-        self._last_tier2_purge_utc_ms: int = 0
-
         # Lifecycle
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
@@ -177,9 +184,6 @@ class PlaylogHorizonDaemon:
                     self._fill_errors,
                 )
 
-            # INV-SCHEDULE-RETENTION-001: purge expired Tier 2 DB rows
-            self._purge_expired_tier2(now_ms, db=db)
-
         return blocks_filled
 
     def get_health_report(self) -> PlaylogHealthReport:
@@ -197,6 +201,18 @@ class PlaylogHorizonDaemon:
             fill_errors_since_start=self._fill_errors,
         )
 
+    @property
+    def evaluation_interval_seconds(self) -> int:
+        return self._eval_interval_s
+
+    def ms_until_below_threshold(self) -> int:
+        """Milliseconds until Tier 2 depth falls below min_hours.
+
+        In-memory only (no DB access): used by HorizonCoordinator to
+        order channels by how close they are to starving.
+        """
+        return self._farthest_end_utc_ms - self._min_hours * 3_600_000 - self._now_utc_ms()
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -223,60 +239,6 @@ class PlaylogHorizonDaemon:
             self._thread = None
         logger.info("PlaylogHorizon[%s]: stopped", self._channel_id)
 
-    # ------------------------------------------------------------------
-    # Internal: retention
-    # ------------------------------------------------------------------
-
-    def _purge_expired_tier2(self, now_utc_ms: int = 0, *, db=None) -> int:
-        """Delete TransmissionLog rows with end_utc_ms <= now - 4 hours.
-
-        INV-SCHEDULE-RETENTION-001: Tier 2 retains only rows where
-        end_utc_ms > now - 4h. Throttled to at most once per hour.
-
-        INV-DAEMON-SESSION-SCOPE-001: Accepts optional db session to avoid
-        opening a new connection when called from evaluate_once().
-
-        Returns the number of rows deleted (0 if throttled or no-op).
-        """
-        if now_utc_ms == 0:
-            now_utc_ms = self._now_utc_ms()
-
-        # Hourly throttle
-        if (now_utc_ms - self._last_tier2_purge_utc_ms) < 3_600_000:
-            return 0
-
-        from retrovue.domain.entities import TransmissionLog
-
-        cutoff_ms = now_utc_ms - (4 * 3_600_000)
-        try:
-            if db is not None:
-                count = db.query(TransmissionLog).filter(
-                    TransmissionLog.channel_slug == self._channel_id,
-                    TransmissionLog.end_utc_ms <= cutoff_ms,
-                ).delete()
-                db.commit()
-            else:
-                from retrovue.infra.uow import session as db_session_factory
-                with db_session_factory() as db:
-                    count = db.query(TransmissionLog).filter(
-                        TransmissionLog.channel_slug == self._channel_id,
-                        TransmissionLog.end_utc_ms <= cutoff_ms,
-                    ).delete()
-            self._last_tier2_purge_utc_ms = now_utc_ms
-            if count > 0:
-                logger.info(
-                    "INV-SCHEDULE-RETENTION-001: Purged %d expired Tier 2 rows "
-                    "for channel=%s (end_utc_ms <= %d)",
-                    count, self._channel_id, cutoff_ms,
-                )
-            return count
-        except Exception as e:
-            logger.warning(
-                "INV-SCHEDULE-RETENTION-001: Tier 2 purge failed for channel=%s: %s",
-                self._channel_id, e,
-            )
-            return 0
-
     # ------------------------------------------------------------------
     # Internal: extension logic
     # ------------------------------------------------------------------
@@ -481,18 +443,16 @@ class PlaylogHorizonDaemon:
         """Load segmented_blocks from CompiledProgramLog (Tier 1).
 
         INV-DAEMON-SESSION-SCOPE-001: Accepts optional db session.
-        """
-        from retrovue.domain.entities import CompiledProgramLog
 
+        INV-SCHEDULE-ROW-CACHE-001: Reads through the compiled-log cache
+        shared with DslScheduleService; a cached day is used only while it
+        matches the row's identity.
+        """
         def _query(s):
-            row = s.query(CompiledProgramLog).filter(
-                CompiledProgramLog.channel_id == self._channel_id,
-                CompiledProgramLog.broadcast_day == broadcast_day,
-                CompiledProgramLog.locked == True,
-            ).first()
-            if row is None:
+            entry = read_compiled_day(s, self._channel_id, broadcast_day)
+            if entry is None:
                 return None
-            cj = row.compiled_json
+            cj = entry.compiled_json
             if "segmented_blocks" not in cj or not cj["segmented_blocks"]:
                 if broadcast_day not in self._warned_stale_days:
                     self._warned_stale_days.add(broadcast_day)
@@ -561,7 +521,7 @@ class PlaylogHorizonDaemon:
         except Exception:
             return set()
 
-    def _fill_ads(self, block: "ScheduledBlock", *, db=None) -> "ScheduledBlock":
+    def _fill_ads(self, block: ScheduledBlock, *, db=None) -> ScheduledBlock:
         """Fill empty filler placeholders with real interstitials.
 
         INV-PLAYLOG-PREFILL-001: Ad fill happens here at Tier 2 generation.
@@ -569,29 +529,41 @@ class PlaylogHorizonDaemon:
         """
         from retrovue.runtime.traffic_manager import fill_ad_blocks
 
+        def fill(asset_lib) -> ScheduledBlock:
+            return fill_ad_blocks(
+                block,
+                filler_uri=self._filler_path,
+                filler_duration_ms=self._filler_duration_ms,
+                asset_library=asset_lib,
+            )
+
+        if db is None:
+            # The library flushes logged plays into its session, so the
+            # fill has to run before that session commits.
+            try:
+                from retrovue.catalog.db_asset_library import DatabaseAssetLibrary
+                from retrovue.infra.uow import session as db_session_factory
+                with db_session_factory() as own_db:
+                    return fill(DatabaseAssetLibrary(own_db, channel_slug=self._channel_id))
+            except Exception as e:
+                logger.warning(
+                    "PlaylogHorizon[%s]: Could not fill from asset library: %s",
+                    self._channel_id, e,
+                )
+                return fill(None)
+
         asset_lib = None
         try:
             from retrovue.catalog.db_asset_library import DatabaseAssetLibrary
-            if db is not None:
-                asset_lib = DatabaseAssetLibrary(db, channel_slug=self._channel_id)
-            else:
-                from retrovue.infra.uow import session as db_session_factory
-                with db_session_factory() as db:
-                    asset_lib = DatabaseAssetLibrary(db, channel_slug=self._channel_id)
+            asset_lib = DatabaseAssetLibrary(db, channel_slug=self._channel_id)
         except Exception as e:
             logger.warning(
                 "PlaylogHorizon[%s]: Could not create asset library: %s",
                 self._channel_id, e,
             )
+        return fill(asset_lib)
 
-        return fill_ad_blocks(
-            block,
-            filler_uri=self._filler_path,
-            filler_duration_ms=self._filler_duration_ms,
-            asset_library=asset_lib,
-        )
-
-    def _write_to_txlog(self, block: "ScheduledBlock", broadcast_day: date, *, db=None) -> None:
+    def _write_to_txlog(self, block: ScheduledBlock, broadcast_day: date, *, db=None) -> None:
         """Write a filled block to TransmissionLog.
 
         INV-PLAYLOG-PREFILL-001: Canonical Tier 2 write path.
@@ -631,6 +603,10 @@ class PlaylogHorizonDaemon:
 
             segments_data.append(d)
 
+        # INV-SEGMENT-CODEC-001: readers decode the packed copy; the JSON
+        # list stays as the inspectable/evidence view.
+        packed = pack_blocks([block])
+
         try:
             if db is not None:
                 row = TransmissionLog(
@@ -640,6 +616,7 @@ class PlaylogHorizonDaemon:
                     start_utc_ms=block.start_utc_ms,
                     end_utc_ms=block.end_utc_ms,
                     segments=segments_data,
+                    segments_packed=packed,
                 )
                 db.merge(row)
                 db.commit()
@@ -653,6 +630,7 @@ class PlaylogHorizonDaemon:
                         start_utc_ms=block.start_utc_ms,
                         end_utc_ms=block.end_utc_ms,
                         segments=segments_data,
+                        segments_packed=packed,
                     )
                     db.merge(row)
         except Exception as e:
@@ -661,6 +639,8 @@ class PlaylogHorizonDaemon:
                 self._channel_id, block.block_id, e,
             )
             raise
+        finally:
+            get_transmission_log_cache().invalidate(block.block_id)
 
     # ------------------------------------------------------------------
     # Internal: queries
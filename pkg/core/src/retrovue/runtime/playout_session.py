@@ -12,6 +12,7 @@ Usage:
     session.start(join_utc_ms)
     session.seed(block_a, block_b)
     session.feed(block_c)  # Call when slot available
+                           # (non-blocking when on_feed_result is given)
     session.stop("last_viewer_left")
 
 Copyright (c) 2025 RetroVue
@@ -46,10 +47,19 @@ class FeedResult(Enum):
     Distinguishes QUEUE_FULL (capacity, not an error) from ERROR
     (gRPC/transport failure). Enables credit-based flow control
     in BlockPlanProducer.
+
+    PENDING is returned only by a session constructed with
+    ``on_feed_result``: the request is in flight and its final result
+    (ACCEPTED / QUEUE_FULL / ERROR) is delivered to that callback.
     """
     ACCEPTED = "accepted"
     QUEUE_FULL = "queue_full"
     ERROR = "error"
+    PENDING = "pending"
+
+
+# Deadline for one FeedBlockPlan call.
+FEED_TIMEOUT_S = 5.0
 
 
 def _get_playout_stubs() -> tuple[types.ModuleType, types.ModuleType]:
@@ -192,6 +202,20 @@ class SessionState:
     session_end_reason: Optional[str] = None
 
 
+class _FeedCall:
+    """One FeedBlockPlan request in flight (INV-FEED-NONBLOCKING-001)."""
+
+    __slots__ = ("block", "future", "submitter", "submitting", "result", "lock")
+
+    def __init__(self, block: "BlockPlan") -> None:
+        self.block = block
+        self.future: Optional[grpc.Future] = None
+        self.submitter = threading.get_ident()
+        self.submitting = True
+        self.result: Optional[FeedResult] = None
+        self.lock = threading.Lock()
+
+
 class PlayoutSession:
     """
     Orchestrates BlockPlan-based playout through AIR.
@@ -217,6 +241,7 @@ class PlayoutSession:
         on_session_end: Optional[Callable[[str], None]] = None,
         on_block_started: Optional[Callable[[str], None]] = None,
         evidence_endpoint: str = "",
+        on_feed_result: Optional[Callable[[BlockPlan, FeedResult], None]] = None,
     ):
         """
         Initialize PlayoutSession.
@@ -232,6 +257,8 @@ class PlayoutSession:
             on_session_end: Callback when session ends (receives reason)
             on_block_started: Callback when a block starts (receives block_id)
             evidence_endpoint: host:port for evidence gRPC, empty = disabled
+            on_feed_result: Makes feed() non-blocking; receives (block, result)
+                once AIR answers (see feed())
         """
         self.channel_id = channel_id
         self.channel_id_int = channel_id_int
@@ -243,6 +270,7 @@ class PlayoutSession:
         self.on_block_complete = on_block_complete
         self.on_session_end = on_session_end
         self.on_block_started = on_block_started
+        self.on_feed_result = on_feed_result
         self._evidence_endpoint = evidence_endpoint
 
         self._state = SessionState()
@@ -251,6 +279,10 @@ class PlayoutSession:
         self._stub: Optional[playout_pb2_grpc.PlayoutControlStub] = None
         self._event_thread: Optional[threading.Thread] = None
         self._event_stop = threading.Event()
+        # In-flight feeds; guarded by _feed_lock (never held across an RPC
+        # and never taken while waiting on _lock).
+        self._feed_lock = threading.Lock()
+        self._feeds_in_flight: set[_FeedCall] = set()
 
         logger.debug(f"[PlayoutSession:{channel_id}] Initialized, ts_socket={ts_socket_path}")
 
@@ -562,13 +594,22 @@ class PlayoutSession:
 
         INV-FEED-NO-FEED-AFTER-END: Returns ERROR if session has ended.
 
+        INV-FEED-NONBLOCKING-001: The session lock is never held across the
+        FeedBlockPlan RPC.  With ``on_feed_result`` set, the RPC is issued
+        asynchronously and feed() returns PENDING without waiting; the final
+        result is delivered to the callback from a gRPC thread.  If the call
+        has already completed when feed() returns, the result is returned
+        directly and the callback is not invoked.  Without ``on_feed_result``,
+        feed() waits for the answer (up to FEED_TIMEOUT_S).
+
         Args:
             block: Next block to feed
 
         Returns:
             FeedResult.ACCEPTED if feeding succeeded,
             FeedResult.QUEUE_FULL if AIR's queue is full (capacity, not error),
-            FeedResult.ERROR on gRPC/transport failure or invalid state.
+            FeedResult.ERROR on gRPC/transport failure or invalid state,
+            FeedResult.PENDING if the answer will arrive via on_feed_result.
         """
         with self._lock:
             # INV-FEED-NO-FEED-AFTER-END: Defense-in-depth guard
@@ -579,38 +620,92 @@ class PlayoutSession:
                 )
                 return FeedResult.ERROR
 
-            if not self._state.is_running:
+            if not self._state.is_running or self._stub is None:
                 logger.error(f"[PlayoutSession:{self.channel_id}] Cannot feed - not running")
                 return FeedResult.ERROR
 
-            try:
-                request = playout_pb2.FeedBlockPlanRequest(
-                    channel_id=self.channel_id_int,
-                    block=block.to_proto(),
-                )
+            stub = self._stub
+            request = playout_pb2.FeedBlockPlanRequest(
+                channel_id=self.channel_id_int,
+                block=block.to_proto(),
+            )
 
-                response = self._stub.FeedBlockPlan(request, timeout=5.0)
+        call = _FeedCall(block)
+        try:
+            call.future = stub.FeedBlockPlan.future(request, timeout=FEED_TIMEOUT_S)
+        except Exception as e:
+            logger.error(f"[PlayoutSession:{self.channel_id}] Feed RPC error: {e}")
+            return FeedResult.ERROR
+
+        if self.on_feed_result is None:
+            with self._feed_lock:
+                self._feeds_in_flight.add(call)
+            try:
+                return self._feed_outcome(call)
+            finally:
+                with self._feed_lock:
+                    self._feeds_in_flight.discard(call)
+
+        with self._feed_lock:
+            self._feeds_in_flight.add(call)
+        call.future.add_done_callback(lambda _f, c=call: self._on_feed_done(c))
+        with call.lock:
+            call.submitting = False
+            if call.result is not None:
+                return call.result
+        return FeedResult.PENDING
+
+    def _on_feed_done(self, call: _FeedCall) -> None:
+        with self._feed_lock:
+            self._feeds_in_flight.discard(call)
+        if call.future.cancelled():
+            return  # session stopping; nobody is waiting for this block
+        result = self._feed_outcome(call)
+        with call.lock:
+            # Completed before feed() returned, on the submitting thread:
+            # feed() hands the result back directly.
+            if call.submitting and call.submitter == threading.get_ident():
+                call.result = result
+                return
+        try:
+            self.on_feed_result(call.block, result)
+        except Exception as e:
+            logger.error(
+                f"[PlayoutSession:{self.channel_id}] on_feed_result callback error: {e}"
+            )
 
-                if response.success:
-                    self._state.blocks_fed += 1
-                    logger.debug(f"[PlayoutSession:{self.channel_id}] Fed: {block.block_id}")
-                    return FeedResult.ACCEPTED
-                else:
-                    if response.queue_full:
-                        logger.warning(
-                            f"[PlayoutSession:{self.channel_id}] Feed skipped - queue full"
-                        )
-                        return FeedResult.QUEUE_FULL
-                    else:
-                        logger.error(
-                            f"[PlayoutSession:{self.channel_id}] Feed failed: "
-                            f"{response.message} (code={response.result_code})"
-                        )
-                        return FeedResult.ERROR
+    def _feed_outcome(self, call: _FeedCall) -> FeedResult:
+        """Map a finished FeedBlockPlan call to a FeedResult."""
+        block = call.block
+        try:
+            response = call.future.result()
+        except grpc.FutureCancelledError:
+            return FeedResult.ERROR
+        except grpc.RpcError as e:
+            logger.error(f"[PlayoutSession:{self.channel_id}] Feed RPC error: {e}")
+            return FeedResult.ERROR
+
+        if response.success:
+            with self._feed_lock:
+                self._state.blocks_fed += 1
+            logger.debug(f"[PlayoutSession:{self.channel_id}] Fed: {block.block_id}")
+            return FeedResult.ACCEPTED
+        if response.queue_full:
+            logger.warning(
+                f"[PlayoutSession:{self.channel_id}] Feed skipped - queue full"
+            )
+            return FeedResult.QUEUE_FULL
+        logger.error(
+            f"[PlayoutSession:{self.channel_id}] Feed failed: "
+            f"{response.message} (code={response.result_code})"
+        )
+        return FeedResult.ERROR
 
-            except grpc.RpcError as e:
-                logger.error(f"[PlayoutSession:{self.channel_id}] Feed RPC error: {e}")
-                return FeedResult.ERROR
+    @property
+    def feeds_in_flight(self) -> int:
+        """Number of FeedBlockPlan calls awaiting an answer from AIR."""
+        with self._feed_lock:
+            return len(self._feeds_in_flight)
 
     def stop(self, reason: str = "requested") -> bool:
         """
@@ -668,6 +763,13 @@ class PlayoutSession:
         """Clean up resources."""
         self._state.is_running = False
 
+        # Abandon feeds still awaiting AIR; their results are not delivered.
+        with self._feed_lock:
+            pending_feeds = list(self._feeds_in_flight)
+        for call in pending_feeds:
+            if call.future is not None:
+                call.future.cancel()
+
         # Signal event thread to stop
         self._event_stop.set()
         if self._event_thread and self._event_thread.is_alive():
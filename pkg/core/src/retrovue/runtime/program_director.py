@@ -25,6 +25,7 @@ Design Principles:
 
 import asyncio
 import gc
+import json
 import logging
 import os
 import queue
@@ -32,7 +33,7 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
@@ -44,6 +45,7 @@ from fastapi.responses import HTMLResponse, StreamingResponse
 from uvicorn import Config, Server
 
 from retrovue.runtime.clock import MasterClock, RealTimeMasterClock
+from retrovue.runtime.horizon_coordinator import HorizonCoordinator
 from retrovue.runtime.pace import PaceController
 from retrovue.runtime.channel_stream import (
     ChannelStream,
@@ -60,6 +62,7 @@ from retrovue.runtime.config import (
     InlineChannelConfigProvider,
 )
 from retrovue.runtime.schedule_manager_service import ScheduleManagerBackedScheduleService
+from retrovue.runtime.schedule_retention import get_schedule_retention_job
 
 try:
     from retrovue.runtime.settings import RuntimeSettings  # type: ignore
@@ -143,6 +146,24 @@ class ChannelInfo:
     last_activity: datetime
 
 
+@dataclass
+class ChannelStartupTiming:
+    """Cold-start timing for one channel (startup report).
+
+    phases_ms maps phase name ("horizon", "prewarm", "playlog") to wall
+    time spent in that phase.  ready_after_ms is measured from the start
+    of background warmup, so it includes time spent queued behind
+    higher-priority channels.
+    """
+
+    channel_id: str
+    priority: int
+    phases_ms: dict[str, float] = field(default_factory=dict)
+    ready: bool = False
+    error: Optional[str] = None
+    ready_after_ms: Optional[float] = None
+
+
 class ChannelManagerProvider(Protocol):
     """Protocol for getting ChannelManager instances."""
 
@@ -352,6 +373,30 @@ class _ExecutionHorizonExtender:
             )
 
 
+WATCH_PAGE_TEMPLATE = Path("/opt/retrovue/pkg/core/templates/player/watch.html")
+
+
+def render_watch_page(channel_id: str, channels: Optional[list[dict[str, Any]]]) -> str:
+    """Render the HLS player page for *channel_id* with a button per channel in the lineup."""
+    html = WATCH_PAGE_TEMPLATE.read_text()
+
+    channel_name = channel_id
+    channel_buttons = ""
+    if channels is None:
+        channel_buttons = '<a href="/watch/' + channel_id + '" class="active">' + channel_id + '</a>'
+    else:
+        for ch in channels:
+            if ch["channel_id"] == channel_id:
+                channel_name = ch["name"]
+            active = " active" if ch["channel_id"] == channel_id else ""
+            channel_buttons += '<a href="/watch/' + ch["channel_id"] + '" class="' + active.strip() + '">' + ch["name"] + '</a>\n'
+
+    html = html.replace("{{CHANNEL_ID}}", channel_id)
+    html = html.replace("{{CHANNEL_NAME}}", channel_name)
+    html = html.replace("{{CHANNEL_BUTTONS}}", channel_buttons)
+    return html
+
+
 class ProgramDirector:
     """
     Global coordinator and policy layer for the entire broadcast system.
@@ -409,6 +454,11 @@ class ProgramDirector:
         asset_a_path: Optional[str] = None,
         asset_b_path: Optional[str] = None,
         segment_seconds: float = 10.0,
+        horizon_workers: int = 4,
+        startup_workers: int = 4,
+        evidence_port: int = 50052,
+        tune_history_path: Optional[Path] = None,
+        schedule_retention: bool = True,
     ) -> None:
         """Initialize the Program Director.
         
@@ -423,6 +473,15 @@ class ProgramDirector:
             schedule_dir: For embedded mode: directory containing schedule.json files
             channel_config_provider: For embedded mode: channel config provider
             mock_schedule_*: For embedded mode: mock schedule options
+            horizon_workers: Size of the shared HorizonCoordinator pool that
+                services every channel's HorizonManager and PlaylogHorizonDaemon
+            startup_workers: Number of channels warmed concurrently at startup
+            evidence_port: Port of the evidence gRPC server AIR reports to
+                (distinct per process when channels are sharded)
+            tune_history_path: Where last tune-in times are persisted
+                (default: state dir; per shard when channels are sharded)
+            schedule_retention: Run the process-wide schedule log retention
+                job in embedded mode (only one shard does when sharded)
         """
         self._logger = logging.getLogger(__name__)
         self._clock = clock or RealTimeMasterClock()
@@ -446,6 +505,9 @@ class ProgramDirector:
         self._horizon_resolved_stores: dict[str, Any] = {}
         # Playlog Horizon Daemons (Tier 2 — INV-PLAYLOG-HORIZON-001)
         self._playlog_daemons: dict[str, Any] = {}
+        # Shared worker pool for all horizon maintainers: thread and DB
+        # connection counts stay flat as channels are added.
+        self._horizon_coordinator = HorizonCoordinator(max_workers=horizon_workers)
         self._channel_config_provider: Optional[Any] = None
         self._health_check_stop: Optional[threading.Event] = None
         self._health_check_thread: Optional[Thread] = None
@@ -495,7 +557,7 @@ class ProgramDirector:
 
         # Evidence pipeline configuration
         self._evidence_enabled = True
-        self._evidence_port = 50052
+        self._evidence_port = evidence_port
         self._evidence_asrun_dir = "/opt/retrovue/data/logs/asrun"
         self._evidence_ack_dir = "/opt/retrovue/data/logs/asrun/acks"
         self._evidence_endpoint = f"127.0.0.1:{self._evidence_port}" if self._evidence_enabled else ""
@@ -515,6 +577,28 @@ class ProgramDirector:
         # to 503 during the warm-up window.
         self._startup_complete = threading.Event()
 
+        # Per-channel readiness: channels are warmed concurrently in
+        # priority order and become tunable as soon as their own warmup
+        # finishes, before _startup_complete is set.
+        self._startup_workers = max(1, startup_workers)
+        self._startup_lock = threading.Lock()
+        self._channel_ready: set[str] = set()
+        self._channel_failed: dict[str, str] = {}
+        self._startup_timings: dict[str, ChannelStartupTiming] = {}
+        self._startup_t0: Optional[float] = None
+        self._startup_total_ms: Optional[float] = None
+        # Last tune-in wall time per channel, persisted across restarts so
+        # recently-watched channels warm first.
+        self._tune_history_path = tune_history_path or Path(
+            "/opt/retrovue/data/state/channel_tune_history.json"
+        )
+        self._tune_history: dict[str, float] = {}
+        # INV-HORIZON-SNAPSHOT-VALIDATE-001: compiled DSL horizons are
+        # snapshotted here so restarts restore instead of recompiling.
+        self._horizon_snapshot_dir = Path("/opt/retrovue/data/state/horizon_snapshots")
+        # INV-SCHEDULE-RETENTION-001: one batched purge job per process
+        self._schedule_retention = schedule_retention
+
         # Register HTTP endpoints
         self._register_endpoints()
         
@@ -688,6 +772,7 @@ class ProgramDirector:
             return cached
 
         from retrovue.runtime.dsl_schedule_service import DslScheduleService
+        from retrovue.runtime.horizon_snapshot import HorizonSnapshotStore
 
         sc = channel_config.schedule_config or {}
         dsl_path = sc.get("dsl_path", "")
@@ -700,6 +785,7 @@ class ProgramDirector:
             filler_duration_ms=filler_duration_ms,
             channel_slug=channel_id,
             channel_type=sc.get("channel_type", "network"),
+            snapshot_store=HorizonSnapshotStore(self._horizon_snapshot_dir),
         )
 
         setattr(self, key, svc)
@@ -736,16 +822,17 @@ class ProgramDirector:
         setattr(self, key, service)
         return service
 
-    def _init_horizon_managers(self) -> None:
+    def _init_horizon_managers(self, channel_ids: Optional[list[str]] = None) -> None:
         """Create and start HorizonManagers for Phase3 channels.
 
-        Called from start().  For each
+        Called from start() via _warm_channel() (one channel at a time), or
+        with channel_ids=None for every configured channel.  For each
         Phase3 channel:
         1. Creates ScheduleManagerBackedScheduleService and loads the schedule
         2. Creates ExecutionWindowStore
         3. Creates ScheduleExtender / ExecutionExtender adapters
         4. Creates HorizonManager and runs evaluate_once() (readiness gate)
-        5. Locks all initial entries and starts the background thread
+        5. Locks all initial entries and registers it with the HorizonCoordinator
         """
         if self._channel_config_provider is None:
             return
@@ -760,7 +847,10 @@ class ProgramDirector:
         from retrovue.runtime.execution_window_store import ExecutionWindowStore
         from retrovue.runtime.horizon_manager import HorizonManager
 
-        for channel_id in self._channel_config_provider.list_channel_ids():
+        if channel_ids is None:
+            channel_ids = self._channel_config_provider.list_channel_ids()
+
+        for channel_id in channel_ids:
             config = self._channel_config_provider.get_channel_config(channel_id)
             if config is None or config.schedule_source != "phase3":
                 continue
@@ -835,33 +925,38 @@ class ProgramDirector:
                     "[channel %s] Locked %d execution entries", channel_id, locked,
                 )
 
-            # Start background evaluation thread
-            horizon_mgr.start()
+            # Background evaluation via the shared coordinator pool
+            self._horizon_coordinator.register(f"horizon:{channel_id}", horizon_mgr)
+            self._horizon_coordinator.start()
             self._horizon_managers[channel_id] = horizon_mgr
 
-        self._logger.info(
+        self._logger.debug(
             "HorizonManagers initialized: %d channels",
             len(self._horizon_managers),
         )
 
-    def _prewarm_channel_schedules(self) -> None:
-        """Pre-warm schedule data for all configured channels at server startup.
+    def _prewarm_channel_schedules(self, channel_ids: Optional[list[str]] = None) -> int:
+        """Pre-warm schedule data for configured channels at server startup.
 
         INV-SCHEDULE-PREWARM-001: All multi-day DSL compilation and EPG horizon
         building MUST be performed here (scheduler daemon startup), never on a
         viewer-triggered code path. This method creates each channel's schedule
         service and calls load_schedule() to compile the initial horizon.
 
-        Called from start(), before _init_playlog_daemons().
+        Called from start() via _warm_channel(), before _init_playlog_daemons().
+        Returns the number of channels warmed.
         """
         if self._channel_config_provider is None:
-            return
+            return 0
 
         if not hasattr(self._channel_config_provider, "list_channel_ids"):
-            return
+            return 0
+
+        if channel_ids is None:
+            channel_ids = self._channel_config_provider.list_channel_ids()
 
         warmed = 0
-        for channel_id in self._channel_config_provider.list_channel_ids():
+        for channel_id in channel_ids:
             config = self._channel_config_provider.get_channel_config(channel_id)
             if config is None:
                 continue
@@ -882,19 +977,20 @@ class ProgramDirector:
                     channel_id, e, exc_info=True,
                 )
 
-        self._logger.info(
+        self._logger.debug(
             "Schedule prewarm complete: %d channels warmed", warmed,
         )
+        return warmed
 
-    def _init_playlog_daemons(self) -> None:
+    def _init_playlog_daemons(self, channel_ids: Optional[list[str]] = None) -> None:
         """Create and start PlaylogHorizonDaemons for DSL channels.
 
         INV-PLAYLOG-HORIZON-001: Each DSL channel gets a daemon that
         maintains 2-3+ hours of fully-filled playout logs in
         TransmissionLog (Postgres).
 
-        Called from start(), after _prewarm_channel_schedules() and
-        _init_horizon_managers.
+        Called from start() via _warm_channel(), after
+        _prewarm_channel_schedules() and _init_horizon_managers.
         """
         if self._channel_config_provider is None:
             return
@@ -904,7 +1000,10 @@ class ProgramDirector:
 
         from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
 
-        for channel_id in self._channel_config_provider.list_channel_ids():
+        if channel_ids is None:
+            channel_ids = self._channel_config_provider.list_channel_ids()
+
+        for channel_id in channel_ids:
             config = self._channel_config_provider.get_channel_config(channel_id)
             if config is None:
                 continue
@@ -946,15 +1045,179 @@ class ProgramDirector:
                 blocks_filled,
             )
 
-            # Start background thread
-            daemon.start()
+            # Background evaluation via the shared coordinator pool
+            self._horizon_coordinator.register(f"playlog:{channel_id}", daemon)
+            self._horizon_coordinator.start()
             self._playlog_daemons[channel_id] = daemon
 
-        self._logger.info(
+        self._logger.debug(
             "PlaylogHorizonDaemons initialized: %d channels",
             len(self._playlog_daemons),
         )
 
+    # ------------------------------------------------------------------
+    # Startup: concurrent, priority-ordered channel warmup
+    # ------------------------------------------------------------------
+
+    def _is_channel_ready(self, channel_id: str) -> bool:
+        """True once this channel's warmup finished (or global startup completed).
+
+        A channel whose warmup failed stays not-ready after startup completes.
+        """
+        with self._startup_lock:
+            if channel_id in self._channel_ready:
+                return True
+            if channel_id in self._channel_failed:
+                return False
+        return self._startup_complete.is_set()
+
+    def _channel_startup_priority(self, channel_id: str) -> int:
+        config = self._channel_config_provider.get_channel_config(channel_id)
+        if config is None:
+            return 0
+        try:
+            return int((config.schedule_config or {}).get("startup_priority", 0))
+        except (TypeError, ValueError):
+            return 0
+
+    def _startup_order(self, channel_ids: list[str]) -> list[str]:
+        """Order channels for warmup.
+
+        Explicit ``startup_priority`` from channel config first (higher wins),
+        then most recently tuned, then config order.
+        """
+        position = {cid: i for i, cid in enumerate(channel_ids)}
+        return sorted(
+            channel_ids,
+            key=lambda cid: (
+                -self._channel_startup_priority(cid),
+                -self._tune_history.get(cid, 0.0),
+                position[cid],
+            ),
+        )
+
+    def _load_tune_history(self) -> None:
+        try:
+            data = json.loads(self._tune_history_path.read_text())
+            self._tune_history = {
+                str(k): float(v) for k, v in data.get("last_tune_unix", {}).items()
+            }
+        except FileNotFoundError:
+            self._tune_history = {}
+        except Exception as e:
+            self._logger.debug("Tune history unreadable (%s): %s", self._tune_history_path, e)
+            self._tune_history = {}
+
+    def _record_channel_tune(self, channel_id: str) -> None:
+        """Remember that a viewer tuned to this channel (startup priority hint)."""
+        self._tune_history[channel_id] = time.time()
+
+    def _save_tune_history(self) -> None:
+        if not self._tune_history:
+            return
+        try:
+            self._tune_history_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._tune_history_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"last_tune_unix": dict(self._tune_history)}))
+            os.replace(tmp, self._tune_history_path)
+        except OSError as e:
+            self._logger.debug("Could not persist tune history: %s", e)
+
+    def _warm_channel(self, channel_id: str) -> ChannelStartupTiming:
+        """Run every startup phase for one channel and mark it ready."""
+        timing = self._startup_timings[channel_id]
+        config = self._channel_config_provider.get_channel_config(channel_id)
+        try:
+            t = time.monotonic()
+            self._init_horizon_managers([channel_id])
+            timing.phases_ms["horizon"] = (time.monotonic() - t) * 1000.0
+
+            t = time.monotonic()
+            warmed = self._prewarm_channel_schedules([channel_id])
+            timing.phases_ms["prewarm"] = (time.monotonic() - t) * 1000.0
+            if config is not None and not warmed:
+                raise RuntimeError("schedule prewarm failed")
+
+            t = time.monotonic()
+            self._init_playlog_daemons([channel_id])
+            timing.phases_ms["playlog"] = (time.monotonic() - t) * 1000.0
+        except Exception as e:
+            timing.error = str(e)
+            with self._startup_lock:
+                self._channel_failed[channel_id] = str(e)
+            self._logger.error("Startup[%s]: warmup failed: %s", channel_id, e)
+            return timing
+
+        timing.ready = True
+        if self._startup_t0 is not None:
+            timing.ready_after_ms = (time.monotonic() - self._startup_t0) * 1000.0
+        with self._startup_lock:
+            self._channel_ready.add(channel_id)
+        self._logger.info(
+            "Startup[%s]: ready after %.0fms (%s)",
+            channel_id,
+            timing.ready_after_ms or 0.0,
+            " ".join(f"{k}={v:.0f}ms" for k, v in timing.phases_ms.items()),
+        )
+        return timing
+
+    def _warm_all_channels(self) -> None:
+        """Warm every configured channel on a bounded pool, highest priority first."""
+        if self._channel_config_provider is None:
+            return
+        if not hasattr(self._channel_config_provider, "list_channel_ids"):
+            return
+
+        self._load_tune_history()
+        order = self._startup_order(list(self._channel_config_provider.list_channel_ids()))
+        self._startup_t0 = time.monotonic()
+        for channel_id in order:
+            self._startup_timings[channel_id] = ChannelStartupTiming(
+                channel_id=channel_id,
+                priority=self._channel_startup_priority(channel_id),
+            )
+        self._logger.info(
+            "Startup: warming %d channels (workers=%d, order=%s)",
+            len(order), self._startup_workers, ",".join(order),
+        )
+
+        # ThreadPoolExecutor dequeues FIFO, so submission order is service order.
+        with ThreadPoolExecutor(
+            max_workers=self._startup_workers, thread_name_prefix="channel-warmup",
+        ) as pool:
+            for channel_id in order:
+                pool.submit(self._warm_channel, channel_id)
+
+        self._startup_total_ms = (time.monotonic() - self._startup_t0) * 1000.0
+        ready = sum(1 for t in self._startup_timings.values() if t.ready)
+        self._logger.info(
+            "Startup: %d/%d channels ready in %.0fms",
+            ready, len(order), self._startup_total_ms,
+        )
+
+    def get_startup_report(self) -> dict[str, Any]:
+        """Per-channel, per-phase cold-start timings and readiness."""
+        timings = sorted(
+            self._startup_timings.values(),
+            key=lambda t: (t.ready_after_ms is None, t.ready_after_ms or 0.0),
+        )
+        return {
+            "startup_complete": self._startup_complete.is_set(),
+            "total_ms": self._startup_total_ms,
+            "workers": self._startup_workers,
+            "channels": [
+                {
+                    "channel_id": t.channel_id,
+                    "priority": t.priority,
+                    "ready": t.ready,
+                    "ready_after_ms": t.ready_after_ms,
+                    "phases_ms": dict(t.phases_ms),
+                    "error": t.error,
+                }
+                for t in timings
+            ],
+        }
+
     def _get_or_create_manager(self, channel_id: str) -> Any:
         """Get or create ChannelManager for a channel (embedded mode). PD is sole authority for creation.
 
@@ -967,9 +1230,16 @@ class ProgramDirector:
         _prewarm_channel_schedules(). If the schedule is not ready (channel
         was not configured at startup), this raises ChannelManagerError (503).
         """
-        if not self._startup_complete.is_set():
+        if not self._is_channel_ready(channel_id):
             from retrovue.runtime.channel_manager import ChannelManagerError
-            raise ChannelManagerError("Server is starting up — schedule prewarm in progress")
+            failed = self._channel_failed.get(channel_id)
+            if failed is not None:
+                raise ChannelManagerError(
+                    f"Channel {channel_id} failed startup warmup: {failed}"
+                )
+            raise ChannelManagerError(
+                f"Channel {channel_id} is still warming up — schedule prewarm in progress"
+            )
 
         with self._managers_lock:
             if channel_id in self._managers:
@@ -1031,6 +1301,7 @@ class ProgramDirector:
                 return _cm_build(manager, mode)
             manager._build_producer_for_mode = factory_wrapper
             self._managers[channel_id] = manager
+            self._record_channel_tune(channel_id)
             self._logger.info(
                 "[channel %s] ChannelManager created (channel_id_int=%d)",
                 channel_id,
@@ -1276,8 +1547,10 @@ class ProgramDirector:
         INV-SCHEDULE-PREWARM-001 / INV-CHANNEL-STARTUP-NONBLOCKING-001:
         Evidence server, pace thread, and HTTP server launch first so the
         process is reachable immediately. Schedule loading, horizon init,
-        and prewarm run in a background daemon thread. Request handlers
-        return 503 until ``_startup_complete`` is set.
+        and prewarm run in a background daemon thread, warming channels
+        concurrently in priority order (see _warm_all_channels). Tune-ins
+        to a channel return 503 until that channel is ready; the full
+        per-channel timing report is served at /debug/startup.
         """
         # GC telemetry: log collection durations to correlate with UPSTREAM_LOOP spikes.
         # Gen 2 collections traverse the entire object graph under the GIL.
@@ -1347,9 +1620,8 @@ class ProgramDirector:
                     # 200-300ms with collected=0. We collect+freeze once at the end.
                     gc.disable()
                     self.load_all_schedules()
-                    self._init_horizon_managers()
-                    self._prewarm_channel_schedules()
-                    self._init_playlog_daemons()
+                    # Health checks start first: warmed channels accept
+                    # viewers while colder channels are still compiling.
                     if self._health_check_stop is not None:
                         self._health_check_stop.clear()
                         self._health_check_thread = Thread(
@@ -1358,6 +1630,7 @@ class ProgramDirector:
                             daemon=True,
                         )
                         self._health_check_thread.start()
+                    self._warm_all_channels()
                     # Freeze long-lived objects out of GC Gen 2 traversal.
                     # gc.freeze() moves them to a permanent generation the GC
                     # never re-traverses — Gen 2 drops to <1ms.
@@ -1389,6 +1662,9 @@ class ProgramDirector:
             )
             prewarm_thread.start()
             self._logger.info("Background schedule prewarm started")
+
+            if self._schedule_retention:
+                get_schedule_retention_job().start()
         else:
             # Non-embedded mode (tests with external provider): ready immediately
             self._startup_complete.set()
@@ -1464,18 +1740,20 @@ class ProgramDirector:
                     self._logger.warning("Error stopping evidence server: %s", e)
                 self._evidence_server = None
 
-            # Stop all HorizonManagers
-            for channel_id, hm in list(self._horizon_managers.items()):
-                try:
-                    hm.stop()
-                    self._logger.info(
-                        "[channel %s] HorizonManager stopped", channel_id,
-                    )
-                except Exception as e:
-                    self._logger.warning(
-                        "Error stopping HorizonManager for %s: %s", channel_id, e,
-                    )
+            self._save_tune_history()
+
+            # Stop the shared horizon pool (HorizonManagers + PlaylogHorizonDaemons)
+            try:
+                self._horizon_coordinator.stop()
+            except Exception as e:
+                self._logger.warning("Error stopping HorizonCoordinator: %s", e)
+            for key in self._horizon_coordinator.registered_keys():
+                self._horizon_coordinator.unregister(key)
             self._horizon_managers.clear()
+            self._playlog_daemons.clear()
+
+            if self._schedule_retention:
+                get_schedule_retention_job().stop()
         else:
             # Non-embedded mode: stop evidence server (managers are external).
             if self._evidence_server is not None:
@@ -1771,9 +2049,9 @@ class ProgramDirector:
             Phase 0 contract: Channel discovery endpoint.
 
             Returns list of available channels (from provider or embedded registry).
-            Returns 503 during startup while schedule prewarm is in progress.
+            Returns 503 during startup until at least one channel is warmed.
             """
-            if not self._startup_complete.is_set():
+            if not self._startup_complete.is_set() and not self._channel_ready:
                 return Response(
                     content="Server is starting up — schedule prewarm in progress",
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -2001,6 +2279,11 @@ class ProgramDirector:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
 
+        @self.fastapi_app.get("/debug/startup")
+        async def get_startup_report() -> Any:
+            """Per-channel, per-phase cold-start timing and readiness."""
+            return self.get_startup_report()
+
         @self.fastapi_app.get("/debug/horizon/{channel_id}")
         async def get_horizon_health(channel_id: str) -> Any:
             """Horizon health report for a channel.
@@ -2031,6 +2314,8 @@ class ProgramDirector:
                     "evaluation_interval_seconds": report.evaluation_interval_seconds,
                     "last_evaluation_utc_ms": report.last_evaluation_utc_ms,
                     "store_entry_count": report.store_entry_count,
+                    "coverage_compliant": report.coverage_compliant,
+                    "seam_violation_count": report.seam_violation_count,
                 }
             except Exception as e:
                 self._logger.exception("get_horizon_health failed for %s", channel_id)
@@ -2127,6 +2412,32 @@ class ProgramDirector:
             return {"status": "ok", "message": "Emergency override endpoint (no-op in Phase 0)"}
 
 
+        @self.fastapi_app.get("/iptv/channels.m3u")
+        def iptv_playlist(request: Request) -> Response:
+            """M3U lineup of all channels for IPTV clients, with the XMLTV guide URL."""
+            from retrovue.web.api.guide import playlist_response
+
+            return playlist_response(
+                request,
+                self._load_channels_list(),
+                lambda cid: f"/channel/{cid}.ts",
+                guide_path="/iptv/guide.xml",
+            )
+
+        @self.fastapi_app.get("/iptv/guide.xml")
+        def iptv_guide(request: Request, days: int = 7, channel: Optional[str] = None) -> Response:
+            """Streamed XMLTV guide from the compiled horizon (conditional GET).
+
+            INV-EPG-READS-CANONICAL-SCHEDULE-001: reads CompiledProgramLog only.
+            """
+            from retrovue.epg.guide import MAX_GUIDE_DAYS
+            from retrovue.web.api.guide import guide_response
+
+            channels = self._load_channels_list()
+            if channel:
+                channels = [c for c in channels if c["channel_id"] == channel]
+            return guide_response(request, channels, days=max(1, min(days, MAX_GUIDE_DAYS)))
+
         @self.fastapi_app.get("/api/epg")
         def get_epg_all(
             date: Optional[str] = None,
@@ -2444,26 +2755,11 @@ class ProgramDirector:
         @self.fastapi_app.get("/watch/{channel_id}", response_class=HTMLResponse)
         async def watch_channel(channel_id: str) -> HTMLResponse:
             """Serve the HLS web player page."""
-            import json as _json
-            html_path = Path("/opt/retrovue/pkg/core/templates/player/watch.html")
-            html = html_path.read_text()
-
-            channel_name = channel_id
-            channel_buttons = ""
             try:
                 channels = self._load_channels_list()
-                for ch in channels:
-                    if ch["channel_id"] == channel_id:
-                        channel_name = ch["name"]
-                    active = " active" if ch["channel_id"] == channel_id else ""
-                    channel_buttons += '<a href="/watch/' + ch["channel_id"] + '" class="' + active.strip() + '">' + ch["name"] + '</a>\n'
             except Exception:
-                channel_buttons = '<a href="/watch/' + channel_id + '" class="active">' + channel_id + '</a>'
-
-            html = html.replace("{{CHANNEL_ID}}", channel_id)
-            html = html.replace("{{CHANNEL_NAME}}", channel_name)
-            html = html.replace("{{CHANNEL_BUTTONS}}", channel_buttons)
-            return HTMLResponse(content=html)
+                channels = None
+            return HTMLResponse(content=render_watch_page(channel_id, channels))
 
         @self.fastapi_app.get("/epg", response_class=HTMLResponse)
         def epg_guide_html() -> HTMLResponse:
@@ -6,9 +6,15 @@ channel configurations from various sources.
 """
 
 from .file_config_provider import FileChannelConfigProvider
-from .yaml_channel_config_provider import YamlChannelConfigProvider
+from .yaml_channel_config_provider import (
+    ChannelConfigSnapshot,
+    YamlChannelConfigProvider,
+    shared_provider,
+)
 
 __all__ = [
+    "ChannelConfigSnapshot",
     "FileChannelConfigProvider",
     "YamlChannelConfigProvider",
+    "shared_provider",
 ]
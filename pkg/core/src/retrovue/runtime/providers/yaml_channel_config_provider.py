@@ -3,13 +3,26 @@ YAML-based auto-discovery channel configuration provider.
 
 Scans a directory for *.yaml files (skipping _ prefixed partials)
 and builds ChannelConfig objects from each file.
+
+The provider publishes an immutable ChannelConfigSnapshot (channel configs
+plus merged traffic policies) with a monotonically increasing version.
+Parsed files — including every !include target — are memoized by
+(mtime_ns, size), and the snapshot is rebuilt only when a stat of the
+channel files or their includes shows a change.  shared_provider() gives
+every consumer in the process the same provider per config directory.
 """
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -24,8 +37,91 @@ class _IncludeLoader(yaml.SafeLoader):
     pass
 
 
-def _make_include_constructor(base_dir: Path):
-    """Create an !include constructor that resolves relative to base_dir."""
+# Default traffic policy when neither _defaults.yaml nor the channel
+# YAML provide a `traffic` section.
+DEFAULT_TRAFFIC_POLICY: dict[str, Any] = {
+    "allowed_types": ["commercial", "promo", "station_id", "psa",
+                       "stinger", "bumper", "filler"],
+    "default_cooldown_seconds": 3600,
+    "type_cooldowns": {},
+    "max_plays_per_day": 0,
+}
+
+# How often (seconds) snapshot() re-stats config files for changes.
+RELOAD_CHECK_INTERVAL_S = 2.0
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _ParsedYamlCache:
+    """Memoizes parsed YAML by path, invalidated by (mtime_ns, size).
+
+    Top-level entries remember the stat keys of every file they !include,
+    so an edit to a shared partial invalidates each file that includes it.
+    Cached objects are shared — callers must treat them as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._plain: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self._with_includes: dict[
+            Path, tuple[tuple[tuple[Path, tuple[int, int] | None], ...], Any]
+        ] = {}
+
+    def load_plain(self, path: Path) -> Any:
+        key = _stat_key(path)
+        with self._lock:
+            hit = self._plain.get(path)
+            if hit is not None and hit[0] == key:
+                return hit[1]
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        with self._lock:
+            self._plain[path] = (key, data)
+        return data
+
+    def load_with_includes(self, path: Path) -> tuple[Any, tuple[Path, ...]]:
+        """Return (data, dependency paths) for *path* and its includes."""
+        with self._lock:
+            hit = self._with_includes.get(path)
+        if hit is not None and all(_stat_key(p) == k for p, k in hit[0]):
+            return hit[1], tuple(p for p, _ in hit[0])
+
+        deps: list[Path] = []
+        key = _stat_key(path)
+        loader_cls = type("IncludeLoader", (yaml.SafeLoader,), {})
+        loader_cls.add_constructor(
+            "!include", _make_include_constructor(path.parent, deps=deps, cache=self),
+        )
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader_cls) or {}
+
+        stamped = ((path, key),) + tuple((p, _stat_key(p)) for p in deps)
+        with self._lock:
+            self._with_includes[path] = (stamped, data)
+        return data, tuple(p for p, _ in stamped)
+
+
+_PARSED_YAML = _ParsedYamlCache()
+
+
+def _make_include_constructor(
+    base_dir: Path,
+    *,
+    deps: list[Path] | None = None,
+    cache: _ParsedYamlCache | None = None,
+):
+    """Create an !include constructor that resolves relative to base_dir.
+
+    When *deps* is given, every resolved include path is appended to it.
+    When *cache* is given, included files are parsed through it.
+    """
 
     def _include(loader: yaml.Loader, node: yaml.Node) -> Any:
         value = loader.construct_scalar(node)
@@ -39,12 +135,17 @@ def _make_include_constructor(base_dir: Path):
             key_path = None
 
         file_path = base_dir / file_part
+        if deps is not None:
+            deps.append(file_path)
         if not file_path.exists():
             _logger.warning("Include file not found: %s", file_path)
             return None
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        if cache is not None:
+            data = cache.load_plain(file_path)
+        else:
+            with open(file_path, encoding="utf-8") as f:
+                data = yaml.safe_load(f)
 
         if key_path:
             for key in key_path.split("."):
@@ -60,15 +161,12 @@ def _make_include_constructor(base_dir: Path):
 
 
 def _load_yaml_with_includes(file_path: Path) -> dict[str, Any]:
-    """Load a YAML file with !include tag support."""
-    base_dir = file_path.parent
-
-    # Create a fresh loader class each time to avoid cross-contamination
-    loader_cls = type("IncludeLoader", (yaml.SafeLoader,), {})
-    loader_cls.add_constructor("!include", _make_include_constructor(base_dir))
+    """Load a YAML file with !include tag support.
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.load(f, Loader=loader_cls) or {}
+    Parses are memoized; the caller gets a private deep copy.
+    """
+    data, _ = _PARSED_YAML.load_with_includes(Path(file_path))
+    return copy.deepcopy(data)
 
 
 def _titleize(slug: str) -> str:
@@ -76,53 +174,145 @@ def _titleize(slug: str) -> str:
     return slug.replace("-", " ").replace("_", " ").title()
 
 
+@dataclass(frozen=True)
+class ChannelConfigSnapshot:
+    """Immutable view of every channel config and traffic policy.
+
+    ``version`` increases by one on every rebuild, so consumers can cache
+    derived data and cheaply detect that the config changed.
+    """
+    version: int
+    configs: Mapping[str, ChannelConfig]
+    traffic_policies: Mapping[str, Mapping[str, Any]]
+    default_traffic_policy: Mapping[str, Any]
+
+    def traffic_policy(self, channel_slug: str | None) -> dict[str, Any]:
+        """Merged traffic policy (defaults + channel overlay) for a channel.
+
+        Keyed by channel file stem.  Returns a fresh deep copy, so callers
+        may mutate nested sections (e.g. ``type_cooldowns``) freely.
+        """
+        policy = self.default_traffic_policy
+        if channel_slug is not None:
+            policy = self.traffic_policies.get(channel_slug, policy)
+        return copy.deepcopy(dict(policy))
+
+
 class YamlChannelConfigProvider:
     """
     ChannelConfigProvider that auto-discovers channel configs from YAML files.
 
     Scans a directory for *.yaml files (skipping _ prefixed partials),
     parses each and builds ChannelConfig objects.
+
+    Reads go through snapshot(), which re-stats the config files at most
+    every ``reload_check_interval_s`` seconds and rebuilds the snapshot
+    when any channel file, _defaults.yaml or !include target changed.
     """
 
-    def __init__(self, config_dir: Path | str):
+    def __init__(
+        self,
+        config_dir: Path | str,
+        *,
+        reload_check_interval_s: float = RELOAD_CHECK_INTERVAL_S,
+    ):
         self._config_dir = Path(config_dir)
-        self._configs: dict[str, ChannelConfig] = {}
-        self._loaded = False
-
-    def _ensure_loaded(self) -> None:
-        if self._loaded:
-            return
-        self._load()
-
-    def _load(self) -> None:
-        self._configs.clear()
-
+        self._reload_check_interval_s = reload_check_interval_s
+        self._lock = threading.Lock()
+        self._snapshot: ChannelConfigSnapshot | None = None
+        self._version = 0
+        # Stat keys of every file the current snapshot was built from
+        self._signature: dict[Path, tuple[int, int] | None] = {}
+        self._dir_key: tuple[int, int] | None = None
+        self._last_check = 0.0
+
+    # -- snapshot management -------------------------------------------------
+
+    def snapshot(self) -> ChannelConfigSnapshot:
+        """Return the current snapshot, rebuilding it if config files changed."""
+        snap = self._snapshot
+        now = time.monotonic()
+        if snap is not None and now - self._last_check < self._reload_check_interval_s:
+            return snap
+        with self._lock:
+            if self._snapshot is None or self._changed_on_disk():
+                self._rebuild()
+            self._last_check = time.monotonic()
+            return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self.snapshot().version
+
+    def _changed_on_disk(self) -> bool:
+        if _stat_key(self._config_dir) != self._dir_key:
+            return True  # file added/removed/renamed
+        return any(_stat_key(p) != k for p, k in self._signature.items())
+
+    def _rebuild(self) -> None:
+        """Parse the directory into a new snapshot.  Caller holds _lock."""
+        configs: dict[str, ChannelConfig] = {}
+        policies: dict[str, Mapping[str, Any]] = {}
+        deps: set[Path] = set()
+        default_policy = dict(DEFAULT_TRAFFIC_POLICY)
+
+        self._dir_key = _stat_key(self._config_dir)
         if not self._config_dir.is_dir():
             _logger.warning("Channel config directory not found: %s", self._config_dir)
-            self._loaded = True
-            return
-
-        yaml_files = sorted(self._config_dir.glob("*.yaml"))
-        for yaml_file in yaml_files:
-            if yaml_file.name.startswith("_"):
-                continue
-            try:
-                self._load_channel_file(yaml_file)
-            except Exception as e:
-                _logger.warning(
-                    "Skipping invalid channel config %s: %s", yaml_file.name, e
-                )
-
+        else:
+            defaults_path = self._config_dir / "_defaults.yaml"
+            if defaults_path.exists():
+                try:
+                    defaults, file_deps = _PARSED_YAML.load_with_includes(defaults_path)
+                    deps.update(file_deps)
+                    if isinstance(defaults, dict) and "traffic" in defaults:
+                        default_policy.update(defaults["traffic"])
+                except Exception as e:
+                    _logger.warning("Skipping invalid %s: %s", defaults_path.name, e)
+
+            for yaml_file in sorted(self._config_dir.glob("*.yaml")):
+                if yaml_file.name.startswith("_"):
+                    continue
+                deps.add(yaml_file)
+                try:
+                    data, file_deps = _PARSED_YAML.load_with_includes(yaml_file)
+                    deps.update(file_deps)
+                except Exception as e:
+                    _logger.warning(
+                        "Skipping invalid channel config %s: %s", yaml_file.name, e
+                    )
+                    continue
+
+                policy = dict(default_policy)
+                if isinstance(data, dict) and "traffic" in data:
+                    policy.update(data["traffic"])
+                policies[yaml_file.stem] = MappingProxyType(policy)
+
+                try:
+                    config = self._build_channel_config(yaml_file, data)
+                except Exception as e:
+                    _logger.warning(
+                        "Skipping invalid channel config %s: %s", yaml_file.name, e
+                    )
+                    continue
+                configs[config.channel_id] = config
+
+        self._signature = {p: _stat_key(p) for p in deps}
+        self._version += 1
+        self._snapshot = ChannelConfigSnapshot(
+            version=self._version,
+            configs=MappingProxyType(configs),
+            traffic_policies=MappingProxyType(policies),
+            default_traffic_policy=MappingProxyType(default_policy),
+        )
         _logger.info(
-            "Loaded %d channel configs from %s",
-            len(self._configs),
+            "Loaded %d channel configs from %s (config version %d)",
+            len(configs),
             self._config_dir,
+            self._version,
         )
-        self._loaded = True
-
-    def _load_channel_file(self, yaml_file: Path) -> None:
-        data = _load_yaml_with_includes(yaml_file)
 
+    def _build_channel_config(self, yaml_file: Path, data: dict[str, Any]) -> ChannelConfig:
         channel_id = data.get("channel")
         if not channel_id:
             raise ValueError(f"Missing 'channel' field in {yaml_file.name}")
@@ -160,6 +350,17 @@ class YamlChannelConfigProvider:
         channel_tz = data.get("timezone", "UTC")
         channel_type = data.get("channel_type", "network")
 
+        startup_priority = data.get("startup_priority", 0)
+        try:
+            startup_priority = int(startup_priority)
+        except (TypeError, ValueError):
+            _logger.warning(
+                "Ignoring invalid startup_priority %r in %s; using 0",
+                startup_priority,
+                yaml_file.name,
+            )
+            startup_priority = 0
+
         schedule_config = {
             "dsl_path": str(yaml_file),
             "filler_path": filler_path,
@@ -167,6 +368,8 @@ class YamlChannelConfigProvider:
             "grid_minutes": grid_minutes,
             "channel_tz": channel_tz,
             "channel_type": channel_type,
+            # Warmup order at ProgramDirector startup (higher warms first)
+            "startup_priority": startup_priority,
         }
 
         config = ChannelConfig(
@@ -177,33 +380,36 @@ class YamlChannelConfigProvider:
             schedule_source="dsl",
             schedule_config=schedule_config,
         )
-
-        self._configs[channel_id] = config
         _logger.debug(
             "Loaded channel config: %s (int_id=%d) from %s",
             config.channel_id,
             config.channel_id_int,
             yaml_file.name,
         )
+        return config
+
+    # -- ChannelConfigProvider -------------------------------------------------
 
     def reload(self) -> None:
         """Force reload of configs from directory."""
-        self._loaded = False
-        self._load()
+        with self._lock:
+            self._rebuild()
+            self._last_check = time.monotonic()
 
     def get_channel_config(self, channel_id: str) -> ChannelConfig | None:
-        self._ensure_loaded()
-        return self._configs.get(channel_id)
+        return self.snapshot().configs.get(channel_id)
 
     def list_channel_ids(self) -> list[str]:
-        self._ensure_loaded()
-        return list(self._configs.keys())
+        return list(self.snapshot().configs.keys())
+
+    def get_traffic_policy(self, channel_slug: str | None) -> dict[str, Any]:
+        """Merged traffic policy for a channel (defaults when no channel file)."""
+        return self.snapshot().traffic_policy(channel_slug)
 
     def to_channels_list(self) -> list[dict[str, Any]]:
         """Return channel configs as list of dicts (compatible with channels.json format)."""
-        self._ensure_loaded()
         result = []
-        for config in self._configs.values():
+        for config in self.snapshot().configs.values():
             result.append({
                 "channel_id": config.channel_id,
                 "channel_id_int": config.channel_id_int,
@@ -225,6 +431,23 @@ class YamlChannelConfigProvider:
         return result
 
 
+_SHARED_PROVIDERS: dict[Path, YamlChannelConfigProvider] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_provider(config_dir: Path | str) -> YamlChannelConfigProvider:
+    """Process-wide provider for *config_dir* (created on first use)."""
+    key = Path(config_dir)
+    with _SHARED_LOCK:
+        provider = _SHARED_PROVIDERS.get(key)
+        if provider is None:
+            provider = YamlChannelConfigProvider(key)
+            _SHARED_PROVIDERS[key] = provider
+        return provider
+
+
 __all__ = [
+    "ChannelConfigSnapshot",
     "YamlChannelConfigProvider",
+    "shared_provider",
 ]
@@ -0,0 +1,215 @@
+"""
+Process-wide retention job for the Tier 1 and Tier 2 schedule logs.
+
+Each DslScheduleService and PlaylogHorizonDaemon used to purge its own
+channel's expired rows once an hour with a single unbounded DELETE. On a
+multi-channel install that meant one large delete per channel per hour,
+each competing for locks with horizon writes.
+
+ScheduleRetentionJob runs once per process (ProgramDirector starts it; with
+sharded workers only shard 0 does) and deletes expired rows for all channels
+in bounded batches. Each batch is its own short transaction that selects the
+doomed keys through an index (ix_compiled_program_log_broadcast_day,
+ix_transmission_log_end_utc_ms), skipping rows locked by concurrent writers.
+
+INV-SCHEDULE-RETENTION-001: Tier 1 (CompiledProgramLog) retains only rows
+where broadcast_day >= today - 1; Tier 2 (TransmissionLog) retains only
+rows where end_utc_ms > now - 4 hours.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import select
+
+from retrovue.runtime import metrics
+from retrovue.runtime.schedule_row_cache import get_compiled_log_cache, get_transmission_log_cache
+
+logger = logging.getLogger(__name__)
+
+TIER1_RETAIN_DAYS = 1
+TIER2_RETAIN_MS = 4 * 3_600_000
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_INTERVAL_S = 3600.0
+# Yield between batches so horizon writers are never starved of row locks
+DEFAULT_BATCH_PAUSE_S = 0.05
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    """Outcome of one purge pass."""
+
+    tier1_rows: int
+    tier2_rows: int
+    batches: int
+    elapsed_s: float
+
+    @property
+    def rows(self) -> int:
+        return self.tier1_rows + self.tier2_rows
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class ScheduleRetentionJob:
+    """Deletes expired Tier 1 / Tier 2 rows in bounded batches on a timer."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        batch_pause_s: float = DEFAULT_BATCH_PAUSE_S,
+        session_factory: Callable[[], Any] | None = None,
+        now_utc_ms: Callable[[], int] | None = None,
+        today: Callable[[], date] = date.today,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self._batch_size = batch_size
+        self._interval_s = interval_s
+        self._batch_pause_s = batch_pause_s
+        self._session_factory = session_factory
+        self._now_utc_ms = now_utc_ms or (
+            lambda: int(datetime.now(timezone.utc).timestamp() * 1000)
+        )
+        self._today = today
+        self._sleep = sleep
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.last_report: RetentionReport | None = None
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from retrovue.infra.uow import session
+        return session()
+
+    def purge_once(self, now_utc_ms: int | None = None) -> RetentionReport:
+        """Run one full purge pass over both tiers and return what it deleted."""
+        from retrovue.domain.entities import CompiledProgramLog, TransmissionLog
+
+        if now_utc_ms is None:
+            now_utc_ms = self._now_utc_ms()
+        tier1_cutoff = self._today() - timedelta(days=TIER1_RETAIN_DAYS)
+        tier2_cutoff_ms = now_utc_ms - TIER2_RETAIN_MS
+
+        t0 = time.monotonic()
+        tier1_rows, tier1_batches = self._purge_batched(
+            CompiledProgramLog.id, CompiledProgramLog.broadcast_day < tier1_cutoff,
+        )
+        get_compiled_log_cache().invalidate_where(lambda key, _: key[1] < tier1_cutoff)
+        tier2_rows, tier2_batches = self._purge_batched(
+            TransmissionLog.block_id, TransmissionLog.end_utc_ms <= tier2_cutoff_ms,
+        )
+        get_transmission_log_cache().invalidate_where(
+            lambda _, block: block.end_utc_ms <= tier2_cutoff_ms,
+        )
+        report = RetentionReport(
+            tier1_rows=tier1_rows,
+            tier2_rows=tier2_rows,
+            batches=tier1_batches + tier2_batches,
+            elapsed_s=time.monotonic() - t0,
+        )
+        self.last_report = report
+
+        if metrics.schedule_retention_rows_purged_total is not None:
+            metrics.schedule_retention_rows_purged_total.labels(tier="1").inc(tier1_rows)
+            metrics.schedule_retention_rows_purged_total.labels(tier="2").inc(tier2_rows)
+            metrics.schedule_retention_rows_per_second.set(report.rows_per_sec)
+        log_fn = logger.info if report.rows else logger.debug
+        log_fn(
+            "INV-SCHEDULE-RETENTION-001: Purged %d Tier 1 rows (broadcast_day < %s) "
+            "and %d Tier 2 rows (end_utc_ms <= %d) in %d batches, %.2fs (%.0f rows/s)",
+            tier1_rows, tier1_cutoff.isoformat(), tier2_rows, tier2_cutoff_ms,
+            report.batches, report.elapsed_s, report.rows_per_sec,
+        )
+        return report
+
+    def _purge_batched(self, key_column: Any, expired: Any) -> tuple[int, int]:
+        """Delete rows matching *expired*, at most batch_size per transaction.
+
+        Returns (rows deleted, batches run). Stops early when stopped.
+        """
+        model = key_column.class_
+        doomed = (
+            select(key_column)
+            .where(expired)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        total = 0
+        batches = 0
+        while True:
+            with self._session() as db:
+                count = db.query(model).filter(key_column.in_(doomed)).delete(
+                    synchronize_session=False,
+                )
+            batches += 1
+            total += count
+            if count < self._batch_size or self._stop.is_set():
+                return total, batches
+            self._sleep(self._batch_pause_s)
+
+    # ── Background loop ──────────────────────────────────────────────
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="schedule-retention", daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        # First pass immediately: a restarted process may have missed several
+        while not self._stop.is_set():
+            try:
+                self.purge_once()
+            except Exception as e:
+                logger.warning("INV-SCHEDULE-RETENTION-001: retention pass failed: %s", e)
+            self._stop.wait(self._interval_s)
+
+
+_job: ScheduleRetentionJob | None = None
+_job_lock = threading.Lock()
+
+
+def get_schedule_retention_job() -> ScheduleRetentionJob:
+    """Process-wide retention job; batch size from RETROVUE_RETENTION_BATCH_SIZE."""
+    global _job
+    with _job_lock:
+        if _job is None:
+            batch_size = DEFAULT_BATCH_SIZE
+            val = os.environ.get("RETROVUE_RETENTION_BATCH_SIZE")
+            if val:
+                try:
+                    batch_size = max(1, int(val))
+                except ValueError:
+                    logger.warning("Ignoring invalid RETROVUE_RETENTION_BATCH_SIZE=%r", val)
+            _job = ScheduleRetentionJob(batch_size=batch_size)
+        return _job
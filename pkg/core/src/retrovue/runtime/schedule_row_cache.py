@@ -0,0 +1,149 @@
+"""
+Read-through caches for locked schedule rows.
+
+Tier 1 (CompiledProgramLog, one row per channel and broadcast day) and
+Tier 2 (TransmissionLog, one row per block_id) rows do not change once
+written and locked, yet playout and the guide re-read them constantly, and
+each read pays for a round trip plus hydrating a JSONB column. These
+bounded, per-process LRU caches hold the hydrated form keyed by the row
+identity, so steady-state reads only reach Postgres for rows not seen yet.
+
+INV-SCHEDULE-ROW-CACHE-001: Entries are invalidated by the code that
+writes or deletes the rows: DslScheduleService (Tier 1 save/purge, Tier 2
+synchronous compile) and PlaylogHorizonDaemon (Tier 2 write/purge).
+Tier 1 rows can also be rewritten by another process, so Tier 1 readers
+(read_compiled_day, the EPG) check the cached row identity (schedule_hash,
+created_at, compiler_version) against a cheap identity query before using
+an entry.
+
+Sizes come from RETROVUE_TXLOG_CACHE_ENTRIES and
+RETROVUE_COMPILED_LOG_CACHE_ENTRIES; 0 disables a cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from retrovue.runtime.schedule_types import ScheduledBlock
+from retrovue.shared.lru_cache import LruCache  # re-exported for existing imports
+
+logger = logging.getLogger(__name__)
+
+# ~30-minute blocks: 4096 covers two days of a 40-channel lineup
+DEFAULT_TXLOG_CACHE_ENTRIES = 4096
+# Compiled days carry segmented_blocks and can be large; keep a few per channel
+DEFAULT_COMPILED_LOG_CACHE_ENTRIES = 128
+
+
+@dataclass(frozen=True)
+class CompiledDay:
+    """Hydrated locked CompiledProgramLog row.
+
+    ``compiled_json`` is shared by every reader and must not be mutated;
+    code that rewrites a day saves it and invalidates the entry.
+    ``segmented_packed`` is the row's segment_codec payload, if any.
+    """
+
+    schedule_hash: str
+    created_at: datetime | None
+    compiled_json: dict[str, Any]
+    segmented_packed: bytes | None = None
+
+    @property
+    def compiler_version(self) -> str | None:
+        return self.compiled_json.get("source", {}).get("compiler_version")
+
+    def matches(
+        self, schedule_hash: str, created_at: datetime | None, compiler_version: str | None,
+    ) -> bool:
+        return (
+            self.schedule_hash == schedule_hash
+            and self.created_at == created_at
+            and self.compiler_version == compiler_version
+        )
+
+
+def read_compiled_day(db: Any, channel_id: str, broadcast_day: date) -> CompiledDay | None:
+    """Locked Tier 1 row for the day, read through the compiled-log cache.
+
+    A cached entry is used only if it still matches the row identity; the
+    row itself (compiled_json, segmented_packed) is loaded on a miss or
+    mismatch.  Rows with the current compiler version and segmented_blocks
+    are cached.  Returns None when no locked row exists.
+    """
+    from retrovue.domain.entities import CompiledProgramLog
+    from retrovue.runtime.schedule_compiler import COMPILER_VERSION
+
+    cache = get_compiled_log_cache()
+    key = (channel_id, broadcast_day)
+    filters = (
+        CompiledProgramLog.channel_id == channel_id,
+        CompiledProgramLog.broadcast_day == broadcast_day,
+        CompiledProgramLog.locked == True,  # noqa: E712
+    )
+    entry = cache.get(key)
+    if entry is not None:
+        identity = db.query(
+            CompiledProgramLog.schedule_hash,
+            CompiledProgramLog.created_at,
+            CompiledProgramLog.compiled_json["source"]["compiler_version"].astext,
+        ).filter(*filters).first()
+        if identity is None:
+            cache.invalidate(key)
+            return None
+        if entry.matches(*identity):
+            return entry
+        cache.invalidate(key)
+
+    row = db.query(CompiledProgramLog).filter(*filters).first()
+    if row is None:
+        return None
+    entry = CompiledDay(row.schedule_hash, row.created_at, row.compiled_json, row.segmented_packed)
+    # Only rows with segmented_blocks are shared; older rows go through
+    # DslScheduleService._hydrate_schedule's slow path, which mutates the
+    # dict before backfilling it.
+    if entry.compiler_version == COMPILER_VERSION and entry.compiled_json.get("segmented_blocks"):
+        cache.put(key, entry)
+    return entry
+
+
+def _entries_from_env(name: str, default: int) -> int:
+    val = os.environ.get(name)
+    if val is not None:
+        try:
+            return max(0, int(val))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", name, val)
+    return default
+
+
+_lock = threading.Lock()
+_txlog_cache: LruCache[str, ScheduledBlock] | None = None
+_compiled_cache: LruCache[tuple[str, date], CompiledDay] | None = None
+
+
+def get_transmission_log_cache() -> LruCache[str, ScheduledBlock]:
+    """Process-wide Tier 2 cache: block_id -> filled ScheduledBlock."""
+    global _txlog_cache
+    with _lock:
+        if _txlog_cache is None:
+            _txlog_cache = LruCache(
+                _entries_from_env("RETROVUE_TXLOG_CACHE_ENTRIES", DEFAULT_TXLOG_CACHE_ENTRIES)
+            )
+        return _txlog_cache
+
+
+def get_compiled_log_cache() -> LruCache[tuple[str, date], CompiledDay]:
+    """Process-wide Tier 1 cache: (channel_id, broadcast_day) -> CompiledDay."""
+    global _compiled_cache
+    with _lock:
+        if _compiled_cache is None:
+            _compiled_cache = LruCache(
+                _entries_from_env("RETROVUE_COMPILED_LOG_CACHE_ENTRIES", DEFAULT_COMPILED_LOG_CACHE_ENTRIES)
+            )
+        return _compiled_cache
@@ -0,0 +1,188 @@
+"""
+Segment Codec — compact binary encoding of ScheduledBlock segment lists.
+
+CompiledProgramLog.compiled_json["segmented_blocks"] and
+TransmissionLog.segments store every segment as a JSONB dict, so each
+read parses and re-walks the same keys, repeats the same asset URIs
+across every block of a day, and builds ScheduledSegments field by field
+with dict lookups.  The packed columns next to them
+(compiled_program_log.segmented_packed, transmission_log.segments_packed)
+hold the same blocks in this format instead.
+
+Payload layout (all integers big-endian)::
+
+    magic      4 bytes   b"RVSG"
+    version    uint16    SEGMENT_CODEC_VERSION
+    strings    uint32    count of interned strings
+    blocks     uint32    count of blocks
+    string table         per string: uint16 length + UTF-8 bytes
+    blocks               per block: _BLOCK record, then that many
+                         _SEGMENT records
+
+Every string (block ids, segment types, asset URIs, transitions) is
+interned once per payload, so a broadcast day's worth of blocks carries
+each asset URI a single time.  Segment records are fixed width and are
+decoded with struct.iter_unpack straight into the frozen dataclasses;
+identical segments share one object, as in horizon_snapshot.
+
+The JSONB columns remain the inspectable copy for tooling, evidence and
+as-run enrichment; payload_to_json() renders a payload in the same shape
+for debugging.
+
+INV-SEGMENT-CODEC-001: decode_blocks(encode_blocks(blocks)) == blocks for
+any ScheduledBlock sequence.  A payload with a foreign magic, an unknown
+version or a malformed body raises SegmentCodecError; readers fall back
+to the JSONB column.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from collections.abc import Iterable
+from dataclasses import asdict
+from typing import Any
+
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_CODEC_MAGIC = b"RVSG"
+SEGMENT_CODEC_VERSION = 1
+
+_HEADER = struct.Struct(">4sHII")
+_STRING_LEN = struct.Struct(">H")
+# block_id, start_utc_ms, end_utc_ms, segment count
+_BLOCK = struct.Struct(">IqqI")
+# segment_type, asset_uri, asset_start_offset_ms, segment_duration_ms,
+# transition_in, transition_in_duration_ms, transition_out,
+# transition_out_duration_ms, gain_db
+_SEGMENT = struct.Struct(">IIqqIiIid")
+
+
+class SegmentCodecError(ValueError):
+    """A packed segment payload could not be decoded."""
+
+
+def encode_blocks(blocks: Iterable[ScheduledBlock]) -> bytes:
+    """Encode blocks into a single payload with one shared string table."""
+    strings: list[bytes] = []
+    index: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        i = index.get(s)
+        if i is None:
+            i = len(strings)
+            index[s] = i
+            encoded = s.encode("utf-8")
+            if len(encoded) > 0xFFFF:
+                raise SegmentCodecError(f"string too long to encode ({len(encoded)} bytes)")
+            strings.append(encoded)
+        return i
+
+    body = bytearray()
+    block_count = 0
+    try:
+        for b in blocks:
+            body += _BLOCK.pack(intern(b.block_id), b.start_utc_ms, b.end_utc_ms, len(b.segments))
+            for s in b.segments:
+                body += _SEGMENT.pack(
+                    intern(s.segment_type),
+                    intern(s.asset_uri),
+                    s.asset_start_offset_ms,
+                    s.segment_duration_ms,
+                    intern(s.transition_in),
+                    s.transition_in_duration_ms,
+                    intern(s.transition_out),
+                    s.transition_out_duration_ms,
+                    s.gain_db,
+                )
+            block_count += 1
+    except (struct.error, AttributeError) as e:
+        raise SegmentCodecError(f"cannot encode block: {e}") from e
+
+    out = bytearray(_HEADER.pack(
+        SEGMENT_CODEC_MAGIC, SEGMENT_CODEC_VERSION, len(strings), block_count,
+    ))
+    for encoded in strings:
+        out += _STRING_LEN.pack(len(encoded))
+        out += encoded
+    out += body
+    return bytes(out)
+
+
+def pack_blocks(blocks: Iterable[ScheduledBlock]) -> bytes | None:
+    """encode_blocks() for writers: None (JSONB only) if the blocks cannot be packed."""
+    try:
+        return encode_blocks(blocks)
+    except SegmentCodecError as e:
+        logger.warning("Storing segments as JSON only: %s", e)
+        return None
+
+
+def decode_blocks(data: bytes) -> list[ScheduledBlock]:
+    """Decode a payload produced by encode_blocks()."""
+    view = memoryview(data)
+    try:
+        magic, version, string_count, block_count = _HEADER.unpack_from(view)
+        if magic != SEGMENT_CODEC_MAGIC:
+            raise SegmentCodecError("not a segment payload")
+        if version != SEGMENT_CODEC_VERSION:
+            raise SegmentCodecError(f"segment payload version {version} != {SEGMENT_CODEC_VERSION}")
+
+        offset = _HEADER.size
+        strings: list[str] = []
+        for _ in range(string_count):
+            (length,) = _STRING_LEN.unpack_from(view, offset)
+            offset += _STRING_LEN.size
+            if offset + length > len(view):
+                raise SegmentCodecError("segment payload truncated")
+            strings.append(str(view[offset:offset + length], "utf-8"))
+            offset += length
+
+        # Segments are frozen; identical segments across blocks share one object.
+        seg_cache: dict[tuple, ScheduledSegment] = {}
+        blocks: list[ScheduledBlock] = []
+        for _ in range(block_count):
+            block_id, start_ms, end_ms, seg_count = _BLOCK.unpack_from(view, offset)
+            offset += _BLOCK.size
+            end = offset + seg_count * _SEGMENT.size
+            if end > len(view):
+                raise SegmentCodecError("segment payload truncated")
+            segments = []
+            for rec in _SEGMENT.iter_unpack(view[offset:end]):
+                seg = seg_cache.get(rec)
+                if seg is None:
+                    seg = ScheduledSegment(
+                        strings[rec[0]], strings[rec[1]], rec[2], rec[3],
+                        strings[rec[4]], rec[5], strings[rec[6]], rec[7], rec[8],
+                    )
+                    seg_cache[rec] = seg
+                segments.append(seg)
+            offset = end
+            blocks.append(ScheduledBlock(strings[block_id], start_ms, end_ms, tuple(segments)))
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise SegmentCodecError(f"malformed segment payload: {e}") from e
+
+    if offset != len(view):
+        raise SegmentCodecError(f"{len(view) - offset} trailing bytes in segment payload")
+    return blocks
+
+
+def payload_to_json(data: bytes) -> dict[str, Any]:
+    """Render a payload as JSON-safe data for inspection and tooling."""
+    blocks = decode_blocks(data)
+    return {
+        "format": SEGMENT_CODEC_MAGIC.decode("ascii"),
+        "version": SEGMENT_CODEC_VERSION,
+        "size_bytes": len(data),
+        "blocks": [
+            {
+                "block_id": b.block_id,
+                "start_utc_ms": b.start_utc_ms,
+                "end_utc_ms": b.end_utc_ms,
+                "segments": [asdict(s) for s in b.segments],
+            }
+            for b in blocks
+        ],
+    }
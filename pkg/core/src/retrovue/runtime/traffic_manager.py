@@ -9,10 +9,17 @@ Falls back to the static filler file when no interstitials are available.
 
 Leftover time within each ad break is distributed evenly as black pad
 between spots (INV-BREAK-PAD-DISTRIBUTED-001).
+
+Candidates are judged against cooldowns and daily caps at the break's
+scheduled air time. Placed spots are logged to the library at their air
+time once their break is laid out, so later breaks see them; the plays
+are flushed into the library's session in one batch per block and reach
+other fills once it commits (INV-TRAFFIC-PLAY-HISTORY-001).
 """
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
@@ -37,6 +44,9 @@ def fill_ad_blocks(
     If asset_library is None or returns no candidates, falls back to
     the static filler file (v1 behavior).
 
+    Spots placed from the library are logged as plays and flushed into
+    the library's session before returning; the caller commits it.
+
     Args:
         block: ScheduledBlock with empty filler placeholders.
         filler_uri: Path to the fallback filler video file.
@@ -50,14 +60,22 @@ def fill_ad_blocks(
         raise ValueError("filler_duration_ms must be positive")
 
     new_segments: list[ScheduledSegment] = []
+    cursor_ms = block.start_utc_ms
+    break_index = 0
 
     for seg in block.segments:
+        seg_start_ms = cursor_ms
+        cursor_ms += seg.segment_duration_ms
         if seg.segment_type == "filler" and seg.asset_uri == "":
             if asset_library is not None:
                 filled = _fill_break_with_interstitials(
                     break_duration_ms=seg.segment_duration_ms,
                     asset_library=asset_library,
+                    break_start_utc_ms=seg_start_ms,
+                    break_index=break_index,
+                    block_id=block.block_id,
                 )
+                break_index += 1
                 if filled:
                     new_segments.extend(filled)
                     continue
@@ -77,6 +95,9 @@ def fill_ad_blocks(
         else:
             new_segments.append(seg)
 
+    if asset_library is not None:
+        asset_library.flush_plays()
+
     return ScheduledBlock(
         block_id=block.block_id,
         start_utc_ms=block.start_utc_ms,
@@ -88,26 +109,38 @@ def fill_ad_blocks(
 def _fill_break_with_interstitials(
     break_duration_ms: int,
     asset_library: DatabaseAssetLibrary,
+    break_start_utc_ms: int | None = None,
+    break_index: int | None = None,
+    block_id: str | None = None,
 ) -> list[ScheduledSegment] | None:
     """
     Fill a single ad break with interstitials from the asset library.
 
     Packs spots until the break is full (or no more fit), then distributes
-    remaining time as evenly-spaced black pads between spots.
+    remaining time as evenly-spaced black pads between spots. When
+    break_start_utc_ms is given, candidates are judged against cooldowns
+    and caps at that air time, and each spot with a known asset_uuid is
+    logged as a play at its own air time.
 
     Returns None if no interstitials were found (caller falls back to v1).
     """
     remaining_ms = break_duration_ms
     picks: list[tuple[str, int, str]] = []  # (uri, duration_ms, asset_type)
+    pick_uuids: list[str | None] = []
+    air_time = (
+        datetime.fromtimestamp(break_start_utc_ms / 1000, tz=timezone.utc)
+        if break_start_utc_ms is not None else None
+    )
 
     while remaining_ms > 0:
         candidates = asset_library.get_filler_assets(
-            max_duration_ms=remaining_ms, count=5
+            max_duration_ms=remaining_ms, count=5, air_time=air_time
         )
         if not candidates:
             break
         pick = candidates[0]
         picks.append((pick.asset_uri, pick.duration_ms, pick.asset_type))
+        pick_uuids.append(pick.asset_uuid)
         remaining_ms -= pick.duration_ms
 
     if not picks:
@@ -151,4 +184,19 @@ def _fill_break_with_interstitials(
         f"INV-BREAK-PAD-EXACT-001 violated: {total}ms != {break_duration_ms}ms"
     )
 
+    if break_start_utc_ms is not None:
+        air_ms = break_start_utc_ms
+        for i, (uri, duration_ms, asset_type) in enumerate(picks):
+            if pick_uuids[i] is not None:
+                asset_library.log_play(
+                    asset_uri=uri,
+                    asset_uuid=pick_uuids[i],
+                    asset_type=asset_type,
+                    duration_ms=duration_ms,
+                    break_index=break_index,
+                    block_id=block_id,
+                    played_at=datetime.fromtimestamp(air_ms / 1000, tz=timezone.utc),
+                )
+            air_ms += duration_ms + pad_sizes[i]
+
     return segments
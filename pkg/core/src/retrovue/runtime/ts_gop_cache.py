@@ -0,0 +1,187 @@
+"""
+GOP cache for instant tune-in on the raw TS path.
+
+The TS ring buffer is a pass-through: the fanout thread drains it, so a
+viewer joining a ChannelStream starts at the live edge, usually mid-GOP,
+and the player shows black until the next IDR arrives (up to a full GOP).
+
+TsGopCache watches the same bytes the fanout thread delivers and keeps:
+- the latest PAT and PMT packets
+- every byte from the start of the most recent video random-access point
+  (TS packet carrying a PES start with random_access_indicator set, or an
+  H.264 IDR/SPS) up to the end of the last chunk fed
+
+``burst()`` returns PAT + PMT + that GOP. A new subscriber's queue is seeded
+with it before it receives live chunks, so it can start decoding at once and
+channel-change time is bounded by network throughput, not GOP length.
+
+INV-TS-TUNE-BURST-001: The burst ends exactly where the last fed chunk
+ended (including a trailing partial packet), so the next live chunk
+continues the byte stream without gap or overlap. ChannelStream calls
+feed() and burst() under its subscribers lock to make this hold across
+threads; TsGopCache itself is not thread-safe.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from retrovue.streaming.hls_writer import TS_PACKET_SIZE, TS_SYNC_BYTE, _is_keyframe_packet
+
+_logger = logging.getLogger(__name__)
+
+# Upper bound on cached GOP bytes (~13 s at 2.5 Mbit/s). A GOP longer than
+# this is dropped and joiners fall back to the live edge until the next RAP.
+DEFAULT_GOP_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+PAT_PID = 0x0000
+# PMT stream_type values carrying video (MPEG-1/2, MPEG-4 part 2, H.264, HEVC, CAVS, VC-1)
+VIDEO_STREAM_TYPES = frozenset({0x01, 0x02, 0x10, 0x1B, 0x24, 0x42, 0xEA})
+
+
+def _pid(buf: bytes, pos: int) -> int:
+    return ((buf[pos + 1] & 0x1F) << 8) | buf[pos + 2]
+
+
+def _section(packet: bytes) -> Optional[bytes]:
+    """PSI section bytes of a packet that starts one (PUSI set), else None."""
+    if not packet[1] & 0x40:
+        return None
+    afc = (packet[3] >> 4) & 0x03
+    if afc not in (1, 3):
+        return None
+    offset = 4
+    if afc == 3:
+        offset += 1 + packet[4]
+    if offset >= TS_PACKET_SIZE:
+        return None
+    offset += 1 + packet[offset]  # pointer_field
+    if offset + 3 > TS_PACKET_SIZE:
+        return None
+    if not packet[offset + 1] & 0x80:  # section_syntax_indicator
+        return None
+    section_length = ((packet[offset + 1] & 0x0F) << 8) | packet[offset + 2]
+    if offset + 3 + section_length > TS_PACKET_SIZE:
+        return None
+    return packet[offset:offset + 3 + section_length]
+
+
+def parse_pat_pmt_pid(packet: bytes) -> Optional[int]:
+    """PMT PID of the first program listed in a PAT packet."""
+    section = _section(packet)
+    if not section or section[0] != 0x00:
+        return None
+    # 8-byte header, 4-byte CRC, 4-byte program entries in between
+    for i in range(8, len(section) - 4 - 3, 4):
+        program_number = (section[i] << 8) | section[i + 1]
+        if program_number != 0:
+            return ((section[i + 2] & 0x1F) << 8) | section[i + 3]
+    return None
+
+
+def parse_pmt_video_pid(packet: bytes) -> Optional[int]:
+    """Elementary PID of the first video stream listed in a PMT packet."""
+    section = _section(packet)
+    if not section or section[0] != 0x02 or len(section) < 12:
+        return None
+    program_info_length = ((section[10] & 0x0F) << 8) | section[11]
+    i = 12 + program_info_length
+    end = len(section) - 4
+    while i + 5 <= end:
+        stream_type = section[i]
+        es_pid = ((section[i + 1] & 0x1F) << 8) | section[i + 2]
+        es_info_length = ((section[i + 3] & 0x0F) << 8) | section[i + 4]
+        if stream_type in VIDEO_STREAM_TYPES:
+            return es_pid
+        i += 5 + es_info_length
+    return None
+
+
+class TsGopCache:
+    """Most recent PAT/PMT and GOP of a TS byte stream (see module docstring)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_GOP_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._carry = b""
+        self._pat: Optional[bytes] = None
+        self._pmt: Optional[bytes] = None
+        self._pmt_pid: Optional[int] = None
+        self._video_pid: Optional[int] = None
+        self._gop: Optional[list[bytes]] = None
+        self._gop_bytes = 0
+        self.random_access_points = 0
+
+    @property
+    def gop_bytes(self) -> int:
+        return self._gop_bytes if self._gop is not None else 0
+
+    @property
+    def video_pid(self) -> Optional[int]:
+        return self._video_pid
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan *chunk* (any alignment) and extend or restart the cached GOP."""
+        if not chunk:
+            return
+        buf = self._carry + chunk if self._carry else chunk
+        length = len(buf)
+        pos = 0
+        rap_at = -1
+        video_pid = self._video_pid
+        while pos + TS_PACKET_SIZE <= length:
+            if buf[pos] != TS_SYNC_BYTE:
+                pos = buf.find(TS_SYNC_BYTE, pos + 1)
+                if pos == -1:
+                    pos = length
+                continue
+            pid = _pid(buf, pos)
+            if pid == video_pid:
+                # Random access can only begin at a PES start (PUSI)
+                if buf[pos + 1] & 0x40 and _is_keyframe_packet(buf[pos:pos + TS_PACKET_SIZE]):
+                    rap_at = pos
+                    self.random_access_points += 1
+            elif pid == PAT_PID:
+                self._on_pat(buf[pos:pos + TS_PACKET_SIZE])
+            elif pid == self._pmt_pid:
+                self._on_pmt(buf[pos:pos + TS_PACKET_SIZE])
+                video_pid = self._video_pid
+            pos += TS_PACKET_SIZE
+        self._carry = buf[pos:] if pos < length else b""
+
+        if rap_at >= 0:
+            tail = buf[rap_at:]
+            self._gop = [tail]
+            self._gop_bytes = len(tail)
+        elif self._gop is not None:
+            self._gop.append(chunk)
+            self._gop_bytes += len(chunk)
+        if self._gop is not None and self._gop_bytes > self._max_bytes:
+            _logger.debug("GOP exceeds %d bytes; dropping until next random access point", self._max_bytes)
+            self._gop = None
+            self._gop_bytes = 0
+
+    def _on_pat(self, packet: bytes) -> None:
+        pmt_pid = parse_pat_pmt_pid(packet)
+        if pmt_pid is None:
+            return
+        self._pat = packet
+        if pmt_pid != self._pmt_pid:
+            self._pmt_pid = pmt_pid
+            self._pmt = None
+
+    def _on_pmt(self, packet: bytes) -> None:
+        video_pid = parse_pmt_video_pid(packet)
+        if video_pid is None:
+            return
+        self._pmt = packet
+        if video_pid != self._video_pid:
+            self._video_pid = video_pid
+            self._gop = None
+            self._gop_bytes = 0
+
+    def burst(self) -> bytes:
+        """PAT + PMT + GOP so far, or b"" when no complete random access point is cached."""
+        if self._gop is None or self._pat is None or self._pmt is None:
+            return b""
+        return b"".join([self._pat, self._pmt, *self._gop])
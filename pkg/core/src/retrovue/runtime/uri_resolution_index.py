@@ -0,0 +1,239 @@
+"""
+URI Resolution Index — process-wide asset → local path table.
+
+DslScheduleService._resolve_uris used to query PathMapping for every
+collection and Asset (twice) for every program block on each compile.
+This index holds the same data in memory:
+
+    - per collection, a longest-prefix trie of plex_path → local_path
+    - asset_uuid → (collection_uuid, canonical_uri)
+
+so resolving a compiled day is pure dictionary/trie lookups.
+
+Refresh:
+    The index is rebuilt lazily.  At most once per ``refresh_interval_s``
+    a single fingerprint query (asset count + max(updated_at), plus the
+    small path_mappings table) decides whether the tables changed; only
+    then are asset rows reloaded.  Asset.updated_at is bumped on every
+    ORM update, so a canonical_uri rewritten by ingest or enrichment
+    changes the fingerprint.  A lookup for an asset the index has
+    never seen forces one refresh, so newly ingested assets resolve
+    without waiting for the interval.
+
+Thread-safe: a rebuild publishes new tables by reference swap; readers
+never observe a half-built index.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from retrovue.infra.uow import session
+
+logger = logging.getLogger(__name__)
+
+# Seconds between fingerprint checks against the DB
+REFRESH_INTERVAL_S = 60.0
+
+
+class _PrefixTrie:
+    """Character trie mapping string prefixes to values (longest match wins).
+
+    Matching is plain string-prefix (``str.startswith``) semantics, the same
+    as the PathMapping sort-and-scan it replaces.
+    """
+
+    __slots__ = ("_root",)
+
+    _TERMINAL = None  # dict key marking a stored value
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+
+    def insert(self, prefix: str, value: str) -> None:
+        """Insert *prefix*.  The first value stored for a prefix wins."""
+        node = self._root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault(self._TERMINAL, value)
+
+    def longest_match(self, s: str) -> tuple[int, str] | None:
+        """Return (matched_prefix_len, value) for the longest stored prefix of *s*."""
+        node = self._root
+        best = (0, node[self._TERMINAL]) if self._TERMINAL in node else None
+        for i, ch in enumerate(s):
+            node = node.get(ch)
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                best = (i + 1, node[self._TERMINAL])
+        return best
+
+
+@dataclass(frozen=True)
+class _Tables:
+    tries: dict[str, _PrefixTrie]
+    assets: dict[str, tuple[str, str | None]]  # uuid -> (collection_uuid, canonical_uri)
+    fingerprint: Any
+
+
+class UriResolutionIndex:
+    """In-memory PathMapping + Asset table for URI resolution."""
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Any] = session,
+        refresh_interval_s: float = REFRESH_INTERVAL_S,
+        monotonic_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._refresh_interval_s = refresh_interval_s
+        self._monotonic = monotonic_fn
+        self._tables: _Tables | None = None
+        self._checked_at = float("-inf")
+        self._refresh_lock = threading.Lock()
+        self._rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def build_tables(
+        path_mappings: Iterable[tuple[str, str, str]],
+        assets: Iterable[tuple[str, str, str | None]],
+        fingerprint: Any = None,
+    ) -> _Tables:
+        """Build tables from (collection_uuid, plex_path, local_path) and
+        (asset_uuid, collection_uuid, canonical_uri) rows."""
+        tries: dict[str, _PrefixTrie] = {}
+        for col_uuid, plex_path, local_path in path_mappings:
+            tries.setdefault(str(col_uuid), _PrefixTrie()).insert(plex_path, local_path)
+        asset_map = {
+            str(a_uuid): (str(col_uuid), canonical_uri)
+            for a_uuid, col_uuid, canonical_uri in assets
+        }
+        return _Tables(tries=tries, assets=asset_map, fingerprint=fingerprint)
+
+    def load_rows(
+        self,
+        path_mappings: Iterable[tuple[str, str, str]],
+        assets: Iterable[tuple[str, str, str | None]],
+    ) -> None:
+        """Replace the index contents from pre-fetched rows (no DB access)."""
+        self._tables = self.build_tables(path_mappings, assets)
+        self._checked_at = self._monotonic()
+        self._rebuilds += 1
+
+    def invalidate(self) -> None:
+        """Force a fingerprint check on the next lookup."""
+        self._checked_at = float("-inf")
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Reload from the DB if due and the tables changed.  Returns True on rebuild.
+
+        ``force`` skips the refresh interval, not the fingerprint check.
+        """
+        now = self._monotonic()
+        if not force and now - self._checked_at < self._refresh_interval_s:
+            return False
+        with self._refresh_lock:
+            if not force and self._monotonic() - self._checked_at < self._refresh_interval_s:
+                return False  # another thread refreshed while we waited
+            from sqlalchemy import func
+
+            from retrovue.domain.entities import Asset, PathMapping
+
+            with self._session_factory() as db:
+                pm_rows = tuple(
+                    (str(collection_uuid), plex_path, local_path)
+                    for collection_uuid, plex_path, local_path in db.query(
+                        PathMapping.collection_uuid,
+                        PathMapping.plex_path,
+                        PathMapping.local_path,
+                    ).order_by(PathMapping.created_at, PathMapping.id).all()
+                )
+                count, max_updated = db.query(
+                    func.count(Asset.uuid), func.max(Asset.updated_at),
+                ).one()
+                fingerprint = (count, max_updated, pm_rows)
+
+                current = self._tables
+                if current is not None and current.fingerprint == fingerprint:
+                    self._checked_at = self._monotonic()
+                    return False
+
+                asset_rows = db.query(
+                    Asset.uuid, Asset.collection_uuid, Asset.canonical_uri,
+                ).all()
+                self._tables = self.build_tables(pm_rows, asset_rows, fingerprint)
+
+            self._checked_at = self._monotonic()
+            self._rebuilds += 1
+            logger.info(
+                "URI resolution index rebuilt: %d assets, %d collections with path mappings",
+                len(self._tables.assets), len(self._tables.tries),
+            )
+            return True
+
+    @property
+    def rebuild_count(self) -> int:
+        return self._rebuilds
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def has_asset(self, asset_id: str) -> bool:
+        tables = self._tables
+        return tables is not None and str(asset_id) in tables.assets
+
+    def resolve(self, asset_id: str, uri: str) -> str | None:
+        """Resolve a catalog file URI to a local path.
+
+        Returns None when *uri* is a plex:// URI and the asset has no
+        local canonical_uri (it must be re-ingested).  Otherwise returns
+        the source path with the collection's longest matching PathMapping
+        applied, or unchanged when no mapping matches.
+        """
+        tables = self._tables
+        entry = tables.assets.get(str(asset_id)) if tables is not None else None
+
+        # Normalise file:// prefix
+        source_path = uri.replace("file://", "") if uri.startswith("file://") else uri
+
+        # plex:// URIs that weren't migrated yet: use canonical_uri
+        if uri.startswith("plex://"):
+            canonical = entry[1] if entry is not None else None
+            if not canonical or canonical.startswith("plex://"):
+                return None
+            source_path = canonical
+
+        if entry is None:
+            return source_path
+        trie = tables.tries.get(entry[0])
+        if trie is None:
+            return source_path
+        match = trie.longest_match(source_path)
+        if match is None:
+            return source_path
+        prefix_len, local_prefix = match
+        return local_prefix + source_path[prefix_len:]
+
+
+_INDEX: UriResolutionIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_uri_resolution_index() -> UriResolutionIndex:
+    """Process-wide index shared by all DslScheduleService instances."""
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = UriResolutionIndex()
+        return _INDEX
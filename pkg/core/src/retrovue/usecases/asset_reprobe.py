@@ -4,33 +4,56 @@ Use-case: reprobe one or more assets.
 Resets asset state, clears stale probed data, and re-runs the enrichment
 pipeline so that duration_ms and other technical metadata are refreshed
 from the actual file on disk.
+
+The ffprobe and loudness enrichers consult the probe cache first, so a
+file whose size and mtime are unchanged is served from the cache instead
+of being decoded again.  Pass ``refresh_cache=True`` to drop the asset's
+cache entries and force new subprocess runs (e.g. after upgrading ffmpeg).
+
+Collections are reprobed one asset per transaction, optionally across a
+process pool, with results streamed as they complete and a checkpoint that
+lets an interrupted run resume (see iter_reprobe_collection).
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from ..adapters.enrichers.probe_cache import get_probe_cache
 from ..domain.entities import Asset, AssetProbed, Collection, Marker, validate_state_transition
 from ..shared.types import MarkerKind
 from .ingest_orchestrator import ingest_collection_assets
 
 logger = logging.getLogger(__name__)
 
+# Default process-pool size for collection reprobes (CLI --workers)
+DEFAULT_REPROBE_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
 
 def reprobe_asset(
     db: Session,
     *,
     asset_uuid: str,
+    refresh_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Re-probe a single asset: reset it to 'new', clear stale probed/marker
     data, then run the collection's enrichment pipeline on it.
 
+    With ``refresh_cache``, cached probe results for the asset's last
+    resolved local path are discarded first.
+
+    Does not commit: the caller's transaction covers the whole reprobe.
+
     Returns a summary dict with the asset uuid and result status.
     """
     try:
@@ -50,6 +73,11 @@ def reprobe_asset(
     old_duration_ms = asset.duration_ms
     old_state = asset.state
 
+    if refresh_cache and asset.canonical_uri:
+        cache = get_probe_cache()
+        if cache is not None:
+            cache.invalidate(asset.canonical_uri)
+
     # 1. Clear stale probed metadata
     probed_row = db.get(AssetProbed, asset.uuid)
     if probed_row is not None:
@@ -79,29 +107,13 @@ def reprobe_asset(
     asset.updated_at = datetime.now(UTC)
     db.flush()
 
-    # 4. Run the ingest orchestrator for this collection
-    #    It only processes assets in 'new' state, so only our reset asset runs.
-    #    To avoid re-probing OTHER new assets, we temporarily park them.
-    other_new = (
-        db.query(Asset)
-        .filter(
-            Asset.collection_uuid == collection.uuid,
-            Asset.state == "new",
-            Asset.uuid != asset.uuid,
-        )
-        .all()
+    # 4. Run the ingest orchestrator on this asset only.  Other 'new' assets
+    #    in the collection are left untouched, so concurrent reprobes of
+    #    different assets never write the same rows.  The caller's
+    #    transaction covers the reset above and the enrichment together.
+    summary = ingest_collection_assets(
+        db, collection, asset_uuids=[asset.uuid], commit=False
     )
-    for a in other_new:
-        a.state = "enriching"
-    db.flush()
-
-    try:
-        summary = ingest_collection_assets(db, collection)
-    finally:
-        # Restore the other assets
-        for a in other_new:
-            a.state = "new"
-        db.flush()
 
     # Refresh asset from DB
     db.refresh(asset)
@@ -117,67 +129,174 @@ def reprobe_asset(
     }
 
 
-def reprobe_collection(
+def _reprobe_in_session(db: Session, asset_uuid: str, refresh_cache: bool) -> dict[str, Any]:
+    """Reprobe one asset as its own transaction on *db*."""
+    try:
+        result = reprobe_asset(db, asset_uuid=asset_uuid, refresh_cache=refresh_cache)
+        db.commit()
+        return result
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to reprobe asset {asset_uuid}: {e}")
+        return {"uuid": asset_uuid, "error": str(e)}
+
+
+def _reprobe_in_worker(asset_uuid: str, refresh_cache: bool) -> dict[str, Any]:
+    """Process-pool entry point: reprobe one asset in a fresh Unit of Work."""
+    from ..infra.uow import session
+
+    with session() as db:
+        return _reprobe_in_session(db, asset_uuid, refresh_cache)
+
+
+class _Checkpoint:
+    """Tracks the last asset such that it and every asset before it has finished."""
+
+    def __init__(self, order: list[str], start: str | None) -> None:
+        self._order = order
+        self._done: set[str] = set()
+        self._next = 0
+        self.value = start
+
+    def mark(self, asset_uuid: str) -> str | None:
+        self._done.add(asset_uuid)
+        while self._next < len(self._order) and self._order[self._next] in self._done:
+            self.value = self._order[self._next]
+            self._next += 1
+        return self.value
+
+
+def iter_reprobe_collection(
     db: Session,
     *,
     collection_uuid: str,
     include_ready: bool = False,
     limit: int | None = None,
-) -> dict[str, Any]:
+    refresh_cache: bool = False,
+    workers: int = 1,
+    resume_after: str | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    Re-probe all assets in a collection.
+    Re-probe a collection's assets, yielding each result as it completes.
 
-    By default only re-probes assets that are NOT in 'ready' state.
-    Pass include_ready=True to force re-probe of ready assets too.
+    Assets are processed in UUID order and each one is committed in its own
+    transaction, so an interrupted run loses at most the assets in flight.
+    With ``workers > 1`` assets fan out over a process pool; each worker
+    opens its own session.
+
+    Every yielded dict is a reprobe_asset() summary (or ``{"uuid", "uri",
+    "error"}`` on failure) plus ``"checkpoint"``: the UUID of the last asset
+    that, together with every asset before it, has finished.  Passing that
+    value back as ``resume_after`` continues an interrupted run.
+
+    Raises ValueError immediately for an unknown collection.
     """
     try:
         coll_id = UUID(collection_uuid)
+        after = UUID(resume_after) if resume_after else None
     except Exception as exc:
-        raise ValueError(f"Invalid collection UUID: {collection_uuid}") from exc
+        raise ValueError(f"Invalid UUID: {exc}") from exc
 
     collection = db.get(Collection, coll_id)
     if collection is None:
         raise ValueError(f"Collection not found: {collection_uuid}")
 
-    query = db.query(Asset).filter(Asset.collection_uuid == collection.uuid)
-
+    query = db.query(Asset.uuid, Asset.uri).filter(Asset.collection_uuid == collection.uuid)
     if not include_ready:
         query = query.filter(Asset.state != "ready")
-
+    if after is not None:
+        query = query.filter(Asset.uuid > after)
+    query = query.order_by(Asset.uuid)
     if limit:
         query = query.limit(limit)
+    targets = [(str(u), uri) for u, uri in query.all()]
+
+    return _run_reprobes(db, targets, refresh_cache, max(1, int(workers)), resume_after)
+
+
+def _run_reprobes(
+    db: Session,
+    targets: list[tuple[str, str]],
+    refresh_cache: bool,
+    workers: int,
+    resume_after: str | None,
+) -> Iterator[dict[str, Any]]:
+    checkpoint = _Checkpoint([u for u, _ in targets], resume_after)
+    uris = dict(targets)
 
-    assets = query.all()
+    def _finish(asset_uuid: str, result: dict[str, Any]) -> dict[str, Any]:
+        if "error" in result:
+            result.setdefault("uri", uris.get(asset_uuid))
+        result["checkpoint"] = checkpoint.mark(asset_uuid)
+        return result
 
-    if not assets:
-        return {
-            "collection_uuid": collection_uuid,
-            "collection_name": collection.name,
-            "total": 0,
-            "results": [],
+    if workers == 1 or len(targets) <= 1:
+        for asset_uuid, _ in targets:
+            yield _finish(asset_uuid, _reprobe_in_session(db, asset_uuid, refresh_cache))
+        return
+
+    # spawn: workers must not inherit the parent's engine, sockets or threads
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(targets)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        futures = {
+            pool.submit(_reprobe_in_worker, asset_uuid, refresh_cache): asset_uuid
+            for asset_uuid, _ in targets
         }
+        for fut in as_completed(futures):
+            asset_uuid = futures[fut]
+            try:
+                result = fut.result()
+            except Exception as e:  # worker crashed (e.g. BrokenProcessPool)
+                logger.error(f"Failed to reprobe asset {asset_uuid}: {e}")
+                result = {"uuid": asset_uuid, "error": str(e)}
+            yield _finish(asset_uuid, result)
+    finally:
+        # On interrupt, drop queued assets; in-flight ones finish and commit.
+        pool.shutdown(wait=True, cancel_futures=True)
 
-    results = []
-    for asset in assets:
-        try:
-            result = reprobe_asset(db, asset_uuid=str(asset.uuid))
-            results.append(result)
-        except Exception as e:
-            logger.error(f"Failed to reprobe asset {asset.uuid}: {e}")
-            results.append({
-                "uuid": str(asset.uuid),
-                "uri": asset.uri,
-                "error": str(e),
-            })
+
+def reprobe_collection(
+    db: Session,
+    *,
+    collection_uuid: str,
+    include_ready: bool = False,
+    limit: int | None = None,
+    refresh_cache: bool = False,
+    workers: int = 1,
+    resume_after: str | None = None,
+) -> dict[str, Any]:
+    """
+    Re-probe all assets in a collection.
+
+    By default only re-probes assets that are NOT in 'ready' state.
+    Pass include_ready=True to force re-probe of ready assets too.
+    See iter_reprobe_collection() for workers / resume_after.
+    """
+    results = list(
+        iter_reprobe_collection(
+            db,
+            collection_uuid=collection_uuid,
+            include_ready=include_ready,
+            limit=limit,
+            refresh_cache=refresh_cache,
+            workers=workers,
+            resume_after=resume_after,
+        )
+    )
+    collection = db.get(Collection, UUID(collection_uuid))
 
     succeeded = sum(1 for r in results if "error" not in r and r.get("new_state") == "ready")
     failed = sum(1 for r in results if "error" in r)
 
     return {
         "collection_uuid": collection_uuid,
-        "collection_name": collection.name,
+        "collection_name": collection.name if collection is not None else None,
         "total": len(results),
         "succeeded": succeeded,
         "failed": failed,
+        "checkpoint": results[-1]["checkpoint"] if results else resume_after,
         "results": results,
     }
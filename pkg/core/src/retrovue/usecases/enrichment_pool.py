@@ -0,0 +1,122 @@
+"""
+Enrichment pool — runs per-asset enricher pipelines concurrently.
+
+Ingest used to run every enricher on every asset in one serial loop, so a
+collection cost the sum of all ffprobe/ffmpeg subprocess times.  Enrichers
+are stateless (see adapters/enrichers/base.py) and spend their time in
+subprocesses, so a thread pool overlaps them without contention on the GIL.
+
+    - Each asset's pipeline still runs its enrichers in priority order;
+      only different assets run concurrently.
+    - Each enricher type has its own concurrency limit, so a CPU-heavy
+      decoder pass (loudness) cannot starve cheap probes (ffprobe).
+    - ordered() yields results in input order with a bounded look-ahead,
+      so callers persist, transition state and validate markers on one
+      thread in a deterministic order.
+
+INV-ENRICH-POOL-ORDER-001: Results are consumed in the order items were
+supplied, regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _cpu_count() -> int:
+    return os.cpu_count() or 1
+
+
+# Per-enricher-type concurrency.  Enrichers may override with a
+# ``max_concurrency`` attribute.
+DEFAULT_ENRICHER_CONCURRENCY: dict[str, Callable[[], int]] = {
+    "ffprobe": lambda: max(2, _cpu_count()),
+    "loudness": lambda: max(1, _cpu_count() // 2),  # full decode per file
+}
+
+# Pool size when the caller does not choose one
+DEFAULT_MAX_WORKERS = max(2, min(32, _cpu_count()))
+
+# Items submitted ahead of the consumer, per worker
+LOOKAHEAD_PER_WORKER = 4
+
+
+@dataclass
+class EnrichmentOutcome:
+    """One item after its pipeline ran."""
+
+    item: Any
+    errors: list[tuple[str, Exception]] = field(default_factory=list)  # (enricher name, error)
+
+
+class EnrichmentPool:
+    """Bounded worker pool for enricher pipelines."""
+
+    def __init__(
+        self,
+        enrichers: Sequence[Any],
+        *,
+        max_workers: int | None = None,
+        enricher_limits: dict[str, int] | None = None,
+    ) -> None:
+        self.enrichers = list(enrichers)
+        self.max_workers = max(1, int(max_workers or DEFAULT_MAX_WORKERS))
+        limits = dict(enricher_limits or {})
+        self._gates: dict[int, threading.BoundedSemaphore] = {}
+        for enr in self.enrichers:
+            limit = self._limit_for(enr, limits)
+            self._gates[id(enr)] = threading.BoundedSemaphore(limit)
+
+    def _limit_for(self, enr: Any, limits: dict[str, int]) -> int:
+        name = getattr(enr, "name", None)
+        name = name if isinstance(name, str) else type(enr).__name__
+        for value in (limits.get(name), getattr(enr, "max_concurrency", None)):
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                return value
+        default = DEFAULT_ENRICHER_CONCURRENCY.get(name)
+        return default() if default is not None else self.max_workers
+
+    def run_pipeline(self, item: Any) -> EnrichmentOutcome:
+        """Run every enricher on *item* in order.  A failing enricher is recorded and skipped."""
+        outcome = EnrichmentOutcome(item=item)
+        for enr in self.enrichers:
+            with self._gates[id(enr)]:
+                try:
+                    outcome.item = enr.enrich(outcome.item)
+                except Exception as e:
+                    outcome.errors.append((str(getattr(enr, "name", type(enr).__name__)), e))
+        return outcome
+
+    def enrich_all(self, items: Iterable[Any]) -> Iterator[EnrichmentOutcome]:
+        """Run pipelines concurrently; yield outcomes in input order."""
+        return self.ordered(self.run_pipeline, items)
+
+    def ordered(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply *fn* on the pool, yielding results in input order (INV-ENRICH-POOL-ORDER-001).
+
+        At most ``max_workers * LOOKAHEAD_PER_WORKER`` items are in flight, so
+        memory stays bounded for large collections.  Exceptions from *fn*
+        propagate when their result is reached.
+        """
+        if self.max_workers == 1:
+            for it in items:
+                yield fn(it)
+            return
+        window = self.max_workers * LOOKAHEAD_PER_WORKER
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich") as pool:
+            pending: deque[Future[R]] = deque()
+            for it in items:
+                pending.append(pool.submit(fn, it))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -8,14 +8,16 @@ running configured enrichers and persisting results back to the database.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
 from ..adapters.importers.base import DiscoveredItem
 from ..domain.entities import Asset, Collection, Marker, PathMapping, validate_marker_bounds, validate_state_transition
 from .asset_path_resolver import AssetPathResolver
+from .enrichment_pool import EnrichmentPool
 from ..infra.metadata.persistence import persist_asset_metadata
 from ..shared.types import MarkerKind
 
@@ -24,10 +26,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Assets enriched concurrently (and committed together with batch_commits)
+ENRICH_BATCH_SIZE = 64
+
 
 def ingest_collection_assets(
     db: Session,
     collection: Collection,
+    *,
+    asset_uuids: Iterable[UUID] | None = None,
+    batch_commits: bool = False,
+    commit: bool = True,
 ) -> dict[str, int]:
     """
     Ingest all assets in "new" state for a given collection.
@@ -42,6 +51,14 @@ def ingest_collection_assets(
     Args:
         db: Database session
         collection: Collection to ingest assets from
+        asset_uuids: Restrict to these assets (still only those in "new");
+            lets callers enrich one asset without touching the rest
+        batch_commits: Commit after every ENRICH_BATCH_SIZE assets so
+            progress survives an interrupted run.  A failure then leaves
+            the earlier batches committed.  By default the whole
+            collection is committed once at the end.
+        commit: With False, only flush; the caller owns the transaction
+            (batch_commits is ignored)
 
     Returns:
         Summary dict with counts:
@@ -67,10 +84,13 @@ def ingest_collection_assets(
     path_mappings = [(pm.plex_path, pm.local_path) for pm in path_mappings_list]
 
     # Get assets in "new" state for this collection
-    assets = db.query(Asset).filter(
+    query = db.query(Asset).filter(
         Asset.collection_uuid == collection.uuid,
         Asset.state == "new"
-    ).all()
+    )
+    if asset_uuids is not None:
+        query = query.filter(Asset.uuid.in_(list(asset_uuids)))
+    assets = query.all()
 
     summary["total"] = len(assets)
 
@@ -139,156 +159,193 @@ def ingest_collection_assets(
     importer_config = {k: v for k, v in (source.config or {}).items() if k != "enrichers"}
     importer = get_importer(source.type, **importer_config)
 
-    # Process each asset
-    for asset in assets:
-        try:
-            # Transition to "enriching" state
-            validate_state_transition(asset.state, "enriching")
-            asset.state = "enriching"
-            db.flush()
-
-            # Get editorial data for this asset
-            from ..domain.entities import AssetEditorial
-            editorial_obj = db.query(AssetEditorial).filter(
-                AssetEditorial.asset_uuid == asset.uuid
-            ).first()
-            editorial_data = editorial_obj.payload if editorial_obj else {}
-
-            # Create DiscoveredItem from existing asset data
-            discovered_item = DiscoveredItem(
-                path_uri=asset.uri,
-                provider_key=asset.uri,  # Use URI as provider key for now
-                raw_labels=[],  # Labels not needed for re-enrichment
-                last_modified=asset.discovered_at,
-                size=asset.size,
-                editorial=editorial_data,
-            )
-
-            # Resolve local file path via AssetPathResolver
+    # Process assets in batches: prepare serially, enrich concurrently,
+    # apply results in asset order.
+    pool = EnrichmentPool(enrichers)
+    for start in range(0, len(assets), ENRICH_BATCH_SIZE):
+        prepared: list[tuple[Asset, DiscoveredItem]] = []
+        for asset in assets[start:start + ENRICH_BATCH_SIZE]:
+            item = _begin_enrichment(db, asset, collection, importer, path_mappings, summary)
+            if item is not None:
+                prepared.append((asset, item))
+
+        # INV-ENRICH-POOL-ORDER-001: outcomes arrive in the order of `prepared`
+        outcomes = pool.enrich_all(item for _, item in prepared)
+        for (asset, _), outcome in zip(prepared, outcomes):
+            for enricher_name, e in outcome.errors:
+                # Continue with next enricher rather than failing the whole asset
+                logger.error(f"Enricher {enricher_name} failed for asset {asset.uuid}: {e}")
             try:
-                collection_locations = (collection.config or {}).get("locations", [])
-                plex_client = getattr(importer, "client", None)
-                resolver = AssetPathResolver(
-                    path_mappings=path_mappings,
-                    plex_client=plex_client,
-                    collection_locations=collection_locations,
-                )
-                local_path = resolver.resolve(
-                    uri=asset.uri,
-                    canonical_uri=asset.canonical_uri,
-                )
-            
-                if not local_path:
-                    logger.warning(
-                        "Could not resolve local path for asset %s (uri=%s)",
-                        asset.uuid, asset.uri,
-                    )
-                    summary["skipped"] += 1
-                    asset.state = "new"
-                    continue
-            
-                discovered_item.path_uri = local_path
-                asset.canonical_uri = local_path
-                db.flush()
-            
+                _apply_enrichment(db, asset, outcome.item)
+                summary["enriched"] += 1
+                logger.info(f"Successfully enriched asset {asset.uuid}")
             except Exception as e:
-                logger.error("Error resolving path for asset %s: %s", asset.uuid, e)
-                summary["skipped"] += 1
-                asset.state = "new"
-                continue
-
-
-            # Run enrichers in sequence
-            enriched_item = discovered_item
-            for enricher in enrichers:
+                logger.error(f"Failed to enrich asset {asset.uuid}: {e}")
+                summary["failed"] += 1
+                # Revert state on failure
                 try:
-                    enriched_item = enricher.enrich(enriched_item)
-                except Exception as e:
-                    logger.error(f"Enricher {enricher.name} failed for asset {asset.uuid}: {e}")
-                    # Continue with next enricher rather than failing the whole asset
-                    continue
+                    asset.state = "new"
+                    db.flush()
+                except Exception:
+                    pass
 
-            # Extract probed data
-            probed_data = enriched_item.probed or {}
+        if commit and batch_commits:
+            db.commit()
 
-            # Update asset fields from probed data
-            if probed_data.get("duration_ms"):
-                asset.duration_ms = probed_data["duration_ms"]
+    if not commit:
+        db.flush()
+    elif not batch_commits:
+        db.commit()
 
-            if probed_data.get("video"):
-                video_data = probed_data["video"]
-                asset.video_codec = video_data.get("codec")
+    logger.info(
+        f"Ingest complete for collection {collection.name}: "
+        f"{summary['enriched']} enriched, {summary['skipped']} skipped, {summary['failed']} failed"
+    )
+
+    return summary
 
-            if probed_data.get("audio"):
-                audio_data = probed_data["audio"]
-                if isinstance(audio_data, list) and len(audio_data) > 0:
-                    asset.audio_codec = audio_data[0].get("codec")
 
-            if probed_data.get("container"):
-                asset.container = probed_data["container"]
+def _begin_enrichment(
+    db: Session,
+    asset: Asset,
+    collection: Collection,
+    importer: object,
+    path_mappings: list[tuple[str, str]],
+    summary: dict[str, int],
+) -> DiscoveredItem | None:
+    """Move *asset* to "enriching" and build its DiscoveredItem.
 
-            # Persist probed data to asset_probed table
-            persist_asset_metadata(
-                db,
-                asset,
-                probed=probed_data
+    Returns None (and updates *summary*) when the asset is skipped or fails.
+    """
+    try:
+        # Transition to "enriching" state
+        validate_state_transition(asset.state, "enriching")
+        asset.state = "enriching"
+        db.flush()
+
+        # Get editorial data for this asset
+        from ..domain.entities import AssetEditorial
+        editorial_obj = db.query(AssetEditorial).filter(
+            AssetEditorial.asset_uuid == asset.uuid
+        ).first()
+        editorial_data = editorial_obj.payload if editorial_obj else {}
+
+        # Create DiscoveredItem from existing asset data
+        discovered_item = DiscoveredItem(
+            path_uri=asset.uri,
+            provider_key=asset.uri,  # Use URI as provider key for now
+            raw_labels=[],  # Labels not needed for re-enrichment
+            last_modified=asset.discovered_at,
+            size=asset.size,
+            editorial=editorial_data,
+        )
+
+        # Resolve local file path via AssetPathResolver
+        try:
+            collection_locations = (collection.config or {}).get("locations", [])
+            plex_client = getattr(importer, "client", None)
+            resolver = AssetPathResolver(
+                path_mappings=path_mappings,
+                plex_client=plex_client,
+                collection_locations=collection_locations,
+            )
+            local_path = resolver.resolve(
+                uri=asset.uri,
+                canonical_uri=asset.canonical_uri,
             )
 
-            # Extract and create chapter markers
-            chapters = probed_data.get("chapters", [])
-            if chapters and asset.duration_ms and asset.duration_ms > 0:
-                for ch in chapters:
-                    ch_start = ch.get("start_ms", 0)
-                    ch_end = ch.get("end_ms", 0)
-                    try:
-                        validate_marker_bounds(ch_start, ch_end, asset.duration_ms)
-                    except ValueError:
-                        logger.warning(
-                            "Skipping out-of-bounds chapter marker for asset %s: start=%d end=%d duration=%d",
-                            asset.uuid, ch_start, ch_end, asset.duration_ms,
-                        )
-                        continue
-                    marker = Marker(
-                        id=uuid4(),
-                        asset_uuid=asset.uuid,
-                        kind=MarkerKind.CHAPTER,
-                        start_ms=ch_start,
-                        end_ms=ch_end,
-                        payload={"title": ch.get("title", "")}
-                    )
-                    db.add(marker)
-
-            # Only promote to ready if we got meaningful probe data
-            if asset.duration_ms and asset.duration_ms > 0:
-                validate_state_transition(asset.state, "ready")
-                asset.state = "ready"
-            else:
-                validate_state_transition(asset.state, "new")
+            if not local_path:
+                logger.warning(
+                    "Could not resolve local path for asset %s (uri=%s)",
+                    asset.uuid, asset.uri,
+                )
+                summary["skipped"] += 1
                 asset.state = "new"
-                asset.approved_for_broadcast = False
-                logger.warning(f"Asset {asset.uuid} enriched but missing valid duration, keeping in new state")
-            db.flush()
+                return None
 
-            summary["enriched"] += 1
-            logger.info(f"Successfully enriched asset {asset.uuid}")
+            discovered_item.path_uri = local_path
+            asset.canonical_uri = local_path
+            db.flush()
 
         except Exception as e:
-            logger.error(f"Failed to enrich asset {asset.uuid}: {e}")
-            summary["failed"] += 1
-            # Revert state on failure
-            try:
-                asset.state = "new"
-                db.flush()
-            except Exception:
-                pass
-            continue
+            logger.error("Error resolving path for asset %s: %s", asset.uuid, e)
+            summary["skipped"] += 1
+            asset.state = "new"
+            return None
 
-    # Commit all changes
-    db.commit()
+        return discovered_item
 
-    logger.info(
-        f"Ingest complete for collection {collection.name}: "
-        f"{summary["enriched"]} enriched, {summary["skipped"]} skipped, {summary["failed"]} failed"
+    except Exception as e:
+        logger.error(f"Failed to enrich asset {asset.uuid}: {e}")
+        summary["failed"] += 1
+        # Revert state on failure
+        try:
+            asset.state = "new"
+            db.flush()
+        except Exception:
+            pass
+        return None
+
+
+def _apply_enrichment(db: Session, asset: Asset, enriched_item: DiscoveredItem) -> None:
+    """Persist an enriched item onto *asset* and settle its state."""
+    # Extract probed data
+    probed_data = enriched_item.probed or {}
+
+    # Update asset fields from probed data
+    if probed_data.get("duration_ms"):
+        asset.duration_ms = probed_data["duration_ms"]
+
+    if probed_data.get("video"):
+        video_data = probed_data["video"]
+        asset.video_codec = video_data.get("codec")
+
+    if probed_data.get("audio"):
+        audio_data = probed_data["audio"]
+        if isinstance(audio_data, list) and len(audio_data) > 0:
+            asset.audio_codec = audio_data[0].get("codec")
+
+    if probed_data.get("container"):
+        asset.container = probed_data["container"]
+
+    # Persist probed data to asset_probed table
+    persist_asset_metadata(
+        db,
+        asset,
+        probed=probed_data
     )
 
-    return summary
+    # Extract and create chapter markers
+    chapters = probed_data.get("chapters", [])
+    if chapters and asset.duration_ms and asset.duration_ms > 0:
+        for ch in chapters:
+            ch_start = ch.get("start_ms", 0)
+            ch_end = ch.get("end_ms", 0)
+            try:
+                validate_marker_bounds(ch_start, ch_end, asset.duration_ms)
+            except ValueError:
+                logger.warning(
+                    "Skipping out-of-bounds chapter marker for asset %s: start=%d end=%d duration=%d",
+                    asset.uuid, ch_start, ch_end, asset.duration_ms,
+                )
+                continue
+            marker = Marker(
+                id=uuid4(),
+                asset_uuid=asset.uuid,
+                kind=MarkerKind.CHAPTER,
+                start_ms=ch_start,
+                end_ms=ch_end,
+                payload={"title": ch.get("title", "")}
+            )
+            db.add(marker)
+
+    # Only promote to ready if we got meaningful probe data
+    if asset.duration_ms and asset.duration_ms > 0:
+        validate_state_transition(asset.state, "ready")
+        asset.state = "ready"
+    else:
+        validate_state_transition(asset.state, "new")
+        asset.state = "new"
+        asset.approved_for_broadcast = False
+        logger.warning(f"Asset {asset.uuid} enriched but missing valid duration, keeping in new state")
+    db.flush()
@@ -4,6 +4,11 @@ Shared by zone_add, zone_update, and the schedule preview endpoint.
 No DB access, no side effects — operates on zone-like objects with
 start_time, end_time, day_filters, and enabled attributes.
 
+Overlap and coverage run on ZonePlanIndex, a per-weekday sorted interval
+index, so validation cost grows as O(n log n) with plan size rather than
+with the number of zone pairs, and single-zone edits can be checked
+incrementally (validate_zone_change).
+
 Enforces:
   INV-PLAN-NO-ZONE-OVERLAP-001 — No two active zones may overlap
   INV-PLAN-FULL-COVERAGE-001   — Zones must tile the full broadcast day
@@ -13,12 +18,18 @@ All interval arithmetic is normalized to broadcast-day-relative coordinates
 This correctly handles programming_day_start ≠ 00:00 and midnight-wrapping zones.
 
 Migration note: Existing plans in DB may violate these invariants.
-After this change, editing/saving such plans will fail until corrected.
+zone_add / zone_update check only the zone being saved (validate_zone_change):
+its overlaps with neighbouring zones and coverage of the days it touches.
+Violations elsewhere in a legacy plan do not block unrelated edits; the full
+plan check (validate_zone_plan_integrity) still reports them.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from collections.abc import Iterable
 from datetime import time as dt_time
+from heapq import heappop, heappush
 from typing import Any, Protocol
 
 # All 7 broadcast days
@@ -89,20 +100,6 @@ def _days_overlap(a: Any, b: Any) -> frozenset[str]:
     return _effective_days(a) & _effective_days(b)
 
 
-def _interval_pair_overlap(
-    a_start: int, a_end: int, b_start: int, b_end: int
-) -> tuple[int, int] | None:
-    """Return the overlap interval (start, end) in minutes, or None.
-
-    Assumes non-wrapping intervals where start < end.
-    """
-    lo = max(a_start, b_start)
-    hi = min(a_end, b_end)
-    if lo < hi:
-        return (lo, hi)
-    return None
-
-
 def _norm_to_wall(norm_min: int, pds_min: int) -> str:
     """Convert normalized broadcast-day minutes back to wall-clock HH:MM."""
     wall = (norm_min + pds_min) % _DAY_MINUTES
@@ -121,6 +118,185 @@ def _minutes_to_hhmm(m: int) -> str:
     return f"{h:02d}:{mm:02d}"
 
 
+class ZonePlanIndex:
+    """Per-weekday interval index over the enabled zones of a plan.
+
+    Each weekday keeps its zones' normalized sub-intervals sorted by start,
+    so the plan-wide overlap check is a sweep line (O(n log n + k) instead
+    of comparing every zone pair) and coverage is one merge walk per day.
+
+    The index can also be edited in place: add()/remove() touch only the
+    changed zone's days, conflicts_with() finds the zones one candidate
+    overlaps by bisection, and coverage gaps are recomputed only for the
+    days an edit touched. validate_zone_change() builds on these so that a
+    caller holding the index of a valid plan can check a single zone edit
+    without re-validating the whole plan.
+    """
+
+    def __init__(
+        self,
+        zones: Iterable[Any] = (),
+        programming_day_start: dt_time = dt_time(0, 0),
+    ) -> None:
+        self._pds_min = _time_to_minutes(programming_day_start)
+        # Insertion order keeps violation messages in zone-list order
+        self._next_order = 0
+        self._order_of: dict[int, int] = {}
+        self._entries: dict[int, tuple[Any, frozenset[str], list[tuple[int, int]]]] = {}
+        # day -> sorted [(start, end, order, part)]
+        self._days: dict[str, list[tuple[int, int, int, int]]] = {d: [] for d in ALL_DAYS}
+        # Longest sub-interval per day bounds the backward scan in conflicts_with
+        self._max_span: dict[str, int] = dict.fromkeys(ALL_DAYS, 0)
+        self._zone_count: dict[str, int] = dict.fromkeys(ALL_DAYS, 0)
+        self._gaps: dict[str, list[tuple[int, int]]] = {}
+        for zone in zones:
+            self.add(zone)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, zone: Any) -> bool:
+        return id(zone) in self._order_of
+
+    def _intervals(self, zone: Any) -> list[tuple[int, int]]:
+        return _normalize_intervals(
+            _time_to_minutes(zone.start_time),
+            _time_to_minutes(zone.end_time),
+            self._pds_min,
+        )
+
+    def add(self, zone: Any) -> None:
+        """Index an enabled zone (disabled zones are ignored)."""
+        if not zone.enabled or id(zone) in self._order_of:
+            return
+        self._insert(zone, _effective_days(zone), self._intervals(zone))
+
+    def _insert(self, zone: Any, days: frozenset[str], intervals: list[tuple[int, int]]) -> None:
+        order = self._next_order
+        self._next_order += 1
+        self._order_of[id(zone)] = order
+        self._entries[order] = (zone, days, intervals)
+        for day in days:
+            spans = self._days[day]
+            for part, (s, e) in enumerate(intervals):
+                insort(spans, (s, e, order, part))
+                self._max_span[day] = max(self._max_span[day], e - s)
+            self._zone_count[day] += 1
+            self._gaps.pop(day, None)
+
+    def remove(self, zone: Any) -> tuple[frozenset[str], list[tuple[int, int]]] | None:
+        """Drop a zone using the days and times it had when it was added.
+
+        Returns what was indexed for it, or None if it was not indexed.
+        """
+        order = self._order_of.pop(id(zone), None)
+        if order is None:
+            return None
+        _, days, intervals = self._entries.pop(order)
+        for day in days:
+            spans = self._days[day]
+            for part, (s, e) in enumerate(intervals):
+                i = bisect_left(spans, (s, e, order, part))
+                del spans[i]
+            self._max_span[day] = max((e - s for s, e, _, _ in spans), default=0)
+            self._zone_count[day] -= 1
+            self._gaps.pop(day, None)
+        return days, intervals
+
+    def conflicts_with(self, zone: Any, *, exclude: Any | None = None) -> list[str]:
+        """Overlap violations between *zone* and the indexed zones.
+
+        *zone* itself (and *exclude*, e.g. the pre-edit version of the same
+        zone) is skipped. O(log n + k) per day via bisection.
+        """
+        if not zone.enabled:
+            return []
+        skip = {self._order_of.get(id(zone)), self._order_of.get(id(exclude))}
+        intervals = self._intervals(zone)
+        days = _effective_days(zone)
+        hits: dict[tuple[int, int, int], tuple[int, int]] = {}
+        for day in days:
+            spans = self._days[day]
+            reach = self._max_span[day]
+            for part, (s, e) in enumerate(intervals):
+                i = bisect_left(spans, (e,)) - 1
+                while i >= 0 and spans[i][0] > s - reach:
+                    o_s, o_e, order, o_part = spans[i]
+                    if order not in skip and o_e > s:
+                        hits[(order, o_part, part)] = (max(s, o_s), min(e, o_e))
+                    i -= 1
+        return [
+            self._overlap_message(self._entries[order][0], zone, hit)
+            for (order, _, _), hit in sorted(hits.items())
+        ]
+
+    def overlap_violations(self) -> list[str]:
+        """All pairwise overlaps on shared days, in zone-list pair order."""
+        hits: dict[tuple[int, int, int, int], tuple[int, int]] = {}
+        for spans in self._days.values():
+            # Sweep by start; heap holds sub-intervals still open at the cursor
+            open_spans: list[tuple[int, int, int, int]] = []
+            for s, e, order, part in spans:
+                while open_spans and open_spans[0][0] <= s:
+                    heappop(open_spans)
+                for o_e, o_order, o_part, o_s in open_spans:
+                    if o_order == order:
+                        continue
+                    if o_order < order:
+                        key = (o_order, order, o_part, part)
+                    else:
+                        key = (order, o_order, part, o_part)
+                    hits[key] = (max(s, o_s), min(e, o_e))
+                heappush(open_spans, (e, order, part, s))
+        return [
+            self._overlap_message(self._entries[i][0], self._entries[j][0], hit)
+            for (i, j, _, _), hit in sorted(hits.items())
+        ]
+
+    def _overlap_message(self, a: Any, b: Any, hit: tuple[int, int]) -> str:
+        days_str = ",".join(sorted(_days_overlap(a, b)))
+        return (
+            f"INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED: "
+            f"zones '{getattr(a, 'name', '?')}' and '{getattr(b, 'name', '?')}' overlap "
+            f"[{_norm_to_wall(hit[0], self._pds_min)}"
+            f"-{_norm_to_wall(hit[1], self._pds_min)}] "
+            f"on days [{days_str}]"
+        )
+
+    def _day_gaps(self, day: str) -> list[tuple[int, int]]:
+        gaps = self._gaps.get(day)
+        if gaps is None:
+            gaps = []
+            covered = 0
+            for s, e, _, _ in self._days[day]:
+                if s > covered:
+                    gaps.append((covered, s))
+                covered = max(covered, e)
+            if covered < _DAY_MINUTES:
+                gaps.append((covered, _DAY_MINUTES))
+            self._gaps[day] = gaps
+        return gaps
+
+    def coverage_violations(self, days: Iterable[str] | None = None) -> list[str]:
+        """Gaps in [0, 1440] on each day any zone applies to (or on *days*)."""
+        if not self._entries:
+            return [
+                "INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
+                "no enabled zones — broadcast day has no coverage"
+            ]
+        plan_days = {d for d, n in self._zone_count.items() if n > 0}
+        if days is not None:
+            plan_days &= set(days)
+        return [
+            f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
+            f"gap on {day} "
+            f"[{_norm_to_wall(s, self._pds_min)}"
+            f"-{_norm_to_wall(e, self._pds_min)}]"
+            for day in sorted(plan_days)
+            for s, e in self._day_gaps(day)
+        ]
+
+
 def check_overlap(
     zones: list[Any],
     programming_day_start: dt_time = dt_time(0, 0),
@@ -133,45 +309,7 @@ def check_overlap(
     Returns a list of violation strings (empty if clean).
     Each violation is tagged with INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED.
     """
-    pds_min = _time_to_minutes(programming_day_start)
-    active = [z for z in zones if z.enabled]
-    violations: list[str] = []
-
-    for i in range(len(active)):
-        for j in range(i + 1, len(active)):
-            a, b = active[i], active[j]
-            shared_days = _days_overlap(a, b)
-            if not shared_days:
-                continue
-
-            a_intervals = _normalize_intervals(
-                _time_to_minutes(a.start_time),
-                _time_to_minutes(a.end_time),
-                pds_min,
-            )
-            b_intervals = _normalize_intervals(
-                _time_to_minutes(b.start_time),
-                _time_to_minutes(b.end_time),
-                pds_min,
-            )
-
-            # Check all sub-interval pairs for overlap
-            for a_s, a_e in a_intervals:
-                for b_s, b_e in b_intervals:
-                    hit = _interval_pair_overlap(a_s, a_e, b_s, b_e)
-                    if hit:
-                        a_name = getattr(a, "name", "?")
-                        b_name = getattr(b, "name", "?")
-                        days_str = ",".join(sorted(shared_days))
-                        violations.append(
-                            f"INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED: "
-                            f"zones '{a_name}' and '{b_name}' overlap "
-                            f"[{_norm_to_wall(hit[0], pds_min)}"
-                            f"-{_norm_to_wall(hit[1], pds_min)}] "
-                            f"on days [{days_str}]"
-                        )
-
-    return violations
+    return ZonePlanIndex(zones, programming_day_start).overlap_violations()
 
 
 def check_coverage(
@@ -185,75 +323,7 @@ def check_coverage(
     Returns a list of violation strings (empty if clean).
     Each violation is tagged with INV-PLAN-FULL-COVERAGE-001-VIOLATED.
     """
-    pds_min = _time_to_minutes(programming_day_start)
-    active = [z for z in zones if z.enabled]
-    if not active:
-        return [
-            "INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
-            "no enabled zones — broadcast day has no coverage"
-        ]
-
-    # Determine which days the plan covers
-    all_plan_days: set[str] = set()
-    for z in active:
-        all_plan_days |= _effective_days(z)
-
-    violations: list[str] = []
-
-    for day in sorted(all_plan_days):
-        # Collect normalized intervals for this day
-        intervals: list[tuple[int, int]] = []
-        for z in active:
-            if day in _effective_days(z):
-                intervals.extend(
-                    _normalize_intervals(
-                        _time_to_minutes(z.start_time),
-                        _time_to_minutes(z.end_time),
-                        pds_min,
-                    )
-                )
-
-        if not intervals:
-            violations.append(
-                f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
-                f"day {day} has no zone coverage at all"
-            )
-            continue
-
-        # Merge intervals and find gaps in [0, 1440]
-        intervals.sort()
-        merged: list[tuple[int, int]] = [intervals[0]]
-        for s, e in intervals[1:]:
-            if s <= merged[-1][1]:
-                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-            else:
-                merged.append((s, e))
-
-        # Check full coverage [0, 1440]
-        if merged[0][0] > 0:
-            violations.append(
-                f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
-                f"gap on {day} "
-                f"[{_norm_to_wall(0, pds_min)}"
-                f"-{_norm_to_wall(merged[0][0], pds_min)}]"
-            )
-        for k in range(len(merged) - 1):
-            if merged[k][1] < merged[k + 1][0]:
-                violations.append(
-                    f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
-                    f"gap on {day} "
-                    f"[{_norm_to_wall(merged[k][1], pds_min)}"
-                    f"-{_norm_to_wall(merged[k + 1][0], pds_min)}]"
-                )
-        if merged[-1][1] < _DAY_MINUTES:
-            violations.append(
-                f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: "
-                f"gap on {day} "
-                f"[{_norm_to_wall(merged[-1][1], pds_min)}"
-                f"-{_norm_to_wall(_DAY_MINUTES, pds_min)}]"
-            )
-
-    return violations
+    return ZonePlanIndex(zones, programming_day_start).coverage_violations()
 
 
 def check_grid_alignment(
@@ -324,12 +394,17 @@ def check_asset_eligibility(
 
     active = [z for z in zones if z.enabled]
     violations: list[str] = []
+    # Plans reuse assets across zones; check each asset once
+    results: dict[str, tuple[bool, str]] = {}
 
     for z in active:
         assets = getattr(z, "schedulable_assets", None) or []
         name = getattr(z, "name", "?")
         for asset_id in assets:
-            is_eligible, reason = asset_eligibility_checker(str(asset_id))
+            key = str(asset_id)
+            if key not in results:
+                results[key] = asset_eligibility_checker(key)
+            is_eligible, reason = results[key]
             if not is_eligible:
                 violations.append(
                     f"INV-PLAN-ELIGIBLE-ASSETS-ONLY-001-VIOLATED: "
@@ -357,11 +432,12 @@ def validate_zone_plan_integrity(
     if grid_violations:
         raise ValueError(grid_violations[0])
 
-    overlap_violations = check_overlap(zones, programming_day_start)
+    index = ZonePlanIndex(zones, programming_day_start)
+    overlap_violations = index.overlap_violations()
     if overlap_violations:
         raise ValueError(overlap_violations[0])
 
-    coverage_violations = check_coverage(zones, programming_day_start)
+    coverage_violations = index.coverage_violations()
     if coverage_violations:
         raise ValueError(coverage_violations[0])
 
@@ -370,10 +446,52 @@ def validate_zone_plan_integrity(
         raise ValueError(eligibility_violations[0])
 
 
+def validate_zone_change(
+    index: ZonePlanIndex,
+    zone: Any,
+    *,
+    replaces: Any | None = None,
+    grid_block_minutes: int | None = None,
+    asset_eligibility_checker: Any | None = None,
+) -> None:
+    """Validate adding *zone* (or replacing *replaces* with it) in an
+    already-valid plan held by *index*, then apply the change to the index.
+
+    Only the edited zone and the days it or *replaces* touch are checked,
+    with the same precedence and messages as validate_zone_plan_integrity.
+    *replaces* may be *zone* itself when it was edited in place; the index
+    still holds its pre-edit times. On ValueError the index keeps the
+    pre-edit plan.
+    """
+    grid_violations = check_grid_alignment([zone], grid_block_minutes)
+    if grid_violations:
+        raise ValueError(grid_violations[0])
+
+    overlap_violations = index.conflicts_with(zone, exclude=replaces)
+    if overlap_violations:
+        raise ValueError(overlap_violations[0])
+
+    previous = index.remove(replaces) if replaces is not None else None
+    touched = set(_effective_days(zone))
+    if previous is not None:
+        touched |= previous[0]
+    index.add(zone)
+    violations = index.coverage_violations(touched)
+    if not violations:
+        violations = check_asset_eligibility([zone], asset_eligibility_checker)
+    if violations:
+        index.remove(zone)
+        if previous is not None:
+            index._insert(replaces, *previous)
+        raise ValueError(violations[0])
+
+
 __all__ = [
+    "ZonePlanIndex",
     "check_asset_eligibility",
     "check_grid_alignment",
     "check_overlap",
     "check_coverage",
+    "validate_zone_change",
     "validate_zone_plan_integrity",
 ]
@@ -9,7 +9,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..domain.entities import Channel, Zone
-from .zone_coverage_check import validate_zone_plan_integrity
+from .zone_coverage_check import ZonePlanIndex, validate_zone_change
 
 # Valid day filter values
 VALID_DAYS = {"MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"}
@@ -182,6 +182,14 @@ def update_zone(
     """
     zone = _resolve_zone(db, zone_identifier)
 
+    # Index the plan as stored, before the zone is edited in place; the
+    # index keeps the zone's pre-edit times for validate_zone_change.
+    plan_zones = db.query(Zone).filter(Zone.plan_id == zone.plan_id).all()
+    channel = db.query(Channel).filter(Channel.id == zone.plan.channel_id).first()
+    pds = channel.programming_day_start if channel else dt_time(0, 0)
+    grid = channel.grid_block_minutes if channel else None
+    index = ZonePlanIndex(plan_zones, pds)
+
     # Update name if provided
     if name is not None:
         _check_name_uniqueness(db, zone.plan_id, name, zone.id)
@@ -235,22 +243,9 @@ def update_zone(
         zone.dst_policy = _validate_dst_policy(dst_policy)
 
     # INV-PLAN-NO-ZONE-OVERLAP-001 / INV-PLAN-FULL-COVERAGE-001 enforcement.
-    # Validate the post-update candidate zone against all siblings.
-    # Migration note: existing plans may violate these invariants — editing
-    # them will fail until coverage/overlap issues are corrected.
-    sibling_zones = (
-        db.query(Zone)
-        .filter(Zone.plan_id == zone.plan_id)
-        .filter(Zone.id != zone.id)
-        .all()
-    )
-    candidate_zones = list(sibling_zones) + [zone]
-    channel = db.query(Channel).filter(Channel.id == zone.plan.channel_id).first()
-    pds = channel.programming_day_start if channel else dt_time(0, 0)
-    grid = channel.grid_block_minutes if channel else None
-    validate_zone_plan_integrity(
-        candidate_zones, programming_day_start=pds, grid_block_minutes=grid
-    )
+    # Check only the edited zone: overlaps with its neighbours and coverage
+    # on the days it applies to now or did before the edit.
+    validate_zone_change(index, zone, replaces=zone, grid_block_minutes=grid)
 
     db.commit()
     db.refresh(zone)
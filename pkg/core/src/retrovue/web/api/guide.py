@@ -0,0 +1,115 @@
+"""
+IPTV guide endpoints: ``/iptv/channels.m3u`` and ``/iptv/guide.xml``.
+
+Both responses are streamed (see retrovue.epg.guide) and carry validators,
+so a client refreshing an unchanged guide gets a 304 without any schedule
+or catalog read.  ``playlist_response`` and ``guide_response`` are shared
+with ProgramDirector, which serves the same documents for its own lineup.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any
+
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from retrovue.epg import guide
+from retrovue.web.api.epg import _load_channels
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/iptv", tags=["guide"])
+
+M3U_MEDIA_TYPE = "audio/x-mpegurl"
+XMLTV_MEDIA_TYPE = "application/xml"
+
+
+def load_catalog_metadata() -> Mapping[str, Any]:
+    """Catalog entries keyed by canonical asset id (one load per guide render)."""
+    from retrovue.infra.uow import session
+    from retrovue.runtime.catalog_resolver import CatalogAssetResolver
+
+    with session() as db:
+        resolver = CatalogAssetResolver(db)
+    return resolver.catalog_entries()
+
+
+def _not_modified(version: guide.GuideVersion) -> Response:
+    return Response(status_code=304, headers=version.headers())
+
+
+def playlist_response(
+    request: Request,
+    channels: list[dict[str, Any]],
+    stream_path: Callable[[str], str],
+    *,
+    guide_path: str | None = None,
+) -> Response:
+    """Stream an M3U playlist; ``stream_path(channel_id)`` is relative to the base URL."""
+    base_url = str(request.base_url).rstrip("/")
+    version = guide.playlist_version(channels, base_url)
+    if guide.is_not_modified(request.headers, version):
+        return _not_modified(version)
+    return StreamingResponse(
+        guide.iter_m3u(
+            channels,
+            lambda cid: base_url + stream_path(cid),
+            guide_url=base_url + guide_path if guide_path else None,
+        ),
+        media_type=M3U_MEDIA_TYPE,
+        headers=version.headers(),
+    )
+
+
+def guide_response(
+    request: Request,
+    channels: list[dict[str, Any]],
+    *,
+    days: int = guide.DEFAULT_GUIDE_DAYS,
+    now: datetime | None = None,
+) -> Response:
+    """Stream an XMLTV guide covering *days* broadcast days of the compiled horizon."""
+    window_start, window_end = guide.guide_window(days, now)
+    try:
+        version = guide.guide_version(
+            [c["channel_id"] for c in channels], window_start, window_end
+        )
+    except Exception as e:
+        # Without validators the guide is still served, just not revalidatable.
+        logger.warning("Guide version lookup failed: %s", e)
+        version = None
+    if version is not None and guide.is_not_modified(request.headers, version):
+        return _not_modified(version)
+    return StreamingResponse(
+        guide.iter_xmltv(channels, window_start, window_end, metadata=load_catalog_metadata),
+        media_type=XMLTV_MEDIA_TYPE,
+        headers=version.headers() if version is not None else {"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/channels.m3u")
+def get_channels_playlist(request: Request) -> Response:
+    """Serve the IPTV channel playlist (points at ``/iptv/channel/{id}.ts``)."""
+    return playlist_response(
+        request,
+        _load_channels(),
+        lambda cid: f"/iptv/channel/{cid}.ts",
+        guide_path="/iptv/guide.xml",
+    )
+
+
+@router.get("/guide.xml")
+def get_guide(
+    request: Request,
+    days: int = Query(default=guide.DEFAULT_GUIDE_DAYS, ge=1, le=guide.MAX_GUIDE_DAYS),
+    channel: str = Query(default=None, description="Channel ID filter"),
+) -> Response:
+    """Serve the XMLTV guide from the compiled horizon."""
+    channels = _load_channels()
+    if channel:
+        channels = [c for c in channels if c["channel_id"] == channel]
+    return guide_response(request, channels, days=days)
@@ -7,17 +7,22 @@ React/Vue SPAs, or any other HTTP client.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import time
 import uuid as uuid_module
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 
 from ...domain.entities import Asset, AssetEditorial, Channel, SchedulePlan, Zone
 from ...infra.uow import session as get_session
+from ...shared.lru_cache import LruCache
 from ...usecases import plan_add, plan_delete, plan_list, plan_update
 from ...usecases import zone_add, zone_delete, zone_list, zone_update
 
@@ -394,48 +399,112 @@ async def delete_zone_endpoint(
 # ============================================================================
 
 
+# Keyset pagination: the listing is ordered by (discovered_at DESC, uuid DESC),
+# served by the partial index ix_assets_schedulable_keyset, and a page after
+# ``cursor`` is a range scan from that key — page N costs the same as page 1.
+# Totals are counted once per filter set and reused for ASSET_COUNT_TTL_S;
+# filter sets come from query strings, so at most ASSET_COUNT_CACHE_SIZE
+# of them are kept.
+ASSET_COUNT_TTL_S = 60.0
+ASSET_COUNT_CACHE_SIZE = 256
+_asset_count_cache: LruCache[tuple[Any, ...], tuple[float, int]] = LruCache(ASSET_COUNT_CACHE_SIZE)
+
+
+def encode_asset_cursor(discovered_at: datetime, asset_uuid: uuid_module.UUID) -> str:
+    """Opaque cursor for the listing position after (discovered_at, uuid)."""
+    raw = json.dumps([discovered_at.isoformat(), str(asset_uuid)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_asset_cursor(cursor: str) -> tuple[datetime, uuid_module.UUID]:
+    """Inverse of encode_asset_cursor.  Raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        discovered_at, asset_uuid = json.loads(raw)
+        return datetime.fromisoformat(discovered_at), uuid_module.UUID(asset_uuid)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _cached_asset_count(key: tuple[Any, ...], count: Any) -> int:
+    """Return the total for *key*, calling ``count()`` at most once per TTL."""
+    now = time.monotonic()
+    hit = _asset_count_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    total = count()
+    _asset_count_cache.put(key, (now + ASSET_COUNT_TTL_S, total))
+    return total
+
+
+def _schedulable_assets_query(
+    db: Session,
+    content_class: str | None,
+    daypart_profile: str | None,
+    genre: str | None,
+):
+    query = (
+        db.query(Asset, AssetEditorial)
+        .outerjoin(AssetEditorial, Asset.uuid == AssetEditorial.asset_uuid)
+        .filter(Asset.state == "ready")
+        .filter(Asset.approved_for_broadcast == True)  # noqa: E712
+        .filter(Asset.is_deleted == False)  # noqa: E712
+    )
+
+    # Editorial filters as one JSONB containment test (GIN ix_asset_editorial_payload)
+    wanted: dict[str, Any] = {}
+    if content_class:
+        wanted["content_class"] = content_class
+    if daypart_profile:
+        wanted["daypart_profile"] = daypart_profile
+    if genre:
+        # Genre is stored as an array in JSONB
+        wanted["genres"] = [genre]
+    if wanted:
+        query = query.filter(AssetEditorial.payload.contains(wanted))
+    return query
+
+
 @router.get("/assets")
 async def list_assets(
     content_class: str | None = Query(None, description="Filter by content class (cartoon, sitcom, movie, etc.)"),
     daypart_profile: str | None = Query(None, description="Filter by daypart profile (morning, prime, late_night, etc.)"),
     genre: str | None = Query(None, description="Filter by genre"),
     limit: int = Query(50, ge=1, le=200, description="Maximum results to return"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(None, description="Opaque next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor (OFFSET cost grows with depth)"),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """
     List assets available for scheduling, with optional filters.
 
     This endpoint powers the content browser sidebar in the schedule builder UI.
+    Pass ``next_cursor`` from a response as ``cursor`` to fetch the next page;
+    ``next_cursor`` is null on the last page.  ``total`` may lag by up to
+    ASSET_COUNT_TTL_S seconds.
     """
-    query = (
-        db.query(Asset, AssetEditorial)
-        .outerjoin(AssetEditorial, Asset.uuid == AssetEditorial.asset_uuid)
-        .filter(Asset.state == "ready")
-        .filter(Asset.approved_for_broadcast == True)  # noqa: E712
-        .filter(Asset.is_deleted == False)  # noqa: E712
+    query = _schedulable_assets_query(db, content_class, daypart_profile, genre)
+
+    total = _cached_asset_count(
+        (content_class, daypart_profile, genre),
+        lambda: query.with_entities(func.count(Asset.uuid)).order_by(None).scalar() or 0,
     )
 
-    # Apply filters based on editorial metadata
-    if content_class or daypart_profile or genre:
-        # Filter using JSONB payload fields
-        if content_class:
-            query = query.filter(
-                AssetEditorial.payload["content_class"].astext == content_class
-            )
-        if daypart_profile:
-            query = query.filter(
-                AssetEditorial.payload["daypart_profile"].astext == daypart_profile
-            )
-        if genre:
-            # Genre is stored as an array in JSONB
-            query = query.filter(
-                AssetEditorial.payload["genres"].contains([genre])
-            )
-
-    # Apply pagination
-    total = query.count()
-    assets = query.order_by(Asset.discovered_at.desc()).offset(offset).limit(limit).all()
+    page = query.order_by(Asset.discovered_at.desc(), Asset.uuid.desc())
+    if cursor:
+        try:
+            after = decode_asset_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        page = page.filter(tuple_(Asset.discovered_at, Asset.uuid) < after)
+    elif offset:
+        page = page.offset(offset)
+    rows = page.limit(limit + 1).all()
+    assets = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = assets[-1][0]
+        next_cursor = encode_asset_cursor(last.discovered_at, last.uuid)
 
     # Format response
     items = []
@@ -459,6 +528,7 @@ async def list_assets(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -25,6 +25,7 @@ from retrovue.streaming.ffmpeg_cmd import build_cmd
 from retrovue.streaming.mpegts_stream import MPEGTSStreamer
 from retrovue.web.api.scheduling import router as scheduling_router
 from retrovue.web.api.epg import router as epg_router
+from retrovue.web.api.guide import router as guide_router
 
 logger = logging.getLogger(__name__)
 
@@ -253,6 +254,7 @@ def run_server(port: int = 8000, active_streams: dict | None = None, debug: bool
     # Include scheduling API routes
     app.include_router(scheduling_router)
     app.include_router(epg_router)
+    app.include_router(guide_router)
 
     @app.middleware("http")
     async def streaming_headers(request: Request, call_next):
@@ -267,11 +269,10 @@ def run_server(port: int = 8000, active_streams: dict | None = None, debug: bool
             # Ensure no compression for .ts files
             resp.headers["Content-Encoding"] = "identity"
         elif request.url.path.endswith(".m3u"):
-            # IPTV playlists should not be cached
-            resp.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            resp.headers["Pragma"] = "no-cache"
-            resp.headers["Expires"] = "0"
-            resp.headers["Content-Type"] = "application/vnd.apple.mpegurl"
+            # IPTV playlists are always revalidated (ETag), never served stale
+            resp.headers["Cache-Control"] = "no-cache"
+            if resp.status_code != 304:
+                resp.headers["Content-Type"] = "application/vnd.apple.mpegurl"
         return resp
 
     # Set up Jinja2 templates - use package-relative path
@@ -438,24 +439,6 @@ def run_server(port: int = 8000, active_streams: dict | None = None, debug: bool
             logger.error(f"Error streaming channel {channel_id}: {e}")
             return {"error": f"Failed to stream channel {channel_id}: {str(e)}"}
 
-    @app.get("/iptv/channels.m3u")
-    async def get_channels_playlist():
-        """
-        Serve IPTV channels playlist.
-        TODO: Implement M3U playlist generation
-        """
-        # TODO: Generate M3U playlist from active channels
-        return {"message": "M3U playlist endpoint - TODO"}
-
-    @app.get("/iptv/guide.xml")
-    async def get_guide():
-        """
-        Serve XMLTV guide.
-        TODO: Implement XMLTV guide generation
-        """
-        # TODO: Generate XMLTV guide from channel schedule
-        return {"message": "XMLTV guide endpoint - TODO"}
-
     @app.get("/")
     async def root():
         return {"message": "Retrovue IPTV Server", "status": "ready"}
@@ -3,9 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from retrovue.adapters.enrichers.ffprobe_enricher import FFprobeEnricher
 from retrovue.adapters.importers.base import DiscoveredItem
 
+pytestmark = pytest.mark.usefixtures("isolated_probe_cache")
+
 
 def test_ffprobe_enricher_preserves_editorial_and_adds_probed(tmp_path: Path, monkeypatch: Any) -> None:
     # Create a temporary media file to satisfy existence checks
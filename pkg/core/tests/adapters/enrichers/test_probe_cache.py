@@ -0,0 +1,112 @@
+"""Tests for the persistent probe-result cache and its use by enrichers.
+
+Verifies:
+- Unchanged files are served from the cache; size/mtime changes miss
+- A content hash finds results recorded under another path
+- FFprobeEnricher and LoudnessEnricher only run their tool on a miss
+- Loudness gain is recomputed from the cached integrated value
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from retrovue.adapters.enrichers.ffprobe_enricher import FFprobeEnricher
+from retrovue.adapters.enrichers.loudness_enricher import LoudnessEnricher
+from retrovue.adapters.enrichers.probe_cache import ProbeCache
+from retrovue.adapters.importers.base import DiscoveredItem
+
+FFPROBE_JSON = {
+    "format": {"duration": "60.0", "format_name": "matroska"},
+    "streams": [{"codec_type": "video", "codec_name": "h264", "width": 640, "height": 480}],
+}
+
+EBUR128_STDERR = "[Parsed_ebur128_0 @ 0x1] Summary:\n\n  Integrated loudness:\n    I:         -20.0 LUFS\n"
+
+
+def _media(tmp_path: Path, name: str = "a.mkv", data: bytes = b"\x00" * 16) -> Path:
+    p = tmp_path / name
+    p.write_bytes(data)
+    return p
+
+
+class TestProbeCache:
+    def test_hit_until_file_changes(self, tmp_path: Path) -> None:
+        cache = ProbeCache(tmp_path / "cache.sqlite3")
+        media = _media(tmp_path)
+
+        assert cache.get("ffprobe", media) is None
+        cache.put("ffprobe", media, {"x": 1})
+        assert cache.get("ffprobe", media) == {"x": 1}
+        assert cache.get("ffprobe", media, variant="other") is None
+
+        st = media.stat()
+        os.utime(media, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache.get("ffprobe", media) is None
+
+    def test_content_hash_follows_moved_file(self, tmp_path: Path) -> None:
+        cache = ProbeCache(tmp_path / "cache.sqlite3")
+        old = _media(tmp_path, "old.mkv")
+        cache.put("ffprobe", old, {"x": 1}, sha256="abc")
+
+        new = _media(tmp_path, "new.mkv")
+        assert cache.get("ffprobe", new) is None
+        assert cache.get("ffprobe", new, sha256="abc") == {"x": 1}
+        # Re-keyed: the new path now hits without the hash
+        assert cache.get("ffprobe", new) == {"x": 1}
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        cache = ProbeCache(tmp_path / "cache.sqlite3")
+        media = _media(tmp_path)
+        cache.put("ffprobe", media, {"x": 1})
+        cache.put("loudness", media, {"integrated_lufs": -20.0})
+
+        assert cache.invalidate(media, kind="ffprobe") == 1
+        assert cache.get("ffprobe", media) is None
+        assert cache.get("loudness", media) is not None
+
+
+class TestEnrichersUseCache:
+    def test_ffprobe_runs_once_for_unchanged_file(self, tmp_path: Path, monkeypatch: Any) -> None:
+        calls: list[Path] = []
+
+        def _fake_run(self: FFprobeEnricher, file_path: Path) -> dict[str, Any]:
+            calls.append(file_path)
+            return FFPROBE_JSON
+
+        monkeypatch.setattr(FFprobeEnricher, "_run_ffprobe", _fake_run)
+        enricher = FFprobeEnricher(use_cache=False)
+        enricher.cache = ProbeCache(tmp_path / "cache.sqlite3")
+        item = DiscoveredItem(path_uri=str(_media(tmp_path)), provider_key="k")
+
+        first = enricher.enrich(item)
+        second = enricher.enrich(item)
+
+        assert len(calls) == 1
+        assert first.probed == second.probed
+        assert second.probed["duration_ms"] == 60000
+
+    @patch("retrovue.adapters.enrichers.loudness_enricher.subprocess.run")
+    def test_loudness_measured_once_and_gain_recomputed(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stderr=EBUR128_STDERR)
+        enricher = LoudnessEnricher(use_cache=False)
+        enricher.cache = ProbeCache(tmp_path / "cache.sqlite3")
+        media = str(_media(tmp_path))
+
+        first = enricher.measure_loudness(media)
+        with patch("retrovue.adapters.enrichers.loudness_enricher.TARGET_LUFS", -23.0):
+            second = enricher.measure_loudness(media)
+
+        assert mock_run.call_count == 1
+        assert first["gain_db"] == -4.0
+        assert second["integrated_lufs"] == -20.0
+        assert second["gain_db"] == -3.0
+
+    def test_use_cache_false_disables(self) -> None:
+        assert FFprobeEnricher(use_cache=False).cache is None
+        assert LoudnessEnricher(use_cache=False).cache is None
@@ -0,0 +1,164 @@
+"""Fake Plex Media Server for importer tests.
+
+Serves a small in-memory library over real HTTP so PlexClient exercises
+paging headers, flattened endpoints and updatedAt filters end to end.
+
+    sections:  "1" (show library), "2" (movie library)
+    endpoints: /library/sections, /library/sections/{key}/all,
+               /library/metadata/{key}, /library/metadata/{key}/allLeaves
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import quoteattr
+
+import pytest
+
+
+@dataclass
+class FakePlexLibrary:
+    """Mutable library content plus request accounting."""
+
+    shows: dict[str, dict] = field(default_factory=dict)  # rk -> {title, episodes: [...]}
+    movies: list[dict] = field(default_factory=list)
+    requests: list[str] = field(default_factory=list)
+    latency_s: float = 0.0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_show(self, rk: str, title: str, seasons: int, episodes: int, updated_at: int = 1000):
+        eps = []
+        for s in range(1, seasons + 1):
+            for e in range(1, episodes + 1):
+                eps.append({
+                    "ratingKey": f"{rk}{s:02d}{e:02d}",
+                    "title": f"{title} S{s}E{e}",
+                    "type": "episode",
+                    "grandparentTitle": title,
+                    "parentTitle": f"Season {s}",
+                    "parentIndex": str(s),
+                    "index": str(e),
+                    "updatedAt": str(updated_at),
+                    "file": f"/media/{title}/S{s:02d}E{e:02d}.mkv",
+                })
+        self.shows[rk] = {"title": title, "episodes": eps}
+
+    def all_episodes(self) -> list[dict]:
+        return [ep for show in self.shows.values() for ep in show["episodes"]]
+
+    def find(self, rk: str) -> dict | None:
+        for v in self.all_episodes() + self.movies:
+            if v["ratingKey"] == rk:
+                return v
+        return None
+
+
+def _video_xml(v: dict) -> str:
+    attrs = " ".join(
+        f"{k}={quoteattr(str(val))}" for k, val in v.items() if k != "file" and val is not None
+    )
+    return (
+        f"<Video {attrs}><Media duration=\"1320000\">"
+        f"<Part file={quoteattr(v['file'])} size=\"1000\"/></Media></Video>"
+    )
+
+
+def _make_handler(lib: FakePlexLibrary):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # keep pytest output quiet
+            pass
+
+        def _send(self, body: str, status: int = 200):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _container(self, children: list[str], **attrs) -> str:
+            start = int(self.headers.get("X-Plex-Container-Start", 0))
+            size = self.headers.get("X-Plex-Container-Size")
+            page = children[start:] if size is None else children[start:start + int(size)]
+            extra = " ".join(f"{k}={quoteattr(str(v))}" for k, v in attrs.items())
+            return (
+                f"<MediaContainer size=\"{len(page)}\" totalSize=\"{len(children)}\" "
+                f"offset=\"{start}\" {extra}>{''.join(page)}</MediaContainer>"
+            )
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            q = {k: v[0] for k, v in parse_qs(url.query).items()}
+            with lib.lock:
+                lib.requests.append(url.path)
+                lib.in_flight += 1
+                lib.max_in_flight = max(lib.max_in_flight, lib.in_flight)
+            try:
+                if lib.latency_s:
+                    time.sleep(lib.latency_s)
+                self._route(url.path, q)
+            finally:
+                with lib.lock:
+                    lib.in_flight -= 1
+
+        def _route(self, path: str, q: dict):
+            since = int(q.get("updatedAt>>", 0))
+
+            def _fresh(vs):
+                return [v for v in vs if int(v["updatedAt"]) >= since]
+
+            if path == "/library/sections":
+                return self._send(
+                    "<MediaContainer>"
+                    "<Directory key=\"1\" title=\"TV\" type=\"show\"><Location path=\"/media\"/></Directory>"
+                    "<Directory key=\"2\" title=\"Movies\" type=\"movie\"/>"
+                    "</MediaContainer>"
+                )
+            m = re.fullmatch(r"/library/sections/(\d+)/all", path)
+            if m and m.group(1) == "1":
+                if q.get("type") == "4":
+                    kids = [_video_xml(v) for v in _fresh(lib.all_episodes())]
+                else:
+                    kids = [
+                        f"<Directory ratingKey={quoteattr(rk)} title={quoteattr(s['title'])} type=\"show\"/>"
+                        for rk, s in lib.shows.items()
+                    ]
+                return self._send(self._container(kids, viewGroup="show"))
+            if m and m.group(1) == "2":
+                kids = [_video_xml(v) for v in _fresh(lib.movies)]
+                return self._send(self._container(kids, viewGroup="movie"))
+            m = re.fullmatch(r"/library/metadata/(\w+)/allLeaves", path)
+            if m and m.group(1) in lib.shows:
+                kids = [_video_xml(v) for v in _fresh(lib.shows[m.group(1)]["episodes"])]
+                return self._send(self._container(kids))
+            m = re.fullmatch(r"/library/metadata/(\w+)", path)
+            if m and lib.find(m.group(1)):
+                v = dict(lib.find(m.group(1)), summary="A summary")
+                return self._send(f"<MediaContainer>{_video_xml(v)}</MediaContainer>")
+            return self._send("<MediaContainer/>", status=404)
+
+    return Handler
+
+
+@pytest.fixture
+def fake_plex():
+    """Yield (base_url, FakePlexLibrary) for a live fake Plex server."""
+    lib = FakePlexLibrary()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(lib))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", lib
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,144 @@
+"""Tests for FilesystemImporter's scandir walker and scan manifest.
+
+Verifies:
+- Glob patterns match per path component, ``**`` spans zero or more dirs
+- Each file is emitted once even when several patterns match it
+- Hidden entries are pruned; sidecars come from the directory listing
+- Unchanged files are skipped once a manifest is committed
+- A changed file, sidecar or scan context re-emits the file
+- discover() alone never writes the manifest (INV-SCAN-MANIFEST-COMMIT-001)
+"""
+
+from __future__ import annotations
+
+import os
+
+from retrovue.adapters.importers.filesystem_importer import (
+    FilesystemImporter,
+    _glob_match,
+    _split_glob,
+)
+from retrovue.adapters.importers.scan_manifest import ScanManifest
+
+
+def _touch(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _importer(root, manifest=None, **kw):
+    imp = FilesystemImporter(
+        source_name="test",
+        root_paths=[str(root)],
+        manifest_path=str(manifest) if manifest else None,
+        **kw,
+    )
+    imp.set_scan_context("ctx")
+    return imp
+
+
+def _names(items):
+    return sorted(os.path.basename(i.provider_key) for i in items)
+
+
+class TestGlobMatch:
+    def test_double_star_spans_zero_or_more_dirs(self):
+        pat = _split_glob("**/*.mp4")
+        assert _glob_match(pat, ("a.mp4",))
+        assert _glob_match(pat, ("x", "y", "a.mp4"))
+        assert not _glob_match(pat, ("x", "a.mkv"))
+
+    def test_star_does_not_cross_directories(self):
+        pat = _split_glob("*.mp4")
+        assert _glob_match(pat, ("a.mp4",))
+        assert not _glob_match(pat, ("x", "a.mp4"))
+
+    def test_trailing_double_star_matches_no_files(self):
+        assert _split_glob("media/**") is None
+
+
+class TestWalker:
+    def test_single_emission_and_hidden_pruning(self, tmp_path):
+        _touch(tmp_path / "Show" / "ep1.mp4")
+        _touch(tmp_path / "top.mp4")
+        _touch(tmp_path / ".cache" / "junk.mp4")
+        _touch(tmp_path / "Show" / ".partial.mp4")
+        _touch(tmp_path / "notes.txt")
+        imp = _importer(tmp_path, glob_patterns=["**/*.mp4", "**/ep*.mp4"])
+        assert _names(imp.discover()) == ["ep1.mp4", "top.mp4"]
+
+    def test_sidecar_from_listing(self, tmp_path):
+        _touch(tmp_path / "a.mkv")
+        _touch(tmp_path / "a.mkv.json", '{"title": "Side"}')
+        (item,) = _importer(tmp_path).discover()
+        assert item.sidecar == {"title": "Side"}
+
+    def test_depth_bounded_patterns(self, tmp_path):
+        _touch(tmp_path / "a.mp4")
+        _touch(tmp_path / "deep" / "b.mp4")
+        assert _names(_importer(tmp_path, glob_patterns=["*.mp4"]).discover()) == ["a.mp4"]
+
+
+class TestManifest:
+    def test_unchanged_files_skipped_after_commit(self, tmp_path):
+        root, manifest = tmp_path / "media", tmp_path / "scan.json"
+        _touch(root / "a.mp4")
+        _touch(root / "b.mp4")
+
+        imp = _importer(root, manifest)
+        assert len(imp.discover()) == 2
+        assert not manifest.exists()  # INV-SCAN-MANIFEST-COMMIT-001
+        assert imp.commit_scan_manifest()
+
+        imp = _importer(root, manifest)
+        assert imp.discover() == []
+
+        _touch(root / "c.mp4")
+        _bump_mtime(root / "a.mp4")
+        assert _names(imp.discover()) == ["a.mp4", "c.mp4"]
+
+    def test_uncommitted_scan_is_re_emitted(self, tmp_path):
+        root, manifest = tmp_path / "media", tmp_path / "scan.json"
+        _touch(root / "a.mp4")
+        imp = _importer(root, manifest)
+        imp.discover()
+        imp.commit_scan_manifest()
+
+        _touch(root / "b.mp4")
+        assert _names(imp.discover()) == ["b.mp4"]
+        # Ingest failed: nothing committed, so b.mp4 comes back.
+        assert _names(imp.discover()) == ["b.mp4"]
+
+    def test_sidecar_change_re_emits(self, tmp_path):
+        root, manifest = tmp_path / "media", tmp_path / "scan.json"
+        _touch(root / "a.mp4")
+        imp = _importer(root, manifest)
+        imp.discover()
+        imp.commit_scan_manifest()
+
+        _touch(root / "a.mp4.yaml", "title: New\n")
+        (item,) = imp.discover()
+        assert item.sidecar == {"title": "New"}
+
+    def test_context_change_forces_full_scan(self, tmp_path):
+        root, manifest = tmp_path / "media", tmp_path / "scan.json"
+        _touch(root / "a.mp4")
+        imp = _importer(root, manifest)
+        imp.discover()
+        imp.commit_scan_manifest()
+
+        imp.set_scan_context("other-pipeline")
+        assert _names(imp.discover()) == ["a.mp4"]
+        imp.set_scan_context(None)
+        assert _names(imp.discover()) == ["a.mp4"]
+        assert not imp.commit_scan_manifest()
+
+    def test_corrupt_manifest_loads_empty(self, tmp_path):
+        manifest = _touch(tmp_path / "scan.json", "{not json")
+        assert ScanManifest.load(manifest).entries == {}
@@ -0,0 +1,98 @@
+"""Tests for the paginated, concurrent Plex crawler (against a fake Plex server).
+
+Verifies:
+- A TV library is read from the flattened episode listing, not per season
+- Every page of a container is fetched, pages after the first concurrently
+- Title-scoped crawls use allLeaves per matching show
+- updatedAt sync state limits later discovery to changed items
+- Sync state is only written by commit_scan_manifest()
+"""
+
+from __future__ import annotations
+
+from retrovue.adapters.importers.plex_importer import PlexClient, PlexImporter
+
+
+def _client(base_url, **kw):
+    return PlexClient(base_url, "tok", **kw)
+
+
+class TestCrawl:
+    def test_show_library_uses_flattened_pages(self, fake_plex):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=3, episodes=10)
+        lib.add_show("20", "Beta", seasons=2, episodes=5)
+
+        items = _client(base_url, page_size=7).get_library_items("1", library_type="show")
+
+        assert len(items) == 40
+        assert {i["show_title"] for i in items} == {"Alpha", "Beta"}
+        first = next(i for i in items if i["ratingKey"] == "100203")
+        assert (first["season_index"], first["episode_index"]) == ("2", "3")
+        # ceil(40 / 7) pages, no per-show or per-season requests
+        assert lib.requests.count("/library/sections/1/all") == 6
+        assert not any("/children" in r for r in lib.requests)
+
+    def test_pages_fetched_concurrently(self, fake_plex):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=4, episodes=10)
+        lib.latency_s = 0.05
+
+        items = _client(base_url, page_size=5, pool_size=4).get_library_items(
+            "1", library_type="show"
+        )
+
+        assert len(items) == 40
+        assert lib.max_in_flight > 1
+
+    def test_title_filter_uses_all_leaves(self, fake_plex):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=2, episodes=3)
+        lib.add_show("20", "Beta", seasons=2, episodes=3)
+
+        items = _client(base_url).get_library_items(
+            "1", title_filter="alp", season_filter=2, library_type="show"
+        )
+
+        assert [i["episode_index"] for i in items] == ["1", "2", "3"]
+        assert "/library/metadata/10/allLeaves" in lib.requests
+        assert "/library/metadata/20/allLeaves" not in lib.requests
+
+    def test_library_type_detected_when_unknown(self, fake_plex):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=1, episodes=2)
+        assert len(_client(base_url).get_library_items("1")) == 2
+
+
+class TestIncrementalSync:
+    def test_only_updated_items_after_commit(self, fake_plex, tmp_path):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=1, episodes=4)
+        for i, ep in enumerate(lib.shows["10"]["episodes"]):
+            ep["updatedAt"] = str(1000 + i)
+
+        imp = PlexImporter(base_url, "tok", manifest_path=str(tmp_path))
+        imp.library_key = "1"
+        imp.set_scan_context("ctx")
+
+        assert len(imp.discover()) == 4
+        assert not list(tmp_path.iterdir())
+        assert imp.commit_scan_manifest()
+
+        lib.shows["10"]["episodes"][0]["updatedAt"] = "2000"
+        changed = imp.discover()
+        # The high-water mark (1003) is inclusive, so its own item is re-read.
+        assert {d.provider_key for d in changed} == {"100101", "100104"}
+
+    def test_context_change_forces_full_sync(self, fake_plex, tmp_path):
+        base_url, lib = fake_plex
+        lib.add_show("10", "Alpha", seasons=1, episodes=3, updated_at=1000)
+
+        imp = PlexImporter(base_url, "tok", manifest_path=str(tmp_path))
+        imp.library_key = "1"
+        imp.set_scan_context("ctx")
+        imp.discover()
+        imp.commit_scan_manifest()
+
+        imp.set_scan_context("other")
+        assert len(imp.discover()) == 3
@@ -51,3 +51,11 @@ def _force_test_db(monkeypatch):
 
     # optional: make get_engine() return the test engine when called again
     monkeypatch.setattr(db_module, "get_engine", lambda for_test=False, db_url=None: engine)
+
+
+@pytest.fixture
+def isolated_probe_cache(monkeypatch, tmp_path):
+    """Point the process-wide probe cache at a per-test file, not the user's cache."""
+    path = tmp_path / "probe-cache.sqlite3"
+    monkeypatch.setenv("RETROVUE_PROBE_CACHE", str(path))
+    return path
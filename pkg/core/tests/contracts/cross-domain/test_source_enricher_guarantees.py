@@ -8,10 +8,13 @@ transactional integrity, and proper error handling across domains.
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from retrovue.cli.main import app
 
+pytestmark = pytest.mark.usefixtures("isolated_probe_cache")
+
 
 class TestSourceEnricherGuarantees:
     """Test Source ↔ Enricher cross-domain guarantees (G-#)."""
@@ -142,12 +142,14 @@ class TestInvChannelStartupNonblocking001:
         it MUST return without recompilation.
         """
         from retrovue.runtime.dsl_schedule_service import DslScheduleService
+        from retrovue.runtime.loudness_queue import LoudnessQueue
 
         # Create a real DslScheduleService with a minimal DSL
         svc = DslScheduleService(
             dsl_path="/dev/null",
             filler_path="/opt/retrovue/assets/filler.mp4",
             filler_duration_ms=3_650_000,
+            loudness_queue=LoudnessQueue(":memory:"),
         )
 
         # Pre-populate blocks to simulate a previously loaded schedule
@@ -194,7 +194,6 @@ class TestRule2HelpersAcceptDbParam:
         "_batch_block_exists_in_txlog",
         "_fill_ads",
         "_write_to_txlog",
-        "_purge_expired_tier2",
     ])
     def test_method_accepts_db_param(self, method_name):
         """Each DB helper MUST accept an optional `db` keyword argument."""
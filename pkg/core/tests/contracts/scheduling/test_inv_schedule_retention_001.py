@@ -3,6 +3,7 @@ Contract tests for INV-SCHEDULE-RETENTION-001: Schedule data lifecycle and reten
 
 Tier 1 (CompiledProgramLog) retains only rows where broadcast_day >= today - 1.
 Tier 2 (TransmissionLog) retains only rows where end_utc_ms > now - 4 hours.
+Both are purged by one process-wide ScheduleRetentionJob in bounded batches.
 _save_compiled_schedule correctly upserts on (channel_id, broadcast_day).
 _hydrate_schedule slow path backfills segmented_blocks into the DB row.
 """
@@ -13,7 +14,10 @@ from unittest.mock import MagicMock, patch, call
 
 import pytest
 
+from sqlalchemy.dialects import postgresql
+
 from retrovue.runtime.dsl_schedule_service import DslScheduleService
+from retrovue.runtime.schedule_retention import ScheduleRetentionJob
 
 
 # ---------------------------------------------------------------------------
@@ -28,136 +32,101 @@ def _build_service_for_purge() -> DslScheduleService:
     svc._compiled_days = set()
     svc._extending = False
     svc._channel_slug = "test-channel"
-    svc._last_tier1_purge_utc_ms = 0
     return svc
 
 
 # ---------------------------------------------------------------------------
-# Tier 1 Purge
+# Retention job (both tiers, batched)
 # ---------------------------------------------------------------------------
 
 
-class TestPurgeExpiredTier1:
-    """INV-SCHEDULE-RETENTION-001: Tier 1 purge deletes stale broadcast days."""
-
-    def test_deletes_rows_older_than_cutoff(self):
-        """Rows with broadcast_day < today - 1 MUST be deleted."""
-        svc = _build_service_for_purge()
-
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filtered = MagicMock()
-        mock_query.filter.return_value = mock_filtered
-        mock_filtered.delete.return_value = 5  # 5 rows purged
-
-        with patch("retrovue.runtime.dsl_schedule_service.session") as mock_session:
-            mock_session.return_value.__enter__ = MagicMock(return_value=mock_db)
-            mock_session.return_value.__exit__ = MagicMock(return_value=False)
-
-            count = svc._purge_expired_tier1()
-
-        assert count == 5, (
-            "INV-SCHEDULE-RETENTION-001 violated: purge should return count of deleted rows"
-        )
-        mock_db.query.assert_called_once()
-        mock_filtered.delete.assert_called_once()
-
-    def test_respects_hourly_throttle(self):
-        """Purge MUST NOT run more than once per hour."""
-        svc = _build_service_for_purge()
-
-        # Simulate last purge was 30 minutes ago
-        now_ms = int(datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp() * 1000)
-        thirty_min_ago_ms = now_ms - (30 * 60 * 1000)
-        svc._last_tier1_purge_utc_ms = thirty_min_ago_ms
-
-        with patch("retrovue.runtime.dsl_schedule_service.session") as mock_session:
-            count = svc._purge_expired_tier1(now_utc_ms=now_ms)
-
-        assert count == 0, (
-            "INV-SCHEDULE-RETENTION-001 violated: purge fired within throttle window"
-        )
-        # session() should NOT have been called
-        mock_session.assert_not_called()
-
-    def test_runs_after_throttle_expires(self):
-        """Purge MUST run after the 1-hour throttle window expires."""
-        svc = _build_service_for_purge()
-
-        now_ms = int(datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp() * 1000)
-        two_hours_ago_ms = now_ms - (2 * 3600 * 1000)
-        svc._last_tier1_purge_utc_ms = two_hours_ago_ms
-
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filtered = MagicMock()
-        mock_query.filter.return_value = mock_filtered
-        mock_filtered.delete.return_value = 0
-
-        with patch("retrovue.runtime.dsl_schedule_service.session") as mock_session:
-            mock_session.return_value.__enter__ = MagicMock(return_value=mock_db)
-            mock_session.return_value.__exit__ = MagicMock(return_value=False)
-
-            count = svc._purge_expired_tier1(now_utc_ms=now_ms)
-
-        mock_db.query.assert_called_once()
-
-
-# ---------------------------------------------------------------------------
-# Tier 2 Purge
-# ---------------------------------------------------------------------------
-
-
-class TestPurgeExpiredTier2:
-    """INV-SCHEDULE-RETENTION-001: Tier 2 purge deletes stale transmission log rows."""
-
-    def test_deletes_rows_older_than_4h(self):
-        """Rows with end_utc_ms <= now - 4h MUST be deleted."""
+class _FakeSession:
+    """session() stand-in recording each batch's DELETE filter."""
+
+    def __init__(self, *delete_counts: int):
+        self.counts = list(delete_counts)
+        self.filters: list = []
+        self.opened = 0
+
+    def __call__(self):
+        self.opened += 1
+        db = MagicMock()
+
+        def _filter(clause):
+            self.filters.append(clause)
+            q = MagicMock()
+            q.delete.return_value = self.counts.pop(0)
+            return q
+
+        db.query.return_value.filter.side_effect = _filter
+        session = MagicMock()
+        session.__enter__ = MagicMock(return_value=db)
+        session.__exit__ = MagicMock(return_value=False)
+        return session
+
+
+def _job(fake: _FakeSession, batch_size: int = 100) -> ScheduleRetentionJob:
+    return ScheduleRetentionJob(
+        batch_size=batch_size,
+        session_factory=fake,
+        today=lambda: date(2026, 3, 10),
+        sleep=lambda _: None,
+    )
+
+
+class TestScheduleRetentionJob:
+    """INV-SCHEDULE-RETENTION-001: one process-wide job purges both tiers."""
+
+    NOW_MS = int(datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+    def test_purges_both_tiers_with_cutoffs(self):
+        """Tier 1 rows with broadcast_day < today - 1 and Tier 2 rows with
+        end_utc_ms <= now - 4h MUST be deleted, for all channels."""
+        fake = _FakeSession(5, 10)
+        report = _job(fake).purge_once(now_utc_ms=self.NOW_MS)
+
+        assert (report.tier1_rows, report.tier2_rows, report.batches) == (5, 10, 2)
+        tier1_sql = str(fake.filters[0].compile(dialect=postgresql.dialect(),
+                                                compile_kwargs={"literal_binds": True}))
+        tier2_sql = str(fake.filters[1].compile(dialect=postgresql.dialect(),
+                                                compile_kwargs={"literal_binds": True}))
+        assert "broadcast_day < '2026-03-09'" in tier1_sql
+        assert f"end_utc_ms <= {self.NOW_MS - 4 * 3_600_000}" in tier2_sql
+        assert "channel" not in tier1_sql and "channel" not in tier2_sql
+
+    def test_deletes_in_bounded_batches(self):
+        """Each DELETE MUST be bounded and skip rows locked by writers; the
+        job keeps going until a batch comes back short."""
+        fake = _FakeSession(100, 100, 7, 100, 0)
+        report = _job(fake, batch_size=100).purge_once(now_utc_ms=self.NOW_MS)
+
+        assert report.tier1_rows == 207
+        assert report.tier2_rows == 100
+        assert report.batches == 5
+        # One short transaction per batch
+        assert fake.opened == 5
+        sql = str(fake.filters[0].compile(dialect=postgresql.dialect()))
+        assert "LIMIT" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+    def test_reports_throughput(self):
+        fake = _FakeSession(3, 4)
+        job = _job(fake)
+        report = job.purge_once(now_utc_ms=self.NOW_MS)
+        assert job.last_report is report
+        assert report.rows == 7
+        assert report.rows_per_sec >= 0
+
+    def test_rejects_non_positive_batch(self):
+        with pytest.raises(ValueError):
+            ScheduleRetentionJob(batch_size=0)
+
+    def test_per_channel_services_do_not_purge(self):
+        """Purging moved out of the per-channel services."""
         from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
 
-        daemon = PlaylogHorizonDaemon.__new__(PlaylogHorizonDaemon)
-        daemon._channel_id = "test-channel"
-        daemon._last_tier2_purge_utc_ms = 0
-        daemon._lock = threading.Lock()
-        daemon._clock = None
-
-        mock_db = MagicMock()
-        mock_query = MagicMock()
-        mock_db.query.return_value = mock_query
-        mock_filtered = MagicMock()
-        mock_query.filter.return_value = mock_filtered
-        mock_filtered.delete.return_value = 10
-
-        with patch("retrovue.infra.uow.session") as mock_session:
-            mock_session.return_value.__enter__ = MagicMock(return_value=mock_db)
-            mock_session.return_value.__exit__ = MagicMock(return_value=False)
-
-            count = daemon._purge_expired_tier2()
-
-        assert count == 10, (
-            "INV-SCHEDULE-RETENTION-001 violated: purge should return count of deleted rows"
-        )
-        mock_db.query.assert_called_once()
-        mock_filtered.delete.assert_called_once()
-
-    def test_respects_hourly_throttle(self):
-        """Purge MUST NOT run more than once per hour."""
-        from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
-
-        daemon = PlaylogHorizonDaemon.__new__(PlaylogHorizonDaemon)
-        daemon._channel_id = "test-channel"
-        daemon._lock = threading.Lock()
-
-        now_ms = int(datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp() * 1000)
-        daemon._last_tier2_purge_utc_ms = now_ms - (30 * 60 * 1000)
-
-        with patch("retrovue.infra.uow.session") as mock_session:
-            count = daemon._purge_expired_tier2(now_utc_ms=now_ms)
-
-        assert count == 0
-        mock_session.assert_not_called()
+        assert not hasattr(DslScheduleService, "_purge_expired_tier1")
+        assert not hasattr(PlaylogHorizonDaemon, "_purge_expired_tier2")
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +25,8 @@ from retrovue.adapters.enrichers.loudness_enricher import (
 )
 from retrovue.adapters.importers.base import DiscoveredItem
 
+pytestmark = pytest.mark.usefixtures("isolated_probe_cache")
+
 
 # ---------------------------------------------------------------------------
 # Rule 7: gain_db == target_lufs - integrated_lufs
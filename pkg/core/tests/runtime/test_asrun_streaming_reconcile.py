@@ -0,0 +1,208 @@
+"""Tests for streaming as-run reconciliation.
+
+Verifies:
+- reconcile_block_streams agrees with reconcile_transmission_log on
+  well-formed days and reports missing / extra / duplicate / timing /
+  segment errors per block
+- Memory stays within the match window over a long range
+- iter_asrun_blocks rebuilds blocks from .asrun.jsonl evidence, across
+  session files, including unfenced blocks
+- reconcile_range streams Tier 2 rows through one session
+- AsRunLogger keyed lookups
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from retrovue.runtime.asrun_logger import AsRunLogger
+from retrovue.runtime.asrun_reconciler import (
+    reconcile_block_streams,
+    reconcile_transmission_log,
+)
+from retrovue.runtime.asrun_stream import iter_asrun_blocks, reconcile_range
+from retrovue.runtime.asrun_types import AsRunBlock, AsRunLog, AsRunSegment
+from retrovue.runtime.planning_pipeline import TransmissionLog, TransmissionLogEntry
+
+BLOCK_MS = 1_800_000
+T0 = int(datetime(2026, 3, 1, tzinfo=UTC).timestamp() * 1000)
+
+
+def _entry(i: int) -> TransmissionLogEntry:
+    start = T0 + i * BLOCK_MS
+    return TransmissionLogEntry(
+        block_id=f"blk-{i}",
+        block_index=i,
+        start_utc_ms=start,
+        end_utc_ms=start + BLOCK_MS,
+        segments=[
+            {"segment_type": "content", "asset_uri": f"/m/{i}.mp4",
+             "asset_start_offset_ms": 0, "segment_duration_ms": BLOCK_MS - 60_000},
+            {"segment_type": "filler", "asset_uri": "/m/promo.mp4",
+             "asset_start_offset_ms": 0, "segment_duration_ms": 60_000},
+        ],
+    )
+
+
+def _aired(entry: TransmissionLogEntry) -> AsRunBlock:
+    return AsRunBlock(
+        block_id=entry.block_id,
+        start_utc_ms=entry.start_utc_ms,
+        end_utc_ms=entry.end_utc_ms,
+        segments=[
+            AsRunSegment(s["segment_type"], s["asset_uri"], s["asset_start_offset_ms"],
+                         s["segment_duration_ms"])
+            for s in entry.segments
+        ],
+    )
+
+
+def _day_report(plan, as_run):
+    log = TransmissionLog("ch", datetime(2026, 3, 1).date(), plan, True, {})
+    return reconcile_transmission_log(log, AsRunLog("ch", log.broadcast_date, as_run))
+
+
+def test_stream_matches_day_reconciler() -> None:
+    plan = [_entry(i) for i in range(48)]
+    as_run = [_aired(e) for e in plan]
+    del as_run[5]  # missing
+    as_run[10].end_utc_ms += 2000  # timing
+    as_run[20].segments.reverse()  # sequence
+    as_run.insert(30, AsRunBlock("stray", plan[31].start_utc_ms, plan[31].start_utc_ms, []))
+
+    streamed = reconcile_block_streams(plan, as_run)
+    day = _day_report(plan, as_run)
+    assert sorted(streamed.errors) == sorted(day.errors)
+    assert set(streamed.classification) == set(day.classification) == {
+        "MISSING_BLOCK", "EXTRA_BLOCK", "BLOCK_TIME_MISMATCH", "SEGMENT_SEQUENCE_MISMATCH",
+    }
+    assert (streamed.planned_blocks, streamed.as_run_blocks) == (48, 48)
+    assert _day_report(plan, [_aired(e) for e in plan]).success
+
+
+def test_duplicate_and_trailing_missing() -> None:
+    plan = [_entry(i) for i in range(4)]
+    as_run = [_aired(plan[0]), _aired(plan[1]), _aired(plan[1])]
+    report = reconcile_block_streams(plan, as_run)
+    assert report.errors == [
+        "Duplicate block_id in as-run: block_id='blk-1'",
+        "Missing as-run block for planned block_id='blk-2'",
+        "Missing as-run block for planned block_id='blk-3'",
+    ]
+
+
+def test_window_bounds_memory_and_errors_are_capped() -> None:
+    held: list[int] = []
+
+    def plan():
+        for i in range(6 * 48 * 7):  # a week at 30 minutes, many times over
+            held.append(i)
+            yield _entry(i)
+
+    def as_run():
+        for i in range(6 * 48 * 7):
+            # Only the plan read ahead of this block may be held
+            assert len(held) - i <= 12 + 1
+            if i % 100:
+                yield _aired(_entry(i))
+
+    report = reconcile_block_streams(
+        plan(), as_run(), match_window_ms=6 * 3_600_000, max_errors=5,
+    )
+    assert len(report.errors) == 5
+    assert report.suppressed_errors == len(range(0, 6 * 48 * 7, 100)) - 5
+    assert not report.success
+
+
+# ── Evidence files ──────────────────────────────────────────────────
+
+
+def _write_evidence(path, entries, *, fence=True, terminate=False) -> None:
+    with open(path, "a") as fh:
+        for e in entries:
+            recs = [{"status": "START", "block_id": e.block_id, "actual_start_utc_ms": e.start_utc_ms}]
+            t = e.start_utc_ms
+            for idx, s in enumerate(e.segments):
+                recs.append({
+                    "status": "SEG_START", "block_id": e.block_id, "segment_index": idx,
+                    "segment_type": s["segment_type"], "asset_uri": s["asset_uri"],
+                    "asset_start_frame": 0, "scheduled_duration_ms": s["segment_duration_ms"],
+                })
+                t += s["segment_duration_ms"]
+                recs.append({"status": "AIRED", "block_id": e.block_id, "actual_end_utc_ms": t})
+            if fence:
+                recs.append({"status": "FENCE", "block_id": e.block_id, "actual_end_utc_ms": e.end_utc_ms})
+            for r in recs:
+                fh.write(json.dumps(r) + "\n")
+        if terminate:
+            fh.write(json.dumps({"status": "TERMINATED", "block_id": ""}) + "\n")
+        fh.write("{not json\n")
+
+
+def test_iter_asrun_blocks_reads_session_files(tmp_path) -> None:
+    base = tmp_path / "ch"
+    base.mkdir()
+    plan = [_entry(i) for i in range(100)]  # spans three UTC days
+    # One session opened 2026-03-01 and ran past midnight; a restart opened a new file
+    _write_evidence(base / "2026-03-01.asrun.jsonl", plan[:60])
+    _write_evidence(base / "2026-03-02.asrun.jsonl", plan[60:99])
+    _write_evidence(base / "2026-03-02.asrun.jsonl", plan[99:], fence=False, terminate=True)
+    (base / "notes.asrun.jsonl").write_text("ignored\n")
+
+    blocks = list(iter_asrun_blocks(tmp_path, "ch", plan[50].start_utc_ms, plan[-1].end_utc_ms))
+    assert [b.block_id for b in blocks] == [e.block_id for e in plan[50:]]
+    report = reconcile_block_streams(plan[50:], blocks)
+    # The unfenced block ends at its last segment end, which here is on time
+    assert report.errors == []
+    assert blocks[-1].end_utc_ms == plan[-1].end_utc_ms
+
+    report = reconcile_range("ch", plan[0].start_utc_ms, plan[-1].end_utc_ms,
+                             asrun_dir=tmp_path, planned=iter(plan))
+    assert report.success and report.as_run_blocks == 100
+
+
+def test_reconcile_range_streams_tier2_rows(tmp_path) -> None:
+    (tmp_path / "ch").mkdir()
+    plan = [_entry(i) for i in range(4)]
+    _write_evidence(tmp_path / "ch" / "2026-03-01.asrun.jsonl", plan[:3])
+
+    db = MagicMock()
+    rows = [MagicMock(block_id=e.block_id, start_utc_ms=e.start_utc_ms,
+                      end_utc_ms=e.end_utc_ms, segments=e.segments) for e in plan]
+    db.query.return_value.filter.return_value.order_by.return_value.yield_per.return_value = rows
+    session = MagicMock()
+    session.__enter__ = MagicMock(return_value=db)
+    session.__exit__ = MagicMock(return_value=False)
+
+    report = reconcile_range("ch", T0, T0 + 86_400_000, asrun_dir=tmp_path,
+                             session_factory=lambda: session)
+    assert report.errors == ["Missing as-run block for planned block_id='blk-3'"]
+    db.query.return_value.filter.return_value.order_by.return_value.yield_per.assert_called_once()
+
+
+# ── AsRunLogger ─────────────────────────────────────────────────────
+
+
+def test_asrun_logger_keyed_lookups() -> None:
+    logger = AsRunLogger()
+    start = datetime(2026, 3, 1, 5, tzinfo=UTC)
+    ids = [
+        logger.log_playout_start(ch, f"p{i}", "a", start + timedelta(hours=i))
+        for i in range(3) for ch in ("ch1", "ch2")
+    ]
+    updated = logger.log_playout_end(ids[2], start + timedelta(hours=2))
+    assert updated is not None and logger.events[2] is updated
+    assert updated.duration_seconds == 3600.0
+    assert logger.log_playout_end("nope", start) is None
+
+    day = logger.get_events_for_broadcast_day("ch1", "2026-03-01")
+    assert [e.program_id for e in day] == ["p0", "p1", "p2"]
+    assert logger.get_events_for_broadcast_day("ch3", "2026-03-01") == []
+    assert logger.get_continuous_playout_spanning_rollover(
+        "ch1", start + timedelta(minutes=90),
+    ) is updated
+    assert logger.get_continuous_playout_spanning_rollover(
+        "ch2", start + timedelta(minutes=90),
+    ) is None
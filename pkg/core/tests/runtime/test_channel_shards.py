@@ -0,0 +1,184 @@
+"""Tests for multi-process channel sharding (INV-CHANNEL-SHARD-001).
+
+Verifies:
+- Shard assignment is deterministic, total, and preserves lineup order
+- The shard provider view exposes only its own channels
+- The front-end redirects per-channel routes to the owning worker
+- Lineup-wide routes fan out to every worker and merge in lineup order
+- Dead workers are restarted with exponential backoff
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from retrovue.runtime import channel_shards
+from retrovue.runtime.channel_shards import (
+    ChannelSource,
+    ShardChannelConfigProvider,
+    ShardedProgramDirector,
+    ShardWorker,
+    assign_channel_shards,
+    build_shard_specs,
+    shard_for,
+)
+
+CHANNEL_IDS = [f"retro-{i}" for i in range(12)]
+
+
+class _Provider:
+    def __init__(self, channel_ids: list[str]) -> None:
+        self._ids = list(channel_ids)
+
+    def list_channel_ids(self) -> list[str]:
+        return list(self._ids)
+
+    def get_channel_config(self, channel_id: str):
+        return SimpleNamespace(channel_id=channel_id) if channel_id in self._ids else None
+
+    def to_channels_list(self) -> list[dict[str, Any]]:
+        return [{"channel_id": cid, "channel_id_int": i, "name": cid.upper()} for i, cid in enumerate(self._ids)]
+
+    def get_traffic_policy(self, slug):
+        return {"slug": slug}
+
+
+def test_assignment_is_deterministic_and_total() -> None:
+    shards = assign_channel_shards(CHANNEL_IDS, 3)
+    assert len(shards) == 3
+    assert sorted(cid for shard in shards for cid in shard) == sorted(CHANNEL_IDS)
+    assert shards == assign_channel_shards(CHANNEL_IDS, 3)
+    for index, shard in enumerate(shards):
+        assert all(shard_for(cid, 3) == index for cid in shard)
+        assert shard == [cid for cid in CHANNEL_IDS if cid in shard]
+    assert assign_channel_shards(CHANNEL_IDS, 1) == [CHANNEL_IDS]
+
+
+def test_shard_provider_filters_and_delegates() -> None:
+    inner = _Provider(CHANNEL_IDS)
+    views = [ShardChannelConfigProvider(inner, i, 3) for i in range(3)]
+    assert [v.list_channel_ids() for v in views] == assign_channel_shards(CHANNEL_IDS, 3)
+    for view in views:
+        for cid in CHANNEL_IDS:
+            assert (view.get_channel_config(cid) is not None) == view.owns(cid)
+        assert [c["channel_id"] for c in view.to_channels_list()] == view.list_channel_ids()
+    assert views[0].get_traffic_policy("x") == {"slug": "x"}
+
+
+def test_specs_get_distinct_ports_and_state(tmp_path) -> None:
+    specs = build_shard_specs(3, ChannelSource("yaml", "/cfg"), host="0.0.0.0", port=8000, state_dir=tmp_path)
+    assert [s.port for s in specs] == [8001, 8002, 8003]
+    assert [s.evidence_port for s in specs] == [50052, 50053, 50054]
+    assert len({s.tune_history_path for s in specs}) == 3
+
+
+@pytest.fixture
+def frontend(monkeypatch: pytest.MonkeyPatch):
+    specs = build_shard_specs(2, ChannelSource("yaml", "/cfg"), host="0.0.0.0", port=8000)
+    director = ShardedProgramDirector(_Provider(CHANNEL_IDS), [ShardWorker(s) for s in specs])
+    requests: list[tuple[str, str]] = []
+
+    def fake_fetch(url: str, *, method: str = "GET", timeout: float = 0):
+        requests.append((method, url))
+        port = int(url.split(":")[2].split("/")[0])
+        shard = port - 8001
+        owned = assign_channel_shards(CHANNEL_IDS, 2)[shard]
+        if url.endswith("/channels"):
+            return 200, {"channels": [{"id": cid, "name": cid} for cid in owned]}
+        if "/api/epg" in url:
+            return 200, {
+                "broadcast_day": "2026-03-02",
+                "entries": [{"channel_id": cid, "title": f"{cid} show"} for cid in owned],
+            }
+        return 200, {"status": "ok"}
+
+    monkeypatch.setattr(channel_shards, "_fetch_json", fake_fetch)
+    client = TestClient(director.fastapi_app)
+    client.requests = requests
+    return client
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("get", "/channel/{cid}.ts"),
+        ("get", "/hls/{cid}/live.m3u8"),
+        ("get", "/hls/{cid}/seg_00012.ts"),
+        ("post", "/hls/{cid}/tune_out"),
+        ("get", "/api/epg/{cid}?start=2026-03-02T06:00:00"),
+        ("get", "/debug/horizon/{cid}"),
+    ],
+)
+def test_per_channel_routes_redirect_to_owner(frontend, method: str, path: str) -> None:
+    for cid in CHANNEL_IDS[:4]:
+        resp = getattr(frontend, method)(path.format(cid=cid), follow_redirects=False)
+        assert resp.status_code == 307
+        port = 8001 + shard_for(cid, 2)
+        assert resp.headers["location"] == f"http://testserver:{port}" + path.format(cid=cid)
+    assert frontend.requests == []
+
+
+def test_unknown_channel_is_not_redirected(frontend) -> None:
+    resp = frontend.get("/channel/nope.ts", follow_redirects=False)
+    assert resp.status_code == 404
+
+
+def test_channels_and_epg_are_merged_in_lineup_order(frontend) -> None:
+    channels = frontend.get("/channels").json()["channels"]
+    assert sorted(c["id"] for c in channels) == sorted(CHANNEL_IDS)
+
+    epg = frontend.get("/api/epg?date=2026-03-02").json()
+    assert epg["broadcast_day"] == "2026-03-02"
+    assert [e["channel_id"] for e in epg["entries"]] == CHANNEL_IDS
+    assert all(url.endswith("/api/epg?date=2026-03-02") for _, url in frontend.requests[-2:])
+
+    frontend.requests.clear()
+    one = frontend.get("/api/epg?channel=retro-5").json()
+    assert len(frontend.requests) == 1
+    assert str(8001 + shard_for("retro-5", 2)) in frontend.requests[0][1]
+    assert "retro-5" in [e["channel_id"] for e in one["entries"]]
+
+
+def test_emergency_fans_out_to_every_shard(frontend) -> None:
+    body = frontend.post("/admin/emergency").json()
+    assert body["status"] == "ok"
+    assert sorted(m for m, _ in frontend.requests) == ["POST", "POST"]
+
+
+def test_health_reports_down_when_no_worker_runs(frontend) -> None:
+    resp = frontend.get("/health")
+    assert resp.status_code == 503
+    assert resp.json()["status"] == "down"
+    assert [s["port"] for s in resp.json()["shards"]] == [8001, 8002]
+
+
+class _DeadProcess:
+    exitcode = 1
+    pid = 123
+
+    def start(self) -> None:
+        pass
+
+    def is_alive(self) -> bool:
+        return False
+
+
+def test_dead_worker_restarts_with_backoff() -> None:
+    ctx = SimpleNamespace(Event=lambda: SimpleNamespace(set=lambda: None), Process=lambda **kw: _DeadProcess())
+    spec = build_shard_specs(1, ChannelSource("yaml", "/cfg"), host="h", port=8000)[0]
+    worker = ShardWorker(spec, mp_context=ctx)
+    worker.start()
+    t0 = worker._started_at + 1.0
+
+    assert worker.ensure_running(now=t0) is False  # schedules restart after 1s
+    assert worker.ensure_running(now=t0 + 1.0) is True
+    assert worker.restarts == 1
+    now = worker._started_at + 0.5
+    assert worker.ensure_running(now=now) is False  # second crash: 2s backoff
+    assert worker.ensure_running(now=now + 1.0) is False
+    assert worker.ensure_running(now=now + 2.0) is True
+    assert worker.restarts == 2
@@ -6,6 +6,7 @@ Verifies:
 - Window boundaries (start/end) report correctly
 - Duplicate entries are deduplicated
 - Sorted order maintained regardless of insertion order
+- Seam breaks tracked incrementally across add/replace/prune
 - HorizonManager populates store when ExecutionDayResult is returned
 - HorizonManager works without store (legacy int path)
 """
@@ -229,6 +230,62 @@ class TestGetAllEntries:
         assert len(result1) == len(result2)
 
 
+class TestIncrementalSeams:
+    """Seam state tracks add/replace/prune without a full re-walk."""
+
+    def test_contiguous_days_have_no_breaks(self):
+        store = ExecutionWindowStore()
+        store.add_entries(_make_day_entries(date(2026, 2, 11)))
+        store.add_entries(_make_day_entries(date(2026, 2, 12)))
+        summary = store.coverage_summary()
+        assert summary.entry_count == 96
+        assert summary.is_contiguous
+        assert store.get_seam_breaks() == []
+
+    def test_gap_at_day_join_detected(self):
+        store = ExecutionWindowStore()
+        store.add_entries(_make_day_entries(date(2026, 2, 11), n_blocks=47))
+        store.add_entries(_make_day_entries(date(2026, 2, 12)))
+        breaks = store.get_seam_breaks()
+        assert len(breaks) == 1
+        assert breaks[0].left_block_id == "BLOCK-test-2026-02-11-46"
+        assert breaks[0].delta_ms == BLOCK_DURATION_MS
+        assert store.coverage_summary().gap_ms == BLOCK_DURATION_MS
+
+    def test_out_of_order_insert_fills_gap(self):
+        store = ExecutionWindowStore()
+        entries = _make_day_entries(date(2026, 2, 11), n_blocks=5)
+        store.add_entries([entries[0], entries[1], entries[3], entries[4]])
+        assert store.coverage_summary().seam_break_count == 1
+        store.add_entries([entries[2]])
+        assert store.coverage_summary().is_contiguous
+        assert [e.block_index for e in store.get_all_entries()] == [0, 1, 2, 3, 4]
+
+    def test_replace_rechecks_neighbours(self):
+        store = ExecutionWindowStore()
+        entries = _make_day_entries(date(2026, 2, 11), n_blocks=3)
+        store.add_entries(entries)
+        middle = entries[1]
+        shorter = _make_entry(1, middle.start_utc_ms, block_id="BLOCK-short")
+        shorter.end_utc_ms -= 60_000
+        middle.is_locked = False
+        store.replace_entry(middle.block_id, shorter, now_utc_ms=0)
+        breaks = store.get_seam_breaks()
+        assert [(b.left_block_id, b.delta_ms) for b in breaks] == [("BLOCK-short", 60_000)]
+        assert store.mark_locked("BLOCK-short")
+        assert not store.mark_locked(middle.block_id)
+
+    def test_prune_drops_aired_prefix(self):
+        store = ExecutionWindowStore()
+        store.add_entries(_make_day_entries(date(2026, 2, 11), n_blocks=4))
+        cutoff = _day_start_ms(2026, 2, 11) + 2 * BLOCK_DURATION_MS
+        assert store.prune_ended_before(cutoff) == 2
+        summary = store.coverage_summary()
+        assert summary.entry_count == 2
+        assert summary.window_start_utc_ms == cutoff
+        assert store.mark_locked("BLOCK-test-2026-02-11-3")
+
+
 # ---------------------------------------------------------------------------
 # HorizonManager + ExecutionWindowStore integration
 # ---------------------------------------------------------------------------
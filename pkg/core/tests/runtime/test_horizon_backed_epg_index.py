@@ -0,0 +1,123 @@
+"""Tests for the HorizonBackedScheduleService EPG event index (INV-EPG-EVENT-INDEX-001).
+
+Verifies:
+- get_epg_events matches the per-call slot walk on random windows,
+  including after-midnight slots and missing days
+- A day is indexed once and re-indexed only when the store replaces it
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from retrovue.runtime.horizon_backed_schedule_service import HorizonBackedScheduleService
+from retrovue.runtime.schedule_types import ResolvedAsset
+
+FIRST_DAY = date(2026, 3, 1)
+GRID_MIN = 30
+
+
+class _Store:
+    def __init__(self) -> None:
+        self.days: dict[tuple[str, date], SimpleNamespace] = {}
+
+    def get(self, channel_id: str, programming_day_date: date):
+        return self.days.get((channel_id, programming_day_date))
+
+
+def _resolved_day(rng: random.Random, bd: date) -> SimpleNamespace:
+    slots, events = [], []
+    for i in range(48):
+        slot_time = time((6 + i // 2) % 24, 30 * (i % 2))
+        asset = ResolvedAsset(f"/media/{bd}/{i}.mkv", asset_id=f"a{i}", title=f"Show {i}")
+        slots.append(SimpleNamespace(slot_time=slot_time, resolved_asset=asset))
+    i = 0
+    while i < len(slots):
+        span = min(rng.choice([1, 1, 2, 4]), len(slots) - i)
+        events.append(SimpleNamespace(block_span_count=span, resolved_asset=None))
+        i += span
+    return SimpleNamespace(programming_day_date=bd, resolved_slots=slots, program_events=events)
+
+
+def _reference(svc: HorizonBackedScheduleService, store: _Store, channel_id: str,
+               start_time: datetime, end_time: datetime) -> list[dict]:
+    """The original per-call walk."""
+    events = []
+    current = start_time
+    while current < end_time:
+        bd = svc._broadcast_date_for(current)
+        resolved = store.get(channel_id, bd)
+        if resolved is not None:
+            slot_idx = 0
+            for pe in resolved.program_events:
+                if slot_idx >= len(resolved.resolved_slots):
+                    break
+                first_slot = resolved.resolved_slots[slot_idx]
+                event_start = svc._slot_to_datetime(bd, first_slot.slot_time).replace(tzinfo=UTC)
+                event_end = event_start + timedelta(seconds=pe.block_span_count * GRID_MIN * 60)
+                if event_start < end_time and event_end > start_time:
+                    asset = pe.resolved_asset or first_slot.resolved_asset
+                    events.append({
+                        "channel_id": channel_id,
+                        "start_time": event_start.isoformat(),
+                        "end_time": event_end.isoformat(),
+                        "title": asset.title,
+                        "episode_title": asset.episode_title,
+                        "episode_id": asset.episode_id,
+                        "programming_day_date": bd.isoformat(),
+                        "asset": {
+                            "file_path": asset.file_path,
+                            "asset_id": asset.asset_id,
+                            "duration_seconds": asset.content_duration_seconds,
+                        },
+                    })
+                slot_idx += pe.block_span_count
+        current += timedelta(days=1)
+    return events
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_slot_walk(seed: int) -> None:
+    rng = random.Random(seed)
+    store = _Store()
+    for d in range(7):
+        if rng.random() < 0.85:
+            bd = FIRST_DAY + timedelta(days=d)
+            store.days[("ch", bd)] = _resolved_day(rng, bd)
+    svc = HorizonBackedScheduleService(None, store, grid_block_minutes=GRID_MIN, channel_id="ch")
+
+    for _ in range(20):
+        start = datetime(2026, 3, 1, tzinfo=UTC) + timedelta(minutes=rng.randrange(0, 7 * 24 * 60, 15))
+        end = start + timedelta(minutes=rng.randrange(1, 3 * 24 * 60))
+        assert svc.get_epg_events("ch", start, end) == _reference(svc, store, "ch", start, end)
+
+
+def test_day_is_indexed_once_and_rebuilt_on_replace() -> None:
+    rng = random.Random(0)
+    store = _Store()
+    store.days[("ch", FIRST_DAY)] = _resolved_day(rng, FIRST_DAY)
+    svc = HorizonBackedScheduleService(None, store, grid_block_minutes=GRID_MIN, channel_id="ch")
+    window = (datetime(2026, 3, 1, 12, tzinfo=UTC), datetime(2026, 3, 1, 18, tzinfo=UTC))
+
+    with patch.object(svc, "_build_epg_day", wraps=svc._build_epg_day) as build:
+        first = svc.get_epg_events("ch", *window)
+        second = svc.get_epg_events("ch", *window)
+        assert build.call_count == 1
+        assert first == second and first[0] is second[0]
+
+        # force_replace() stores a new ResolvedScheduleDay object
+        replacement = _resolved_day(random.Random(1), FIRST_DAY)
+        for slot in replacement.resolved_slots:
+            slot.resolved_asset = ResolvedAsset("/media/new.mkv", title="Special")
+        store.days[("ch", FIRST_DAY)] = replacement
+        third = svc.get_epg_events("ch", *window)
+        assert build.call_count == 2
+    assert third[0]["title"] == "Special"
+
+    del store.days[("ch", FIRST_DAY)]
+    assert svc.get_epg_events("ch", *window) == []
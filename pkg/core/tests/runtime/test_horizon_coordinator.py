@@ -0,0 +1,204 @@
+"""Tests for HorizonCoordinator (shared horizon evaluation pool).
+
+Verifies:
+- Due tasks are serviced closest-to-starving first
+- Thread count is bounded by max_workers, not by task count
+- A task is never evaluated concurrently with itself
+- unregister() stops further evaluations
+- A task that stays below threshold or keeps failing is retried with
+  backoff instead of spinning
+- HorizonManager / PlaylogHorizonDaemon satisfy the HorizonTask protocol
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from retrovue.runtime.clock import ControllableMasterClock
+from retrovue.runtime.horizon_coordinator import HorizonCoordinator, HorizonTask
+from retrovue.runtime.horizon_manager import HorizonManager
+from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
+
+
+class FakeTask:
+    def __init__(self, name, slack_ms, interval_s=3600.0, log=None, delay_s=0.0):
+        self.name = name
+        self.slack_ms = slack_ms
+        self._interval_s = interval_s
+        self.log = log if log is not None else []
+        self.delay_s = delay_s
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def evaluation_interval_seconds(self):
+        return self._interval_s
+
+    def ms_until_below_threshold(self):
+        return self.slack_ms
+
+    def evaluate_once(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.log.append((self.name, threading.current_thread().name))
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.calls += 1
+        # Serviced: horizon now deep enough
+        self.slack_ms = 3_600_000
+        with self._lock:
+            self.active -= 1
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestPriority:
+    def test_starving_channel_serviced_first(self):
+        log: list = []
+        coord = HorizonCoordinator(max_workers=1)
+        coord.register("a", FakeTask("a", slack_ms=-100, log=log))
+        coord.register("b", FakeTask("b", slack_ms=-50_000, log=log))
+        coord.register("c", FakeTask("c", slack_ms=-10, log=log))
+        coord.register("d", FakeTask("d", slack_ms=600_000, log=log))
+        coord.start()
+        try:
+            assert _wait_for(lambda: len(log) >= 3)
+            time.sleep(0.05)
+        finally:
+            coord.stop()
+        assert [name for name, _ in log] == ["b", "a", "c"]
+
+    def test_healthy_task_runs_on_heartbeat(self):
+        task = FakeTask("a", slack_ms=3_600_000, interval_s=0.02)
+        coord = HorizonCoordinator(max_workers=1)
+        coord.register("a", task)
+        coord.start()
+        try:
+            assert _wait_for(lambda: task.calls >= 3)
+        finally:
+            coord.stop()
+
+
+class TestBoundedPool:
+    def test_thread_count_bounded_by_workers(self):
+        log: list = []
+        tasks = [FakeTask(f"t{i}", slack_ms=0, log=log, delay_s=0.01) for i in range(40)]
+        coord = HorizonCoordinator(max_workers=3)
+        for t in tasks:
+            coord.register(t.name, t)
+        coord.start()
+        try:
+            assert _wait_for(lambda: all(t.calls >= 1 for t in tasks))
+        finally:
+            coord.stop()
+        assert len({thread for _, thread in log}) <= 3
+        assert coord.get_stats().evaluations >= 40
+
+    def test_task_never_runs_concurrently_with_itself(self):
+        task = FakeTask("a", slack_ms=0, interval_s=0.0, delay_s=0.01)
+        task.ms_until_below_threshold = lambda: 0  # always starving
+        coord = HorizonCoordinator(max_workers=4)
+        coord.register("a", task)
+        coord.start()
+        try:
+            assert _wait_for(lambda: task.calls >= 5)
+        finally:
+            coord.stop()
+        assert task.max_active == 1
+
+    def test_unregister_stops_evaluation(self):
+        task = FakeTask("a", slack_ms=3_600_000, interval_s=0.01)
+        coord = HorizonCoordinator(max_workers=1)
+        coord.register("a", task)
+        coord.start()
+        try:
+            assert _wait_for(lambda: task.calls >= 1)
+            coord.unregister("a")
+            time.sleep(0.03)
+            calls = task.calls
+            time.sleep(0.05)
+            assert task.calls == calls
+        finally:
+            coord.stop()
+        assert coord.get_stats().registered_tasks == 0
+
+
+def _last_due(coord: HorizonCoordinator) -> float:
+    """due_at of the most recently scheduled heap entry."""
+    return max(coord._pending, key=lambda entry: entry[2])[0]
+
+
+class TestBackoff:
+    def test_task_that_never_recovers_is_not_spun(self):
+        task = FakeTask("a", slack_ms=0, interval_s=0.2)
+        task.ms_until_below_threshold = lambda: -1000  # never catches up
+        coord = HorizonCoordinator(max_workers=2)
+        coord.register("a", task, evaluate_now=True)
+        coord.start()
+        try:
+            deadline = time.monotonic() + 5.0
+            while task.calls == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert task.calls >= 1
+            first = task.calls
+            time.sleep(0.5)
+            retries = task.calls - first
+        finally:
+            coord.stop()
+        # At most one retry per 0.2s interval once backed off
+        assert retries <= 3
+
+    def test_failing_task_backs_off_to_interval(self):
+        now = [0.0]
+        coord = HorizonCoordinator(max_workers=1, monotonic_fn=lambda: now[0])
+        task = FakeTask("a", slack_ms=3_600_000, interval_s=5.0)
+        coord.register("a", task)
+        delays = []
+        for _ in range(5):
+            coord._schedule("a", task, now[0], evaluated=True, failed=True)
+            delays.append(_last_due(coord) - now[0])
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+        # Positive slack after a successful evaluation resets the backoff
+        coord._schedule("a", task, now[0], evaluated=True)
+        coord._schedule("a", task, now[0], evaluated=True, failed=True)
+        assert _last_due(coord) - now[0] == 1.0
+
+
+class TestProtocolConformance:
+    def test_horizon_manager_is_task(self):
+        clock = ControllableMasterClock(
+            epoch=datetime(2026, 2, 11, 14, 0, tzinfo=timezone.utc),
+        )
+        hm = HorizonManager(
+            schedule_manager=object(),
+            planning_pipeline=object(),
+            master_clock=clock,
+            min_epg_days=1,
+            min_execution_hours=6,
+        )
+        assert isinstance(hm, HorizonTask)
+        # Empty horizon: already below threshold
+        assert hm.ms_until_below_threshold() < 0
+
+    def test_playlog_daemon_is_task(self):
+        clock = ControllableMasterClock(
+            epoch=datetime(2026, 2, 11, 14, 0, tzinfo=timezone.utc),
+        )
+        daemon = PlaylogHorizonDaemon("ch", min_hours=3, master_clock=clock)
+        assert isinstance(daemon, HorizonTask)
+        now_ms = int(clock.now_utc().timestamp() * 1000)
+        daemon._farthest_end_utc_ms = now_ms + 4 * 3_600_000
+        assert daemon.ms_until_below_threshold() == 3_600_000
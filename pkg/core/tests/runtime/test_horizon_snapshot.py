@@ -0,0 +1,217 @@
+"""Tests for the on-disk horizon snapshot (HorizonSnapshotStore).
+
+Verifies:
+- Blocks round-trip through the snapshot byte format unchanged
+- Days compiled from a different DSL hash are dropped individually
+- A COMPILER_VERSION or format mismatch invalidates the whole snapshot
+- Corrupt files are discarded without raising
+- DslScheduleService restores valid days and compiles only the rest
+- A day whose locked Tier 1 row was deleted or rewritten is recompiled
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from retrovue.runtime.dsl_schedule_service import DslScheduleService
+from retrovue.runtime.horizon_snapshot import (
+    HorizonSnapshotStore,
+    SnapshotDay,
+    decode_snapshot,
+    encode_snapshot,
+    tier1_stamp,
+)
+from retrovue.runtime.loudness_queue import LoudnessQueue
+from retrovue.runtime.schedule_compiler import COMPILER_VERSION
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+
+DAY_MS = 86_400_000
+
+
+def _block(block_id: str, start_ms: int, n_segments: int = 3) -> ScheduledBlock:
+    seg_ms = 600_000
+    segments = tuple(
+        ScheduledSegment(
+            segment_type="content" if i % 2 == 0 else "filler",
+            asset_uri=f"/media/show/ep{i}.mkv" if i % 2 == 0 else "",
+            asset_start_offset_ms=i * 1000,
+            segment_duration_ms=seg_ms,
+            transition_in="TRANSITION_FADE" if i else "TRANSITION_NONE",
+            transition_in_duration_ms=500 if i else 0,
+            gain_db=-3.5 if i == 0 else 0.0,
+        )
+        for i in range(n_segments)
+    )
+    return ScheduledBlock(
+        block_id=block_id,
+        start_utc_ms=start_ms,
+        end_utc_ms=start_ms + seg_ms * n_segments,
+        segments=segments,
+    )
+
+
+def _day(day_index: int, dsl_hash: str = "h1", stamp: str | None = "t1") -> SnapshotDay:
+    base = 1_767_225_600_000 + day_index * DAY_MS
+    return SnapshotDay(
+        dsl_hash=dsl_hash,
+        blocks=tuple(_block(f"b{day_index}-{i}", base + i * 1_800_000) for i in range(4)),
+        tier1_stamp=stamp,
+    )
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        days = {"2026-01-01": _day(0), "2026-01-02": _day(1)}
+        data = encode_snapshot("ch", "2.2.0", days)
+        out = decode_snapshot(data, channel_id="ch", compiler_version="2.2.0", dsl_hash="h1")
+        assert out == days
+
+    def test_day_with_other_dsl_hash_dropped(self):
+        days = {"2026-01-01": _day(0, "old"), "2026-01-02": _day(1, "h1")}
+        data = encode_snapshot("ch", "2.2.0", days)
+        out = decode_snapshot(data, channel_id="ch", compiler_version="2.2.0", dsl_hash="h1")
+        assert list(out) == ["2026-01-02"]
+
+    def test_compiler_version_mismatch_drops_all(self):
+        data = encode_snapshot("ch", "1.0.0", {"2026-01-01": _day(0)})
+        out = decode_snapshot(data, channel_id="ch", compiler_version="2.2.0", dsl_hash="h1")
+        assert out == {}
+
+
+class TestStore:
+    def test_save_then_load(self, tmp_path):
+        store = HorizonSnapshotStore(tmp_path)
+        days = {"2026-01-01": _day(0)}
+        assert store.save("ch", compiler_version="2.2.0", days=days)
+        assert store.load("ch", compiler_version="2.2.0", dsl_hash="h1") == days
+        # No temp files left behind
+        assert [p.name for p in tmp_path.iterdir()] == ["ch.hsnap"]
+
+    def test_missing_and_corrupt_files_load_empty(self, tmp_path):
+        store = HorizonSnapshotStore(tmp_path)
+        assert store.load("ch", compiler_version="2.2.0", dsl_hash="h1") == {}
+        store.path_for("ch").write_bytes(b"RVHS\x00\x01garbage")
+        assert store.load("ch", compiler_version="2.2.0", dsl_hash="h1") == {}
+        store.path_for("ch").write_bytes(b"xx")
+        assert store.load("ch", compiler_version="2.2.0", dsl_hash="h1") == {}
+
+
+class TestDslScheduleServiceRestore:
+    """_compile_day and the Tier 1 table are faked: compiling a day writes
+    a new locked row (a new stamp), as _save_compiled_schedule does."""
+
+    def _svc(self, tmp_path, tier1, dsl_text="channel: x\n"):
+        dsl = tmp_path / "ch.yaml"
+        dsl.write_text(dsl_text)
+        svc = DslScheduleService(
+            dsl_path=str(dsl),
+            filler_path="/dev/null",
+            filler_duration_ms=30_000,
+            broadcast_day="2026-01-01",
+            snapshot_store=HorizonSnapshotStore(tmp_path / "snap"),
+            loudness_queue=LoudnessQueue(":memory:"),
+        )
+        svc._tier1_stamps = lambda channel_id, days: {d: tier1[d] for d in days if d in tier1}
+        return svc
+
+    def _fake_compile(self, calls, tier1):
+        def compile_day(channel_id, day_str):
+            calls.append(day_str)
+            tier1[day_str] = f"row-{len(calls)}"
+            idx = int(day_str[-2:]) - 1
+            return list(_day(idx).blocks)
+        return compile_day
+
+    def test_restart_restores_without_compiling(self, tmp_path):
+        calls: list[str] = []
+        tier1: dict[str, str] = {}
+        svc = self._svc(tmp_path, tier1)
+        with patch.object(svc, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            svc._build_initial("ch")
+        assert calls == ["2026-01-01", "2026-01-02", "2026-01-03"]
+        first_blocks = list(svc._blocks)
+
+        restarted = self._svc(tmp_path, tier1)
+        with patch.object(restarted, "_compile_day", side_effect=AssertionError(
+            "valid snapshot days MUST NOT be recompiled"
+        )):
+            restarted._build_initial("ch")
+        assert restarted._blocks == first_blocks
+
+    def test_deleted_tier1_row_recompiles(self, tmp_path):
+        calls: list[str] = []
+        tier1: dict[str, str] = {}
+        svc = self._svc(tmp_path, tier1)
+        with patch.object(svc, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            assert svc.load_schedule("ch") == (True, None)
+
+        # `retrovue programming rebuild` deletes Tier 1 rows out of process
+        del tier1["2026-01-02"]
+        calls.clear()
+        restarted = self._svc(tmp_path, tier1)
+        with patch.object(restarted, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            assert restarted.load_schedule("ch") == (True, None)
+        assert calls == ["2026-01-02"]
+        assert "2026-01-02" in tier1
+
+        # The recompiled day is written back with its new row's stamp
+        stored = restarted._snapshot_store.load(
+            "ch", compiler_version=COMPILER_VERSION, dsl_hash=restarted._current_dsl_hash(),
+        )
+        assert stored["2026-01-02"].tier1_stamp == tier1["2026-01-02"]
+
+    def test_rewritten_tier1_row_recompiles(self, tmp_path):
+        calls: list[str] = []
+        tier1: dict[str, str] = {}
+        svc = self._svc(tmp_path, tier1)
+        with patch.object(svc, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            svc._build_initial("ch")
+
+        tier1["2026-01-03"] = "rewritten"
+        calls.clear()
+        restarted = self._svc(tmp_path, tier1)
+        with patch.object(restarted, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            restarted._build_initial("ch")
+        assert calls == ["2026-01-03"]
+
+    def test_dsl_change_recompiles(self, tmp_path):
+        calls: list[str] = []
+        tier1: dict[str, str] = {}
+        svc = self._svc(tmp_path, tier1)
+        with patch.object(svc, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            svc._build_initial("ch")
+
+        calls.clear()
+        edited = self._svc(tmp_path, tier1, dsl_text="channel: y\n")
+        with patch.object(edited, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            edited._build_initial("ch")
+        assert calls == ["2026-01-01", "2026-01-02", "2026-01-03"]
+
+    def test_only_missing_days_compiled(self, tmp_path):
+        tier1 = {"2026-01-01": "t1", "2026-01-02": "t1"}
+        svc = self._svc(tmp_path, tier1)
+        dsl_hash = svc._current_dsl_hash()
+        svc._snapshot_store.save(
+            "ch",
+            compiler_version=COMPILER_VERSION,
+            days={"2026-01-01": _day(0, dsl_hash), "2026-01-02": _day(1, dsl_hash)},
+        )
+
+        calls: list[str] = []
+        with patch.object(svc, "_compile_day", side_effect=self._fake_compile(calls, tier1)):
+            svc._build_initial("ch")
+        assert calls == ["2026-01-03"]
+        assert len(svc._blocks) == 12
+
+        # The newly compiled day is written back to the snapshot
+        stored = svc._snapshot_store.load(
+            "ch", compiler_version=COMPILER_VERSION, dsl_hash=dsl_hash,
+        )
+        assert sorted(stored) == ["2026-01-01", "2026-01-02", "2026-01-03"]
+
+    def test_tier1_stamp_identifies_row(self):
+        created = datetime(2026, 1, 1, 12, tzinfo=UTC)
+        assert tier1_stamp("h", created) == tier1_stamp("h", created)
+        assert tier1_stamp("h", created) != tier1_stamp("h", created.replace(minute=1))
+        assert tier1_stamp("h", created) != tier1_stamp("g", created)
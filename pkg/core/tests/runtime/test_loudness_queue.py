@@ -0,0 +1,133 @@
+"""Tests for the durable loudness measurement queue.
+
+Verifies:
+- INV-LOUDNESS-QUEUE-DEDUP-001: one job per asset, earliest airtime kept
+- Jobs are taken soonest-airtime first
+- INV-LOUDNESS-QUEUE-DURABLE-001: pending and failed jobs survive a restart
+- Failures back off; leased jobs are not handed out twice
+- Workers run measurements concurrently and notify listeners
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from retrovue.runtime import loudness_queue as lq
+from retrovue.runtime.loudness_queue import LoudnessQueue
+
+
+def _loudness(_path: str) -> dict[str, Any]:
+    return {"integrated_lufs": -20.0, "gain_db": -4.0, "target_lufs": -24.0}
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.measured: list[str] = []
+        self.persisted: dict[str, dict[str, Any]] = {}
+
+    def measure(self, path: str) -> dict[str, Any]:
+        self.measured.append(path)
+        return _loudness(path)
+
+    def persist(self, asset_id: str, data: dict[str, Any]) -> None:
+        self.persisted[asset_id] = data
+
+
+def _queue(path: Path | str, rec: _Recorder, **kw: Any) -> LoudnessQueue:
+    return LoudnessQueue(path, measure=rec.measure, persist=rec.persist, **kw)
+
+
+def test_dedup_keeps_earliest_airtime_and_orders_by_it(tmp_path: Path) -> None:
+    rec = _Recorder()
+    q = _queue(tmp_path / "q.sqlite3", rec)
+    q.start = lambda: None  # drive synchronously
+
+    q.enqueue("late", "/m/late.mkv", 3_000)
+    q.enqueue("soon", "/m/soon.mkv", 2_000)
+    q.enqueue("late", "/m/late-v2.mkv", 1_000)  # now the soonest
+    q.enqueue("soon", "/m/soon.mkv", 9_000)  # later airtime ignored
+
+    assert q.pending() == 2
+    while q.run_once():
+        pass
+    assert rec.measured == ["/m/late-v2.mkv", "/m/soon.mkv"]
+    assert q.pending() == 0
+
+
+def test_pending_jobs_survive_restart(tmp_path: Path) -> None:
+    path = tmp_path / "q.sqlite3"
+    first = _queue(path, _Recorder())
+    first.start = lambda: None
+    first.enqueue("a", "/m/a.mkv", 1_000)
+    first.enqueue("b", "/m/b.mkv", 2_000)
+
+    rec = _Recorder()
+    second = _queue(path, rec)
+    assert second.pending() == 2
+    while second.run_once():
+        pass
+    assert set(rec.persisted) == {"a", "b"}
+
+
+def test_failure_backs_off_and_is_retained(tmp_path: Path) -> None:
+    def boom(_path: str) -> dict[str, Any]:
+        raise RuntimeError("ffmpeg failed")
+
+    q = LoudnessQueue(tmp_path / "q.sqlite3", measure=boom, persist=lambda *a: None)
+    q.start = lambda: None
+    q.enqueue("a", "/m/a.mkv", 1_000)
+
+    assert q.run_once() is True
+    assert q.run_once() is False  # backing off
+    assert q.pending() == 1
+
+
+def test_leased_job_not_claimed_twice(tmp_path: Path) -> None:
+    q = _queue(tmp_path / "q.sqlite3", _Recorder())
+    q.start = lambda: None
+    q.enqueue("a", "/m/a.mkv", 1_000)
+
+    assert q._claim() is not None
+    assert q._claim() is None
+
+
+def test_workers_measure_concurrently_and_notify(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(lq, "IDLE_POLL_S", 0.05)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    done = threading.Event()
+    seen: list[str] = []
+    both_running = threading.Barrier(2)
+
+    def slow_measure(path: str) -> dict[str, Any]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        if path in ("/m/0.mkv", "/m/1.mkv"):
+            both_running.wait(timeout=5)  # two measurements at once
+        with lock:
+            active -= 1
+        return _loudness(path)
+
+    def listener(asset_id: str, data: dict[str, Any]) -> None:
+        seen.append(asset_id)
+        if len(seen) == 4:
+            done.set()
+
+    q = LoudnessQueue(":memory:", workers=3, measure=slow_measure, persist=lambda *a: None)
+    q.add_listener(listener)
+    try:
+        for i in range(4):
+            q.enqueue(f"a{i}", f"/m/{i}.mkv", i)
+        assert done.wait(5)
+    finally:
+        q.stop(timeout=5)
+
+    assert sorted(seen) == ["a0", "a1", "a2", "a3"]
+    assert peak > 1
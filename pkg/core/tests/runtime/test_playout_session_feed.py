@@ -0,0 +1,180 @@
+"""Tests for the non-blocking BlockPlan feed path (INV-FEED-NONBLOCKING-001).
+
+Runs PlayoutSession against an in-process fake AIR gRPC server.
+
+Verifies:
+- With on_feed_result, feed() returns PENDING at once and the answer
+  (ACCEPTED / QUEUE_FULL) arrives via the callback
+- The session lock is free while a feed is in flight
+- Without a callback, feed() still returns AIR's answer synchronously
+- BlockPlanProducer keeps one feed in flight and resumes feeding on ACCEPTED
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent import futures
+from pathlib import Path
+
+import grpc
+import pytest
+
+from retrovue.runtime.playout_session import (
+    BlockPlan,
+    FeedResult,
+    PlayoutSession,
+    playout_pb2,
+    playout_pb2_grpc,
+)
+
+
+class _FakeAir(playout_pb2_grpc.PlayoutControlServicer):
+    """FeedBlockPlan that can be held open and can report queue_full."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.release.set()
+        self.received = threading.Event()
+        self.queue_full = False
+        self.fed: list[str] = []
+
+    def FeedBlockPlan(self, request, context):
+        self.received.set()
+        self.release.wait(5)
+        if self.queue_full:
+            return playout_pb2.FeedBlockPlanResponse(success=False, queue_full=True)
+        self.fed.append(request.block.block_id)
+        return playout_pb2.FeedBlockPlanResponse(success=True)
+
+
+class _Clock:
+    def now_utc(self):
+        from datetime import datetime, timezone
+
+        return datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def air():
+    fake = _FakeAir()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    playout_pb2_grpc.add_PlayoutControlServicer_to_server(fake, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    fake.stub = playout_pb2_grpc.PlayoutControlStub(channel)
+    yield fake
+    fake.release.set()
+    channel.close()
+    server.stop(grace=None)
+
+
+def _session(air: _FakeAir, on_feed_result=None) -> PlayoutSession:
+    session = PlayoutSession(
+        channel_id="test-ch",
+        channel_id_int=1,
+        ts_socket_path=Path("/tmp/unused.sock"),
+        program_format={},
+        clock=_Clock(),
+        air_binary_path=Path("/nonexistent/retrovue_air"),
+        on_feed_result=on_feed_result,
+    )
+    session._stub = air.stub
+    session._state.is_running = True
+    return session
+
+
+def _block(block_id: str = "blk-1") -> BlockPlan:
+    return BlockPlan(block_id=block_id, channel_id=1, start_utc_ms=0, end_utc_ms=10_000, segments=[])
+
+
+class _Results:
+    def __init__(self) -> None:
+        self.items: list[tuple[str, FeedResult]] = []
+        self.done = threading.Event()
+
+    def __call__(self, block, result) -> None:
+        self.items.append((block.block_id, result))
+        self.done.set()
+
+
+def test_feed_returns_pending_and_lock_stays_free(air) -> None:
+    results = _Results()
+    session = _session(air, results)
+    air.release.clear()
+
+    assert session.feed(_block()) == FeedResult.PENDING
+    assert air.received.wait(5)
+    # AIR is holding the call; other session operations are not blocked
+    assert session._lock.acquire(timeout=1)
+    session._lock.release()
+    assert session.feeds_in_flight == 1
+    assert results.items == []
+
+    air.release.set()
+    assert results.done.wait(5)
+    assert results.items == [("blk-1", FeedResult.ACCEPTED)]
+    assert session.feeds_in_flight == 0
+    assert air.fed == ["blk-1"]
+
+
+def test_queue_full_is_delivered_as_backpressure(air) -> None:
+    results = _Results()
+    session = _session(air, results)
+    air.queue_full = True
+
+    first = session.feed(_block())
+    if first == FeedResult.PENDING:
+        assert results.done.wait(5)
+        first = results.items[0][1]
+    assert first == FeedResult.QUEUE_FULL
+
+
+def test_feed_without_callback_is_synchronous(air) -> None:
+    session = _session(air)
+    assert session.feed(_block()) == FeedResult.ACCEPTED
+    air.queue_full = True
+    assert session.feed(_block("blk-2")) == FeedResult.QUEUE_FULL
+
+
+def test_feed_after_stop_is_error(air) -> None:
+    session = _session(air, _Results())
+    session._state.session_ended = True
+    assert session.feed(_block()) == FeedResult.ERROR
+
+
+def test_producer_keeps_one_feed_in_flight_and_resumes_on_ack() -> None:
+    from retrovue.runtime.channel_manager import BlockPlanProducer, _FeedState
+
+    producer = BlockPlanProducer(channel_id="test-ch", clock=_Clock())
+    issued: list[BlockPlan] = []
+
+    class _AsyncSession:
+        def feed(self, block):
+            issued.append(block)
+            return FeedResult.PENDING
+
+    blocks = iter([_block("blk-c"), _block("blk-d")])
+    producer._resolve_plan_for_block = lambda: object()
+    producer._generate_next_block = lambda scheduled: next(blocks)
+    producer._session = _AsyncSession()
+    producer._feed_state = _FeedState.RUNNING
+    producer._started = True
+    producer._feed_credits = 2
+
+    with producer._lock:
+        producer._feed_ahead()
+        producer._feed_ahead()  # answer outstanding: no second request
+    assert [b.block_id for b in issued] == ["blk-c"]
+    assert producer._feed_in_flight is issued[0]
+
+    producer._on_feed_result(issued[0], FeedResult.ACCEPTED)
+    assert producer._feed_credits == 1
+    assert producer._next_block_start_ms == issued[0].end_utc_ms
+    # The acknowledgement resumed feeding with the remaining credit
+    assert [b.block_id for b in issued] == ["blk-c", "blk-d"]
+
+    producer._on_feed_result(issued[1], FeedResult.QUEUE_FULL)
+    assert producer._feed_credits == 0
+    assert producer._pending_block is issued[1]
+    assert producer._feed_in_flight is None
@@ -0,0 +1,132 @@
+"""Tests for ProgramDirector concurrent, priority-ordered channel warmup.
+
+Verifies:
+- Channels warm in startup_priority order, then most-recently-tuned order
+- A warmed channel is tunable while colder channels are still warming
+- A channel whose warmup fails stays not-ready after startup completes
+- The startup report carries per-channel, per-phase timings
+"""
+
+from __future__ import annotations
+
+import threading
+
+from retrovue.runtime.config import ChannelConfig, InlineChannelConfigProvider
+from retrovue.runtime.program_director import ProgramDirector
+
+
+def _cfg(channel_id: str, channel_int: int, priority: int = 0) -> ChannelConfig:
+    return ChannelConfig(
+        channel_id=channel_id,
+        channel_id_int=channel_int,
+        name=channel_id,
+        program_format={"width": 1920, "height": 1080, "fps": 30},
+        schedule_source="dsl",
+        schedule_config={"dsl_path": "/dev/null", "startup_priority": priority},
+    )
+
+
+def _make_pd(tmp_path, configs, *, workers=1, prewarm=None):
+    pd = ProgramDirector(
+        channel_config_provider=InlineChannelConfigProvider(configs),
+        host="127.0.0.1",
+        port=0,
+        startup_workers=workers,
+    )
+    pd._tune_history_path = tmp_path / "tune_history.json"
+    pd._init_horizon_managers = lambda channel_ids=None: None
+    pd._init_playlog_daemons = lambda channel_ids=None: None
+    pd._prewarm_channel_schedules = prewarm or (lambda channel_ids=None: len(channel_ids or []))
+    return pd
+
+
+class TestStartupOrder:
+    def test_explicit_priority_first(self, tmp_path):
+        order: list[str] = []
+
+        def prewarm(channel_ids=None):
+            order.extend(channel_ids)
+            return 1
+
+        pd = _make_pd(
+            tmp_path,
+            [_cfg("a", 1, 0), _cfg("b", 2, 10), _cfg("c", 3, 5)],
+            prewarm=prewarm,
+        )
+        pd._warm_all_channels()
+        assert order == ["b", "c", "a"]
+
+    def test_recently_tuned_before_untouched(self, tmp_path):
+        order: list[str] = []
+
+        def prewarm(channel_ids=None):
+            order.extend(channel_ids)
+            return 1
+
+        pd = _make_pd(
+            tmp_path, [_cfg("a", 1), _cfg("b", 2), _cfg("c", 3)], prewarm=prewarm,
+        )
+        pd._tune_history = {"c": 200.0, "b": 100.0}
+        pd._save_tune_history()
+        pd._tune_history = {}
+
+        pd._warm_all_channels()
+        assert order == ["c", "b", "a"]
+
+
+class TestPerChannelReadiness:
+    def test_warm_channel_ready_while_cold_channel_compiling(self, tmp_path):
+        release = threading.Event()
+        started = threading.Event()
+
+        def prewarm(channel_ids=None):
+            if channel_ids == ["slow"]:
+                started.set()
+                release.wait(timeout=5.0)
+            return 1
+
+        pd = _make_pd(
+            tmp_path,
+            [_cfg("fast", 1, 10), _cfg("slow", 2, 0)],
+            workers=2,
+            prewarm=prewarm,
+        )
+        t = threading.Thread(target=pd._warm_all_channels)
+        t.start()
+        try:
+            assert started.wait(timeout=5.0)
+            for _ in range(500):
+                if pd._is_channel_ready("fast"):
+                    break
+                threading.Event().wait(0.01)
+            assert pd._is_channel_ready("fast")
+            assert not pd._is_channel_ready("slow")
+        finally:
+            release.set()
+            t.join(timeout=5.0)
+        assert pd._is_channel_ready("slow")
+
+    def test_failed_channel_not_ready_after_startup(self, tmp_path):
+        def prewarm(channel_ids=None):
+            return 0 if channel_ids == ["bad"] else 1
+
+        pd = _make_pd(tmp_path, [_cfg("good", 1), _cfg("bad", 2)], prewarm=prewarm)
+        pd._warm_all_channels()
+        pd._startup_complete.set()
+
+        assert pd._is_channel_ready("good")
+        assert not pd._is_channel_ready("bad")
+
+
+class TestStartupReport:
+    def test_report_has_phase_timings(self, tmp_path):
+        pd = _make_pd(tmp_path, [_cfg("a", 1), _cfg("b", 2)], workers=2)
+        pd._warm_all_channels()
+
+        report = pd.get_startup_report()
+        assert report["total_ms"] is not None
+        assert {c["channel_id"] for c in report["channels"]} == {"a", "b"}
+        for c in report["channels"]:
+            assert c["ready"] is True
+            assert set(c["phases_ms"]) == {"horizon", "prewarm", "playlog"}
+            assert c["ready_after_ms"] is not None
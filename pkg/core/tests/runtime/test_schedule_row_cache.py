@@ -0,0 +1,306 @@
+"""Tests for the schedule row read-through caches (INV-SCHEDULE-ROW-CACHE-001).
+
+Verifies:
+- LRU eviction order, invalidation and counters
+- Tier 2 lookups by block_id hit the DB once, negative results are not cached
+- Tier 2 writes and retention purges invalidate cached blocks
+- Tier 1 reads are cached; saves and retention purges invalidate
+- Tier 1 reads reuse a cached day only while the row identity matches
+- The EPG reuses cached days only while the row identity matches
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from retrovue.domain.entities import CompiledProgramLog
+from retrovue.runtime import schedule_row_cache
+from retrovue.runtime.dsl_schedule_service import DslScheduleService
+from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
+from retrovue.runtime.schedule_compiler import COMPILER_VERSION
+from retrovue.runtime.schedule_retention import ScheduleRetentionJob
+from retrovue.runtime.schedule_row_cache import CompiledDay
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+from retrovue.shared.lru_cache import LruCache
+
+DAY = date(2026, 3, 1)
+CREATED = datetime(2026, 2, 27, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    txlog: LruCache = LruCache(16)
+    compiled: LruCache = LruCache(16)
+    monkeypatch.setattr(schedule_row_cache, "_txlog_cache", txlog)
+    monkeypatch.setattr(schedule_row_cache, "_compiled_cache", compiled)
+    return SimpleNamespace(txlog=txlog, compiled=compiled)
+
+
+def _mock_session(target: str):
+    patcher = patch(target)
+    factory = patcher.start()
+    db = MagicMock()
+    factory.return_value.__enter__ = MagicMock(return_value=db)
+    factory.return_value.__exit__ = MagicMock(return_value=False)
+    return patcher, db
+
+
+def _txlog_row(block_id: str = "blk-1", end_utc_ms: int = 1_800_000) -> SimpleNamespace:
+    return SimpleNamespace(
+        block_id=block_id,
+        start_utc_ms=0,
+        end_utc_ms=end_utc_ms,
+        segments=[{"segment_type": "content", "asset_uri": "/a.mp4", "segment_duration_ms": 1_800_000}],
+        segments_packed=None,
+    )
+
+
+def _service() -> DslScheduleService:
+    return DslScheduleService.__new__(DslScheduleService)
+
+
+def _compiled_json(start: str = "2026-03-01T06:00:00+00:00") -> dict:
+    return {
+        "source": {"compiler_version": COMPILER_VERSION},
+        "program_blocks": [{"start_at": start, "slot_duration_sec": 1800, "asset_id": "a"}],
+        "segmented_blocks": [{"block_id": "b"}],
+    }
+
+
+# ── LruCache ────────────────────────────────────────────────────────
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache: LruCache[str, int] = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 1}
+
+
+def test_lru_invalidation_and_disabled() -> None:
+    cache: LruCache[str, int] = LruCache(8)
+    for i in range(5):
+        cache.put(str(i), i)
+    cache.invalidate("0")
+    assert cache.invalidate_where(lambda _, v: v >= 3) == 2
+    assert len(cache) == 2
+
+    disabled: LruCache[str, int] = LruCache(0)
+    disabled.put("a", 1)
+    assert disabled.get("a") is None
+
+
+def test_compiled_day_identity() -> None:
+    day = CompiledDay("h", CREATED, _compiled_json())
+    assert day.matches("h", CREATED, COMPILER_VERSION)
+    assert not day.matches("h2", CREATED, COMPILER_VERSION)
+    assert not day.matches("h", CREATED + timedelta(seconds=1), COMPILER_VERSION)
+    assert not day.matches("h", CREATED, "old")
+
+
+# ── Tier 2 ──────────────────────────────────────────────────────────
+
+
+def test_filled_block_lookup_reads_db_once(caches) -> None:
+    patcher, db = _mock_session("retrovue.infra.uow.session")
+    try:
+        db.query.return_value.options.return_value.filter.return_value.first.return_value = _txlog_row()
+        svc = _service()
+        first = svc._get_filled_block_by_id("blk-1")
+        second = svc._get_filled_block_by_id("blk-1")
+    finally:
+        patcher.stop()
+    assert first is second
+    assert first.segments[0].asset_uri == "/a.mp4"
+    assert db.query.call_count == 1
+
+
+def test_filled_block_miss_is_not_cached(caches) -> None:
+    patcher, db = _mock_session("retrovue.infra.uow.session")
+    try:
+        db.query.return_value.options.return_value.filter.return_value.first.return_value = None
+        svc = _service()
+        assert svc._get_filled_block_by_id("blk-1") is None
+        assert svc._get_filled_block_by_id("blk-1") is None
+    finally:
+        patcher.stop()
+    assert db.query.call_count == 2
+    assert len(caches.txlog) == 0
+
+
+def _daemon() -> PlaylogHorizonDaemon:
+    daemon = PlaylogHorizonDaemon.__new__(PlaylogHorizonDaemon)
+    daemon._channel_id = "ch"
+    daemon._warned_stale_days = set()
+    return daemon
+
+
+def test_write_and_purge_invalidate(caches) -> None:
+    seg = ScheduledSegment(segment_type="content", asset_uri="/a.mp4",
+                           asset_start_offset_ms=0, segment_duration_ms=1000)
+    old = ScheduledBlock(block_id="old", start_utc_ms=0, end_utc_ms=1000, segments=(seg,))
+    new = ScheduledBlock(block_id="new", start_utc_ms=20_000_000, end_utc_ms=21_000_000, segments=(seg,))
+    caches.txlog.put("old", old)
+    caches.txlog.put("new", new)
+
+    daemon = _daemon()
+    daemon._write_to_txlog(new, DAY, db=MagicMock())
+    assert caches.txlog.get("new") is None
+
+    caches.compiled.put(("ch", DAY - timedelta(days=2)), CompiledDay("h", CREATED, _compiled_json()))
+    caches.compiled.put(("ch", DAY), CompiledDay("h", CREATED, _compiled_json()))
+    db = MagicMock()
+    db.query.return_value.filter.return_value.delete.return_value = 0
+    session = MagicMock()
+    session.__enter__ = MagicMock(return_value=db)
+    session.__exit__ = MagicMock(return_value=False)
+    job = ScheduleRetentionJob(session_factory=lambda: session, today=lambda: DAY)
+    job.purge_once(now_utc_ms=4 * 3_600_000 + 1000)
+    assert caches.txlog.get("old") is None
+    assert caches.txlog.get("new") is None
+    assert caches.compiled.get(("ch", DAY - timedelta(days=2))) is None
+    assert caches.compiled.get(("ch", DAY)) is not None
+
+
+# ── Tier 1 ──────────────────────────────────────────────────────────
+
+
+def _tier1_db(db: MagicMock, row: SimpleNamespace | None) -> MagicMock:
+    """Route identity queries and full-row queries on *db*; returns the full-row query."""
+    row_query = MagicMock()
+    row_query.filter.return_value.first.return_value = row
+    identity_query = MagicMock()
+    identity_query.filter.return_value.first.side_effect = lambda: (
+        None if row is None
+        else (row.schedule_hash, row.created_at, row.compiled_json["source"]["compiler_version"])
+    )
+
+    def query(*columns):
+        return row_query if columns[0] is CompiledProgramLog else identity_query
+
+    db.query.side_effect = query
+    return row_query
+
+
+def _tier1_row(schedule_hash: str = "h", compiled_json: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(schedule_hash=schedule_hash, created_at=CREATED,
+                           compiled_json=compiled_json or _compiled_json(), segmented_packed=None)
+
+
+def test_cached_schedule_loads_row_once_and_save_invalidates(caches) -> None:
+    row = _tier1_row()
+    patcher, db = _mock_session("retrovue.runtime.dsl_schedule_service.session")
+    try:
+        row_query = _tier1_db(db, row)
+        svc = _service()
+        assert svc._get_cached_schedule("ch", DAY.isoformat()) is row.compiled_json
+        assert svc._get_cached_schedule("ch", DAY.isoformat()) is row.compiled_json
+        assert row_query.filter.return_value.first.call_count == 1
+
+        svc._save_compiled_schedule("ch", DAY.isoformat(), _compiled_json(), "h2")
+        assert caches.compiled.get(("ch", DAY)) is None
+    finally:
+        patcher.stop()
+
+
+def test_cached_schedule_follows_rows_rewritten_elsewhere(caches) -> None:
+    caches.compiled.put(("ch", DAY), CompiledDay("h", CREATED, _compiled_json()))
+    rewritten = _tier1_row("h2", _compiled_json("2026-03-01T06:30:00+00:00"))
+    patcher, db = _mock_session("retrovue.runtime.dsl_schedule_service.session")
+    try:
+        _tier1_db(db, rewritten)
+        assert _service()._get_cached_schedule("ch", DAY.isoformat()) is rewritten.compiled_json
+
+        # Deleted by another process: the cached day is dropped
+        _tier1_db(db, None)
+        assert _service()._get_cached_schedule("ch", DAY.isoformat()) is None
+    finally:
+        patcher.stop()
+    assert caches.compiled.get(("ch", DAY)) is None
+
+
+def test_stale_or_unsegmented_rows_are_not_cached(caches) -> None:
+    stale = _compiled_json()
+    stale["source"]["compiler_version"] = "0"
+    legacy = _compiled_json()
+    del legacy["segmented_blocks"]
+    patcher, db = _mock_session("retrovue.runtime.dsl_schedule_service.session")
+    try:
+        svc = _service()
+        for cj in (stale, legacy):
+            _tier1_db(db, _tier1_row(compiled_json=cj))
+            svc._get_cached_schedule("ch", DAY.isoformat())
+    finally:
+        patcher.stop()
+    assert len(caches.compiled) == 0
+
+
+def test_daemon_tier1_load_checks_cached_identity(caches) -> None:
+    cached = _compiled_json()
+    caches.compiled.put(("ch", DAY), CompiledDay("h", CREATED, cached))
+    db = MagicMock()
+    row_query = _tier1_db(db, _tier1_row(compiled_json=cached))
+    assert _daemon()._load_tier1_blocks(DAY, db=db) == [{"block_id": "b"}]
+    row_query.filter.assert_not_called()
+
+    rewritten = _compiled_json()
+    rewritten["segmented_blocks"] = [{"block_id": "b2"}]
+    _tier1_db(db, _tier1_row("h2", rewritten))
+    assert _daemon()._load_tier1_blocks(DAY, db=db) == [{"block_id": "b2"}]
+    assert caches.compiled.get(("ch", DAY)).schedule_hash == "h2"
+
+
+# ── EPG ─────────────────────────────────────────────────────────────
+
+
+def _epg_session(identity: SimpleNamespace, row: SimpleNamespace):
+    patcher, db = _mock_session("retrovue.runtime.dsl_schedule_service.session")
+    identity_query = MagicMock()
+    identity_query.filter.return_value.all.return_value = [identity]
+    json_query = MagicMock()
+    json_query.filter.return_value.all.return_value = [row]
+    json_query.filter.return_value.filter.return_value.all.return_value = [row]
+
+    def query(*columns):
+        names = {getattr(c, "key", None) for c in columns}
+        return json_query if "compiled_json" in names else identity_query
+
+    db.query.side_effect = query
+    return patcher, json_query
+
+
+def test_epg_reuses_cached_day_while_identity_matches(caches) -> None:
+    window = (datetime(2026, 3, 1, 6, tzinfo=UTC), datetime(2026, 3, 1, 7, tzinfo=UTC))
+    identity = SimpleNamespace(broadcast_day=DAY, schedule_hash="h", created_at=CREATED,
+                               compiler_version=COMPILER_VERSION)
+    row = SimpleNamespace(broadcast_day=DAY, schedule_hash="h", created_at=CREATED,
+                          compiled_json=_compiled_json())
+
+    patcher, json_query = _epg_session(identity, row)
+    try:
+        first = DslScheduleService.get_canonical_epg("ch", *window)
+        second = DslScheduleService.get_canonical_epg("ch", *window)
+    finally:
+        patcher.stop()
+    assert first == second and len(first) == 1
+    assert json_query.filter.return_value.all.call_count == 1
+
+    # A rewrite (new hash) by another process forces a reload
+    identity.schedule_hash = "h2"
+    row.schedule_hash = "h2"
+    row.compiled_json = _compiled_json("2026-03-01T06:30:00+00:00")
+    patcher, json_query = _epg_session(identity, row)
+    try:
+        third = DslScheduleService.get_canonical_epg("ch", *window)
+    finally:
+        patcher.stop()
+    assert third[0]["start_at"] == "2026-03-01T06:30:00+00:00"
+    assert caches.compiled.get(("ch", DAY)).schedule_hash == "h2"
@@ -0,0 +1,188 @@
+"""Tests for the packed segment payload codec (INV-SEGMENT-CODEC-001).
+
+Verifies:
+- Random block lists round-trip exactly, with one string table per payload
+- Foreign, truncated or trailing-garbage payloads raise SegmentCodecError
+- Tier 1 and Tier 2 writers store the packed copy; readers prefer it and
+  fall back to JSONB when it is missing or unreadable
+- HorizonBackedScheduleService reuses a hydrated block until its entry changes
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import struct
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from retrovue.runtime.dsl_schedule_service import (
+    DslScheduleService,
+    _deserialize_txlog_row,
+    _serialize_scheduled_block,
+)
+from retrovue.runtime.execution_window_store import ExecutionEntry
+from retrovue.runtime.horizon_backed_schedule_service import HorizonBackedScheduleService
+from retrovue.runtime.playlog_horizon_daemon import PlaylogHorizonDaemon
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+from retrovue.runtime.segment_codec import (
+    SegmentCodecError,
+    decode_blocks,
+    encode_blocks,
+    pack_blocks,
+    payload_to_json,
+)
+
+URIS = ["/media/shows/Cheers/S01E01.mkv", "/media/ads/Tide — 1987.mp4", "", "/media/filler/bars.ts"]
+
+
+def _random_blocks(rng: random.Random, n: int) -> list[ScheduledBlock]:
+    blocks = []
+    t = 1_772_345_600_000
+    for i in range(n):
+        segs = []
+        for _ in range(rng.randint(0, 8)):
+            fade = rng.random() < 0.3
+            segs.append(ScheduledSegment(
+                segment_type=rng.choice(["content", "filler", "commercial", "pad"]),
+                asset_uri=rng.choice(URIS),
+                asset_start_offset_ms=rng.randrange(0, 3_600_000),
+                segment_duration_ms=rng.randrange(0, 1_800_000),
+                transition_in="TRANSITION_FADE" if fade else "TRANSITION_NONE",
+                transition_in_duration_ms=500 if fade else 0,
+                gain_db=rng.choice([0.0, -3.25, 1.5]),
+            ))
+        blocks.append(ScheduledBlock(f"blk-{i}", t, t + 1_800_000, tuple(segs)))
+        t += 1_800_000
+    return blocks
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_round_trip(seed: int) -> None:
+    rng = random.Random(seed)
+    blocks = _random_blocks(rng, rng.randint(0, 48))
+    data = encode_blocks(blocks)
+    assert decode_blocks(data) == blocks
+    assert payload_to_json(data)["blocks"] == json.loads(json.dumps(payload_to_json(data)["blocks"]))
+
+
+def test_strings_are_stored_once_per_payload() -> None:
+    blocks = _random_blocks(random.Random(1), 48)
+    data = encode_blocks(blocks)
+    assert data.count(URIS[0].encode("utf-8")) == 1
+    as_json = json.dumps([_serialize_scheduled_block(b) for b in blocks]).encode("utf-8")
+    assert len(data) < len(as_json) / 2
+    decoded = decode_blocks(data)
+    # Identical segments share one object
+    segs = [s for b in decoded for s in b.segments]
+    assert len({id(s) for s in segs}) == len(set(segs))
+
+
+@pytest.mark.parametrize("mangle, message", [
+    (lambda d: b"XXXX" + d[4:], "not a segment payload"),
+    (lambda d: d[:4] + struct.pack(">H", 99) + d[6:], "version 99"),
+    (lambda d: d[:-3], "malformed|truncated"),
+    (lambda d: d + b"\0", "trailing"),
+])
+def test_bad_payloads_raise(mangle, message) -> None:
+    data = encode_blocks(_random_blocks(random.Random(2), 3))
+    with pytest.raises(SegmentCodecError, match=message):
+        decode_blocks(mangle(data))
+
+
+def test_pack_blocks_returns_none_for_unencodable_blocks() -> None:
+    seg = ScheduledSegment("content", "/a.mp4", 0, 1.5)  # type: ignore[arg-type]
+    assert pack_blocks([ScheduledBlock("b", 0, 1000, (seg,))]) is None
+
+
+# ── Tier 2 ──────────────────────────────────────────────────────────
+
+
+def _block() -> ScheduledBlock:
+    return _random_blocks(random.Random(3), 1)[0]
+
+
+def test_txlog_row_prefers_packed_and_falls_back() -> None:
+    block = _block()
+    row = SimpleNamespace(
+        block_id=block.block_id, start_utc_ms=block.start_utc_ms, end_utc_ms=block.end_utc_ms,
+        segments=[], segments_packed=encode_blocks([block]),
+    )
+    assert _deserialize_txlog_row(row) == block
+
+    row.segments = _serialize_scheduled_block(block)["segments"]
+    row.segments_packed = b"RVSG garbage"
+    assert _deserialize_txlog_row(row) == block
+
+
+def test_daemon_writes_packed_segments() -> None:
+    daemon = PlaylogHorizonDaemon.__new__(PlaylogHorizonDaemon)
+    daemon._channel_id = "ch"
+    block = _block()
+    db = MagicMock()
+    daemon._write_to_txlog(block, None, db=db)
+    row = db.merge.call_args.args[0]
+    assert decode_blocks(row.segments_packed) == [block]
+    assert len(row.segments) == len(block.segments)
+
+
+# ── Tier 1 ──────────────────────────────────────────────────────────
+
+
+def _save(svc: DslScheduleService, existing, **kwargs) -> MagicMock:
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = existing
+    with patch("retrovue.runtime.dsl_schedule_service.session") as session:
+        session.return_value.__enter__ = MagicMock(return_value=db)
+        session.return_value.__exit__ = MagicMock(return_value=False)
+        svc._save_compiled_schedule("ch", "2026-03-01", {"program_blocks": []}, "h", **kwargs)
+    return db
+
+
+def test_compiled_save_stores_or_clears_packed_blocks() -> None:
+    svc = DslScheduleService.__new__(DslScheduleService)
+    blocks = _random_blocks(random.Random(4), 4)
+
+    db = _save(svc, None, blocks=blocks)
+    assert decode_blocks(db.add.call_args.args[0].segmented_packed) == blocks
+
+    existing = SimpleNamespace(segmented_packed=b"stale")
+    _save(svc, existing)
+    assert existing.segmented_packed is None
+
+
+def test_hydrate_decodes_packed_blocks() -> None:
+    svc = DslScheduleService.__new__(DslScheduleService)
+    blocks = _random_blocks(random.Random(5), 4)
+    schedule = {"segmented_blocks": [_serialize_scheduled_block(b) for b in blocks]}
+
+    with patch("retrovue.runtime.dsl_schedule_service._deserialize_scheduled_block") as from_dict:
+        assert svc._hydrate_schedule(schedule, "ch", "2026-03-01", packed=encode_blocks(blocks)) == blocks
+    from_dict.assert_not_called()
+    # An unreadable payload falls back to the JSON copy
+    assert svc._hydrate_schedule(schedule, "ch", "2026-03-01", packed=b"bad") == blocks
+
+
+# ── Horizon-backed reads ────────────────────────────────────────────
+
+
+def test_horizon_backed_block_is_reused_until_entry_changes() -> None:
+    block = _block()
+    entry = ExecutionEntry(
+        block.block_id, 0, block.start_utc_ms, block.end_utc_ms,
+        _serialize_scheduled_block(block)["segments"],
+    )
+    store = MagicMock()
+    store.get_entry_at.return_value = entry
+    svc = HorizonBackedScheduleService(store)
+
+    first = svc.get_block_at("ch", block.start_utc_ms)
+    assert first == block
+    assert svc.get_block_at("ch", block.start_utc_ms) is first
+
+    store.get_entry_at.return_value = ExecutionEntry(
+        block.block_id, 0, block.start_utc_ms, block.end_utc_ms, [],
+    )
+    assert svc.get_block_at("ch", block.start_utc_ms).segments == ()
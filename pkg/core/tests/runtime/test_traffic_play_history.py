@@ -0,0 +1,276 @@
+"""Tests for the in-memory traffic play window (INV-TRAFFIC-PLAY-HISTORY-001).
+
+Verifies:
+- Cooldown and daily-cap answers match the traffic_play_log rules over
+  random play histories, judged at an air time with future-dated plays
+- The window is loaded once, pruned, and reloaded when stale
+- A fill's plays are visible to that fill at once, reach the shared
+  window only when its session commits, and are dropped on rollback
+- A fill through DatabaseAssetLibrary queries play history once, judges
+  and logs spots at their air times, and writes them back in one batch
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from retrovue.catalog.db_asset_library import DatabaseAssetLibrary
+from retrovue.catalog.traffic_play_history import (
+    TrafficPlay,
+    TrafficPlayBuffer,
+    TrafficPlayHistory,
+)
+from retrovue.domain.entities import Asset, Collection, TrafficPlayLog
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment
+from retrovue.runtime.traffic_manager import fill_ad_blocks
+
+NOW = datetime(2026, 3, 1, 15, 0, tzinfo=UTC)
+TYPE_COOLDOWNS = {"promo": 600, "commercial": 7200}
+DEFAULT_CD = 3600
+
+
+def _row(p: TrafficPlay) -> tuple:
+    return (uuid.uuid4(), p.asset_uri, uuid.UUID(p.asset_uuid), p.asset_type, p.played_at)
+
+
+def _db_with_plays(rows: list[tuple]) -> MagicMock:
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = rows
+    return db
+
+
+def _session() -> Session:
+    """An unbound Session whose commit/rollback events fire without a database."""
+    s = Session()
+    s.add_all = MagicMock()  # type: ignore[method-assign]
+    return s
+
+
+def _play(i: int, played_at: datetime, asset_type: str = "commercial") -> TrafficPlay:
+    return TrafficPlay(f"/ads/{i}.mp4", str(uuid.UUID(int=i + 1)), asset_type, played_at)
+
+
+def _random_plays(rng: random.Random, n: int) -> list[TrafficPlay]:
+    plays = []
+    for _ in range(n):
+        i = rng.randrange(6)
+        # Spots are logged ahead of air, so plays run into the future
+        played_at = NOW + timedelta(seconds=rng.randrange(-20 * 3600, 20 * 3600))
+        plays.append(_play(i, played_at, rng.choice(["promo", "commercial", "filler"])))
+    return plays
+
+
+def test_answers_match_query_rules() -> None:
+    for seed in range(20):
+        rng = random.Random(seed)
+        plays = _random_plays(rng, rng.randint(0, 40))
+        air_time = NOW + timedelta(seconds=rng.randrange(-6 * 3600, 6 * 3600))
+        since = min(air_time - timedelta(seconds=7200), air_time.replace(hour=0, minute=0))
+        window = [p for p in plays if p.played_at >= since]
+        history = TrafficPlayHistory("ch")
+        history.ensure_loaded(_db_with_plays([_row(p) for p in window]), since)
+
+        for uri in {p.asset_uri for p in plays}:
+            expected = any(
+                p.asset_uri == uri
+                and abs((air_time - p.played_at).total_seconds())
+                < TYPE_COOLDOWNS.get(p.asset_type, DEFAULT_CD)
+                for p in window
+            )
+            assert history.is_cooling(uri, air_time, TYPE_COOLDOWNS, DEFAULT_CD) == expected
+        for asset_uuid in {p.asset_uuid for p in plays}:
+            expected = sum(
+                1 for p in window
+                if p.asset_uuid == asset_uuid and p.played_at.date() == air_time.date()
+            )
+            assert history.plays_on(asset_uuid, air_time.date()) == expected
+
+
+def test_future_plays_cool_earlier_breaks_and_count_on_their_own_day() -> None:
+    later = _play(0, NOW + timedelta(hours=1))
+    tomorrow = _play(0, NOW + timedelta(hours=10))
+    history = TrafficPlayHistory("ch")
+    history.ensure_loaded(_db_with_plays([_row(later), _row(tomorrow)]), NOW - timedelta(hours=2))
+
+    assert history.is_cooling(later.asset_uri, NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    assert history.is_cooling(later.asset_uri, NOW - timedelta(minutes=50), TYPE_COOLDOWNS, DEFAULT_CD)
+    assert not history.is_cooling(later.asset_uri, NOW - timedelta(hours=2), TYPE_COOLDOWNS, DEFAULT_CD)
+    assert history.plays_on(later.asset_uuid, NOW.date()) == 1
+    assert history.plays_on(later.asset_uuid, tomorrow.played_at.date()) == 1
+
+
+def test_window_loads_once_prunes_and_reloads() -> None:
+    clock = [0.0]
+    history = TrafficPlayHistory("ch", reload_after_s=900, monotonic=lambda: clock[0])
+    old = _play(0, NOW - timedelta(hours=3))
+    db = _db_with_plays([_row(old)])
+
+    history.ensure_loaded(db, NOW - timedelta(hours=4))
+    history.ensure_loaded(db, NOW - timedelta(hours=2))
+    assert db.query.call_count == 1
+    # The 3-hour-old play fell out of the window
+    assert not history.is_cooling(old.asset_uri, NOW, {}, 24 * 3600)
+
+    clock[0] = 1000.0
+    db = _db_with_plays([_row(_play(1, NOW))])
+    history.ensure_loaded(db, NOW - timedelta(hours=2))
+    assert db.query.call_count == 1
+    assert history.is_cooling("/ads/1.mp4", NOW, {}, 60)
+
+    # A longer window than the loaded one always reloads
+    db = _db_with_plays([])
+    history.ensure_loaded(db, NOW - timedelta(hours=10))
+    assert db.query.call_count == 1
+    assert not history.is_cooling("/ads/1.mp4", NOW, {}, 60)
+
+
+def test_publish_skips_plays_already_loaded() -> None:
+    history = TrafficPlayHistory("ch")
+    history.publish([_play(0, NOW)])  # not loaded yet: the first load reads the table
+    play_id = uuid.uuid4()
+    history.ensure_loaded(_db_with_plays([(play_id, "/ads/0.mp4", uuid.UUID(int=1), "commercial", NOW)]),
+                          NOW - timedelta(hours=1))
+    history.publish([TrafficPlay("/ads/0.mp4", str(uuid.UUID(int=1)), "commercial", NOW, play_id=str(play_id))])
+    assert history.plays_on(str(uuid.UUID(int=1)), NOW.date()) == 1
+
+
+# ── Per-fill buffers ────────────────────────────────────────────────
+
+
+def test_buffer_publishes_on_commit_and_drops_on_rollback() -> None:
+    history = TrafficPlayHistory("ch")
+    history.ensure_loaded(_db_with_plays([]), NOW - timedelta(hours=2))
+
+    buffer = TrafficPlayBuffer()
+    buffer.record(_play(0, NOW))
+    assert buffer.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    assert not history.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+
+    db = _session()
+    db.begin()
+    assert buffer.flush(db, "ch", history) == 1
+    # Flushed but uncommitted: still answered by the buffer only
+    assert buffer.pending == 1
+    assert buffer.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    assert not history.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    db.rollback()
+    assert buffer.pending == 0
+    assert not buffer.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    assert not history.is_cooling("/ads/0.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+
+    buffer.record(_play(1, NOW))
+    buffer.flush(db, "ch", history)
+    db.commit()
+    assert buffer.pending == 0
+    assert history.is_cooling("/ads/1.mp4", NOW, TYPE_COOLDOWNS, DEFAULT_CD)
+    assert history.plays_on(str(uuid.UUID(int=2)), NOW.date()) == 1
+    # Listeners are removed once the transaction settles
+    db.commit()
+    assert history.plays_on(str(uuid.UUID(int=2)), NOW.date()) == 1
+
+
+def test_flush_writes_one_batch_and_keeps_plays_on_failure() -> None:
+    buffer = TrafficPlayBuffer()
+    for i in range(3):
+        buffer.record(_play(i, NOW, "promo"))
+
+    failing = _session()
+    failing.add_all.side_effect = RuntimeError("db down")
+    with pytest.raises(RuntimeError):
+        buffer.flush(failing, "ch", None)
+    assert buffer.pending == 3
+
+    db = _session()
+    assert buffer.flush(db, "ch", None) == 3
+    assert buffer.flush(db, "ch", None) == 0
+    db.add_all.assert_called_once()
+    rows = db.add_all.call_args.args[0]
+    assert [r.asset_uri for r in rows] == ["/ads/0.mp4", "/ads/1.mp4", "/ads/2.mp4"]
+    assert all(r.channel_slug == "ch" for r in rows)
+    assert len({r.id for r in rows}) == 3
+
+
+def test_fills_of_one_channel_keep_separate_buffers() -> None:
+    history = TrafficPlayHistory("ch")
+    a = DatabaseAssetLibrary(_session(), channel_slug="ch", play_history=history)
+    b = DatabaseAssetLibrary(_session(), channel_slug="ch", play_history=history)
+
+    a.log_play("/ads/0.mp4", str(uuid.UUID(int=1)), "commercial", NOW)
+    assert b.flush_plays() == 0
+    b._db.add_all.assert_not_called()
+    assert a.flush_plays() == 1
+
+
+# ── Fill through DatabaseAssetLibrary ───────────────────────────────
+
+
+def _library_db(spots: list[tuple[uuid.UUID, str, int, dict]], plays: list[tuple]) -> tuple[Session, list]:
+    db = _session()
+    play_queries: list = []
+
+    def query(*columns):
+        q = MagicMock()
+        owner = getattr(columns[0], "class_", columns[0])
+        if owner is TrafficPlayLog:
+            play_queries.append(q)
+            q.filter.return_value.all.return_value = plays
+        elif owner is Collection:
+            q.filter.return_value.first.return_value = MagicMock(uuid=uuid.UUID(int=99))
+        elif owner is Asset:
+            q.outerjoin.return_value.filter.return_value.all.return_value = spots
+        return q
+
+    db.query = MagicMock(side_effect=query)  # type: ignore[method-assign]
+    return db, play_queries
+
+
+def _block(start: int, breaks: int) -> ScheduledBlock:
+    segs = []
+    for _ in range(breaks):
+        segs.append(ScheduledSegment("content", "/shows/ep.mp4", 0, 600_000))
+        segs.append(ScheduledSegment("filler", "", 0, 60_000))
+    return ScheduledBlock("blk-1", start, start + breaks * 660_000, tuple(segs))
+
+
+def test_fill_queries_history_once_and_rotates_across_breaks() -> None:
+    spots = [
+        (uuid.UUID(int=i + 1), f"/ads/{i}.mp4", 30_000, {"interstitial_type": "commercial"})
+        for i in range(5)
+    ]
+    # /ads/4 is already logged for a later block, inside its cooldown
+    later = _play(4, NOW + timedelta(hours=2))
+    db, play_queries = _library_db(spots, [_row(later)])
+    history = TrafficPlayHistory("ch")
+    lib = DatabaseAssetLibrary(db, channel_slug="ch", play_history=history)
+    lib._policy = {
+        "allowed_types": ["commercial"],
+        "default_cooldown_seconds": 24 * 3600,
+        "type_cooldowns": {},
+        "max_plays_per_day": 0,
+    }
+
+    start_ms = int(NOW.timestamp() * 1000)
+    filled = fill_ad_blocks(_block(start_ms, 2), "/ads/filler.mp4", 60_000, asset_library=lib)
+
+    assert len(play_queries) == 1
+    aired = [s.asset_uri for s in filled.segments if s.segment_type == "commercial"]
+    assert len(aired) == 4
+    assert "/ads/4.mp4" not in aired
+    # Spots from the first break are cooling by the second
+    assert len(set(aired[:2]) & set(aired[2:])) == 0
+    db.add_all.assert_called_once()
+    rows = db.add_all.call_args.args[0]
+    assert [int(r.played_at.timestamp() * 1000) - start_ms for r in rows] == [
+        600_000, 630_000, 1_260_000, 1_290_000,
+    ]
+    assert [r.break_index for r in rows] == [0, 0, 1, 1]
+
+    db.commit()
+    assert lib._play_buffer.pending == 0
+    assert all(history.is_cooling(uri, NOW, {}, 24 * 3600) for uri in aired)
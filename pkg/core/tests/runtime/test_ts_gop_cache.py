@@ -0,0 +1,181 @@
+"""Tests for GOP-aligned tune-in bursts (INV-TS-TUNE-BURST-001).
+
+Verifies:
+- PAT/PMT parsing finds the PMT and video PIDs
+- The burst is PAT + PMT + bytes from the last video random access point
+- Audio random_access_indicator does not restart the GOP
+- Any chunking of the input yields the same burst, ending where the input ends
+- Oversized GOPs are dropped
+- A late ChannelStream subscriber is seeded with the burst, then live bytes
+"""
+
+from __future__ import annotations
+
+import queue
+
+import pytest
+
+from retrovue.runtime.channel_stream import ChannelStream
+from retrovue.runtime.ts_gop_cache import TsGopCache, parse_pat_pmt_pid, parse_pmt_video_pid
+
+PMT_PID = 0x1000
+VIDEO_PID = 0x100
+AUDIO_PID = 0x101
+
+
+def _packet(pid: int, payload: bytes = b"", *, pusi: bool = False, rai: bool = False, cc: int = 0) -> bytes:
+    header = bytes([0x47, (0x40 if pusi else 0) | (pid >> 8), pid & 0xFF])
+    if rai:
+        af = bytes([0x40]) + b"\xff" * 6
+        header += bytes([0x30 | (cc & 0x0F), len(af)]) + af
+    else:
+        header += bytes([0x10 | (cc & 0x0F)])
+    return (header + payload).ljust(188, b"\xff")
+
+
+def _psi(pid: int, section: bytes) -> bytes:
+    return _packet(pid, b"\x00" + section, pusi=True)
+
+
+def _pat() -> bytes:
+    body = b"\x00\x01\xc1\x00\x00" + b"\x00\x01" + bytes([0xE0 | (PMT_PID >> 8), PMT_PID & 0xFF])
+    return _psi(0, bytes([0x00, 0xB0, len(body) + 4]) + body + b"\x00" * 4)
+
+
+def _pmt() -> bytes:
+    streams = (
+        bytes([0x1B, 0xE0 | (VIDEO_PID >> 8), VIDEO_PID & 0xFF, 0xF0, 0x00])
+        + bytes([0x0F, 0xE0 | (AUDIO_PID >> 8), AUDIO_PID & 0xFF, 0xF0, 0x00])
+    )
+    body = b"\x00\x01\xc1\x00\x00" + bytes([0xE0 | (VIDEO_PID >> 8), VIDEO_PID & 0xFF, 0xF0, 0x00]) + streams
+    return _psi(PMT_PID, bytes([0x02, 0xB0, len(body) + 4]) + body + b"\x00" * 4)
+
+
+def _idr(cc: int = 0) -> bytes:
+    return _packet(VIDEO_PID, b"\x00\x00\x01\xe0\x00\x00\x80\x00\x00", pusi=True, rai=True, cc=cc)
+
+
+def _gop(n: int, cc: int = 0) -> list[bytes]:
+    frames = [_idr(cc)]
+    for i in range(1, n):
+        frames.append(_packet(VIDEO_PID, bytes([i]), cc=cc + i))
+        frames.append(_packet(AUDIO_PID, pusi=True, rai=True, cc=i))  # audio RAI: not a RAP
+    return frames
+
+
+def _stream() -> tuple[bytes, int]:
+    """Two GOPs; returns the stream and the offset of the second IDR."""
+    head = b"".join([_pat(), _pmt(), *_gop(5)])
+    tail = b"".join([_pat(), *_gop(4, cc=5)])
+    second_rap = len(head) + 188  # after the repeated PAT
+    return head + tail, second_rap
+
+
+def _feed_in(cache: TsGopCache, data: bytes, size: int) -> None:
+    for i in range(0, len(data), size):
+        cache.feed(data[i:i + size])
+
+
+def test_psi_parsing() -> None:
+    assert parse_pat_pmt_pid(_pat()) == PMT_PID
+    assert parse_pmt_video_pid(_pmt()) == VIDEO_PID
+    assert parse_pat_pmt_pid(_idr()) is None
+
+
+def test_no_burst_before_random_access_point() -> None:
+    cache = TsGopCache()
+    cache.feed(_pat() + _pmt() + _packet(VIDEO_PID, b"\x01"))
+    assert cache.burst() == b""
+    cache.feed(_idr())
+    assert cache.burst() == _pat() + _pmt() + _idr()
+
+
+@pytest.mark.parametrize("chunk_size", [188, 1000, 4096, 32768, 7])
+def test_burst_starts_at_last_video_rap_for_any_chunking(chunk_size: int) -> None:
+    data, second_rap = _stream()
+    cache = TsGopCache()
+    _feed_in(cache, data, chunk_size)
+    assert cache.burst() == _pat() + _pmt() + data[second_rap:]
+    assert cache.video_pid == VIDEO_PID
+    assert cache.random_access_points == 2
+
+
+def test_burst_ends_where_input_ends_mid_packet() -> None:
+    data, second_rap = _stream()
+    cut = second_rap + 188 * 2 + 50
+    cache = TsGopCache()
+    _feed_in(cache, data[:cut], 1000)
+    burst = cache.burst()
+    assert burst.endswith(data[second_rap:cut])
+    # The next live bytes continue the burst exactly
+    cache.feed(data[cut:])
+    assert cache.burst() == burst + data[cut:]
+
+
+def test_oversized_gop_is_dropped() -> None:
+    cache = TsGopCache(max_bytes=188 * 3)
+    cache.feed(_pat() + _pmt() + b"".join(_gop(4)))
+    assert cache.burst() == b""
+    assert cache.gop_bytes == 0
+    cache.feed(_idr())
+    assert cache.burst() == _pat() + _pmt() + _idr()
+
+
+class _ScriptedSource:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks: queue.Queue[bytes] = queue.Queue()
+        for chunk in chunks:
+            self.chunks.put(chunk)
+
+    def read(self, size: int) -> bytes:
+        try:
+            return self.chunks.get(timeout=5)
+        except queue.Empty:
+            return b""
+
+    def close(self) -> None:
+        self.chunks.put(b"")
+
+    def get_socket(self):
+        return None
+
+
+def _drain(queue, nbytes: int) -> bytes:
+    out = b""
+    while len(out) < nbytes:
+        chunk = queue.get(timeout=5)
+        assert chunk, "stream ended early"
+        out += chunk
+    return out
+
+
+def test_late_subscriber_gets_burst_then_live() -> None:
+    data, second_rap = _stream()
+    split = len(data) - 188 * 2 - 40
+    source = _ScriptedSource([data[i:min(i + 1000, split)] for i in range(0, split, 1000)])
+    stream = ChannelStream("gop", ts_source_factory=lambda: source)
+    try:
+        first = stream.subscribe("early")
+        assert _drain(first, split) == data[:split]
+
+        late = stream.subscribe("late")
+        burst = late.get(timeout=1)
+        assert burst == _pat() + _pmt() + data[second_rap:split]
+        assert stream.get_ring_buffer_metrics()["gop_cache_bytes"] == split - second_rap
+
+        source.chunks.put(data[split:])
+        assert _drain(late, len(data) - split) == data[split:]
+    finally:
+        stream.stop()
+
+
+def test_burst_disabled() -> None:
+    data, _ = _stream()
+    source = _ScriptedSource([data])
+    stream = ChannelStream("gop", ts_source_factory=lambda: source, gop_cache_max_bytes=0)
+    try:
+        _drain(stream.subscribe("early"), len(data))
+        late = stream.subscribe("late")
+        assert late.current_bytes == 0
+    finally:
+        stream.stop()
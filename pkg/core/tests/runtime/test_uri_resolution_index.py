@@ -0,0 +1,156 @@
+"""Tests for UriResolutionIndex (in-memory PathMapping/Asset resolution).
+
+Verifies:
+- Longest plex_path prefix wins, with plain string-prefix semantics
+- plex:// URIs resolve via canonical_uri, or not at all
+- Unmapped and unknown assets pass the source path through
+- DslScheduleService._resolve_uris makes no DB calls with a warm index
+- refresh() picks up a canonical_uri rewritten through the ORM
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from sqlalchemy import CheckConstraint, Column, MetaData, Table, create_engine
+from sqlalchemy.orm import Session
+
+from retrovue.domain.entities import Asset, PathMapping
+from retrovue.runtime.dsl_schedule_service import DslScheduleService
+from retrovue.runtime.loudness_queue import LoudnessQueue
+from retrovue.runtime.uri_resolution_index import UriResolutionIndex, _PrefixTrie
+
+COL = "c0000000-0000-0000-0000-000000000001"
+
+
+def _no_db():
+    raise AssertionError("warm index MUST NOT open a DB session")
+
+
+def _index(assets, mappings=None):
+    idx = UriResolutionIndex(session_factory=_no_db, refresh_interval_s=3600)
+    idx.load_rows(
+        mappings if mappings is not None else [
+            (COL, "/data/media", "/mnt/nas"),
+            (COL, "/data/media/tv", "/mnt/tv"),
+        ],
+        assets,
+    )
+    return idx
+
+
+class TestPrefixTrie:
+    def test_longest_match(self):
+        t = _PrefixTrie()
+        t.insert("/a", "A")
+        t.insert("/a/b", "AB")
+        assert t.longest_match("/a/b/c") == (4, "AB")
+        assert t.longest_match("/a/x") == (2, "A")
+        assert t.longest_match("/z") is None
+
+    def test_first_insert_wins(self):
+        t = _PrefixTrie()
+        t.insert("/a", "first")
+        t.insert("/a", "second")
+        assert t.longest_match("/a/b") == (2, "first")
+
+
+class TestResolve:
+    def test_longest_mapping_applied(self):
+        idx = _index([("a1", COL, "/data/media/tv/show/ep1.mkv")])
+        assert idx.resolve("a1", "file:///data/media/tv/show/ep1.mkv") == "/mnt/tv/show/ep1.mkv"
+        assert idx.resolve("a1", "/data/media/movies/x.mkv") == "/mnt/nas/movies/x.mkv"
+
+    def test_string_prefix_semantics(self):
+        idx = _index([("a1", COL, None)])
+        # "/data/media/tv" is a string prefix of "/data/media/tvshows"
+        assert idx.resolve("a1", "/data/media/tvshows/x.mkv") == "/mnt/tvshows/x.mkv"
+
+    def test_plex_uri_uses_canonical_uri(self):
+        idx = _index([
+            ("a1", COL, "/data/media/tv/ep.mkv"),
+            ("a2", COL, None),
+            ("a3", COL, "plex://123"),
+        ])
+        assert idx.resolve("a1", "plex://library/1") == "/mnt/tv/ep.mkv"
+        assert idx.resolve("a2", "plex://library/2") is None
+        assert idx.resolve("a3", "plex://library/3") is None
+        assert idx.resolve("missing", "plex://library/4") is None
+
+    def test_unknown_asset_passthrough(self):
+        idx = _index([])
+        assert idx.resolve("nope", "file:///local/x.mkv") == "/local/x.mkv"
+
+
+class TestDslResolveUris:
+    def test_day_resolves_without_queries(self):
+        assets = [(f"a{i}", COL, f"/data/media/tv/ep{i}.mkv") for i in range(50)]
+        idx = _index(assets)
+        svc = DslScheduleService(
+            dsl_path="/dev/null",
+            filler_path="/dev/null",
+            filler_duration_ms=30_000,
+            uri_index=idx,
+            loudness_queue=LoudnessQueue(":memory:"),
+        )
+        resolver = SimpleNamespace(
+            lookup=lambda aid: SimpleNamespace(file_uri=f"plex://library/{aid}"),
+        )
+        schedule = {"program_blocks": [{"asset_id": f"a{i}"} for i in range(50)]}
+
+        svc._resolve_uris(resolver, schedule)
+
+        assert svc._resolve_uri("plex://library/a7") == "/mnt/tv/ep7.mkv"
+        assert len(svc._uri_cache) == 50
+        assert idx.rebuild_count == 1
+
+
+class TestRefresh:
+    @staticmethod
+    def _engine():
+        """SQLite copies of assets/path_mappings without Postgres-only constraints."""
+        engine = create_engine("sqlite://")
+        md = MetaData()
+        Table("collections", md, Column("uuid", Asset.__table__.c.collection_uuid.type, primary_key=True))
+        for table in (Asset.__table__, PathMapping.__table__):
+            copy = table.to_metadata(md)
+            for c in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+                copy.constraints.discard(c)
+        md.create_all(engine)
+        return engine
+
+    def test_canonical_uri_rewrite_is_picked_up(self):
+        engine = self._engine()
+        col = uuid.UUID(COL)
+
+        @contextmanager
+        def factory():
+            with Session(engine) as db:
+                yield db
+
+        with Session(engine) as db:
+            db.add(PathMapping(collection_uuid=col, plex_path="/data/media", local_path="/mnt/nas"))
+            asset = Asset(
+                collection_uuid=col, canonical_key="k", canonical_key_hash="0" * 64,
+                uri="plex://library/1", canonical_uri="plex://library/1", size=1,
+                state="new", discovered_at=datetime(2020, 1, 1, tzinfo=UTC),
+                updated_at=datetime(2020, 1, 1, tzinfo=UTC),
+            )
+            db.add(asset)
+            db.commit()
+            asset_id = str(asset.uuid)
+
+        idx = UriResolutionIndex(session_factory=factory)
+        assert idx.refresh(force=True)
+        assert idx.resolve(asset_id, "plex://library/1") is None
+
+        # As ingest does once the Plex path resolves
+        with Session(engine) as db:
+            db.get(Asset, uuid.UUID(asset_id)).canonical_uri = "/data/media/tv/ep.mkv"
+            db.commit()
+
+        assert idx.refresh(force=True)
+        assert idx.resolve(asset_id, "plex://library/1") == "/mnt/nas/tv/ep.mkv"
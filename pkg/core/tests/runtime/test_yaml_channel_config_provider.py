@@ -0,0 +1,126 @@
+"""Tests for YamlChannelConfigProvider snapshots and traffic policy.
+
+Verifies:
+- Traffic policy merges hardcoded defaults, _defaults.yaml and channel YAML
+- Unchanged files are not re-parsed between snapshot checks
+- Editing a channel file or an !include target bumps the version
+- Adding a channel file is picked up without reload()
+- _load_channel_traffic_policy reads from the shared snapshot
+- A non-integer startup_priority falls back to 0 instead of dropping the channel
+"""
+
+from __future__ import annotations
+
+import os
+
+from retrovue.catalog.db_asset_library import _load_channel_traffic_policy
+from retrovue.runtime.providers.yaml_channel_config_provider import (
+    YamlChannelConfigProvider,
+    shared_provider,
+)
+
+
+def _write(path, text, bump_ns=0):
+    path.write_text(text)
+    if bump_ns:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+def _channel_yaml(slug, number, traffic=""):
+    return f"channel: {slug}\nchannel_number: {number}\n{traffic}"
+
+
+def _setup(tmp_path):
+    _write(tmp_path / "_defaults.yaml", "traffic:\n  default_cooldown_seconds: 1800\n")
+    _write(tmp_path / "_breaks.yaml", "cooldowns:\n  promo: 600\n")
+    _write(
+        tmp_path / "retro.yaml",
+        _channel_yaml(
+            "retro", 1,
+            "traffic:\n  max_plays_per_day: 4\n  type_cooldowns: !include _breaks.yaml:cooldowns\n",
+        ),
+    )
+    return YamlChannelConfigProvider(tmp_path, reload_check_interval_s=0)
+
+
+class TestTrafficPolicy:
+    def test_layers_merge(self, tmp_path):
+        provider = _setup(tmp_path)
+        policy = provider.get_traffic_policy("retro")
+        assert policy["default_cooldown_seconds"] == 1800
+        assert policy["max_plays_per_day"] == 4
+        assert policy["type_cooldowns"] == {"promo": 600}
+        assert "commercial" in policy["allowed_types"]
+
+    def test_unknown_channel_gets_defaults(self, tmp_path):
+        provider = _setup(tmp_path)
+        policy = provider.get_traffic_policy("nope")
+        assert policy["default_cooldown_seconds"] == 1800
+        assert policy["max_plays_per_day"] == 0
+
+    def test_db_asset_library_uses_shared_snapshot(self, tmp_path):
+        _setup(tmp_path)
+        assert _load_channel_traffic_policy("retro", tmp_path)["max_plays_per_day"] == 4
+        assert shared_provider(tmp_path) is shared_provider(tmp_path)
+
+
+class TestHotReload:
+    def test_unchanged_files_keep_version(self, tmp_path):
+        provider = _setup(tmp_path)
+        first = provider.snapshot()
+        assert provider.snapshot() is first
+        assert provider.version == first.version
+
+    def test_channel_edit_bumps_version(self, tmp_path):
+        provider = _setup(tmp_path)
+        v1 = provider.version
+        _write(
+            tmp_path / "retro.yaml",
+            _channel_yaml("retro", 7, "traffic:\n  max_plays_per_day: 9\n"),
+            bump_ns=1_000_000_000,
+        )
+        assert provider.version == v1 + 1
+        assert provider.get_channel_config("retro").channel_id_int == 7
+        assert provider.get_traffic_policy("retro")["max_plays_per_day"] == 9
+
+    def test_include_edit_bumps_version(self, tmp_path):
+        provider = _setup(tmp_path)
+        v1 = provider.version
+        _write(tmp_path / "_breaks.yaml", "cooldowns:\n  promo: 60\n", bump_ns=1_000_000_000)
+        assert provider.version == v1 + 1
+        assert provider.get_traffic_policy("retro")["type_cooldowns"] == {"promo": 60}
+
+    def test_new_channel_file_discovered(self, tmp_path):
+        provider = _setup(tmp_path)
+        assert provider.list_channel_ids() == ["retro"]
+        _write(tmp_path / "late.yaml", _channel_yaml("late", 2))
+        dir_st = tmp_path.stat()
+        os.utime(tmp_path, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns + 1_000_000_000))
+        assert sorted(provider.list_channel_ids()) == ["late", "retro"]
+
+    def test_snapshot_is_read_only(self, tmp_path):
+        provider = _setup(tmp_path)
+        snap = provider.snapshot()
+        try:
+            snap.configs["x"] = None  # type: ignore[index]
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("snapshot configs must be immutable")
+        # traffic_policy() hands out copies
+        snap.traffic_policy("retro")["max_plays_per_day"] = 99
+        assert snap.traffic_policy("retro")["max_plays_per_day"] == 4
+        snap.traffic_policy("retro")["type_cooldowns"]["promo"] = 1
+        assert snap.traffic_policy("retro")["type_cooldowns"] == {"promo": 600}
+
+
+class TestChannelConfig:
+    def test_invalid_startup_priority_keeps_channel(self, tmp_path, caplog):
+        _write(tmp_path / "a.yaml", _channel_yaml("a", 1, "startup_priority: high\n"))
+        _write(tmp_path / "b.yaml", _channel_yaml("b", 2, "startup_priority: 5\n"))
+        provider = YamlChannelConfigProvider(tmp_path, reload_check_interval_s=0)
+
+        assert provider.get_channel_config("a").schedule_config["startup_priority"] == 0
+        assert provider.get_channel_config("b").schedule_config["startup_priority"] == 5
+        assert "Ignoring invalid startup_priority 'high' in a.yaml" in caplog.text
@@ -459,7 +459,7 @@ class TestCooldownAtFillTime:
 
         played_uris: set[str] = set()
 
-        def get_filler_assets_with_cooldown(max_duration_ms, count):
+        def get_filler_assets_with_cooldown(max_duration_ms, count, air_time=None):
             """Exclude assets that have been played (simulates cooldown)."""
             all_assets = [
                 _make_filler_asset("/ads/asset-x.mp4", 30_000, "commercial"),
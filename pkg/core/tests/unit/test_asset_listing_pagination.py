@@ -0,0 +1,84 @@
+"""Tests for keyset pagination of the scheduling asset listing.
+
+Verifies:
+- Cursors round-trip and malformed cursors are rejected
+- The page query orders on (discovered_at, uuid) and seeks past the cursor
+- Editorial filters compile to a single JSONB containment test
+- Totals are counted once per filter set within the TTL, for a bounded
+  number of filter sets
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from retrovue.domain.entities import Asset
+from retrovue.shared.lru_cache import LruCache
+from retrovue.web.api import scheduling
+
+
+def _sql(query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip() -> None:
+    when = datetime(2026, 3, 2, 11, 30, 15, 123456, tzinfo=timezone.utc)
+    asset_uuid = uuid.uuid4()
+    cursor = scheduling.encode_asset_cursor(when, asset_uuid)
+    assert "=" not in cursor
+    assert scheduling.decode_asset_cursor(cursor) == (when, asset_uuid)
+
+
+@pytest.mark.parametrize("bad", ["", "not-base64!", "WyJ4Il0", "WyJub3QtYS1kYXRlIiwieCJd"])
+def test_malformed_cursor_rejected(bad: str) -> None:
+    with pytest.raises(ValueError):
+        scheduling.decode_asset_cursor(bad)
+
+
+def test_keyset_page_query() -> None:
+    query = scheduling._schedulable_assets_query(Session(), "sitcom", None, "comedy")
+    after = (datetime(2026, 1, 1, tzinfo=timezone.utc), uuid.uuid4())
+    page = (
+        query.order_by(Asset.discovered_at.desc(), Asset.uuid.desc())
+        .filter(tuple_(Asset.discovered_at, Asset.uuid) < after)
+    )
+    sql = _sql(page)
+    assert "(assets.discovered_at, assets.uuid) < (" in sql
+    assert "ORDER BY assets.discovered_at DESC, assets.uuid DESC" in sql
+    assert sql.count("asset_editorial.payload @>") == 1
+    assert "OFFSET" not in sql
+
+
+def test_count_cached_per_filter_set(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling, "_asset_count_cache", LruCache(8))
+    calls: list[int] = []
+
+    def count() -> int:
+        calls.append(1)
+        return 42
+
+    key = ("sitcom", None, None)
+    assert scheduling._cached_asset_count(key, count) == 42
+    assert scheduling._cached_asset_count(key, count) == 42
+    assert len(calls) == 1
+    scheduling._cached_asset_count(("movie", None, None), count)
+    assert len(calls) == 2
+
+    monkeypatch.setattr(scheduling, "ASSET_COUNT_TTL_S", -1.0)
+    scheduling._asset_count_cache.clear()
+    scheduling._cached_asset_count(key, count)
+    scheduling._cached_asset_count(key, count)
+    assert len(calls) == 4
+
+
+def test_count_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling, "_asset_count_cache", LruCache(4))
+    for genre in range(100):
+        scheduling._cached_asset_count(("sitcom", None, str(genre)), lambda: 1)
+    assert len(scheduling._asset_count_cache) == 4
@@ -0,0 +1,64 @@
+"""Cold-start contract for the CLI: command groups and the DB engine load on demand.
+
+Verifies:
+- Importing the CLI and rendering top-level help imports no command module,
+  SQLAlchemy or FastAPI
+- Invoking a group loads it and behaves as an eagerly registered group
+- Importing infra.db does not create an engine until a session is opened
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _run(code: str) -> str:
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=SRC,
+        timeout=60,
+        check=True,
+    )
+    return out.stdout
+
+
+def test_top_level_help_imports_no_command_modules() -> None:
+    out = _run(
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from retrovue.cli.main import app\n"
+        "r = CliRunner().invoke(app, ['--help'])\n"
+        "assert r.exit_code == 0, r.output\n"
+        "assert 'collection' in r.output and 'Asset inspection' in r.output\n"
+        "heavy = [m for m in ('sqlalchemy', 'fastapi', 'retrovue.cli.commands.asset',\n"
+        "                     'retrovue.runtime.program_director') if m in sys.modules]\n"
+        "print(heavy)\n"
+    )
+    assert out.strip() == "[]"
+
+
+def test_group_loads_on_invocation() -> None:
+    from retrovue.cli.main import app
+
+    result = CliRunner().invoke(app, ["asset", "--help"])
+    assert result.exit_code == 0
+    assert "reprobe" in result.output
+    assert "retrovue.cli.commands.asset" in sys.modules
+
+
+def test_engine_created_on_first_session() -> None:
+    out = _run(
+        "import retrovue.infra.db as db\n"
+        "before = db._engine is None\n"
+        "s = db.SessionLocal()\n"
+        "print(before, s.get_bind() is db.engine)\n"
+    )
+    assert out.split() == ["True", "True"]
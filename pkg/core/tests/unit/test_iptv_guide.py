@@ -0,0 +1,205 @@
+"""Tests for streamed XMLTV / M3U guide generation.
+
+Verifies:
+- XMLTV output: channels first, programmes per channel, escaped, catalog-enriched
+- Programmes are read lazily, one channel at a time, from the canonical reader
+- Conditional GET: matching ETag / If-Modified-Since answer 304 without reads
+- Validators change when the compiled horizon changes
+- Catalog metadata comes from the resolver's public catalog_entries()
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from retrovue.epg import guide
+from retrovue.web.api import guide as guide_api
+
+UTC = timezone.utc
+START = datetime(2026, 3, 2, 11, 0, tzinfo=UTC)
+CHANNELS = [
+    {"channel_id": "retro-1", "channel_id_int": 1, "name": "Retro & Co"},
+    {"channel_id": "retro-2", "channel_id_int": 2, "name": "Retro Two"},
+]
+
+
+@dataclass
+class _Entry:
+    canonical_id: str
+    series_title: str
+    title: str
+    season: int | None
+    episode: int | None
+    description: str = ""
+
+
+def _blocks(prefix: str, count: int = 2) -> list[dict]:
+    return [
+        {
+            "title": f"{prefix} {i}",
+            "asset_id": f"{prefix}.{i}",
+            "start_at": (START + timedelta(minutes=30 * i)).isoformat(),
+            "slot_duration_sec": 1800,
+            "episode_duration_sec": 1320,
+        }
+        for i in range(count)
+    ]
+
+
+class _Reader:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, channel_id, window_start, window_end):
+        self.calls.append(channel_id)
+        return _blocks(channel_id) if channel_id == "retro-1" else None
+
+
+def test_xmltv_document_structure_and_metadata() -> None:
+    catalog = {"retro-1.0": _Entry("retro-1.0", "Cheers", "Pilot <1>", 1, 2, "Sam & Diane")}
+    xml = "".join(guide.iter_xmltv(
+        CHANNELS, START, START + timedelta(days=1),
+        metadata=lambda: catalog, read_blocks=_Reader(),
+    ))
+    root = ET.fromstring(xml)
+
+    assert [c.get("id") for c in root.findall("channel")] == ["retro-1", "retro-2"]
+    assert root.find("channel/display-name").text == "Retro & Co"
+    progs = root.findall("programme")
+    assert len(progs) == 2
+    first = progs[0]
+    assert first.get("start") == "20260302110000 +0000"
+    assert first.get("stop") == "20260302113000 +0000"
+    assert first.find("title").text == "Cheers"
+    assert first.find("sub-title").text == "Pilot <1>"
+    assert first.find("desc").text == "Sam & Diane"
+    assert first.find("episode-num[@system='xmltv_ns']").text == "0.1."
+    # No catalog entry: block title, treated as a movie
+    assert progs[1].find("title").text == "retro-1 1"
+    assert progs[1].find("category").text == "Movie"
+
+
+def test_xmltv_reads_channels_lazily_and_metadata_once() -> None:
+    reader = _Reader()
+    loads = []
+    chunks = guide.iter_xmltv(
+        CHANNELS, START, START + timedelta(days=1),
+        metadata=lambda: loads.append(1) or {}, read_blocks=reader,
+    )
+    next(chunks)  # header
+    next(chunks)  # channel elements
+    assert reader.calls == []
+    next(chunks)  # retro-1 programmes
+    assert reader.calls == ["retro-1"]
+    list(chunks)
+    assert reader.calls == ["retro-1", "retro-2"]
+    assert loads == [1]
+
+
+def test_m3u_lists_channels_with_guide_url() -> None:
+    text = "".join(guide.iter_m3u(
+        CHANNELS, lambda cid: f"http://h/{cid}.ts", guide_url="http://h/guide.xml",
+    ))
+    lines = text.splitlines()
+    assert lines[0] == '#EXTM3U url-tvg="http://h/guide.xml"'
+    assert lines[1] == '#EXTINF:-1 tvg-id="retro-1" tvg-name="Retro & Co" tvg-chno="1",Retro & Co'
+    assert lines[2] == "http://h/retro-1.ts"
+    assert len(lines) == 5
+
+
+def test_load_catalog_metadata_uses_resolver_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    from contextlib import nullcontext
+
+    from retrovue.infra import uow
+    from retrovue.runtime.catalog_resolver import CatalogAssetResolver
+
+    entries = [_Entry("a1", "Cheers", "Pilot", 1, 1), _Entry("a2", "Taxi", "Pilot", 1, 1)]
+
+    def load(self, db) -> None:
+        self._catalog.extend(entries)
+
+    monkeypatch.setattr(uow, "session", lambda: nullcontext(None))
+    monkeypatch.setattr(CatalogAssetResolver, "_load", load)
+    assert guide_api.load_catalog_metadata() == {"a1": entries[0], "a2": entries[1]}
+
+
+def test_version_changes_with_horizon() -> None:
+    end = START + timedelta(days=7)
+    created = datetime(2026, 3, 1, 12, 0, 0, 500, tzinfo=UTC)
+    rows = [("retro-1", date(2026, 3, 2), "h1", created)]
+    v1 = guide.version_from_rows(rows, ["retro-1"], START, end)
+    again = guide.version_from_rows(list(rows), ["retro-1"], START, end)
+    recompiled = guide.version_from_rows(
+        [("retro-1", date(2026, 3, 2), "h2", created + timedelta(hours=1))], ["retro-1"], START, end
+    )
+    assert v1 == again
+    assert v1.etag != recompiled.etag
+    assert v1.last_modified == created.replace(microsecond=0)
+    assert v1.etag != guide.version_from_rows(rows, ["retro-1"], START, end + timedelta(days=1)).etag
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({}, False),
+        ({"if-none-match": 'W/"abc"'}, True),
+        ({"if-none-match": '"zzz", "abc"'}, True),
+        ({"if-none-match": '"zzz"', "if-modified-since": "Mon, 02 Mar 2026 12:00:00 GMT"}, False),
+        ({"if-modified-since": "Mon, 02 Mar 2026 12:00:00 GMT"}, True),
+        ({"if-modified-since": "Mon, 02 Mar 2026 11:59:59 GMT"}, False),
+        ({"if-modified-since": "garbage"}, False),
+    ],
+)
+def test_is_not_modified(headers, expected) -> None:
+    version = guide.GuideVersion('W/"abc"', datetime(2026, 3, 2, 12, 0, tzinfo=UTC))
+    assert guide.is_not_modified(headers, version) is expected
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch):
+    reader = _Reader()
+    version = guide.GuideVersion('W/"v1"', datetime(2026, 3, 2, 12, 0, tzinfo=UTC))
+    monkeypatch.setattr(guide_api, "_load_channels", lambda: list(CHANNELS))
+    monkeypatch.setattr(guide_api, "load_catalog_metadata", lambda: {})
+    monkeypatch.setattr(guide, "guide_version", lambda *a: version)
+    from retrovue.runtime.dsl_schedule_service import DslScheduleService
+
+    monkeypatch.setattr(DslScheduleService, "get_canonical_epg", staticmethod(reader))
+    app = FastAPI()
+    app.include_router(guide_api.router)
+    c = TestClient(app)
+    c.reader = reader
+    return c
+
+
+def test_guide_endpoint_streams_and_revalidates(client) -> None:
+    resp = client.get("/iptv/guide.xml")
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == 'W/"v1"'
+    assert resp.headers["last-modified"] == "Mon, 02 Mar 2026 12:00:00 GMT"
+    assert len(ET.fromstring(resp.content).findall("programme")) == 2
+
+    client.reader.calls.clear()
+    resp = client.get("/iptv/guide.xml", headers={"If-None-Match": 'W/"v1"'})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert client.reader.calls == []
+
+    resp = client.get("/iptv/guide.xml", headers={"If-Modified-Since": "Mon, 02 Mar 2026 12:00:00 GMT"})
+    assert resp.status_code == 304
+
+
+def test_playlist_endpoint_revalidates(client) -> None:
+    resp = client.get("/iptv/channels.m3u")
+    assert resp.status_code == 200
+    assert "http://testserver/iptv/channel/retro-2.ts" in resp.text
+    assert 'url-tvg="http://testserver/iptv/guide.xml"' in resp.text
+
+    again = client.get("/iptv/channels.m3u", headers={"If-None-Match": resp.headers["etag"]})
+    assert again.status_code == 304
@@ -0,0 +1,101 @@
+"""Tests for collection reprobe streaming, per-asset transactions and resume.
+
+Verifies:
+- Each asset is committed (or rolled back) on its own; reprobe_asset and
+  the enrichment it runs never commit inside that transaction
+- Failures are reported in the stream without stopping the run
+- The checkpoint only advances over a contiguous prefix of finished assets
+- The pool path streams results in completion order
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from retrovue.usecases import asset_reprobe
+from retrovue.usecases.asset_reprobe import _Checkpoint, _run_reprobes
+
+TARGETS = [(f"00000000-0000-0000-0000-00000000000{i}", f"/media/{i}.mkv") for i in range(1, 6)]
+
+
+def _ok(asset_uuid: str) -> dict[str, Any]:
+    return {"uuid": asset_uuid, "old_state": "ready", "new_state": "ready", "new_duration_ms": 1}
+
+
+def test_checkpoint_advances_over_contiguous_prefix() -> None:
+    cp = _Checkpoint(["a", "b", "c"], start="prev")
+    assert cp.mark("b") == "prev"
+    assert cp.mark("a") == "b"
+    assert cp.mark("c") == "c"
+
+
+def test_in_process_commits_each_asset_and_reports_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    failing = TARGETS[2][0]
+
+    def fake_reprobe(db: Any, *, asset_uuid: str, refresh_cache: bool) -> dict[str, Any]:
+        if asset_uuid == failing:
+            raise ValueError("boom")
+        return _ok(asset_uuid)
+
+    monkeypatch.setattr(asset_reprobe, "reprobe_asset", fake_reprobe)
+    db = MagicMock()
+
+    results = list(_run_reprobes(db, TARGETS, False, workers=1, resume_after=None))
+
+    assert [r["uuid"] for r in results] == [u for u, _ in TARGETS]
+    assert results[2]["error"] == "boom"
+    assert results[2]["uri"] == "/media/3.mkv"
+    assert results[-1]["checkpoint"] == TARGETS[-1][0]
+    assert db.commit.call_count == 4
+    assert db.rollback.call_count == 1
+
+
+def test_reprobe_asset_leaves_the_transaction_to_the_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def fake_ingest(db: Any, collection: Any, **kwargs: Any) -> dict[str, int]:
+        calls.append(kwargs)
+        return {"total": 1, "enriched": 1, "skipped": 0, "failed": 0}
+
+    monkeypatch.setattr(asset_reprobe, "ingest_collection_assets", fake_ingest)
+    asset = MagicMock(markers=[], canonical_uri=None)
+    db = MagicMock()
+    db.get.side_effect = lambda entity, key: asset if entity is asset_reprobe.Asset else None
+
+    asset_reprobe.reprobe_asset(db, asset_uuid=TARGETS[0][0])
+
+    assert calls == [{"asset_uuids": [asset.uuid], "commit": False}]
+    db.commit.assert_not_called()
+
+
+def test_pool_streams_in_completion_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    released = threading.Event()
+
+    def fake_worker(asset_uuid: str, refresh_cache: bool) -> dict[str, Any]:
+        if asset_uuid == TARGETS[0][0]:
+            released.wait(5)  # first asset finishes last
+        return _ok(asset_uuid)
+
+    class _ThreadPool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, mp_context: Any = None) -> None:
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(asset_reprobe, "_reprobe_in_worker", fake_worker)
+    monkeypatch.setattr(asset_reprobe, "ProcessPoolExecutor", _ThreadPool)
+
+    stream = _run_reprobes(MagicMock(), TARGETS, False, workers=3, resume_after="start")
+    early = [next(stream) for _ in range(len(TARGETS) - 1)]
+    # The slow first asset holds the checkpoint back
+    assert all(r["checkpoint"] == "start" for r in early)
+    assert TARGETS[0][0] not in {r["uuid"] for r in early}
+
+    released.set()
+    last = next(stream)
+    assert last["uuid"] == TARGETS[0][0]
+    assert last["checkpoint"] == TARGETS[-1][0]
+    assert list(stream) == []
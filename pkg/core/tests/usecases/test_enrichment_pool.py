@@ -0,0 +1,98 @@
+"""Tests for EnrichmentPool (concurrent per-asset enricher pipelines).
+
+Verifies:
+- Outcomes are yielded in input order regardless of completion order
+- Assets overlap, but each enricher respects its concurrency limit
+- A failing enricher is recorded and the rest of the pipeline still runs
+- Look-ahead is bounded
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from retrovue.usecases.enrichment_pool import LOOKAHEAD_PER_WORKER, EnrichmentPool
+
+
+class _Probe:
+    """Enricher that sleeps and records peak concurrency."""
+
+    def __init__(self, name, delay=0.0, max_concurrency=None, fail_on=(), overlap=0):
+        self.name = name
+        self.delay = delay
+        # First `overlap` calls wait for each other, proving they ran together
+        self.overlap = overlap
+        self._barrier = threading.Barrier(overlap) if overlap else None
+        self.calls = 0
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self.fail_on = set(fail_on)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enrich(self, item):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls += 1
+            rendezvous = self._barrier is not None and self.calls <= self.overlap
+        try:
+            if rendezvous:
+                self._barrier.wait(timeout=5)
+            time.sleep(self.delay(item) if callable(self.delay) else self.delay)
+            if item["id"] in self.fail_on:
+                raise RuntimeError(f"{self.name} failed on {item['id']}")
+            return {**item, "seen": item.get("seen", ()) + (self.name,)}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_results_in_input_order():
+    slow_first = _Probe("probe", delay=lambda item: 0.05 if item["id"] == 0 else 0.0)
+    pool = EnrichmentPool([slow_first], max_workers=4)
+    outcomes = list(pool.enrich_all({"id": i} for i in range(10)))
+    assert [o.item["id"] for o in outcomes] == list(range(10))
+
+
+def test_per_enricher_limits():
+    fast = _Probe("ffprobe", overlap=3)
+    heavy = _Probe("loudness", delay=0.02)
+    pool = EnrichmentPool(
+        [fast, heavy], max_workers=6, enricher_limits={"ffprobe": 6, "loudness": 2}
+    )
+
+    outcomes = list(pool.enrich_all({"id": i} for i in range(12)))
+
+    assert all(o.item["seen"] == ("ffprobe", "loudness") for o in outcomes)
+    assert fast.peak >= 3
+    assert heavy.peak <= 2
+
+
+def test_enricher_failure_is_recorded_and_pipeline_continues():
+    first = _Probe("first", fail_on={3})
+    second = _Probe("second")
+    pool = EnrichmentPool([first, second], max_workers=3)
+
+    outcomes = list(pool.enrich_all({"id": i} for i in range(5)))
+
+    assert [name for name, _ in outcomes[3].errors] == ["first"]
+    assert outcomes[3].item["seen"] == ("second",)
+    assert not any(o.errors for i, o in enumerate(outcomes) if i != 3)
+
+
+def test_lookahead_is_bounded():
+    submitted = []
+
+    def items():
+        for i in range(100):
+            submitted.append(i)
+            yield i
+
+    pool = EnrichmentPool([], max_workers=2)
+    it = pool.ordered(lambda x: x, items())
+    assert next(it) == 0
+    assert len(submitted) <= 2 * LOOKAHEAD_PER_WORKER + 1
+    assert list(it) == list(range(1, 100))
@@ -222,6 +222,38 @@ class TestIngestOrchestrator:
                 # Verify asset state was reverted to 'new'
                 assert mock_asset.state == "new"
 
+    @pytest.mark.parametrize("batch_commits, commits", [(False, 1), (True, 2)])
+    def test_commit_granularity(self, mock_db_session, mock_collection, mock_asset, batch_commits, commits):
+        """One commit per collection by default; one per batch when opted in."""
+        second = Asset(
+            uuid=uuid4(),
+            collection_uuid=mock_collection.uuid,
+            canonical_key="test-key-2",
+            canonical_key_hash="test-hash-2",
+            uri="plex://67890",
+            size=1000000,
+            state="new",
+        )
+        mock_db_session.query.return_value.filter.return_value.all.side_effect = [
+            [],  # path_mappings query
+            [mock_asset, second],  # assets query
+        ]
+
+        mock_importer = MagicMock()
+        mock_importer.resolve_local_uri.return_value = ""
+        mock_enricher = MagicMock()
+        mock_enricher.name = "ffprobe"
+
+        with patch("retrovue.adapters.registry.get_importer", return_value=mock_importer):
+            with patch.dict("retrovue.adapters.registry.ENRICHERS", {"ffprobe": lambda **kwargs: mock_enricher}):
+                with patch("retrovue.usecases.ingest_orchestrator.ENRICH_BATCH_SIZE", 1):
+                    summary = ingest_collection_assets(
+                        mock_db_session, mock_collection, batch_commits=batch_commits
+                    )
+
+        assert summary["total"] == 2
+        assert mock_db_session.commit.call_count == commits
+
     def test_handle_enricher_failure_gracefully(self, mock_db_session, mock_collection, mock_asset):
         """Test that enricher failures are handled gracefully."""
         # Setup mocks
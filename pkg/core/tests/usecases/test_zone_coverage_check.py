@@ -0,0 +1,315 @@
+"""Tests for the interval-indexed zone coverage engine.
+
+Verifies:
+- check_overlap / check_coverage match a pairwise reference on random plans,
+  including programming_day_start offsets, midnight-wrapping zones and
+  day filters
+- ZonePlanIndex add/remove and conflicts_with track single-zone edits
+- validate_zone_change accepts a valid edit, rejects bad ones with the
+  full-check messages, and leaves the index unchanged on rejection
+- zone_add / zone_update validate the edited zone incrementally, without
+  a plan-wide sweep
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import time as dt_time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from retrovue.domain.entities import Channel, SchedulePlan, Zone
+from retrovue.usecases import zone_add, zone_update
+from retrovue.usecases.zone_coverage_check import (
+    _DAY_MINUTES,
+    ALL_DAYS,
+    END_OF_DAY,
+    ZonePlanIndex,
+    _days_overlap,
+    _effective_days,
+    _norm_to_wall,
+    _normalize_intervals,
+    _time_to_minutes,
+    check_coverage,
+    check_overlap,
+    validate_zone_change,
+    validate_zone_plan_integrity,
+)
+
+
+@dataclass
+class Z:
+    name: str
+    start_time: dt_time
+    end_time: dt_time
+    day_filters: list[str] | None = None
+    enabled: bool = True
+    schedulable_assets: list[str] = field(default_factory=list)
+
+
+def _t(hhmm: str) -> dt_time:
+    if hhmm == "24:00":
+        return END_OF_DAY
+    h, m = hhmm.split(":")
+    return dt_time(int(h), int(m))
+
+
+def _zone(name: str, start: str, end: str, days: list[str] | None = None) -> Z:
+    return Z(name, _t(start), _t(end), days)
+
+
+def _reference_overlap(zones: list[Z], pds: dt_time) -> list[str]:
+    """The original pairwise comparison."""
+    pds_min = _time_to_minutes(pds)
+    active = [z for z in zones if z.enabled]
+    out = []
+    for i in range(len(active)):
+        for j in range(i + 1, len(active)):
+            a, b = active[i], active[j]
+            shared = _days_overlap(a, b)
+            if not shared:
+                continue
+            ai = _normalize_intervals(_time_to_minutes(a.start_time), _time_to_minutes(a.end_time), pds_min)
+            bi = _normalize_intervals(_time_to_minutes(b.start_time), _time_to_minutes(b.end_time), pds_min)
+            for a_s, a_e in ai:
+                for b_s, b_e in bi:
+                    lo, hi = max(a_s, b_s), min(a_e, b_e)
+                    if lo < hi:
+                        out.append(
+                            f"INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED: zones '{a.name}' and '{b.name}' "
+                            f"overlap [{_norm_to_wall(lo, pds_min)}-{_norm_to_wall(hi, pds_min)}] "
+                            f"on days [{','.join(sorted(shared))}]"
+                        )
+    return out
+
+
+def _reference_gaps(zones: list[Z], pds: dt_time) -> list[str]:
+    pds_min = _time_to_minutes(pds)
+    active = [z for z in zones if z.enabled]
+    if not active:
+        return ["INV-PLAN-FULL-COVERAGE-001-VIOLATED: no enabled zones — broadcast day has no coverage"]
+    days = set().union(*(_effective_days(z) for z in active))
+    out = []
+    for day in sorted(days):
+        covered = [False] * _DAY_MINUTES
+        for z in active:
+            if day in _effective_days(z):
+                for s, e in _normalize_intervals(
+                    _time_to_minutes(z.start_time), _time_to_minutes(z.end_time), pds_min
+                ):
+                    covered[s:e] = [True] * (e - s)
+        m = 0
+        while m < _DAY_MINUTES:
+            if covered[m]:
+                m += 1
+                continue
+            start = m
+            while m < _DAY_MINUTES and not covered[m]:
+                m += 1
+            out.append(
+                f"INV-PLAN-FULL-COVERAGE-001-VIOLATED: gap on {day} "
+                f"[{_norm_to_wall(start, pds_min)}-{_norm_to_wall(m, pds_min)}]"
+            )
+    return out
+
+
+def _random_plan(rng: random.Random, n: int) -> list[Z]:
+    zones = []
+    for i in range(n):
+        start = rng.randrange(0, 48) * 30
+        length = rng.choice([30, 60, 90, 120, 240, 360])
+        end = (start + length) % _DAY_MINUTES
+        days = None if rng.random() < 0.4 else sorted(rng.sample(sorted(ALL_DAYS), rng.randint(1, 3)))
+        zones.append(Z(
+            f"z{i}",
+            dt_time(start // 60, start % 60),
+            END_OF_DAY if end == 0 else dt_time(end // 60, end % 60),
+            days,
+            enabled=rng.random() > 0.1,
+        ))
+    return zones
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_pairwise_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    zones = _random_plan(rng, rng.randint(1, 25))
+    pds = rng.choice([dt_time(0, 0), dt_time(6, 0), dt_time(5, 30)])
+    assert check_overlap(zones, pds) == _reference_overlap(zones, pds)
+    assert check_coverage(zones, pds) == _reference_gaps(zones, pds)
+
+
+def _tiled_week() -> list[Z]:
+    return [
+        _zone("morning", "06:00", "12:00"),
+        _zone("afternoon", "12:00", "18:00"),
+        _zone("prime", "18:00", "23:00"),
+        _zone("overnight", "23:00", "06:00"),
+    ]
+
+
+def test_conflicts_with_finds_only_candidate_pairs() -> None:
+    zones = _tiled_week()
+    index = ZonePlanIndex(zones, dt_time(6, 0))
+    assert index.overlap_violations() == []
+    assert index.coverage_violations() == []
+
+    late = _zone("late", "22:00", "01:00", ["FRI"])
+    conflicts = index.conflicts_with(late)
+    assert conflicts == _reference_overlap(zones + [late], dt_time(6, 0))
+    assert len(conflicts) == 2  # prime and overnight, on FRI only
+
+
+def test_remove_restores_coverage_gap() -> None:
+    zones = _tiled_week()
+    index = ZonePlanIndex(zones, dt_time(6, 0))
+    index.remove(zones[1])
+    assert len(index) == 3
+    assert index.coverage_violations() == _reference_gaps(
+        [z for z in zones if z is not zones[1]], dt_time(6, 0)
+    )
+    index.add(zones[1])
+    assert index.coverage_violations() == []
+
+
+def test_rejected_edit_leaves_index_unchanged() -> None:
+    zones = _tiled_week()
+    index = ZonePlanIndex(zones, dt_time(6, 0))
+    prime = zones[2]
+    prime.end_time = _t("21:00")  # edited in place, as zone_update does
+    with pytest.raises(ValueError, match="gap on"):
+        validate_zone_change(index, prime, replaces=prime)
+    assert index.coverage_violations() == []
+    # The index still holds prime's pre-edit 18:00-23:00
+    assert len(index.conflicts_with(_zone("news", "21:00", "23:00"))) == 1
+
+
+def test_validate_zone_change_adds_new_days() -> None:
+    weekdays = ["MON", "TUE", "WED", "THU", "FRI"]
+    zones = [_zone("day", "06:00", "18:00", weekdays), _zone("night", "18:00", "06:00", weekdays)]
+    index = ZonePlanIndex(zones, dt_time(6, 0))
+    weekend = _zone("weekend", "06:00", "06:00", ["SAT", "SUN"])
+    validate_zone_change(index, weekend)
+    assert weekend in index
+    assert index.coverage_violations() == []
+    validate_zone_plan_integrity(zones + [weekend], programming_day_start=dt_time(6, 0))
+
+
+def test_validate_zone_change_matches_full_validation() -> None:
+    zones = _tiled_week()
+    index = ZonePlanIndex(zones, dt_time(6, 0))
+    candidate = _zone("afternoon", "12:00", "18:00")
+    candidate.schedulable_assets = ["bad"]
+
+    def checker(asset_id: str) -> tuple[bool, str]:
+        return asset_id != "bad", "not approved"
+
+    with pytest.raises(ValueError) as incremental:
+        validate_zone_change(index, candidate, replaces=zones[1], asset_eligibility_checker=checker)
+    with pytest.raises(ValueError) as full:
+        validate_zone_plan_integrity(
+            [zones[0], zones[2], zones[3], candidate],
+            programming_day_start=dt_time(6, 0),
+            asset_eligibility_checker=checker,
+        )
+    assert str(incremental.value) == str(full.value)
+    assert zones[1] in index and candidate not in index
+
+    candidate.schedulable_assets = ["good"]
+    validate_zone_change(index, candidate, replaces=zones[1], asset_eligibility_checker=checker)
+    assert candidate in index and zones[1] not in index
+
+
+def test_eligibility_checked_once_per_asset() -> None:
+    calls = []
+
+    def checker(asset_id: str) -> tuple[bool, str]:
+        calls.append(asset_id)
+        return True, ""
+
+    zones = _tiled_week()
+    for z in zones:
+        z.schedulable_assets = ["a", "b"]
+    validate_zone_plan_integrity(zones, dt_time(6, 0), asset_eligibility_checker=checker)
+    assert sorted(calls) == ["a", "b"]
+
+
+# ── Edit paths ──────────────────────────────────────────────────────
+
+
+def _plan_db(zones: list[Z]) -> MagicMock:
+    channel = SimpleNamespace(programming_day_start=dt_time(6, 0), grid_block_minutes=30)
+    plan = SimpleNamespace(id=1, channel_id=1)
+    for i, z in enumerate(zones):
+        z.id, z.plan_id, z.plan = i, plan.id, plan
+        z.effective_start = z.effective_end = z.dst_policy = None
+        z.created_at = z.updated_at = None
+
+    def query(entity):
+        q = MagicMock()
+        if entity is Zone:
+            q.filter.return_value.all.return_value = list(zones)
+        elif entity is Channel:
+            q.filter.return_value.first.return_value = channel
+        elif entity is SchedulePlan:
+            q.filter.return_value.first.return_value = plan
+        return q
+
+    db = MagicMock()
+    db.query.side_effect = query
+    return db
+
+
+def _no_sweep():
+    return patch.object(
+        ZonePlanIndex, "overlap_violations",
+        side_effect=AssertionError("edits MUST NOT sweep the whole plan"),
+    )
+
+
+def test_update_zone_checks_only_the_edit() -> None:
+    zones = _tiled_week()
+    db = _plan_db(zones)
+    prime = zones[2]
+    with _no_sweep(), patch.object(zone_update, "_resolve_zone", return_value=prime):
+        with pytest.raises(ValueError, match="INV-PLAN-FULL-COVERAGE-001-VIOLATED: gap on"):
+            zone_update.update_zone(db, zone_identifier="prime", end_time="21:00")
+        db.commit.assert_not_called()
+
+        prime.end_time = _t("23:00")
+        zones[3].start_time = _t("23:00")
+        with pytest.raises(ValueError, match="INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED"):
+            zone_update.update_zone(db, zone_identifier="prime", end_time="23:30")
+
+        prime.end_time = _t("23:00")
+        zone_update.update_zone(db, zone_identifier="prime", schedulable_assets=["x"])
+    db.commit.assert_called_once()
+
+
+def test_add_zone_checks_only_the_new_zone() -> None:
+    weekdays = ["MON", "TUE", "WED", "THU", "FRI"]
+    db = _plan_db([
+        _zone("day", "06:00", "18:00", weekdays),
+        _zone("night", "18:00", "06:00", weekdays),
+        _zone("weekend night", "18:00", "06:00", ["SAT", "SUN"]),
+    ])
+    with _no_sweep():
+        with pytest.raises(ValueError, match="INV-PLAN-NO-ZONE-OVERLAP-001-VIOLATED"):
+            zone_add.add_zone(
+                db, plan_identifier="plan", name="late", start_time="22:00", end_time="02:00",
+                day_filters=["FRI"],
+            )
+        with pytest.raises(ValueError, match="INV-PLAN-FULL-COVERAGE-001-VIOLATED: gap on"):
+            zone_add.add_zone(
+                db, plan_identifier="plan", name="weekend day", start_time="06:00", end_time="17:00",
+                day_filters=["SAT", "SUN"],
+            )
+        db.add.assert_not_called()
+        zone_add.add_zone(
+            db, plan_identifier="plan", name="weekend day", start_time="06:00", end_time="18:00",
+            day_filters=["SAT", "SUN"],
+        )
+    db.add.assert_called_once()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: restoring DSL horizons from snapshots vs. rehydrating from Tier 1.
+
+Simulates an N-channel restart.  For every channel, HORIZON_DAYS days of
+48 × 30-minute blocks are built synthetically, then restored two ways:
+
+  tier1     What _compile_day does on a DB cache hit, minus the DB round
+            trip: json-decode compiled_json and deserialize every
+            segmented block.  (A cache miss adds a full compile on top.)
+  snapshot  HorizonSnapshotStore.load() from local disk.
+
+Usage:
+    python tools/bench_horizon_snapshot.py
+    python tools/bench_horizon_snapshot.py --channels 40 --segments 9
+
+No database or media is required.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_CORE_SRC = Path(__file__).resolve().parent.parent / "pkg" / "core" / "src"
+if str(_CORE_SRC) not in sys.path:
+    sys.path.insert(0, str(_CORE_SRC))
+
+from retrovue.runtime.dsl_schedule_service import (  # noqa: E402
+    HORIZON_DAYS,
+    _deserialize_scheduled_block,
+    _serialize_scheduled_block,
+)
+from retrovue.runtime.horizon_snapshot import HorizonSnapshotStore, SnapshotDay  # noqa: E402
+from retrovue.runtime.schedule_compiler import COMPILER_VERSION  # noqa: E402
+from retrovue.runtime.schedule_types import ScheduledBlock, ScheduledSegment  # noqa: E402
+
+BLOCK_MS = 30 * 60 * 1000
+BLOCKS_PER_DAY = 48
+DAY_MS = 24 * 3600 * 1000
+EPOCH_MS = 1_767_225_600_000  # 2026-01-01T00:00:00Z
+
+
+def _make_day(channel: int, day: int, segments: int) -> list[ScheduledBlock]:
+    seg_ms = BLOCK_MS // segments
+    blocks = []
+    for b in range(BLOCKS_PER_DAY):
+        start = EPOCH_MS + day * DAY_MS + b * BLOCK_MS
+        segs = tuple(
+            ScheduledSegment(
+                segment_type="content" if i % 2 == 0 else "filler",
+                asset_uri=f"/mnt/media/ch{channel}/show{b % 7}/s01e{(b + i) % 22:02d}.mkv"
+                if i % 2 == 0 else "",
+                asset_start_offset_ms=i * seg_ms,
+                segment_duration_ms=seg_ms,
+                gain_db=-2.0 if i % 2 == 0 else 0.0,
+            )
+            for i in range(segments)
+        )
+        blocks.append(ScheduledBlock(
+            block_id=f"ch{channel}-{day}-{b:03d}",
+            start_utc_ms=start,
+            end_utc_ms=start + BLOCK_MS,
+            segments=segs,
+        ))
+    return blocks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=40)
+    parser.add_argument("--segments", type=int, default=9, help="segments per block")
+    args = parser.parse_args()
+
+    dsl_hash = "bench"
+    tier1_rows: list[list[str]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HorizonSnapshotStore(tmp)
+        for ch in range(args.channels):
+            days = {}
+            rows = []
+            for d in range(HORIZON_DAYS):
+                blocks = _make_day(ch, d, args.segments)
+                days[f"2026-01-{d + 1:02d}"] = SnapshotDay(dsl_hash, tuple(blocks))
+                rows.append(json.dumps({
+                    "source": {"compiler_version": COMPILER_VERSION},
+                    "segmented_blocks": [_serialize_scheduled_block(b) for b in blocks],
+                }))
+            store.save(f"ch{ch}", compiler_version=COMPILER_VERSION, days=days)
+            tier1_rows.append(rows)
+
+        t0 = time.perf_counter()
+        n_tier1 = 0
+        for rows in tier1_rows:
+            for row in rows:
+                compiled = json.loads(row)
+                n_tier1 += len([
+                    _deserialize_scheduled_block(b) for b in compiled["segmented_blocks"]
+                ])
+        tier1_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        n_snap = 0
+        for ch in range(args.channels):
+            days = store.load(f"ch{ch}", compiler_version=COMPILER_VERSION, dsl_hash=dsl_hash)
+            n_snap += sum(len(d.blocks) for d in days.values())
+        snap_s = time.perf_counter() - t0
+
+        snap_bytes = sum(p.stat().st_size for p in Path(tmp).iterdir())
+        tier1_bytes = sum(len(r) for rows in tier1_rows for r in rows)
+
+    assert n_tier1 == n_snap
+    print(f"channels={args.channels} days={HORIZON_DAYS} blocks={n_snap} "
+          f"segments/block={args.segments}")
+    print(f"  tier1 rehydrate : {tier1_s * 1000:8.1f} ms  "
+          f"({tier1_bytes / 1024:8.1f} KiB JSON, excludes DB round trips)")
+    print(f"  snapshot load   : {snap_s * 1000:8.1f} ms  "
+          f"({snap_bytes / 1024:8.1f} KiB on disk)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())